@@ -7,8 +7,10 @@ from typing import Any, Dict, List, Optional
 
 from ._logger import context_logger
 from .exception import ValidationError
+from .json_encoder import CircuitSynthJSONEncoder
 from .net import Net
 from .netlist_exporter import NetlistExporter
+from .netlist_ir import NetlistIR
 from .reference_manager import ReferenceManager
 
 
@@ -465,6 +467,15 @@ class Circuit:
 
         return img
 
+    def to_netlist_ir(self) -> NetlistIR:
+        """
+        Build the columnar netlist IR for this circuit and its hierarchy.
+
+        Pass the result to ``NetlistExporter(circuit, ir=...)`` to render
+        several export formats from one traversal of the hierarchy.
+        """
+        return NetlistIR.from_circuit(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Return a hierarchical dictionary representation of this circuit,
@@ -474,13 +485,16 @@ class Circuit:
         exporter = NetlistExporter(self)
         return exporter.to_dict()
 
-    def generate_json_netlist(self, filename: str) -> None:
+    def generate_json_netlist(self, filename: str, snapshot: bool = False) -> None:
         """
         Generate a JSON representation of this circuit and its hierarchy,
         then write it out to 'filename'.
+
+        With ``snapshot=True`` a binary ``.csnap`` sibling is written as well,
+        so tools can load single subcircuits without parsing the whole file.
         """
         exporter = NetlistExporter(self)
-        return exporter.generate_json_netlist(filename)
+        return exporter.generate_json_netlist(filename, snapshot=snapshot)
 
     # --------------------------------------------------------------------------
     # UPDATED FLATTENED JSON LOGIC (SHOWING ALL NETS USED BY LOCAL COMPONENTS)
@@ -505,78 +519,25 @@ class Circuit:
         """
         Generate JSON netlist with hierarchical components flattened into single component/net structure.
         This creates the format expected by the netlist service: {"components": {...}, "nets": {...}}
+
+        Components in subcircuits are keyed by their sheet path
+        (``"<subcircuit>_<ref>"``); every net lists its nodes from all sheets,
+        sheet by sheet in component order, and annotations are written as
+        their ``to_dict()`` form.
         """
         import json
 
-        # Collect all components and nets from this circuit and all subcircuits
-        all_components = {}  # ref -> component_dict
-        all_nets = {}  # net_name -> [connections]
-        all_net_objects = {}  # net_name -> Net object (to collect connections from)
-
         context_logger.info(
             "Collecting hierarchical components and nets",
             component="CIRCUIT",
             circuit_name=self.name,
         )
 
-        # Helper to recursively collect from circuit and subcircuits
-        def collect_from_circuit(circuit, prefix=""):
-            # Collect components
-            for comp_ref, comp in circuit._components.items():
-                if hasattr(comp, "ref") and comp.ref:
-                    full_ref = f"{prefix}{comp.ref}" if prefix else comp.ref
-                    # Convert component to dict format
-                    all_components[full_ref] = comp.to_dict()
-
-            # Collect nets (the Net objects themselves, not connections yet)
-            for net_name, net in circuit._nets.items():
-                if net_name not in all_net_objects:
-                    all_net_objects[net_name] = net
-                    all_nets[net_name] = []
-
-            # Recursively collect from subcircuits
-            for subcircuit in circuit._subcircuits:
-                collect_from_circuit(subcircuit, f"{prefix}{subcircuit.name}_")
-
-        # Start collection from root circuit
-        collect_from_circuit(self)
-
-        # Now collect connections from each net's _pins set
-        for net_name, net in all_net_objects.items():
-            if hasattr(net, "_pins"):
-                for pin in net._pins:
-                    if hasattr(pin, "_component") and pin._component:
-                        component_ref = pin._component.ref
-
-                        # Find the full reference (with prefix) for this component
-                        full_ref = None
-                        for ref, comp in all_components.items():
-                            if comp.get("ref") == component_ref:
-                                full_ref = ref
-                                break
-
-                        if full_ref:
-                            connection = {
-                                "component": full_ref,
-                                "pin": {
-                                    "number": str(pin.num),
-                                    "name": getattr(pin, "name", "~"),
-                                    "type": str(getattr(pin, "func", "passive")),
-                                },
-                            }
-                            all_nets[net_name].append(connection)
-
-        # Create the expected JSON structure
-        json_data = {
-            "name": self.name,
-            "description": getattr(self, "description", ""),
-            "tstamps": "",
-            "source_file": f"{self.name}.kicad_sch",
-            "components": all_components,
-            "nets": all_nets,
-            "subcircuits": [],  # Flattened, so no subcircuits
-            "annotations": getattr(self, "_annotations", []),
-        }
+        json_data = self.to_netlist_ir().flatten(prefix_refs=True)
+        # The flattened file has never carried a sheet timestamp
+        json_data["tstamps"] = ""
+        all_components = json_data["components"]
+        all_nets = json_data["nets"]
 
         context_logger.info(
             "Hierarchical collection complete",
@@ -590,7 +551,7 @@ class Circuit:
         # Write to file
         try:
             with open(filename, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2, default=str)
+                json.dump(json_data, f, indent=2, cls=CircuitSynthJSONEncoder)
             context_logger.info(
                 f"Hierarchical JSON netlist written to {filename}", component="CIRCUIT"
             )
@@ -1070,6 +1031,7 @@ class Circuit:
         project_name: Optional[str] = None,
         include_drill: bool = True,
         drill_format: str = "excellon",
+        max_workers: int = 4,
     ) -> Dict[str, Any]:
         """
         Generate Gerber files for PCB manufacturing from this circuit.
@@ -1085,6 +1047,7 @@ class Circuit:
                          defaults to the circuit name.
             include_drill: Also export drill files along with Gerbers (default: True)
             drill_format: Format for drill files: "excellon" (default) or "gerber"
+            max_workers: Maximum number of concurrent kicad-cli exports (default: 4)
 
         Returns:
             dict: Result dictionary containing:
@@ -1093,6 +1056,7 @@ class Circuit:
                 - drill_files (tuple): Tuple of (plated_holes_file, non_plated_holes_file) or None
                 - project_path (Path): Path to the KiCad project directory
                 - output_dir (Path): Directory where Gerbers were exported
+                - timing (dict): Per-export timing report (see ExportReport.to_dict)
                 - error (str, optional): Error message if generation failed
 
         Example:
@@ -1109,6 +1073,7 @@ class Circuit:
         Notes:
             - First run generates full KiCad project including PCB (slower)
             - Subsequent runs reuse existing project (faster)
+            - Exports are skipped when the .kicad_pcb content is unchanged
             - Default layers: F.Cu, B.Cu, F.Mask, B.Mask, F.SilkS, B.SilkS, F.Paste, B.Paste, Edge.Cuts
             - Gerbers use standard Protel file extension format (.gbr, .gbl, etc.)
             - Compatible with JLCPCB, PCBWay, OSH Park, and most PCB manufacturers
@@ -1167,6 +1132,7 @@ class Circuit:
             )
 
             # Import PCB utilities for Gerber export
+            from ..pcb.export_orchestrator import ExportOrchestrator
             from ..pcb.kicad_cli import get_kicad_cli
 
             cli = get_kicad_cli()
@@ -1184,42 +1150,46 @@ class Circuit:
                 "Edge.Cuts",     # Board outline
             ]
 
-            gerber_files = cli.export_gerbers(
+            # Gerber and drill exports are independent kicad-cli runs, so they
+            # execute concurrently and are skipped when the board is unchanged
+            orchestrator = ExportOrchestrator(
+                cli, max_workers=max_workers, cache_dir=output_path
+            )
+            orchestrator.add_manufacturing_jobs(
                 pcb_file=pcb_file,
                 output_dir=output_path,
                 layers=standard_layers,
                 protel_extensions=True,  # Use .gbr, .gbl format for compatibility
+                include_drill=include_drill,
+                drill_format=drill_format,
             )
+            report = orchestrator.run()
+
+            if not report.success:
+                errors = "; ".join(
+                    f"{name}: {report.jobs[name].error}" for name in report.failed
+                )
+                raise RuntimeError(errors or "export job cancelled")
+
+            gerber_files = report.results.get("gerbers", [])
+            drill_files = report.results.get("drill") if include_drill else None
 
             context_logger.info(
                 "Gerber export successful",
                 component="CIRCUIT",
                 gerber_count=len(gerber_files),
                 output_dir=str(output_path),
+                wall_time=round(report.wall_time, 3),
+                skipped=report.skipped,
             )
 
-            # Export drill files if requested
-            drill_files = None
-            if include_drill:
-                context_logger.debug(
-                    "Exporting drill files",
-                    component="CIRCUIT",
-                    format=drill_format,
-                )
-
-                drill_files = cli.export_drill(
-                    pcb_file=pcb_file,
-                    output_dir=output_path,
-                    format=drill_format,
-                    units="mm",
-                )
-
             return {
                 "success": True,
                 "gerber_files": gerber_files,
                 "drill_files": drill_files,
                 "project_path": project_path,
                 "output_dir": output_path,
+                "timing": report.to_dict(),
             }
 
         except Exception as e:
@@ -1229,7 +1199,7 @@ class Circuit:
             )
             return {"success": False, "error": error_msg}
 
-    def simulate(self):
+    def simulate(self, backend: str = "ngspice"):
         """
         Create a simulator instance for this circuit.
 
@@ -1237,6 +1207,10 @@ class Circuit:
         PySpice as the backend. The returned simulator object can be used to
         run various analyses such as DC operating point, transient, and AC.
 
+        Args:
+            backend: "ngspice" (default) or "mna" for the built-in linear
+                    solver (operating point and AC only, no ngspice needed)
+
         Returns:
             CircuitSimulator: Simulator object for running analyses
 
@@ -1264,8 +1238,9 @@ class Circuit:
             "Creating simulator for circuit",
             component="CIRCUIT",
             circuit_name=self.name,
+            backend=backend,
         )
-        return CircuitSimulator(self)
+        return CircuitSimulator(self, backend=backend)
 
     def simulator(self):
         """
@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional
 
 from .exception import CircuitSynthError
 from .json_encoder import CircuitSynthJSONEncoder
+from .netlist_ir import NetlistIR
+from .netlist_snapshot import write_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -18,24 +20,14 @@ def convert_json_to_netlist(json_file_path, output_path):
     """Python implementation for netlist conversion."""
     try:
         # Import the Python netlist exporter
-        from pathlib import Path
-
-        from ..kicad.netlist_exporter import generate_netlist
-
-        # Ensure output directory exists
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        from ..kicad.netlist_exporter import write_netlist_file
 
         # Read the JSON file
         with open(json_file_path, "r") as f:
             circuit_data = json.load(f)
 
-        # Generate KiCad netlist using Python implementation
-        netlist_content = generate_netlist(circuit_data)
-
-        # Write to output file
-        with open(output_path, "w") as f:
-            f.write(netlist_content)
+        # Build the netlist first and replace the output only on success
+        write_netlist_file(circuit_data, output_path)
 
         logger.info(
             "Successfully generated KiCad netlist at %s",
@@ -113,14 +105,28 @@ class NetlistExporter:
     - Data transformation (to_dict, to_flattened_list)
     """
 
-    def __init__(self, circuit):
+    def __init__(self, circuit, ir: Optional[NetlistIR] = None):
         """
         Initialize the exporter with a circuit reference.
 
         Args:
             circuit: The Circuit object to export
+            ir: Prebuilt netlist IR for the circuit, if one is at hand
         """
         self.circuit = circuit
+        self._ir = ir
+
+    @property
+    def ir(self) -> NetlistIR:
+        """
+        Netlist IR for the circuit, built on first use.
+
+        Every export renders this IR, so exporting several formats walks the
+        circuit hierarchy once.
+        """
+        if self._ir is None:
+            self._ir = NetlistIR.from_circuit(self.circuit)
+        return self._ir
 
     def generate_text_netlist(self) -> str:
         """
@@ -205,93 +211,21 @@ class NetlistExporter:
         (like netlist exporters) and aligns semantically with how components
         are uniquely identified in a schematic. This is the standardized format
         for the library's intermediate JSON representation.
-        """
 
+        The dictionary is rendered from the exporter's netlist IR.
+        """
         logger.debug(f"Starting to_dict() for circuit: {self.circuit.name}")
-        logger.debug(
-            f"Circuit has {len(self.circuit._components)} components and {len(self.circuit._nets)} nets"
-        )
-
-        # TODO: Implement UUID generation and source file tracking later
-        # For now, use placeholders similar to the initial exporter output
-        sheet_tstamps = f"/{self.circuit.name.lower().replace(' ', '-')}-{id(self.circuit)}/"  # Simple placeholder tstamp
-        source_file = f"{self.circuit.name}.kicad_sch"  # Placeholder source file name
-
-        data = {
-            "name": self.circuit.name,
-            "description": self.circuit.description or "",
-            "tstamps": sheet_tstamps,  # Add sheet timestamp placeholder
-            "source_file": source_file,  # Add source file placeholder
-            "components": {},  # Standardized: Dictionary keyed by component reference
-            "nets": {},
-            "subcircuits": [],
-            "annotations": [],  # Add annotations to JSON data
-        }
-
-        # 1) Collect all components
-        for comp in self.circuit._components.values():
-            comp_dict = comp.to_dict()
-            data["components"][comp.ref] = comp_dict  # Add using ref as key
-
-        # 2) Gather net usage only from our local components
-        #    (including any net that actually comes from a parent)
-        net_to_pins = {}
-        for comp in self.circuit._components.values():
-            for pin_id, pin_obj in comp._pins.items():
-                net_obj = pin_obj.net
-                if net_obj is None:
-                    continue
-
-                net_name = net_obj.name
-
-                if net_name not in net_to_pins:
-                    net_to_pins[net_name] = []
-
-                # Store full pin details in original Python format
-                pin_connection = {
-                    "component": comp.ref,
-                    "pin": {
-                        "number": pin_obj.num,  # Keep "number" for consistency
-                        "name": pin_obj.name,
-                        "type": pin_obj.func,  # Use original "type" field name
-                    },
-                }
-                net_to_pins[net_name].append(pin_connection)
-
-        # Store them in data["nets"] - include both nodes and Net properties
-        for net_name, pin_list in net_to_pins.items():
-            # Find the Net object to include its metadata
-            net_obj = self.circuit._nets.get(net_name)
-            if net_obj:
-                # Include Net properties along with nodes
-                data["nets"][net_name] = {
-                    "nodes": pin_list,  # Changed from "connections" to "nodes" for KiCad compatibility
-                    "is_power": net_obj.is_power,
-                    "power_symbol": net_obj.power_symbol,
-                    "trace_current": net_obj.trace_current,
-                    "impedance": net_obj.impedance,
-                    "properties": net_obj.properties,
-                }
-            else:
-                # Fallback: just nodes as direct list (for backward compatibility)
-                data["nets"][net_name] = pin_list
-
-        # 3) Recursively gather subcircuits
-        for sc in self.circuit._subcircuits:
-            exporter = NetlistExporter(sc)
-            subcircuit_data = exporter.to_dict()
-            data["subcircuits"].append(subcircuit_data)
-
-        # 4) Add annotations to JSON data
-        for annotation in self.circuit._annotations:
-            data["annotations"].append(annotation.to_dict())
+        return self.ir.to_dict()
 
-        return data
-
-    def generate_json_netlist(self, filename: str) -> None:
+    def generate_json_netlist(self, filename: str, snapshot: bool = False) -> None:
         """
         Generate a JSON representation of this circuit and its hierarchy,
         then write it out to 'filename'.
+
+        Args:
+            filename: Output path of the JSON netlist.
+            snapshot: Also write the binary ``.csnap`` sibling that lets
+                readers load single subcircuits (see ``netlist_snapshot``).
         """
         logger.info(
             "NetlistExporter.generate_json_netlist: generating JSON netlist for '%s'",
@@ -307,6 +241,8 @@ class NetlistExporter:
 
             with open(filename, "w", encoding="utf-8") as f:
                 json.dump(circuit_data, f, indent=2, cls=CircuitSynthJSONEncoder)
+            if snapshot:
+                write_snapshot(filename, circuit_data)
             logger.debug(
                 "NetlistExporter.generate_json_netlist: JSON netlist written successfully to '%s'",
                 filename,
@@ -332,85 +268,7 @@ class NetlistExporter:
         nets they are actually connected to. That way, we display all nets used by
         local components, including parent-owned nets.
         """
-        if flattened is None:
-            flattened = []
-
-        circuit_data = {
-            "name": self.circuit.name,
-            "parent": parent_name,
-            "description": self.circuit.description or "",
-            "components": {},
-            "nets": {},
-        }
-
-        # Collect components into a dict keyed by final reference
-        for comp in self.circuit._components.values():
-            circuit_data["components"][comp.ref] = {
-                "symbol": comp.symbol,
-                "value": comp.value,
-                "footprint": comp.footprint,
-            }
-
-        # Build usage-based net info
-        used_nets: Dict[str, List[Dict[str, Any]]] = {}
-
-        for comp in self.circuit._components.values():
-            # IMPORTANT FIX: iterate over pin objects, not pin IDs
-            # if comp._pins is dict-like {pin_id: Pin(...), ...}
-            if hasattr(comp._pins, "values"):
-                # assume it's a dict: pin_id -> Pin
-                for pin_obj in comp._pins.values():
-                    net_obj = pin_obj.net
-                    if net_obj is not None:
-                        net_name = net_obj.name
-                        if net_name not in used_nets:
-                            used_nets[net_name] = (
-                                []
-                            )  # Initialize if first time seeing this net
-                        # Construct the full node dictionary (Structure A)
-                        used_nets[net_name].append(
-                            {
-                                "component": comp.ref,
-                                "pin": {  # Corrected attributes based on Pin class
-                                    "number": str(pin_obj.num),  # Use pin_obj.num
-                                    "name": pin_obj.name or "",
-                                    "type": pin_obj.func
-                                    or "unspecified",  # Use pin_obj.func
-                                },
-                            }
-                        )
-            else:
-                # if comp._pins is a list or something else, handle accordingly
-                for pin_obj in comp._pins:
-                    net_obj = pin_obj.net
-                    if net_obj is not None:
-                        net_name = net_obj.name
-                        # Construct the full node dictionary (Structure A)
-                        used_nets.setdefault(net_name, []).append(
-                            {
-                                "component": comp.ref,
-                                "pin": {  # Corrected attributes based on Pin class
-                                    "number": str(pin_obj.num),  # Use pin_obj.num
-                                    "name": pin_obj.name or "",
-                                    "type": pin_obj.func
-                                    or "unspecified",  # Use pin_obj.func
-                                },
-                            }
-                        )
-
-        circuit_data["nets"] = used_nets
-
-        # Add this circuit's data to flattened
-        flattened.append(circuit_data)
-
-        # Recursively flatten subcircuits
-        for sc in self.circuit._subcircuits:
-            exporter = NetlistExporter(sc)
-            exporter.to_flattened_list(
-                parent_name=self.circuit.name, flattened=flattened
-            )
-
-        return flattened
+        return self.ir.to_flattened_list(parent_name, flattened)
 
     def generate_flattened_json_netlist(self, filename: str) -> None:
         """
@@ -443,10 +301,8 @@ class NetlistExporter:
         """
         Generate a KiCad netlist (.net) file for this circuit and its hierarchy.
 
-        This method first generates the intermediate Circuit Synth JSON representation
-        to a temporary file, then calls the KiCad netlist exporter to convert
-        that temporary JSON file into the final KiCad netlist format at the
-        specified 'filename'.
+        The netlist is streamed straight from the circuit's netlist IR, with
+        enum values rendered as they would appear in the JSON netlist.
 
         Args:
             filename: The path (as a string) where the output KiCad netlist
@@ -457,25 +313,11 @@ class NetlistExporter:
             self.circuit.name,
             filename,
         )
-        circuit_data = self.to_dict()
-        temp_json_file = None
         try:
-            # Create a temporary file to hold JSON format
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False, encoding="utf-8"
-            ) as tf:
-                temp_json_file = tf.name
-                json.dump(circuit_data, tf, indent=2, cls=CircuitSynthJSONEncoder)
-                logger.debug(
-                    "Intermediate JSON written to temporary file: %s", temp_json_file
-                )
-
-            # Ensure the temporary file is closed before passing its path
-            # The 'with' block handles closing.
+            from ..kicad.netlist_exporter import write_netlist_file
 
-            # Convert the temporary JSON to the KiCad netlist
-            output_path = Path(filename)
-            convert_json_to_netlist(str(temp_json_file), str(output_path))
+            # Built before the file is touched; a failure keeps the old netlist
+            write_netlist_file(self.ir.to_dict(plain=True), Path(filename))
             logger.info("KiCad netlist successfully generated at '%s'", filename)
 
         except Exception as e:
@@ -489,16 +331,6 @@ class NetlistExporter:
             raise CircuitSynthError(
                 f"Could not generate KiCad netlist for {self.circuit.name}: {e}"
             )
-        finally:
-            # Ensure the temporary file is always deleted
-            if temp_json_file and os.path.exists(temp_json_file):
-                try:
-                    os.remove(temp_json_file)
-                    logger.debug("Temporary JSON file deleted: %s", temp_json_file)
-                except OSError as e:
-                    logger.error(
-                        "Error deleting temporary JSON file '%s': %s", temp_json_file, e
-                    )
 
     def generate_kicad_project(
         self,
@@ -0,0 +1,872 @@
+"""
+Columnar netlist intermediate representation.
+
+A :class:`NetlistIR` is built from a circuit hierarchy in a single traversal
+and keeps everything the exporters need in flat, integer-indexed columns:
+
+- ``strings`` interns every name, reference, value and pin type once
+- sheets, components, pins and nets are rows of parallel ``array`` columns
+- net membership is a node table grouped by sheet, then net
+
+The hierarchical JSON, flattened JSON, KiCad ``.net``, SPICE and BOM views
+are all rendered from the same IR, so exporting several formats from one
+design walks the hierarchy once. The traversal produces the hierarchical
+dictionary directly and the columns are interned from it on first use, so a
+lone JSON export costs no more than the walk. Hierarchical sheet paths are
+normalized once per sheet while building.
+"""
+
+import logging
+from array import array
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Column value for a field that the source data did not have
+MISSING = -1
+
+# Component fields stored as interned columns, in Component.to_dict order
+_COMPONENT_COLUMNS = ("symbol", "ref", "value", "footprint", "datasheet", "description")
+# Pin and node fields stored as interned columns
+_PIN_COLUMNS = ("pin_id", "name", "func")
+_NODE_PIN_COLUMNS = ("number", "name", "type")
+_NODE_PIN_KEYS = frozenset(_NODE_PIN_COLUMNS)
+# Hierarchy keys rebuilt from the columns; the rest of a sheet is kept as-is
+_SHEET_CHILDREN = ("components", "nets", "subcircuits")
+# Placeholder for a component "pins" entry that is rendered from pin rows
+_PIN_ROWS = object()
+
+
+def _int_column() -> array:
+    return array("i")
+
+
+class StringTable:
+    """
+    Interned values addressed by integer id.
+
+    Equal values share one id, so columns can hold small integers instead of
+    repeated strings. Values are keyed by type as well so ``1``, ``1.0`` and
+    ``True`` stay distinct. Enum members (pin types) are interned too;
+    other unhashable values get a fresh id each time.
+    """
+
+    __slots__ = ("values", "_strings", "_others")
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._strings: Dict[str, int] = {}
+        self._others: Dict[Tuple[type, Any], int] = {}
+
+    def intern(self, value: Any) -> int:
+        """Return the id of ``value``, adding it on first use."""
+        if type(value) is str:
+            found = self._strings.get(value)
+            if found is None:
+                found = self._strings[value] = len(self.values)
+                self.values.append(value)
+            return found
+        try:
+            # Enum members are singletons; key them by name since some
+            # (PinType) override equality and are not hashable
+            key = (type(value), value.name if isinstance(value, Enum) else value)
+            found = self._others.get(key)
+        except TypeError:
+            key, found = None, None
+        if found is not None:
+            return found
+        index = len(self.values)
+        self.values.append(value)
+        if key is not None:
+            self._others[key] = index
+        return index
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class NetlistIR:
+    """
+    Flat, integer-indexed netlist for a circuit hierarchy.
+
+    Sheets are stored depth first, so a sheet's own components occupy one
+    contiguous row range and its subcircuits follow it. Every ``*_start`` /
+    ``*_count`` pair addresses a contiguous range of another table. Columns
+    named after fields hold :class:`StringTable` ids, or :data:`MISSING` when
+    a dictionary source omitted the field.
+
+    Views share nested field values (component properties, pin geometry)
+    with the IR; copy them before mutating.
+
+    An IR from :meth:`from_circuit` holds the walked dictionary until a
+    column is first read; ``to_dict()`` is answered from it without
+    building the columns.
+    """
+
+    strings: StringTable = field(default_factory=StringTable)
+
+    # Sheets (one per circuit), depth first
+    sheet_name: array = field(default_factory=_int_column)
+    sheet_parent: array = field(default_factory=_int_column)
+    sheet_path: array = field(default_factory=_int_column)
+    sheet_component_start: array = field(default_factory=_int_column)
+    sheet_component_count: array = field(default_factory=_int_column)
+    sheet_net_start: array = field(default_factory=_int_column)
+    sheet_net_count: array = field(default_factory=_int_column)
+    # Remaining sheet keys; "components"/"nets"/"subcircuits" hold None
+    # placeholders so views keep the source key order
+    sheet_fields: List[Dict[str, Any]] = field(default_factory=list)
+
+    # Components
+    component_sheet: array = field(default_factory=_int_column)
+    component_key: array = field(default_factory=_int_column)
+    component_columns: Dict[str, array] = field(
+        default_factory=lambda: {name: array("i") for name in _COMPONENT_COLUMNS}
+    )
+    component_pin_start: array = field(default_factory=_int_column)
+    component_pin_count: array = field(default_factory=_int_column)
+    # Remaining component keys; "pins" holds a placeholder when the pins
+    # are stored as pin rows
+    component_fields: List[Dict[str, Any]] = field(default_factory=list)
+    # Component attributes that Component.to_dict normalized (a None
+    # footprint becomes ""), as the flattened view reports them
+    component_attrs: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    # Render pins sorted by number as Component.to_dict does; IRs built from
+    # dictionaries keep the source order
+    sort_pins: bool = False
+
+    # Pins, in symbol order within each component
+    pin_component: array = field(default_factory=_int_column)
+    pin_columns: Dict[str, array] = field(
+        default_factory=lambda: {name: array("i") for name in _PIN_COLUMNS}
+    )
+    pin_net: array = field(default_factory=_int_column)
+    pin_fields: List[Dict[str, Any]] = field(default_factory=list)
+
+    # Nets, in first-seen order
+    net_name: array = field(default_factory=_int_column)
+    net_index: Dict[str, int] = field(default_factory=dict)
+
+    # Nets used by each sheet's components: (sheet, net) rows
+    sheet_net_net: array = field(default_factory=_int_column)
+    sheet_net_node_start: array = field(default_factory=_int_column)
+    sheet_net_node_count: array = field(default_factory=_int_column)
+    # Net properties, or None where the sheet lists the net as bare nodes
+    sheet_net_fields: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+
+    # Net membership
+    node_component: array = field(default_factory=_int_column)
+    node_ref: array = field(default_factory=_int_column)
+    node_pin: array = field(default_factory=_int_column)
+    node_columns: Dict[str, array] = field(
+        default_factory=lambda: {name: array("i") for name in _NODE_PIN_COLUMNS}
+    )
+    # Connections that are not plain {"component", "pin"} nodes, kept verbatim
+    node_raw: Dict[int, Any] = field(default_factory=dict)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_circuit(cls, circuit) -> "NetlistIR":
+        """
+        Build the IR from a Circuit and its subcircuits in one traversal.
+
+        Args:
+            circuit: Root Circuit object
+
+        Returns:
+            NetlistIR for the whole hierarchy
+        """
+        component_attrs: Dict[int, Dict[str, Any]] = {}
+        pin_orders: List[List[Any]] = []
+        data = _circuit_dict(circuit, component_attrs, pin_orders)
+        ir = cls.__new__(cls)
+        ir._pending = (data, component_attrs, pin_orders)
+        logger.debug(
+            "Walked netlist for '%s': %d components",
+            circuit.name,
+            len(pin_orders),
+        )
+        return ir
+
+    @classmethod
+    def from_dict(cls, circuit_data: Dict[str, Any]) -> "NetlistIR":
+        """
+        Build the IR from hierarchical circuit JSON data.
+
+        Accepts the format written by ``Circuit.generate_json_netlist``,
+        including nets given as bare node lists or with a legacy
+        ``"connections"`` key.
+
+        Args:
+            circuit_data: Root circuit dictionary
+
+        Returns:
+            NetlistIR for the whole hierarchy
+        """
+        ir = cls()
+        ir._add_hierarchy(circuit_data)
+        return ir
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes the instance lacks: the columns of an
+        # IR from from_circuit that have not been built yet
+        pending = self.__dict__.pop("_pending", None)
+        if pending is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        data, component_attrs, pin_orders = pending
+        self.__init__(component_attrs=component_attrs, sort_pins=True)
+        self._add_hierarchy(data, pin_orders)
+        logger.debug(
+            "Built netlist IR for '%s': %d sheets, %d components, %d pins, %d nets",
+            data["name"],
+            len(self.sheet_name),
+            len(self.component_sheet),
+            len(self.pin_component),
+            len(self.net_name),
+        )
+        return getattr(self, name)
+
+    def _add_hierarchy(
+        self, circuit_data: Dict[str, Any], pin_orders: Optional[List] = None
+    ) -> None:
+        stack = [(circuit_data, MISSING)]
+        while stack:
+            data, parent = stack.pop()
+            sheet = self._add_sheet_dict(data, parent, pin_orders)
+            subcircuits = data.get("subcircuits") or []
+            stack.extend((sub, sheet) for sub in reversed(subcircuits))
+
+    def _net(self, name: str) -> int:
+        index = self.net_index.get(name)
+        if index is None:
+            index = self.net_index[name] = len(self.net_name)
+            self.net_name.append(self.strings.intern(name))
+        return index
+
+    def _intern_or_missing(self, data: Dict[str, Any], key: str) -> int:
+        return self.strings.intern(data[key]) if key in data else MISSING
+
+    def _add_sheet(self, name: Any, parent: int, fields: Dict[str, Any]) -> int:
+        sheet = len(self.sheet_name)
+        if parent == MISSING:
+            path = "/"
+        else:
+            label = name if isinstance(name, str) and name else "UnnamedSheet"
+            path = f"{self.strings[self.sheet_path[parent]]}{label}/"
+        self.sheet_name.append(MISSING if name is None else self.strings.intern(name))
+        self.sheet_parent.append(parent)
+        self.sheet_path.append(self.strings.intern(path))
+        self.sheet_component_start.append(len(self.component_sheet))
+        self.sheet_component_count.append(0)
+        self.sheet_net_start.append(len(self.sheet_net_net))
+        self.sheet_net_count.append(0)
+        self.sheet_fields.append(fields)
+        return sheet
+
+    def _add_component(
+        self,
+        sheet: int,
+        key: str,
+        data: Dict[str, Any],
+        pins: Optional[Iterable[Dict[str, Any]]],
+    ) -> Dict[Any, int]:
+        """
+        Add a component row and its pin rows; returns pin number -> pin row.
+
+        With ``pins`` None, a "pins" entry in ``data`` is kept verbatim.
+        """
+        row = len(self.component_sheet)
+        strings = self.strings
+        self.component_sheet.append(sheet)
+        self.component_key.append(strings.intern(key))
+        columns = self.component_columns
+        fields = {}
+        for k, v in data.items():
+            column = columns.get(k)
+            if column is None:
+                fields[k] = _PIN_ROWS if k == "pins" and pins is not None else v
+        for name, column in columns.items():
+            column.append(strings.intern(data[name]) if name in data else MISSING)
+        self.component_fields.append(fields)
+        self.sheet_component_count[sheet] += 1
+
+        pin_rows: Dict[Any, int] = {}
+        pin_columns = self.pin_columns
+        intern = strings.intern
+        self.component_pin_start.append(len(self.pin_component))
+        for pin in pins or ():
+            pin_row = len(self.pin_component)
+            self.pin_component.append(row)
+            for name, column in pin_columns.items():
+                column.append(intern(pin[name]) if name in pin else MISSING)
+            self.pin_net.append(MISSING)
+            self.pin_fields.append(
+                {k: v for k, v in pin.items() if k not in pin_columns}
+            )
+            if "pin_id" in pin:
+                pin_rows.setdefault(str(pin["pin_id"]), pin_row)
+        self.component_pin_count.append(
+            len(self.pin_component) - self.component_pin_start[row]
+        )
+        return pin_rows
+
+    def _add_sheet_net(
+        self, sheet: int, net: int, fields: Optional[Dict[str, Any]]
+    ) -> int:
+        row = len(self.sheet_net_net)
+        self.sheet_net_net.append(net)
+        self.sheet_net_node_start.append(len(self.node_ref))
+        self.sheet_net_node_count.append(0)
+        self.sheet_net_fields.append(fields)
+        self.sheet_net_count[sheet] += 1
+        return row
+
+    def _add_node(
+        self, sheet_net: int, ref: int, component: int, pin: int, values: Sequence[int]
+    ) -> int:
+        row = len(self.node_ref)
+        self.node_ref.append(ref)
+        self.node_component.append(component)
+        self.node_pin.append(pin)
+        for column, value in zip(self.node_columns.values(), values):
+            column.append(value)
+        self.sheet_net_node_count[sheet_net] += 1
+        return row
+
+    def _add_sheet_dict(
+        self, data: Dict[str, Any], parent: int, pin_orders: Optional[List] = None
+    ) -> int:
+        """
+        Add one sheet of circuit JSON; returns the sheet row.
+
+        ``pin_orders`` gives each component row's pin numbers in symbol
+        order, for dictionaries whose pins were sorted by number.
+        """
+        strings = self.strings
+        sheet = self._add_sheet(
+            data.get("name"),
+            parent,
+            {
+                k: (None if k in _SHEET_CHILDREN else v)
+                for k, v in data.items()
+                if k != "name"
+            },
+        )
+
+        components: Dict[str, Tuple[int, Dict[Any, int]]] = {}
+        for key, comp in (data.get("components") or {}).items():
+            if not isinstance(comp, dict):
+                continue
+            pins = comp.get("pins")
+            if not (
+                isinstance(pins, list) and all(isinstance(pin, dict) for pin in pins)
+            ):
+                # Anything but a list of pin dicts is kept as it is
+                pins = None
+            elif pin_orders is not None:
+                by_number = {pin["pin_id"]: pin for pin in pins}
+                pins = map(by_number.get, pin_orders[len(self.component_sheet)])
+            pin_rows = self._add_component(sheet, key, comp, pins)
+            components[key] = (len(self.component_sheet) - 1, pin_rows)
+
+        for net_name, net_data in (data.get("nets") or {}).items():
+            if isinstance(net_data, dict):
+                node_key = "nodes" if "nodes" in net_data else "connections"
+                nodes = net_data.get(node_key) or []
+                fields = {k: v for k, v in net_data.items() if k != node_key}
+            else:
+                nodes, fields = net_data or [], None
+            net_row = self._net(net_name)
+            sheet_net = self._add_sheet_net(sheet, net_row, fields)
+
+            for node in nodes:
+                if not isinstance(node, dict) or "component" not in node:
+                    row = self._add_node(
+                        sheet_net, MISSING, MISSING, MISSING, (MISSING,) * 3
+                    )
+                    self.node_raw[row] = node
+                    continue
+                ref = node["component"]
+                row, pin_rows = components.get(ref, (MISSING, {}))
+                pin = node.get("pin")
+                plain = (
+                    isinstance(pin, dict)
+                    and node.keys() == {"component", "pin"}
+                    and pin.keys() <= _NODE_PIN_KEYS
+                )
+                pin_row = MISSING
+                if isinstance(pin, dict) and "number" in pin:
+                    pin_row = pin_rows.get(str(pin["number"]), MISSING)
+                    if pin_row != MISSING:
+                        self.pin_net[pin_row] = net_row
+                values = (
+                    tuple(self._intern_or_missing(pin, k) for k in _NODE_PIN_COLUMNS)
+                    if plain
+                    else (MISSING,) * 3
+                )
+                node_row = self._add_node(
+                    sheet_net, strings.intern(ref), row, pin_row, values
+                )
+                if not plain:
+                    self.node_raw[node_row] = node
+        return sheet
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    @property
+    def sheet_count(self) -> int:
+        return len(self.sheet_name)
+
+    @property
+    def component_count(self) -> int:
+        return len(self.component_sheet)
+
+    @property
+    def net_count(self) -> int:
+        return len(self.net_name)
+
+    def _value(self, index: int, plain: bool = False) -> Any:
+        """Interned value for a column entry; None for MISSING."""
+        if index == MISSING:
+            return None
+        value = self.strings[index]
+        if plain and isinstance(value, Enum):
+            return value.value
+        return value
+
+    def _children(self) -> List[List[int]]:
+        children: List[List[int]] = [[] for _ in self.sheet_name]
+        for sheet, parent in enumerate(self.sheet_parent):
+            if parent != MISSING:
+                children[parent].append(sheet)
+        return children
+
+    def _fill(
+        self, data: Dict[str, Any], columns: Dict[str, array], row: int, plain: bool
+    ) -> None:
+        """Copy one row of interned columns into ``data``, skipping MISSING."""
+        values = self.strings.values
+        for name, column in columns.items():
+            index = column[row]
+            if index != MISSING:
+                value = values[index]
+                if plain and isinstance(value, Enum):
+                    value = value.value
+                data[name] = value
+
+    def sheet_label(self, sheet: int) -> Any:
+        """Name of a sheet, or None if its source had no name."""
+        return self._value(self.sheet_name[sheet])
+
+    def _sheet_head(self, sheet: int) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        if self.sheet_name[sheet] != MISSING:
+            data["name"] = self.strings[self.sheet_name[sheet]]
+        data.update(self.sheet_fields[sheet])
+        return data
+
+    def component_ref(self, row: int) -> str:
+        """Reference (dictionary key) of a component row."""
+        return self.strings[self.component_key[row]]
+
+    def component_dict(self, row: int, plain: bool = False) -> Dict[str, Any]:
+        """
+        Render one component in ``Component.to_dict`` format.
+
+        Args:
+            row: Component row
+            plain: Replace enum values with their JSON values
+
+        Returns:
+            Component dictionary
+        """
+        data: Dict[str, Any] = {}
+        self._fill(data, self.component_columns, row, plain)
+        fields = self.component_fields[row]
+        data.update(fields)
+        if fields.get("pins") is _PIN_ROWS:
+            start = self.component_pin_start[row]
+            pins = [
+                self._pin_dict(pin, plain)
+                for pin in range(start, start + self.component_pin_count[row])
+            ]
+            if self.sort_pins:
+                pins.sort(key=lambda pin: _pin_sort_key(pin.get("pin_id")))
+            data["pins"] = pins
+        return data
+
+    def _pin_dict(self, row: int, plain: bool) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        self._fill(data, self.pin_columns, row, plain)
+        data.update(self.pin_fields[row])
+        return data
+
+    def _node_dict(self, row: int, ref: Any, plain: bool) -> Any:
+        if row in self.node_raw:
+            raw = self.node_raw[row]
+            if isinstance(raw, dict) and "component" in raw:
+                raw = dict(raw)
+                raw["component"] = ref
+            return raw
+        pin: Dict[str, Any] = {}
+        self._fill(pin, self.node_columns, row, plain)
+        return {"component": ref, "pin": pin}
+
+    def _sheet_nets(self, sheet: int, plain: bool) -> Dict[str, Any]:
+        strings = self.strings
+        nets: Dict[str, Any] = {}
+        start = self.sheet_net_start[sheet]
+        for sheet_net in range(start, start + self.sheet_net_count[sheet]):
+            node_start = self.sheet_net_node_start[sheet_net]
+            nodes = [
+                self._node_dict(node, self._value(self.node_ref[node]), plain)
+                for node in range(
+                    node_start, node_start + self.sheet_net_node_count[sheet_net]
+                )
+            ]
+            fields = self.sheet_net_fields[sheet_net]
+            name = strings[self.net_name[self.sheet_net_net[sheet_net]]]
+            if fields is None:
+                nets[name] = nodes
+            else:
+                nets[name] = {"nodes": nodes, **fields}
+        return nets
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+    def to_dict(self, plain: bool = False) -> Dict[str, Any]:
+        """
+        Render the hierarchical circuit dictionary.
+
+        This is the canonical circuit JSON format: components keyed by
+        reference, nets listing the nodes of each sheet's own components,
+        and subcircuits nested in order.
+
+        Args:
+            plain: Replace enum values (pin types) with their JSON values, as
+                   a JSON round trip would
+
+        Returns:
+            Root circuit dictionary
+        """
+        pending = self.__dict__.get("_pending")
+        if pending is not None and not plain:
+            return _copy_sheet(pending[0])
+        if not self.sheet_name:
+            return {}
+        children = self._children()
+        rendered: Dict[int, Dict[str, Any]] = {}
+        # Children follow their parent, so build in reverse
+        for sheet in range(len(self.sheet_name) - 1, -1, -1):
+            data = self._sheet_head(sheet)
+            if "components" in data or self.sheet_component_count[sheet]:
+                start = self.sheet_component_start[sheet]
+                data["components"] = {
+                    self.component_ref(row): self.component_dict(row, plain)
+                    for row in range(start, start + self.sheet_component_count[sheet])
+                }
+            if "nets" in data or self.sheet_net_count[sheet]:
+                data["nets"] = self._sheet_nets(sheet, plain)
+            if "subcircuits" in data or children[sheet]:
+                data["subcircuits"] = [rendered.pop(c) for c in children[sheet]]
+            rendered[sheet] = data
+        return rendered[0]
+
+    def to_flattened_list(
+        self, parent_name: Optional[str] = None, flattened: Optional[List] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Render one summary entry per sheet, depth first.
+
+        Each entry has the sheet ``name``, ``parent`` name, ``description``,
+        a ``components`` dict of symbol/value/footprint and ``nets`` mapping
+        net names to the nodes of the sheet's components.
+
+        Args:
+            parent_name: Parent name recorded for the root sheet
+            flattened: Existing list to append to
+
+        Returns:
+            The list of sheet entries
+        """
+        if flattened is None:
+            flattened = []
+        strings = self.strings
+        columns = self.component_columns
+        numbers, names, types = self.node_columns.values()
+        for sheet in range(len(self.sheet_name)):
+            parent = self.sheet_parent[sheet]
+            start = self.sheet_component_start[sheet]
+            components = {}
+            for row in range(start, start + self.sheet_component_count[sheet]):
+                attrs = self.component_attrs.get(row, {})
+                components[self.component_ref(row)] = {
+                    key: (
+                        attrs[key] if key in attrs else self._value(columns[key][row])
+                    )
+                    for key in ("symbol", "value", "footprint")
+                }
+            nets: Dict[str, List[Dict[str, Any]]] = {}
+            net_start = self.sheet_net_start[sheet]
+            for sheet_net in range(net_start, net_start + self.sheet_net_count[sheet]):
+                node_start = self.sheet_net_node_start[sheet_net]
+                node_stop = node_start + self.sheet_net_node_count[sheet_net]
+                nets[strings[self.net_name[self.sheet_net_net[sheet_net]]]] = [
+                    {
+                        "component": strings[self.node_ref[node]],
+                        "pin": {
+                            "number": str(self._value(numbers[node])),
+                            "name": self._value(names[node]) or "",
+                            "type": self._value(types[node]) or "unspecified",
+                        },
+                    }
+                    for node in range(node_start, node_stop)
+                ]
+            flattened.append(
+                {
+                    "name": self.sheet_label(sheet),
+                    "parent": (
+                        parent_name if parent == MISSING else self.sheet_label(parent)
+                    ),
+                    "description": self.sheet_fields[sheet].get("description") or "",
+                    "components": components,
+                    "nets": nets,
+                }
+            )
+        return flattened
+
+    def flatten(self, prefix_refs: bool = False, plain: bool = False) -> Dict[str, Any]:
+        """
+        Render the whole hierarchy as a single sheet.
+
+        The root sheet's own keys are kept; ``components`` holds every
+        component, ``nets`` merges each net's nodes across sheets (nets that
+        no component uses are listed empty) and ``subcircuits`` is empty.
+
+        Args:
+            prefix_refs: Key components in subcircuits by their sheet path,
+                         e.g. ``"power_reg_U1"``, instead of the bare reference
+            plain: Replace enum values with their JSON values
+
+        Returns:
+            Flattened circuit dictionary
+        """
+        if not self.sheet_name:
+            return {"components": {}, "nets": {}, "subcircuits": []}
+        strings = self.strings
+        prefixes = [
+            strings[path][1:].replace("/", "_") if prefix_refs else ""
+            for path in self.sheet_path
+        ]
+
+        components: Dict[str, Dict[str, Any]] = {}
+        for row, sheet in enumerate(self.component_sheet):
+            ref = self.component_ref(row)
+            data = self.component_dict(row, plain)
+            data["ref"] = ref
+            components[prefixes[sheet] + ref] = data
+
+        nets: Dict[str, List[Any]] = {strings[name]: [] for name in self.net_name}
+        for sheet in range(len(self.sheet_name)):
+            prefix = prefixes[sheet]
+            start = self.sheet_net_start[sheet]
+            for sheet_net in range(start, start + self.sheet_net_count[sheet]):
+                node_start = self.sheet_net_node_start[sheet_net]
+                nodes = nets[strings[self.net_name[self.sheet_net_net[sheet_net]]]]
+                for node in range(
+                    node_start, node_start + self.sheet_net_node_count[sheet_net]
+                ):
+                    ref = self._value(self.node_ref[node])
+                    if ref is not None:
+                        ref = prefix + ref
+                    nodes.append(self._node_dict(node, ref, plain))
+
+        data = self._sheet_head(0)
+        data["components"] = components
+        data["nets"] = nets
+        data["subcircuits"] = []
+        return data
+
+    def pin_nets(self) -> Dict[str, List[Tuple[Any, Any, str]]]:
+        """
+        Connected pins of each component, in symbol pin order.
+
+        Returns:
+            Reference -> [(pin number, pin name, net name)] for components
+            with at least one connected pin
+        """
+        strings = self.strings
+        numbers, names = self.pin_columns["pin_id"], self.pin_columns["name"]
+        result: Dict[str, List[Tuple[Any, Any, str]]] = {}
+        for pin, net in enumerate(self.pin_net):
+            if net == MISSING:
+                continue
+            ref = self.component_ref(self.pin_component[pin])
+            result.setdefault(ref, []).append(
+                (
+                    _or(self._value(numbers[pin]), ""),
+                    _or(self._value(names[pin]), ""),
+                    strings[self.net_name[net]],
+                )
+            )
+        return result
+
+    def bom_rows(
+        self, group_by: Sequence[str] = ("symbol", "value", "footprint")
+    ) -> List[Dict[str, Any]]:
+        """
+        Group components into bill-of-materials lines.
+
+        Grouping compares interned ids, so it costs one pass over the
+        component columns.
+
+        Args:
+            group_by: Component fields that must match to share a line
+
+        Returns:
+            One dict per line with the ``group_by`` fields, ``refs`` in
+            design order and ``quantity``
+        """
+        unknown = set(group_by) - set(self.component_columns)
+        if unknown:
+            raise ValueError(f"Cannot group BOM by unknown fields: {sorted(unknown)}")
+        columns = [self.component_columns[key] for key in group_by]
+        lines: Dict[Tuple[int, ...], List[int]] = {}
+        for row in range(len(self.component_sheet)):
+            lines.setdefault(tuple(c[row] for c in columns), []).append(row)
+        return [
+            {
+                **{
+                    key: _or(self._value(index), "")
+                    for key, index in zip(group_by, key_ids)
+                },
+                "refs": [self.component_ref(row) for row in rows],
+                "quantity": len(rows),
+            }
+            for key_ids, rows in lines.items()
+        ]
+
+
+def _circuit_dict(
+    circuit, component_attrs: Dict[int, Dict[str, Any]], pin_orders: List[List[Any]]
+) -> Dict[str, Any]:
+    """
+    Walk a circuit hierarchy into the hierarchical circuit dictionary.
+
+    Components are keyed by reference and each sheet's nets list the pins of
+    its own components, in first-use order. Also records, per component row,
+    the attributes ``Component.to_dict`` normalized and the symbol pin order.
+    """
+    root: Dict[str, Any] = {}
+    stack = [(circuit, None)]
+    while stack:
+        circ, parent = stack.pop()
+        name = circ.name
+        data = {
+            "name": name,
+            "description": circ.description or "",
+            # Placeholder sheet timestamp and source file until real UUIDs
+            # and source tracking exist
+            "tstamps": f"/{name.lower().replace(' ', '-')}-{id(circ)}/",
+            "source_file": f"{name}.kicad_sch",
+            "components": {},
+            "nets": {},
+            "subcircuits": [],
+            "annotations": [a.to_dict() for a in circ._annotations],
+        }
+        if parent is None:
+            root = data
+        else:
+            parent["subcircuits"].append(data)
+
+        components = data["components"]
+        members: Dict[str, List[Dict[str, Any]]] = {}
+        for comp in circ._components.values():
+            ref = comp.ref
+            attrs = {
+                key: None
+                for key in ("symbol", "value", "footprint")
+                if getattr(comp, key) is None
+            }
+            if attrs:
+                component_attrs[len(pin_orders)] = attrs
+            pin_orders.append(list(comp._pins))
+            components[ref] = comp.to_dict()
+            for pin in comp._pins.values():
+                net = pin.net
+                if net is not None:
+                    members.setdefault(net.name, []).append(
+                        {
+                            "component": ref,
+                            "pin": {
+                                "number": pin.num,
+                                "name": pin.name,
+                                "type": pin.func,
+                            },
+                        }
+                    )
+
+        # Net properties come from this sheet's own Net objects
+        nets = data["nets"]
+        local = circ._nets
+        for net_name, nodes in members.items():
+            net = local.get(net_name)
+            if net is None:
+                nets[net_name] = nodes
+            else:
+                nets[net_name] = {
+                    "nodes": nodes,
+                    "is_power": net.is_power,
+                    "power_symbol": net.power_symbol,
+                    "trace_current": net.trace_current,
+                    "impedance": net.impedance,
+                    "properties": net.properties,
+                }
+        stack.extend((sub, data) for sub in reversed(circ._subcircuits))
+    return root
+
+
+def _copy_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    return {"component": node["component"], "pin": dict(node["pin"])}
+
+
+def _copy_sheet(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a walked sheet down to its pin and node dicts, as a render would."""
+    copy = dict(data)
+    copy["components"] = {
+        ref: {**comp, "pins": [dict(pin) for pin in comp["pins"]]}
+        for ref, comp in data["components"].items()
+    }
+    copy["nets"] = {
+        name: (
+            [_copy_node(node) for node in net]
+            if isinstance(net, list)
+            else {**net, "nodes": [_copy_node(node) for node in net["nodes"]]}
+        )
+        for name, net in data["nets"].items()
+    }
+    copy["subcircuits"] = [_copy_sheet(sub) for sub in data["subcircuits"]]
+    copy["annotations"] = list(data["annotations"])
+    return copy
+
+
+def _or(value: Any, default: Any) -> Any:
+    return default if value is None else value
+
+
+def _pin_sort_key(pin_id: Any) -> float:
+    """Numeric pins in numeric order, then the rest (Component.to_dict order)."""
+    text = str(pin_id)
+    return int(text) if text.isdigit() else float("inf")
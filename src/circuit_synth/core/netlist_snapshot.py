@@ -0,0 +1,306 @@
+"""
+Binary snapshot sibling for circuit JSON netlists.
+
+``Circuit.generate_json_netlist(..., snapshot=True)`` writes ``<project>.csnap``
+next to ``<project>.json``. The snapshot stores every sheet of the hierarchy
+as its own compact JSON blob behind an offset table, so a reader can load one
+subcircuit without parsing the whole design.
+
+File layout (little endian)::
+
+    header   magic "CSNP", u16 version, u16 reserved,
+             32-byte SHA-256 of the JSON file, u32 table length,
+             u32 sheet count
+    table    JSON list with one [name, parent, offset, length, size] entry
+             per sheet in preorder; ``size`` counts the sheet and all of its
+             descendants, so every subtree is one contiguous byte range
+    blobs    per-sheet JSON objects without their "subcircuits" key
+
+The snapshot is only used while the hash in its header matches the JSON file
+next to it; any other writer that rewrites the JSON makes it stale and
+readers fall back to the JSON.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .exception import ParseError
+from .json_encoder import CircuitSynthJSONEncoder
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".csnap"
+
+_MAGIC = b"CSNP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH32sII")
+
+
+@dataclass(frozen=True)
+class SheetEntry:
+    """One row of the snapshot offset table."""
+
+    name: str
+    parent: int
+    offset: int
+    length: int
+    size: int
+
+
+def snapshot_path(json_path: Union[str, Path]) -> Path:
+    """Return the snapshot path that belongs to ``json_path``."""
+    return Path(json_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def _digest_file(path: Path) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def write_snapshot(
+    json_path: Union[str, Path],
+    data: Optional[Dict[str, Any]] = None,
+    digest: Optional[bytes] = None,
+) -> Path:
+    """
+    Write the binary snapshot for an existing circuit JSON file.
+
+    Args:
+        json_path: Path of the ``<project>.json`` the snapshot mirrors.
+        data: Circuit data already written to ``json_path``. Parsed from the
+            file when omitted.
+        digest: SHA-256 of the JSON file bytes. Computed when omitted.
+
+    Returns:
+        Path of the written snapshot.
+    """
+    json_path = Path(json_path)
+    if data is None or digest is None:
+        raw = json_path.read_bytes()
+        digest = hashlib.sha256(raw).digest()
+        if data is None:
+            data = json.loads(raw)
+
+    table = []
+    blobs = []
+    offset = 0
+    # (sheet, parent index) in preorder; sizes are filled in on the way out
+    stack = [(data, -1)]
+    while stack:
+        sheet, parent = stack.pop()
+        children = sheet.get("subcircuits")
+        if isinstance(children, list):
+            own = {k: v for k, v in sheet.items() if k != "subcircuits"}
+        else:
+            own, children = sheet, []
+        blob = json.dumps(
+            own, cls=CircuitSynthJSONEncoder, separators=(",", ":")
+        ).encode("utf-8")
+        table.append([sheet.get("name", ""), parent, offset, len(blob), 1])
+        blobs.append(blob)
+        offset += len(blob)
+        index = len(table) - 1
+        stack.extend((child, index) for child in reversed(children))
+
+    for entry in reversed(table[1:]):
+        table[entry[1]][4] += entry[4]
+
+    table_bytes = json.dumps(table, separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(_MAGIC, _VERSION, 0, digest, len(table_bytes), len(table))
+
+    path = snapshot_path(json_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(table_bytes)
+        f.writelines(blobs)
+    os.replace(tmp_path, path)
+    logger.debug("Wrote netlist snapshot with %d sheets to %s", len(table), path)
+    return path
+
+
+class NetlistSnapshot:
+    """
+    Lazy reader for a netlist snapshot.
+
+    Opening a snapshot reads only its header and offset table; sheet blobs
+    are read and parsed on demand.
+    """
+
+    def __init__(self, path: Path, digest: bytes, sheets: List[SheetEntry], base: int):
+        self.path = path
+        self.digest = digest
+        self.sheets = sheets
+        self._base = base
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "NetlistSnapshot":
+        """
+        Read the header and offset table of a snapshot file.
+
+        Raises:
+            ParseError: If the file is not a snapshot this version can read.
+        """
+        path = Path(path)
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+            if len(head) != _HEADER.size:
+                raise ParseError(f"Truncated netlist snapshot: {path}")
+            magic, version, _, digest, table_length, count = _HEADER.unpack(head)
+            if magic != _MAGIC or version != _VERSION:
+                raise ParseError(f"Unsupported netlist snapshot: {path}")
+            try:
+                table = json.loads(f.read(table_length))
+            except ValueError as e:
+                raise ParseError(f"Corrupt netlist snapshot table in {path}: {e}")
+        if len(table) != count:
+            raise ParseError(f"Corrupt netlist snapshot table in {path}")
+        sheets = [SheetEntry(*entry) for entry in table]
+        return cls(path, digest, sheets, _HEADER.size + table_length)
+
+    def __len__(self) -> int:
+        return len(self.sheets)
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Sheet names in preorder, starting with the root."""
+        return [entry.name for entry in self.sheets]
+
+    def find(self, name: str) -> int:
+        """
+        Return the index of the first sheet named ``name`` in preorder.
+
+        Raises:
+            KeyError: If no sheet has that name.
+        """
+        for index, entry in enumerate(self.sheets):
+            if entry.name == name:
+                return index
+        raise KeyError(f"No subcircuit named '{name}' in {self.path}")
+
+    def children(self, index: int) -> List[int]:
+        """Return the indices of the direct subcircuits of sheet ``index``."""
+        end = index + self.sheets[index].size
+        result = []
+        child = index + 1
+        while child < end:
+            result.append(child)
+            child += self.sheets[child].size
+        return result
+
+    def load_sheet(
+        self, sheet: Union[int, str] = 0, include_children: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Load one sheet, optionally with all of its subcircuits.
+
+        Args:
+            sheet: Sheet index or name. Defaults to the root sheet.
+            include_children: Attach the nested ``"subcircuits"`` list as in
+                the JSON file. When False, only the sheet's own components
+                and nets are read and the key is left out.
+
+        Returns:
+            The sheet as it appears in the circuit JSON.
+        """
+        index = self.find(sheet) if isinstance(sheet, str) else sheet
+        first = self.sheets[index]
+        count = first.size if include_children else 1
+        entries = self.sheets[index : index + count]
+        last = entries[-1]
+
+        # A subtree is contiguous in preorder, so it is a single read
+        with open(self.path, "rb") as f:
+            f.seek(self._base + first.offset)
+            chunk = f.read(last.offset + last.length - first.offset)
+
+        loaded = []
+        for entry in entries:
+            start = entry.offset - first.offset
+            loaded.append(json.loads(chunk[start : start + entry.length]))
+        if not include_children:
+            return loaded[0]
+
+        for data in loaded:
+            data.setdefault("subcircuits", [])
+        for position in range(1, count):
+            parent = entries[position].parent - index
+            loaded[parent]["subcircuits"].append(loaded[position])
+        return loaded[0]
+
+    def load(self) -> Dict[str, Any]:
+        """Load the full hierarchy, equal to parsing the JSON file."""
+        return self.load_sheet(0)
+
+
+def open_snapshot(json_path: Union[str, Path]) -> Optional[NetlistSnapshot]:
+    """
+    Open the snapshot next to ``json_path`` if it is in sync with the JSON.
+
+    Returns:
+        The snapshot, or None when it is missing, unreadable or was written
+        for different JSON content.
+    """
+    json_path = Path(json_path)
+    path = snapshot_path(json_path)
+    if not path.exists() or not json_path.exists():
+        return None
+    try:
+        snapshot = NetlistSnapshot.open(path)
+    except (OSError, ParseError) as e:
+        logger.warning("Ignoring unreadable netlist snapshot %s: %s", path, e)
+        return None
+    if snapshot.digest != _digest_file(json_path):
+        logger.debug("Netlist snapshot %s is stale, using %s", path, json_path)
+        return None
+    return snapshot
+
+
+def load_circuit_json(
+    json_path: Union[str, Path],
+    subcircuit: Optional[str] = None,
+    include_children: bool = True,
+) -> Dict[str, Any]:
+    """
+    Load a circuit JSON netlist, or one sheet of it.
+
+    Uses the snapshot sibling when it is in sync and falls back to parsing
+    the JSON file otherwise; both return the same data.
+
+    Args:
+        json_path: Path of the ``<project>.json`` netlist.
+        subcircuit: Name of the sheet to load. Defaults to the root sheet.
+        include_children: See :meth:`NetlistSnapshot.load_sheet`.
+
+    Raises:
+        KeyError: If ``subcircuit`` is not in the design.
+    """
+    snapshot = open_snapshot(json_path)
+    if snapshot is not None:
+        sheet = 0 if subcircuit is None else subcircuit
+        return snapshot.load_sheet(sheet, include_children)
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    sheet = data
+    if subcircuit is not None:
+        stack = [data]
+        while stack:
+            sheet = stack.pop()
+            if sheet.get("name") == subcircuit:
+                break
+            children = sheet.get("subcircuits")
+            if isinstance(children, list):
+                stack.extend(reversed(children))
+        else:
+            raise KeyError(f"No subcircuit named '{subcircuit}' in {json_path}")
+    if not include_children and isinstance(sheet.get("subcircuits"), list):
+        return {k: v for k, v in sheet.items() if k != "subcircuits"}
+    return sheet
@@ -7,11 +7,19 @@ component-specific failure modes.
 
 import hashlib
 import json
+import logging
 import sqlite3
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def symptom_terms(symptoms: Iterable[str]) -> Set[str]:
+    """Lowercased words of a symptom list, as compared by Jaccard matching"""
+    return {word.lower() for symptom in symptoms for word in symptom.split()}
 
 
 @dataclass
@@ -35,12 +43,8 @@ class DebugPattern:
             return 0.0
 
         # Simple Jaccard similarity
-        pattern_set = set(
-            word.lower() for symptom in self.symptoms for word in symptom.split()
-        )
-        symptom_set = set(
-            word.lower() for symptom in symptoms for word in symptom.split()
-        )
+        pattern_set = symptom_terms(self.symptoms)
+        symptom_set = symptom_terms(symptoms)
 
         intersection = len(pattern_set & symptom_set)
         union = len(pattern_set | symptom_set)
@@ -64,11 +68,21 @@ class ComponentFailure:
 
 
 class DebugKnowledgeBase:
-    """Manages debugging knowledge and historical patterns"""
+    """Manages debugging knowledge and historical patterns
+
+    Pattern symptoms are indexed word by word in ``debug_pattern_terms`` so
+    symptom searches score and rank candidates in SQL, and only the rows
+    that pass the similarity threshold are decoded. Decoded patterns are
+    cached per row version and shared between searches, so treat returned
+    patterns as read-only. When SQLite has FTS5, symptoms and root causes
+    also get a full-text index for ``search_text``.
+    """
 
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or Path("memory-bank/debugging/debug_kb.db")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # pattern_id -> ((rowid, occurrence_count, updated_at), pattern)
+        self._pattern_cache: Dict[str, Tuple[tuple, DebugPattern]] = {}
         self._init_database()
         self._load_default_patterns()
 
@@ -125,10 +139,76 @@ class DebugKnowledgeBase:
             CREATE INDEX IF NOT EXISTS idx_patterns_category ON debug_patterns(category);
             CREATE INDEX IF NOT EXISTS idx_components_type ON component_failures(component_type);
             CREATE INDEX IF NOT EXISTS idx_sessions_board ON debug_sessions(board_name);
+
+            -- Inverted index of lowercased symptom words for search_patterns
+            CREATE TABLE IF NOT EXISTS debug_pattern_terms (
+                term TEXT NOT NULL,
+                pattern_id TEXT NOT NULL,
+                PRIMARY KEY (term, pattern_id)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS debug_pattern_term_counts (
+                pattern_id TEXT PRIMARY KEY,
+                term_count INTEGER NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_pattern_terms_pattern ON debug_pattern_terms(pattern_id);
         """
         )
+
+        try:
+            self.conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS debug_patterns_fts
+                USING fts5(pattern_id UNINDEXED, symptoms, root_cause)
+            """
+            )
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            logger.debug("SQLite FTS5 unavailable, search_text will scan patterns")
+            self.has_fts = False
+
+        self._index_unindexed_patterns()
         self.conn.commit()
 
+    def _index_unindexed_patterns(self):
+        """Index patterns written before the term index existed"""
+        rows = self.conn.execute(
+            """
+            SELECT pattern_id, symptoms, root_cause FROM debug_patterns
+            WHERE pattern_id NOT IN (SELECT pattern_id FROM debug_pattern_term_counts)
+        """
+        ).fetchall()
+        for row in rows:
+            self._index_pattern(
+                row["pattern_id"], json.loads(row["symptoms"]), row["root_cause"]
+            )
+        if rows:
+            logger.debug(f"Indexed {len(rows)} existing debug patterns")
+
+    def _index_pattern(self, pattern_id: str, symptoms: List[str], root_cause: str):
+        """Replace the index rows of one pattern (caller commits)"""
+        terms = symptom_terms(symptoms)
+        self.conn.execute(
+            "DELETE FROM debug_pattern_terms WHERE pattern_id = ?", (pattern_id,)
+        )
+        self.conn.executemany(
+            "INSERT INTO debug_pattern_terms (term, pattern_id) VALUES (?, ?)",
+            [(term, pattern_id) for term in terms],
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO debug_pattern_term_counts VALUES (?, ?)",
+            (pattern_id, len(terms)),
+        )
+        if self.has_fts:
+            self.conn.execute(
+                "DELETE FROM debug_patterns_fts WHERE pattern_id = ?", (pattern_id,)
+            )
+            self.conn.execute(
+                "INSERT INTO debug_patterns_fts VALUES (?, ?, ?)",
+                (pattern_id, " ".join(symptoms), root_cause or ""),
+            )
+
     def _load_default_patterns(self):
         """Load default debugging patterns"""
         default_patterns = [
@@ -271,56 +351,224 @@ class DebugKnowledgeBase:
                     json.dumps(pattern.references) if pattern.references else None,
                 ),
             )
+            self._index_pattern(
+                pattern.pattern_id, pattern.symptoms, pattern.root_cause
+            )
             self.conn.commit()
+            self._pattern_cache.pop(pattern.pattern_id, None)
             return True
         except Exception as e:
+            self.conn.rollback()
             print(f"Error adding pattern: {e}")
             return False
 
+    def _row_to_pattern(self, row: sqlite3.Row) -> DebugPattern:
+        """Decode a debug_patterns row"""
+        return DebugPattern(
+            pattern_id=row["pattern_id"],
+            category=row["category"],
+            symptoms=json.loads(row["symptoms"]),
+            root_cause=row["root_cause"],
+            solutions=json.loads(row["solutions"]),
+            component_types=json.loads(row["component_types"]),
+            occurrence_count=row["occurrence_count"],
+            success_rate=row["success_rate"],
+            typical_measurements=(
+                json.loads(row["typical_measurements"])
+                if row["typical_measurements"]
+                else None
+            ),
+            references=(
+                json.loads(row["reference_docs"]) if row["reference_docs"] else None
+            ),
+        )
+
+    @staticmethod
+    def _row_stamp(row: sqlite3.Row) -> tuple:
+        """Version of a pattern row, used to validate cached patterns"""
+        return (row["rowid"], row["occurrence_count"], row["updated_at"])
+
+    def _load_patterns(self, rows: List[sqlite3.Row]) -> Dict[str, DebugPattern]:
+        """Decoded patterns for the given pattern rows, via the cache
+
+        Each row needs ``rowid``, ``pattern_id``, ``occurrence_count`` and
+        ``updated_at``; only patterns missing from the cache or changed
+        since they were cached are fetched and decoded.
+        """
+        patterns = {}
+        missing = []
+        for row in rows:
+            cached = self._pattern_cache.get(row["pattern_id"])
+            if cached is not None and cached[0] == self._row_stamp(row):
+                patterns[row["pattern_id"]] = cached[1]
+            else:
+                missing.append(row["pattern_id"])
+
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(missing), 500):
+            chunk = missing[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                f"SELECT rowid, * FROM debug_patterns WHERE pattern_id IN ({placeholders})",
+                chunk,
+            )
+            for row in cursor:
+                pattern = self._row_to_pattern(row)
+                self._pattern_cache[pattern.pattern_id] = (
+                    self._row_stamp(row),
+                    pattern,
+                )
+                patterns[pattern.pattern_id] = pattern
+        return patterns
+
     def search_patterns(
         self,
         symptoms: List[str],
         category: Optional[str] = None,
         min_similarity: float = 0.3,
+        limit: Optional[int] = None,
     ) -> List[Tuple[DebugPattern, float]]:
-        """Search for patterns matching given symptoms"""
-        query = "SELECT * FROM debug_patterns"
+        """Search for patterns matching given symptoms
+
+        Similarity is the Jaccard index of the lowercased symptom words.
+        Results are ordered by similarity, then success rate.
+
+        Args:
+            symptoms: Observed symptoms
+            category: Only search patterns in this category
+            min_similarity: Minimum similarity to include a pattern
+            limit: Maximum number of matches to return (all if None)
+
+        Returns:
+            List of (pattern, similarity) tuples, best first
+        """
+        if min_similarity <= 0:
+            # Patterns sharing no words qualify too, so the index can't help
+            return self._scan_patterns(symptoms, category, min_similarity, limit)
+
+        terms = sorted(symptom_terms(symptoms))
+        if not terms:
+            return []
+
+        # Shared-word counts come from the term index; the union size is
+        # |pattern terms| + |query terms| - shared, exactly as in
+        # DebugPattern.matches_symptoms.
+        placeholders = ", ".join("?" * len(terms))
+        query = f"""
+            SELECT p.rowid, p.pattern_id, p.occurrence_count, p.updated_at,
+                   CAST(COUNT(*) AS REAL) / (c.term_count + ? - COUNT(*)) AS similarity
+            FROM debug_pattern_terms t
+            JOIN debug_pattern_term_counts c ON c.pattern_id = t.pattern_id
+            JOIN debug_patterns p ON p.pattern_id = t.pattern_id
+            WHERE t.term IN ({placeholders})
+        """
+        params: List[Any] = [len(terms), *terms]
+
+        if category:
+            query += " AND p.category = ?"
+            params.append(category)
+
+        query += """
+            GROUP BY t.pattern_id
+            HAVING similarity >= ?
+            ORDER BY similarity DESC, p.success_rate DESC, p.rowid
+        """
+        params.append(min_similarity)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        rows = self.conn.execute(query, params).fetchall()
+        patterns = self._load_patterns(rows)
+        return [(patterns[row["pattern_id"]], row["similarity"]) for row in rows]
+
+    def _scan_patterns(
+        self,
+        symptoms: List[str],
+        category: Optional[str],
+        min_similarity: float,
+        limit: Optional[int],
+    ) -> List[Tuple[DebugPattern, float]]:
+        """Score every pattern in Python (used when the index can't prune)"""
+        query = (
+            "SELECT rowid, pattern_id, occurrence_count, updated_at FROM debug_patterns"
+        )
         params = []
 
         if category:
             query += " WHERE category = ?"
             params.append(category)
 
-        cursor = self.conn.execute(query, params)
-        matches = []
-
-        for row in cursor:
-            pattern = DebugPattern(
-                pattern_id=row["pattern_id"],
-                category=row["category"],
-                symptoms=json.loads(row["symptoms"]),
-                root_cause=row["root_cause"],
-                solutions=json.loads(row["solutions"]),
-                component_types=json.loads(row["component_types"]),
-                occurrence_count=row["occurrence_count"],
-                success_rate=row["success_rate"],
-                typical_measurements=(
-                    json.loads(row["typical_measurements"])
-                    if row["typical_measurements"]
-                    else None
-                ),
-                references=(
-                    json.loads(row["reference_docs"]) if row["reference_docs"] else None
-                ),
-            )
+        rows = self.conn.execute(query + " ORDER BY rowid", params).fetchall()
+        patterns = self._load_patterns(rows)
 
+        matches = []
+        for row in rows:
+            pattern = patterns[row["pattern_id"]]
             similarity = pattern.matches_symptoms(symptoms)
             if similarity >= min_similarity:
                 matches.append((pattern, similarity))
 
         # Sort by similarity and success rate
         matches.sort(key=lambda x: (x[1], x[0].success_rate), reverse=True)
-        return matches
+        return matches if limit is None else matches[:limit]
+
+    def search_text(
+        self, text: str, category: Optional[str] = None, limit: int = 10
+    ) -> List[Tuple[DebugPattern, float]]:
+        """Full-text search over pattern symptoms and root causes
+
+        Any word of ``text`` may match. With FTS5 results are ranked by
+        BM25; otherwise by the number of words found.
+
+        Args:
+            text: Free-form description, e.g. "regulator hot"
+            category: Only search patterns in this category
+            limit: Maximum number of matches to return
+
+        Returns:
+            List of (pattern, score) tuples, best first
+        """
+        words = text.split()
+        if not words:
+            return []
+
+        if self.has_fts:
+            match = " OR ".join('"' + word.replace('"', '""') + '"' for word in words)
+            query = """
+                SELECT p.rowid, p.pattern_id, p.occurrence_count, p.updated_at,
+                       -bm25(debug_patterns_fts) AS score
+                FROM debug_patterns_fts f
+                JOIN debug_patterns p ON p.pattern_id = f.pattern_id
+                WHERE debug_patterns_fts MATCH ?
+            """
+            params: List[Any] = [match]
+        else:
+            haystack = "lower(p.symptoms || ' ' || coalesce(p.root_cause, ''))"
+            hits = " + ".join(f"(instr({haystack}, ?) > 0)" for _ in words)
+            query = f"""
+                SELECT * FROM (
+                    SELECT p.rowid, p.pattern_id, p.occurrence_count, p.updated_at,
+                           p.category, {hits} AS score
+                    FROM debug_patterns p
+                ) p WHERE score > 0
+            """
+            params = [word.lower() for word in words]
+
+        if category:
+            query += " AND p.category = ?"
+            params.append(category)
+        query += " ORDER BY score DESC, p.rowid LIMIT ?"
+        params.append(limit)
+
+        try:
+            rows = self.conn.execute(query, params).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Text search failed for {text!r}: {e}")
+            return []
+
+        patterns = self._load_patterns(rows)
+        return [(patterns[row["pattern_id"]], row["score"]) for row in rows]
 
     def add_component_failure(self, failure: ComponentFailure) -> bool:
         """Add known component failure mode"""
@@ -402,7 +650,7 @@ class DebugKnowledgeBase:
 
             # Update pattern statistics if similar pattern exists
             if session_data.get("success") and session_data.get("symptoms"):
-                patterns = self.search_patterns(session_data["symptoms"])
+                patterns = self.search_patterns(session_data["symptoms"], limit=1)
                 if patterns:
                     best_pattern = patterns[0][0]
                     self.conn.execute(
@@ -415,6 +663,7 @@ class DebugKnowledgeBase:
                         (best_pattern.pattern_id,),
                     )
                     self.conn.commit()
+                    self._pattern_cache.pop(best_pattern.pattern_id, None)
 
             return True
         except Exception as e:
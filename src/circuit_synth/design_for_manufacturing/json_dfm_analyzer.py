@@ -143,6 +143,31 @@ class JSONDFMAnalyzer:
             self.has_digikey = False
             logger.warning("DigiKey integration not available")
 
+    def analyze_circuit_file(
+        self,
+        json_path: str,
+        subcircuit: Optional[str] = None,
+        quantities: List[int] = None,
+    ) -> DFMAnalysisResult:
+        """
+        Analyze a circuit JSON file, or one subcircuit of it, for DFM
+
+        Only the requested sheet and its children are loaded when the
+        file has an up-to-date ``.csnap`` snapshot next to it.
+
+        Args:
+            json_path: Path to the hierarchical circuit JSON
+            subcircuit: Name of the subcircuit to analyze (default: root)
+            quantities: List of quantities for pricing (default: [1, 100, 1000])
+
+        Returns:
+            DFMAnalysisResult with all findings
+        """
+        from ..core.netlist_snapshot import load_circuit_json
+
+        circuit_json = load_circuit_json(json_path, subcircuit)
+        return self.analyze_circuit_json(circuit_json, quantities)
+
     def analyze_circuit_json(
         self, circuit_json: Dict[str, Any], quantities: List[int] = None
     ) -> DFMAnalysisResult:
@@ -7,10 +7,12 @@ Python Circuit objects and KiCad schematics.
 """
 
 import logging
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.circuit import Circuit
+from .signature_index import SignatureIndex
 
 logger = logging.getLogger(__name__)
 
@@ -695,38 +697,123 @@ class CircuitMatcher:
             f"with {len(new_indices)} new ones using connectivity"
         )
 
-        # Calculate connectivity scores between all pairs
-        scores: List[Tuple[int, int, float]] = []
-
-        for old_idx in old_indices:
-            for new_idx in new_indices:
-                if new_idx in matched_new_components:
-                    continue  # Skip already matched components
-
-                score = self._calculate_connectivity_score(
-                    old_circuit, new_circuit, old_idx, new_idx
-                )
-                scores.append((old_idx, new_idx, score))
-                self.logger.debug(
-                    f"Connectivity score: old[{old_idx}] <-> new[{new_idx}] = {score:.3f}"
-                )
+        old_pin_nets = {
+            idx: dict(old_circuit.get_component_nets(idx)) for idx in old_indices
+        }
+        new_pin_nets = {
+            idx: dict(new_circuit.get_component_nets(idx))
+            for idx in new_indices
+            if idx not in matched_new_components
+        }
 
-        # Sort by score (highest first) and match greedily
-        scores.sort(key=lambda x: x[2], reverse=True)
+        def assign(old_idx: int, new_idx: int, score: float) -> None:
+            matches[old_idx] = new_idx
+            matched_new_components.add(new_idx)
+            self.logger.debug(
+                f"Matched '{component_type}': old[{old_idx}] -> new[{new_idx}] "
+                f"(score: {score:.3f})"
+            )
 
-        for old_idx, new_idx, score in scores:
-            # Skip if either component is already matched
-            if matches[old_idx] != -1 or new_idx in matched_new_components:
+        # 1. Identical pin->net maps are the only pairs scoring 1.0. Pair them
+        #    in index order, as the greedy pass over sorted scores would.
+        identical = defaultdict(deque)
+        for new_idx, pin_nets in new_pin_nets.items():
+            if pin_nets:
+                identical[frozenset(pin_nets.items())].append(new_idx)
+        for old_idx in old_indices:
+            pin_nets = old_pin_nets[old_idx]
+            bucket = identical.get(frozenset(pin_nets.items())) if pin_nets else None
+            if bucket:
+                assign(old_idx, bucket.popleft(), 1.0)
+
+        # 2. Every other pair goes through one greedy pass over all scores,
+        #    as if all pairs had been scored. A pair's score depends on its
+        #    pin names and on how many pin->net connections it shares.
+        #    Pairs sharing a rare connection are scored one by one; all other
+        #    pairs share only high-fanout connections (such as GND), so they
+        #    are scored per group of equal pin names and high-fanout
+        #    connections instead of per pair.
+        index = SignatureIndex()
+        for new_idx, pin_nets in new_pin_nets.items():
+            if new_idx not in matched_new_components:
+                index.add(new_idx, pin_nets.items())
+
+        def is_common(token) -> bool:
+            return len(index.postings.get(token, ())) > index.max_posting
+
+        # score -> old index -> new indices offered at that score
+        pair_offers: Dict[float, Dict[int, List[int]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        old_groups: Dict[Tuple[frozenset, frozenset], List[int]] = defaultdict(list)
+        for old_idx in old_indices:
+            pin_nets = old_pin_nets[old_idx]
+            if matches[old_idx] != -1 or not pin_nets:
                 continue
-
-            # Only match if score is above threshold
-            if score > 0.0:  # Could adjust threshold if needed
-                matches[old_idx] = new_idx
-                matched_new_components.add(new_idx)
-                self.logger.debug(
-                    f"Matched '{component_type}': old[{old_idx}] -> new[{new_idx}] "
-                    f"(score: {score:.3f})"
+            common = frozenset(t for t in pin_nets.items() if is_common(t))
+            old_groups[frozenset(pin_nets), common].append(old_idx)
+            candidates = set()
+            for token in pin_nets.items():
+                if token not in common:
+                    candidates.update(index.postings.get(token, ()))
+            for new_idx in candidates:
+                score = self._score_pin_nets(pin_nets, new_pin_nets[new_idx])
+                pair_offers[score][old_idx].append(new_idx)
+
+        new_groups: Dict[Tuple[frozenset, frozenset], deque] = defaultdict(deque)
+        for new_idx, pin_nets in new_pin_nets.items():
+            if new_idx in index and pin_nets:
+                common = frozenset(t for t in pin_nets.items() if is_common(t))
+                new_groups[frozenset(pin_nets), common].append(new_idx)
+
+        # A group score is exact for pairs sharing no rare connection. Pairs
+        # that do share one score strictly higher, so they are offered (and
+        # matched, if both are free) before their group's turn comes.
+        group_offers: Dict[float, List[Tuple[List[int], deque]]] = defaultdict(list)
+        for (old_pins, old_common), old_members in old_groups.items():
+            for (new_pins, new_common), new_members in new_groups.items():
+                score = self._pin_match_score(
+                    len(old_pins),
+                    len(new_pins),
+                    len(old_pins & new_pins),
+                    len(old_common & new_common),
                 )
+                if score > 0.0:
+                    group_offers[score].append((old_members, new_members))
+
+        # Within one score, pair in (old, new) index order like a stable
+        # sort over all pairs would
+        old_order = {idx: pos for pos, idx in enumerate(old_indices)}
+        new_order = {idx: pos for pos, idx in enumerate(new_indices)}
+        for score in sorted(set(pair_offers) | set(group_offers), reverse=True):
+            if score <= 0.0:
+                break
+            offers: Dict[int, list] = defaultdict(list)
+            for old_idx, new_list in pair_offers.get(score, {}).items():
+                offers[old_idx].append(new_list)
+            for old_members, new_members in group_offers.get(score, ()):
+                for old_idx in old_members:
+                    offers[old_idx].append(new_members)
+
+            for old_idx in sorted(offers, key=old_order.__getitem__):
+                if matches[old_idx] != -1:
+                    continue
+                best = None
+                for offered in offers[old_idx]:
+                    if isinstance(offered, deque):
+                        # Group members are in index order; drop taken ones
+                        while offered and offered[0] in matched_new_components:
+                            offered.popleft()
+                        free = [offered[0]] if offered else []
+                    else:
+                        free = [
+                            idx for idx in offered if idx not in matched_new_components
+                        ]
+                    for new_idx in free:
+                        if best is None or new_order[new_idx] < new_order[best]:
+                            best = new_idx
+                if best is not None:
+                    assign(old_idx, best, score)
 
     def _calculate_connectivity_score(
         self,
@@ -760,33 +847,64 @@ class CircuitMatcher:
         old_pin_nets = {pin: net for pin, net in old_nets}
         new_pin_nets = {pin: net for pin, net in new_nets}
 
-        # Check if pin counts match
-        if len(old_pin_nets) != len(new_pin_nets):
-            # Different number of pins - penalize but don't disqualify
-            pin_count_penalty = 0.5
-        else:
-            pin_count_penalty = 1.0
+        return self._score_pin_nets(old_pin_nets, new_pin_nets)
+
+    @staticmethod
+    def _score_pin_nets(
+        old_pin_nets: Dict[str, str], new_pin_nets: Dict[str, str]
+    ) -> float:
+        """
+        Score two pin-to-net mappings.
 
-        # Calculate matches based on pin-to-net connections
-        matching_connections = 0
-        total_pins = max(len(old_pin_nets), len(new_pin_nets))
+        Args:
+            old_pin_nets: Pin -> net mapping of the old component
+            new_pin_nets: Pin -> net mapping of the new component
+
+        Returns:
+            Score between 0.0 and 1.0, where 1.0 is a perfect match
+        """
+        if not old_pin_nets or not new_pin_nets:
+            return 0.0
 
-        # Check if the actual net connections match
+        shared_pins = 0
+        equal_nets = 0
         for pin, old_net in old_pin_nets.items():
             if pin in new_pin_nets:
-                new_net = new_pin_nets[pin]
+                shared_pins += 1
                 # Use strict net name matching - exact match only
-                if old_net == new_net:
-                    matching_connections += 1
-                else:
-                    # Different nets on same pin - this is a connection change!
-                    # Give a small score to indicate same pin exists but different net
-                    matching_connections += 0.1
+                if old_net == new_pin_nets[pin]:
+                    equal_nets += 1
 
-        # Calculate final score
-        if total_pins > 0:
-            score = (matching_connections / total_pins) * pin_count_penalty
-        else:
-            score = 0.0
+        return CircuitMatcher._pin_match_score(
+            len(old_pin_nets), len(new_pin_nets), shared_pins, equal_nets
+        )
+
+    @staticmethod
+    def _pin_match_score(
+        old_pins: int, new_pins: int, shared_pins: int, equal_nets: int
+    ) -> float:
+        """
+        Score two components from their pin counts.
+
+        Each shared pin on the same net counts 1, and each shared pin on a
+        different net counts 0.1 (same pin exists, but the connection
+        changed). The sum is divided by the larger pin count and halved when
+        the pin counts differ.
+
+        Args:
+            old_pins: Number of pins of the old component
+            new_pins: Number of pins of the new component
+            shared_pins: Number of pin names both components have
+            equal_nets: Number of shared pins connected to the same net
+
+        Returns:
+            Score between 0.0 and 1.0, where 1.0 is a perfect match
+        """
+        if not old_pins or not new_pins:
+            return 0.0
 
+        # Different number of pins - penalize but don't disqualify
+        pin_count_penalty = 1.0 if old_pins == new_pins else 0.5
+        matching_connections = equal_nets + 0.1 * (shared_pins - equal_nets)
+        score = matching_connections / max(old_pins, new_pins) * pin_count_penalty
         return min(score, 1.0)  # Ensure score doesn't exceed 1.0
@@ -22,9 +22,11 @@ Net Format (Structure A):
     }
 """
 
+import io
 import json
 import logging
 import os
+import re
 import uuid
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -35,6 +37,9 @@ from .sheet_hierarchy_manager import SheetHierarchyManager
 
 logger = logging.getLogger(__name__)
 
+# Patterns rewritten by cleanup_whitespace; used to skip tokens that need no work
+_NEEDS_CLEANUP = re.compile(r" \)|\( |\n\n|symbols/(?:Device|RF_Module)|\(export\n")
+
 
 def normalize_hierarchical_path(path: str, name: str) -> str:
     """
@@ -160,25 +165,7 @@ def convert_json_to_netlist(json_path: Path, output_path: Path) -> None:
     # Load the JSON data
     circuit_data = load_circuit_json(json_path)
 
-    # Generate the netlist content
-    netlist_content = generate_netlist(circuit_data)
-
-    # Ensure consistent line endings (LF only, which is what KiCad expects)
-    netlist_content = netlist_content.replace("\r\n", "\n")
-
-    # Clean up any excess spacing in the file - try to match KiCad's exact format
-    netlist_content = cleanup_whitespace(netlist_content)
-
-    # Ensure parent directory exists
-    from pathlib import Path
-
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to the output file with binary mode to preserve encoding and line endings
-    # No BOM in the UTF-8 encoding to ensure KiCad can read it
-    with open(output_path, "wb") as f:
-        f.write(netlist_content.encode("utf-8"))
+    write_netlist_file(circuit_data, output_path, cleanup=True)
 
     logger.debug(f"Successfully wrote KiCad netlist to {output_path}")
 
@@ -235,7 +222,72 @@ def generate_netlist(circuit_data: Dict[str, Any]) -> str:
     Returns:
         String containing the KiCad netlist content
     """
+    buffer = io.StringIO()
+    write_netlist(circuit_data, buffer)
+    return buffer.getvalue()
+
+
+def write_netlist(
+    circuit_data: Dict[str, Any], out: TextIO, cleanup: bool = False
+) -> None:
+    """
+    Stream a KiCad netlist for Circuit-Synth JSON data to a text handle.
+
+    Args:
+        circuit_data: Dictionary containing the circuit data
+        out: Writable text handle (buffered file or ``io.StringIO``)
+        cleanup: Apply :func:`cleanup_whitespace` fixes while writing
+    """
+    netlist = build_netlist_expr(circuit_data)
+
+    # Format the netlist as an S-expression with KiCad's exact structure
+    logger.debug("Writing final S-expression...")
+    SExpressionWriter(out, cleanup=cleanup).write(netlist)
+    logger.debug("...S-expression writing complete.")
+
+
+def write_netlist_file(
+    circuit_data: Dict[str, Any], output_path: Path, cleanup: bool = False
+) -> None:
+    """
+    Write a KiCad netlist file without clobbering it on failure.
+
+    The netlist expression is built before the output is touched, then
+    streamed to a temporary file next to ``output_path`` that replaces it
+    once complete. An error leaves any existing netlist unchanged.
+
+    Args:
+        circuit_data: Dictionary containing the circuit data
+        output_path: Path to the output netlist file
+        cleanup: Apply :func:`cleanup_whitespace` fixes while writing
+    """
+    netlist = build_netlist_expr(circuit_data)
+
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+
+    # newline="" keeps LF line endings (what KiCad expects) and UTF-8 is
+    # written without a BOM.
+    try:
+        with open(tmp_file, "w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+            SExpressionWriter(f, cleanup=cleanup).write(netlist)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def build_netlist_expr(circuit_data: Dict[str, Any]) -> List[Any]:
+    """
+    Build the nested-list expression tree for a KiCad netlist.
+
+    Args:
+        circuit_data: Dictionary containing the circuit data
 
+    Returns:
+        Netlist expression rooted at ``export``
+    """
     logger.debug("Starting generate_netlist...")
     # Build the netlist structure
     # The version needs to be formatted as (export (version "E")) to match KiCad's format
@@ -271,11 +323,7 @@ def generate_netlist(circuit_data: Dict[str, Any]) -> str:
     netlist.append(nets_section)
     logger.debug("...Nets section generated.")
 
-    # Format the netlist as an S-expression with KiCad's exact structure
-    logger.debug("Formatting final S-expression...")
-    result = format_s_expr(netlist)
-    logger.debug("...S-expression formatting complete.")
-    return result
+    return netlist
 
 
 def generate_design_section(circuit_data: Dict[str, Any]) -> List[Any]:
@@ -1029,6 +1077,23 @@ def normalize_hierarchical_path(path: str, name: str) -> str:
     return path
 
 
+def _index_path_suffixes(index: Dict[str, str], net_name: str) -> None:
+    """
+    Index a net name under every suffix that follows a "/".
+
+    ``index.get(name)`` then returns the first indexed net whose name ends
+    with ``"/" + name``. Earlier entries win, matching a linear scan.
+
+    Args:
+        index: Suffix -> net name mapping to update
+        net_name: Net name to index
+    """
+    start = net_name.find("/")
+    while start != -1:
+        index.setdefault(net_name[start + 1 :], net_name)
+        start = net_name.find("/", start + 1)
+
+
 def generate_nets_section(circuit_data: Dict[str, Any]) -> List[Any]:
     nets_section = ["nets"]
     net_code = 1
@@ -1077,6 +1142,13 @@ def generate_nets_section(circuit_data: Dict[str, Any]) -> List[Any]:
                         f"  Mapped net '{net_name}' to sheet '{sheet_name}' from component {comp_ref}"
                     )
 
+    # Hierarchical net names indexed by the name after each "/", so the
+    # "<path>/<name>" lookups below are dictionary hits instead of scans
+    circuit_net_suffixes = {}
+    for net_name in circuit_data.get("nets", {}):
+        _index_path_suffixes(circuit_net_suffixes, net_name)
+    node_net_suffixes = {}
+
     # First collect all nodes and determine net types
     def process_net_nodes(circ, path="/"):
         for net_name, net_data in circ.get("nets", {}).items():
@@ -1187,29 +1259,19 @@ def generate_nets_section(circuit_data: Dict[str, Any]) -> List[Any]:
 
                     # If no sheet assignment found, look in circuit data
                     if not existing_net:
-                        for net_name in circuit_data.get("nets", {}):
-                            if (
-                                net_name.endswith("/" + original_name)
-                                and "/" in net_name
-                            ):
-                                existing_net = net_name
-                                logger.debug(
-                                    f"  Found existing path in circuit data: {existing_net}"
-                                )
-                                break
+                        existing_net = circuit_net_suffixes.get(original_name)
+                        if existing_net:
+                            logger.debug(
+                                f"  Found existing path in circuit data: {existing_net}"
+                            )
 
                         # If still not found, look in all_nodes_by_net_name
                         if not existing_net:
-                            for net_name in all_nodes_by_net_name.keys():
-                                if (
-                                    net_name.endswith("/" + original_name)
-                                    and "/" in net_name
-                                ):
-                                    existing_net = net_name
-                                    logger.debug(
-                                        f"  Found existing path in all_nodes: {existing_net}"
-                                    )
-                                    break
+                            existing_net = node_net_suffixes.get(original_name)
+                            if existing_net:
+                                logger.debug(
+                                    f"  Found existing path in all_nodes: {existing_net}"
+                                )
 
                 if existing_net:
                     # Use the existing path
@@ -1235,6 +1297,7 @@ def generate_nets_section(circuit_data: Dict[str, Any]) -> List[Any]:
             # Initialize net's node list if needed
             if final_net_name not in all_nodes_by_net_name:
                 all_nodes_by_net_name[final_net_name] = []
+                _index_path_suffixes(node_net_suffixes, final_net_name)
 
             # Add nodes preserving original component paths
             for node in nodes:
@@ -1850,309 +1913,293 @@ def generate_net_entry(
     return net_entry
 
 
-def format_s_expr(expr: Any, indent: int = 0) -> str:
+class SExpressionWriter:
     """
-    Format a Python object as an S-expression string exactly matching KiCad's format.
+    Stream a netlist expression tree to a text handle in KiCad's exact format.
 
-    Args:
-        expr: The expression to format (string, list, or other)
-        indent: Current indentation level
+    Tokens are written straight to ``out`` in a single depth-first pass, so
+    the formatted netlist is never assembled in memory. With ``cleanup``
+    enabled the writer produces the same text as running the formatted
+    output through :func:`cleanup_whitespace`, without the extra copies.
 
-    Returns:
-        Formatted S-expression string
+    Args:
+        out: Writable text handle (buffered file or ``io.StringIO``)
+        cleanup: Apply KiCad whitespace and library path fixes while writing
     """
-    # logger.debug(
-    #     f"format_s_expr called with type={type(expr)}, value={repr(expr)}, indent={indent}"
-    # )
-    indent_str = "  " * indent
-
-    if isinstance(expr, str):
-        # Always quote strings in S-expressions
-        return f'"{expr}"'
-
-    if isinstance(expr, (int, float)):
-        # Quote numbers too, as KiCad expects quoted values for attributes
-        return f'"{str(expr)}"'
-
-    if isinstance(expr, list):
-        if not expr:
-            return "()"
-
-        keyword = expr[0]
-
-        # Top-level export expression - KiCad has special format
-        if keyword == "export":
-            result = '(export (version "E")'
-            for item in expr[2:]:  # Skip version which is handled inline
-                result += f"\n{indent_str}  {format_s_expr(item, indent + 1)}"
-            result += ")"
-            return result
-
-        # Design section - KiCad specific format
-        elif keyword == "design":
-            result = "  (design"
-            for item in expr[1:]:
-                result += f"\n{indent_str}    {format_s_expr(item, indent + 2)}"
-            result += ")"
-            return result
-
-        # Sheet section
-        elif keyword == "sheet":
-            result = "(sheet"
-            number = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "number"
-                ),
-                None,
-            )
-            name = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "name"
-                ),
-                None,
-            )
-            tstamps = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "tstamps"
-                ),
-                None,
-            )
 
-            # Format sheet header items on one line
-            result += f" (number {format_s_expr(number[1], 0)}) (name {format_s_expr(name[1], 0)}) (tstamps {format_s_expr(tstamps[1], 0)})"
-
-            # Title block on new line
-            title_block = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "title_block"
-                ),
-                None,
-            )
-            if title_block:
-                result += "\n      (title_block"
-                for tb_item in title_block[1:]:
-                    if tb_item[0] == "comment":
-                        result += f"\n        (comment (number {format_s_expr(tb_item[1][1], 0)}) (value {format_s_expr(tb_item[2][1], 0)}))"
-                    else:
-                        result += f"\n        ({tb_item[0]} {format_s_expr(tb_item[1], 0) if len(tb_item) > 1 else ''})"
-                result += ")"
-
-            result += ")"
-            return result
-
-        # Components section
-        elif keyword == "components":
-            result = "  (components"
-            for item in expr[1:]:
-                result += f"\n{format_s_expr(item, indent + 1)}"
-            result += ")"
-            return result
-
-        # Component entry - KiCad has very specific format
-        elif keyword == "comp":
-            ref_item = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "ref"
-                ),
-                None,
-            )
+    def __init__(self, out: TextIO, cleanup: bool = False):
+        self.out = out
+        self.cleanup = cleanup
+        self._handlers = {
+            "export": self._write_export,
+            "design": self._write_design,
+            "sheet": self._write_sheet,
+            "components": self._write_section,
+            "libparts": self._write_section,
+            "libraries": self._write_section,
+            "nets": self._write_section,
+            "comp": self._write_comp,
+            "libpart": self._write_libpart,
+            "library": self._write_library,
+            "net": self._write_net,
+        }
 
-            # KiCad format: (comp (ref "X") on first line - no extra spaces
-            result = f"    (comp (ref {format_s_expr(ref_item[1], 0)})"  # Space between comp and (ref for KiCad format
+    def write(self, expr: Any, indent: int = 0) -> None:
+        """
+        Write an expression (string, number or nested list) to the output.
 
-            # Every other attribute on its own line with 2-space indentation from comp
-            remaining_items = [
-                item for item in expr[1:] if isinstance(item, list) and item[0] != "ref"
-            ]
+        Args:
+            expr: The expression to write
+            indent: Current indentation level
+        """
+        if not isinstance(expr, list):
+            self.out.write(self.atom(expr))
+        elif not expr:
+            self.out.write("()")
+        else:
+            handler = self._handlers.get(expr[0], self._write_generic)
+            handler(expr, indent)
+
+    def atom(self, value: Any) -> str:
+        """Quote a scalar value, as KiCad expects quoted attribute values."""
+        text = f'"{value!s}"'
+        if self.cleanup:
+            text = _cleanup_atom(text)
+        return text
+
+    def _empty(self, keyword: Any) -> str:
+        # An expression with no arguments is formatted as "(keyword )";
+        # cleanup_whitespace collapses that to "(keyword)".
+        return f"({keyword})" if self.cleanup else f"({keyword} )"
+
+    def _write_export(self, expr: List, indent: int) -> None:
+        write = self.out.write
+        indent_str = "  " * indent
+        write('(export (version "E")')
+        for item in expr[2:]:  # Skip version which is handled inline
+            write(f"\n{indent_str}  ")
+            self.write(item, indent + 1)
+        write(")")
+
+    def _write_design(self, expr: List, indent: int) -> None:
+        write = self.out.write
+        indent_str = "  " * indent
+        write("  (design")
+        for item in expr[1:]:
+            write(f"\n{indent_str}    ")
+            self.write(item, indent + 2)
+        write(")")
+
+    def _write_sheet(self, expr: List, indent: int) -> None:
+        write = self.out.write
+        atom = self.atom
+        number = _find_child(expr, "number")
+        name = _find_child(expr, "name")
+        tstamps = _find_child(expr, "tstamps")
+
+        # Format sheet header items on one line
+        write(
+            f"(sheet (number {atom(number[1])}) (name {atom(name[1])})"
+            f" (tstamps {atom(tstamps[1])})"
+        )
 
-            for item in remaining_items:
-                if item[0] in ["value", "footprint", "description"]:
-                    result += f"\n      ({item[0]} {format_s_expr(item[1], 0)})"
-                elif item[0] == "fields":
-                    result += "\n      (fields"
-                    for field in item[1:]:
-                        result += f"\n        (field (name {format_s_expr(field[1][1], 0)}) {format_s_expr(field[2], 0)})"
-                    result += ")"
-                elif item[0] == "libsource":
-                    result += f"\n      (libsource (lib {format_s_expr(item[1][1], 0)}) (part {format_s_expr(item[2][1], 0)})"
-                    if len(item) > 3:
-                        result += f" (description {format_s_expr(item[3][1], 0)})"
-                    result += ")"
-                elif item[0] == "property":
-                    result += f"\n      (property (name {format_s_expr(item[1][1], 0)}) (value {format_s_expr(item[2][1], 0)}))"
-                elif item[0] == "sheetpath":
-                    result += f"\n      (sheetpath (names {format_s_expr(item[1][1], 0)}) (tstamps {format_s_expr(item[2][1], 0)}))"
+        # Title block on new line
+        title_block = _find_child(expr, "title_block")
+        if title_block:
+            write("\n      (title_block")
+            for tb_item in title_block[1:]:
+                if tb_item[0] == "comment":
+                    write(
+                        f"\n        (comment (number {atom(tb_item[1][1])})"
+                        f" (value {atom(tb_item[2][1])}))"
+                    )
+                elif len(tb_item) > 1:
+                    write(f"\n        ({tb_item[0]} {atom(tb_item[1])})")
                 else:
-                    result += f"\n      {format_s_expr(item, indent + 3)}"
-
-            # Close with closing parenthesis
-            result += ")"
-            return result
-
-        # Libparts section
-        elif keyword == "libparts":
-            result = "  (libparts"
-            for item in expr[1:]:
-                result += f"\n{format_s_expr(item, indent + 1)}"
-            result += ")"
-            return result
-
-        # Libpart entry - KiCad specific format
-        elif keyword == "libpart":
-            lib_item = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "lib"
-                ),
-                None,
-            )
-            part_item = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "part"
-                ),
-                None,
-            )
+                    write(f"\n        {self._empty(tb_item[0])}")
+            write(")")
+
+        write(")")
+
+    def _write_section(self, expr: List, indent: int) -> None:
+        write = self.out.write
+        write(f"  ({expr[0]}")
+        for item in expr[1:]:
+            write("\n")
+            self.write(item, indent + 1)
+        write(")")
+
+    def _write_fields(self, fields: List) -> None:
+        write = self.out.write
+        atom = self.atom
+        write("\n      (fields")
+        for field in fields[1:]:
+            write(f"\n        (field (name {atom(field[1][1])}) {atom(field[2])})")
+        write(")")
+
+    def _write_comp(self, expr: List, indent: int) -> None:
+        write = self.out.write
+        atom = self.atom
+        ref_item = _find_child(expr, "ref")
+
+        # KiCad format: (comp (ref "X") on first line - no extra spaces
+        write(f"    (comp (ref {atom(ref_item[1])})")
+
+        # Every other attribute on its own line with 2-space indentation from comp
+        for item in expr[1:]:
+            if not isinstance(item, list) or item[0] == "ref":
+                continue
+            if item[0] in ("value", "footprint", "description"):
+                write(f"\n      ({item[0]} {atom(item[1])})")
+            elif item[0] == "fields":
+                self._write_fields(item)
+            elif item[0] == "libsource":
+                write(
+                    f"\n      (libsource (lib {atom(item[1][1])})"
+                    f" (part {atom(item[2][1])})"
+                )
+                if len(item) > 3:
+                    write(f" (description {atom(item[3][1])})")
+                write(")")
+            elif item[0] == "property":
+                write(
+                    f"\n      (property (name {atom(item[1][1])})"
+                    f" (value {atom(item[2][1])}))"
+                )
+            elif item[0] == "sheetpath":
+                write(
+                    f"\n      (sheetpath (names {atom(item[1][1])})"
+                    f" (tstamps {atom(item[2][1])}))"
+                )
+            else:
+                write("\n      ")
+                self.write(item, indent + 3)
 
-            # First line has lib and part
-            result = f"    (libpart (lib {format_s_expr(lib_item[1], 0)}) (part {format_s_expr(part_item[1], 0)})"
+        write(")")
 
-            # Other items on new lines
-            remaining_items = [
-                item
-                for item in expr[1:]
-                if isinstance(item, list) and item[0] not in ["lib", "part"]
-            ]
+    def _write_libpart(self, expr: List, indent: int) -> None:
+        write = self.out.write
+        atom = self.atom
+        lib_item = _find_child(expr, "lib")
+        part_item = _find_child(expr, "part")
 
-            for item in remaining_items:
-                if item[0] == "description":
-                    result += f"\n      (description {format_s_expr(item[1], 0)})"
-                elif item[0] == "docs":
-                    result += f"\n      (docs {format_s_expr(item[1], 0)})"
-                elif item[0] == "footprints":
-                    result += "\n      (footprints"
-                    for fp in item[1:]:
-                        result += f"\n        (fp {format_s_expr(fp[1], 0)})"
-                    result += ")"
-                elif item[0] == "fields":
-                    result += "\n      (fields"
-                    for field in item[1:]:
-                        result += f"\n        (field (name {format_s_expr(field[1][1], 0)}) {format_s_expr(field[2], 0)})"
-                    result += ")"
-                elif item[0] == "pins":
-                    result += "\n      (pins"
-                    for pin in item[1:]:
-                        result += f"\n        (pin (num {format_s_expr(pin[1][1], 0)}) (name {format_s_expr(pin[2][1], 0)}) (type {format_s_expr(pin[3][1], 0)}))"
-                    result += ")"
-                else:
-                    result += f"\n      {format_s_expr(item, indent + 3)}"
-
-            # Close with closing parenthesis
-            result += ")"
-            return result
-
-        # Libraries section
-        elif keyword == "libraries":
-            result = "  (libraries"
-            for item in expr[1:]:
-                result += f"\n{format_s_expr(item, indent + 1)}"
-            result += ")"
-            return result
-
-        # Library entry
-        elif keyword == "library":
-            logical_item = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "logical"
-                ),
-                None,
-            )
-            uri_item = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "uri"
-                ),
-                None,
-            )
+        # First line has lib and part
+        write(f"    (libpart (lib {atom(lib_item[1])}) (part {atom(part_item[1])})")
 
-            result = f"    (library (logical {format_s_expr(logical_item[1], 0)})"
-            result += f"\n      (uri {format_s_expr(uri_item[1], 0)})"
-            result += ")"
-            return result
-
-        # Nets section
-        elif keyword == "nets":
-            result = "  (nets"
-            for item in expr[1:]:
-                result += f"\n{format_s_expr(item, indent + 1)}"
-            result += ")"
-            return result
-
-        # Net entry - KiCad specific format
-        elif keyword == "net":
-            code = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "code"
-                ),
-                None,
-            )
-            name = next(
-                (
-                    item
-                    for item in expr[1:]
-                    if isinstance(item, list) and item[0] == "name"
-                ),
-                None,
-            )
+        # Other items on new lines
+        for item in expr[1:]:
+            if not isinstance(item, list) or item[0] in ("lib", "part"):
+                continue
+            if item[0] in ("description", "docs"):
+                write(f"\n      ({item[0]} {atom(item[1])})")
+            elif item[0] == "footprints":
+                write("\n      (footprints")
+                for fp in item[1:]:
+                    write(f"\n        (fp {atom(fp[1])})")
+                write(")")
+            elif item[0] == "fields":
+                self._write_fields(item)
+            elif item[0] == "pins":
+                write("\n      (pins")
+                for pin in item[1:]:
+                    write(
+                        f"\n        (pin (num {atom(pin[1][1])})"
+                        f" (name {atom(pin[2][1])}) (type {atom(pin[3][1])}))"
+                    )
+                write(")")
+            else:
+                write("\n      ")
+                self.write(item, indent + 3)
 
-            # Format the net header: (net (code "1") (name "+3V3")
-            net_header = f"    (net (code {format_s_expr(code[1], 0)}) (name {format_s_expr(name[1], 0)})"  # Keep header open for nodes
+        write(")")
 
-            # Format nodes separately
-            node_strings = []
-            nodes = [
-                item
-                for item in expr[1:]
-                if isinstance(item, list) and item[0] == "node"
-            ]
-            for node in nodes:
-                # Use indent+3 for nodes relative to the start of the (net ...) line
-                node_strings.append(format_node(node, indent + 3))
+    def _write_library(self, expr: List, indent: int) -> None:
+        logical_item = _find_child(expr, "logical")
+        uri_item = _find_child(expr, "uri")
+        self.out.write(
+            f"    (library (logical {self.atom(logical_item[1])})"
+            f"\n      (uri {self.atom(uri_item[1])}))"
+        )
 
-            # Combine header, nodes (each on a new line, indented), and closing parenthesis
-            if node_strings:
-                # Correctly place nodes inside the net parentheses
-                result = net_header + "\n" + "\n".join(node_strings) + ")"
-            else:
-                # Close immediately if no nodes
-                result = net_header + ")"
+    def _write_net(self, expr: List, indent: int) -> None:
+        write = self.out.write
+        code = _find_child(expr, "code")
+        name = _find_child(expr, "name")
 
-            return result
+        # Net header: (net (code "1") (name "+3V3") - kept open for nodes
+        write(f"    (net (code {self.atom(code[1])}) (name {self.atom(name[1])})")
 
-        # Special handling for other cases
-        else:
-            parts = [format_s_expr(item, 0) for item in expr[1:]]
-            return f"({keyword} {' '.join(parts)})"
+        for item in expr[1:]:
+            if isinstance(item, list) and item[0] == "node":
+                # Nodes are indented relative to the start of the (net ...) line
+                write("\n")
+                self.write_node(item, indent + 3)
+        write(")")
+
+    def write_node(self, node_expr: List, indent: int = 0) -> None:
+        """
+        Write a node expression with all attributes on one line.
+
+        Args:
+            node_expr: The node expression to write
+            indent: Current indentation level
+        """
+        atom = self.atom
+        ref = _find_child(node_expr, "ref")
+        pin = _find_child(node_expr, "pin")
+        pintype = _find_child(node_expr, "pintype")
+        self.out.write(
+            f"{'  ' * indent}(node (ref {atom(ref[1])}) (pin {atom(pin[1])})"
+            f" (pintype {atom(pintype[1])})"
+        )
+
+        # Add pinfunction if available
+        pinfunc = _find_child(node_expr, "pinfunction")
+        if pinfunc:
+            self.out.write(f" (pinfunction {atom(pinfunc[1])})")
+        self.out.write(")")
 
-    # For other types, convert to string
-    return f'"{str(expr)}"'
+    def _write_generic(self, expr: List, indent: int) -> None:
+        if len(expr) == 1:
+            self.out.write(self._empty(expr[0]))
+            return
+        write = self.out.write
+        write(f"({expr[0]}")
+        for item in expr[1:]:
+            write(" ")
+            self.write(item, 0)
+        write(")")
+
+
+def _find_child(expr: List, keyword: str) -> Optional[List]:
+    """Return the first list child of ``expr`` whose keyword matches."""
+    for item in expr[1:]:
+        if isinstance(item, list) and item and item[0] == keyword:
+            return item
+    return None
+
+
+def _cleanup_atom(text: str) -> str:
+    """Apply the cleanup_whitespace rewrites that can match inside a token."""
+    if "\r\n" in text:
+        text = text.replace("\r\n", "\n")
+    return cleanup_whitespace(text) if _NEEDS_CLEANUP.search(text) else text
+
+
+def format_s_expr(expr: Any, indent: int = 0) -> str:
+    """
+    Format a Python object as an S-expression string exactly matching KiCad's format.
+
+    Args:
+        expr: The expression to format (string, list, or other)
+        indent: Current indentation level
+
+    Returns:
+        Formatted S-expression string
+    """
+    buffer = io.StringIO()
+    SExpressionWriter(buffer).write(expr, indent)
+    return buffer.getvalue()
 
 
 def format_node(node_expr: List, indent: int = 0) -> str:
@@ -2166,40 +2213,6 @@ def format_node(node_expr: List, indent: int = 0) -> str:
     Returns:
         Formatted node string
     """
-    indent_str = "  " * indent
-
-    # Extract node components
-    ref = next(
-        (item for item in node_expr[1:] if isinstance(item, list) and item[0] == "ref"),
-        None,
-    )
-    pin = next(
-        (item for item in node_expr[1:] if isinstance(item, list) and item[0] == "pin"),
-        None,
-    )
-    pintype = next(
-        (
-            item
-            for item in node_expr[1:]
-            if isinstance(item, list) and item[0] == "pintype"
-        ),
-        None,
-    )
-
-    # Format the node line with all attributes on one line
-    result = f"{indent_str}(node (ref {format_s_expr(ref[1], 0)}) (pin {format_s_expr(pin[1], 0)}) (pintype {format_s_expr(pintype[1], 0)})"
-
-    # Add pinfunction if available
-    pinfunc = next(
-        (
-            item
-            for item in node_expr[1:]
-            if isinstance(item, list) and item[0] == "pinfunction"
-        ),
-        None,
-    )
-    if pinfunc:
-        result += f" (pinfunction {format_s_expr(pinfunc[1], 0)})"
-
-    result += ")"
-    return result
+    buffer = io.StringIO()
+    SExpressionWriter(buffer).write_node(node_expr, indent)
+    return buffer.getvalue()
@@ -68,62 +68,14 @@ class CircuitDataLoader:
     def _flatten_hierarchical_data(
         self, circuit_data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Flatten hierarchical circuit data into a single-level structure for netlist generation."""
-        flattened_components = {}
-        flattened_nets = {}
-
-        # Helper function to recursively collect components and nets
-        def collect_from_circuit(circuit, prefix=""):
-            # Collect components from this circuit level
-            components = circuit.get("components", {})
-            for comp_ref, comp_data in components.items():
-                full_ref = f"{prefix}{comp_ref}" if prefix else comp_ref
-                flattened_components[full_ref] = comp_data.copy()
-                # Update the component's ref to include prefix
-                flattened_components[full_ref]["ref"] = full_ref
-
-            # Collect nets from this circuit level
-            nets = circuit.get("nets", {})
-            for net_name, net_data in nets.items():
-                if net_name not in flattened_nets:
-                    flattened_nets[net_name] = []
-
-                # Handle both formats: list of connections OR dict with nodes key
-                if isinstance(net_data, dict):
-                    # Changed from "connections" to "nodes" for KiCad compatibility
-                    net_connections = net_data.get("nodes", net_data.get("connections", []))  # Fall back to "connections" for backward compatibility
-                else:
-                    net_connections = net_data  # Old format: just a list
-
-                # Update component references in net connections to include prefix
-                for connection in net_connections:
-                    if isinstance(connection, dict) and "component" in connection:
-                        original_ref = connection["component"]
-                        full_ref = f"{prefix}{original_ref}" if prefix else original_ref
-                        updated_connection = connection.copy()
-                        updated_connection["component"] = full_ref
-                        flattened_nets[net_name].append(updated_connection)
-                    else:
-                        flattened_nets[net_name].append(connection)
-
-            # Recursively process subcircuits
-            subcircuits = circuit.get("subcircuits", [])
-            for subcircuit in subcircuits:
-                # Remove subcircuit prefixing to get clean references (R1, R2 instead of subcircuit_R1, subcircuit_R2)
-                collect_from_circuit(subcircuit, prefix)
-
-        # Start flattening from root circuit
-        collect_from_circuit(circuit_data)
-
-        # Create flattened circuit data structure
-        flattened_data = circuit_data.copy()
-        flattened_data["components"] = flattened_components
-        flattened_data["nets"] = flattened_nets
-        flattened_data["subcircuits"] = (
-            []
-        )  # Clear subcircuits since we've flattened them
-
-        return flattened_data
+        """Flatten hierarchical circuit data into a single-level structure for netlist generation.
+
+        Components keep their own references (R1, R2 rather than
+        subcircuit_R1) and each net's nodes are merged across sheets.
+        """
+        from ..core.netlist_ir import NetlistIR
+
+        return NetlistIR.from_dict(circuit_data).flatten()
 
 
 class CircuitReconstructor:
@@ -5,6 +5,7 @@ This module generates PCB files from circuit definitions, extracting component
 information from schematics and applying hierarchical placement algorithms.
 """
 
+import copy
 import json
 import logging
 import re
@@ -12,12 +13,20 @@ import tempfile
 import uuid
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import kicad_sch_api as ksa
 
 from circuit_synth.core.circuit import Circuit
 from circuit_synth.pcb import PCBNotAvailableError
+from circuit_synth.pcb.annealing_placer import (
+    AnnealingResult,
+    PlacementProblem,
+    anneal_placement,
+)
+from circuit_synth.pcb.clearance_drc import ClearanceChecker
+from circuit_synth.pcb.grid_router import GridRouter, board_pads
+from circuit_synth.pcb.placement_metrics import PlacementMetrics, placement_score
 
 # PCB features require kicad-pcb-api which is not included in open source version
 PCBBoard = None
@@ -57,6 +66,7 @@ class PCBGenerator:
         self.project_dir = Path(project_dir)
         self.project_name = project_name
         self.pcb_path = self.project_dir / f"{project_name}.kicad_pcb"
+        self.placement_metrics: Optional[Dict[str, float]] = None
 
     def _calculate_initial_board_size(
         self, pcb: "PCBBoard", component_spacing: float = 5.0, margin: float = 10.0
@@ -172,33 +182,44 @@ class PCBGenerator:
         group_spacing: float = 10.0,  # Increased from 5.0
         max_board_size: float = 500.0,  # Maximum allowed board dimension
         board_size_increment: float = 25.0,  # Reduced from 50.0
-        auto_route: bool = False,  # Disable auto-routing by default (can be slow)
+        auto_route: Union[bool, str] = False,  # False, True (Freerouting) or "native"
         routing_passes: int = 4,  # Number of routing passes
         routing_effort: float = 1.0,  # Routing effort level
         generate_ratsnest: bool = True,
+        compare_placements: bool = False,  # Keep the best of all algorithms
+        annealing_time_limit: float = 30.0,  # Seconds per annealing start
+        annealing_starts: int = 1,  # Independent annealing runs, best kept
     ) -> bool:  # Generate ratsnest connections
         """
         Generate a PCB file from the schematic files in the project.
 
         Args:
             circuit_dict: Optional dictionary of circuits (if not provided, reads from schematics)
-            placement_algorithm: Algorithm to use for placement ("hierarchical", "force_directed", etc.)
+            placement_algorithm: Algorithm to use for placement ("hierarchical", "spiral"
+                or "annealing", which refines a spiral placement in-process)
             board_width: Initial board width in mm (if None, auto-calculated)
             board_height: Initial board height in mm (if None, auto-calculated)
             component_spacing: Spacing between components in mm
             group_spacing: Spacing between hierarchical groups in mm
             max_board_size: Maximum allowed board dimension in mm
             board_size_increment: Size increase per retry in mm
-            auto_route: If True, automatically route the PCB using Freerouting (default: False)
+            auto_route: If True, automatically route the PCB using Freerouting; if
+                "native", route in-process with the built-in grid router (default: False)
             routing_passes: Number of routing passes for Freerouting (1-99)
             routing_effort: Routing effort level (0.0-2.0, where 2.0 is maximum)
             generate_ratsnest: If True, generate ratsnest connections (default: True)
+            compare_placements: If True, also run the other supported placement
+                algorithms and keep whichever gives the shortest ratsnest
+            annealing_time_limit: Seconds each annealing start may run
+            annealing_starts: Number of independent annealing starts, run across
+                a process pool; the best placement is kept
 
         Returns:
             True if successful, False otherwise
         """
-        # Validate placement algorithm (kicad-pcb-api only supports: hierarchical, spiral)
-        SUPPORTED_ALGORITHMS = {"hierarchical", "spiral"}
+        # Validate placement algorithm (kicad-pcb-api supports hierarchical and
+        # spiral; annealing runs in-process on top of spiral)
+        SUPPORTED_ALGORITHMS = {"hierarchical", "spiral", "annealing"}
         DEFAULT_ALGORITHM = "hierarchical"
 
         if placement_algorithm not in SUPPORTED_ALGORITHMS:
@@ -289,6 +310,15 @@ class PCBGenerator:
                 f"Component spacing: {component_spacing}mm, Group spacing: {group_spacing}mm"
             )
 
+            # Annealing scores placements by their nets, so pads need them first
+            netlist_applied = None
+            if placement_algorithm == "annealing":
+                netlist_applied = self._apply_netlist_to_pcb(pcb)
+            annealing_options = {
+                "time_limit": annealing_time_limit,
+                "starts": annealing_starts,
+            }
+
             # Retry loop for placement with increasing board size
             placement_successful = False
             while retry_count < max_retries and not placement_successful:
@@ -331,13 +361,14 @@ class PCBGenerator:
                             iterations_per_level=150,  # More iterations
                         )
                     else:
-                        result = pcb.auto_place_components(
-                            algorithm=placement_algorithm,
+                        result = self._place_components(
+                            pcb,
+                            placement_algorithm,
                             component_spacing=component_spacing,
                             group_spacing=group_spacing,
                             board_width=current_width,
                             board_height=current_height,
-                            connections=None,  # kicad-pcb-api handles connections internally
+                            annealing_options=annealing_options,
                         )
 
                     # If we get here, placement was successful
@@ -413,20 +444,44 @@ class PCBGenerator:
                 logger.error("Failed to place components after all retries")
                 return False
 
-            # Apply netlist to PCB
-            logger.debug("Applying netlist to PCB...")
-            netlist_applied = self._apply_netlist_to_pcb(pcb)
+            # Apply netlist to PCB (already done before annealing placement)
+            if netlist_applied is None:
+                logger.debug("Applying netlist to PCB...")
+                netlist_applied = self._apply_netlist_to_pcb(pcb)
             if netlist_applied:
                 logger.info("✓ Netlist successfully applied to PCB")
             else:
                 logger.warning("⚠ No netlist found or netlist application failed")
 
+            # Placements can be scored once pads carry their nets
+            if netlist_applied and compare_placements:
+                self._select_best_placement(
+                    pcb,
+                    placement_algorithm,
+                    sorted(SUPPORTED_ALGORITHMS - {placement_algorithm}),
+                    component_spacing=component_spacing,
+                    group_spacing=group_spacing,
+                    board_width=actual_width,
+                    board_height=actual_height,
+                    annealing_options=annealing_options,
+                )
+            if netlist_applied:
+                self.placement_metrics = PlacementMetrics.from_board(pcb).summary()
+                logger.info(
+                    f"Placement metrics: HPWL {self.placement_metrics['hpwl']:.1f}mm, "
+                    f"ratsnest {self.placement_metrics['ratsnest']:.1f}mm, "
+                    f"{self.placement_metrics['crossings']} airwire crossings"
+                )
+
             # Auto-route if requested
             if auto_route:
                 logger.info("Starting auto-routing process...")
-                routing_success = self._auto_route_pcb(
-                    pcb, passes=routing_passes, effort=routing_effort
-                )
+                if auto_route == "native":
+                    routing_success = self._native_route_pcb(pcb)
+                else:
+                    routing_success = self._auto_route_pcb(
+                        pcb, passes=routing_passes, effort=routing_effort
+                    )
                 if routing_success:
                     logger.info("✓ Auto-routing completed successfully")
                 else:
@@ -938,6 +993,229 @@ class PCBGenerator:
             logger.error(f"Error applying netlist: {e}", exc_info=True)
             return False
 
+    def _select_best_placement(
+        self,
+        pcb: "PCBBoard",
+        current_algorithm: str,
+        alternatives: List[str],
+        **placement_kwargs,
+    ) -> str:
+        """
+        Try alternative placement algorithms and keep the best result.
+
+        Placements are compared by ratsnest length, then airwire crossings.
+        The footprints end up where the winning algorithm put them.
+
+        Args:
+            pcb: PCB board with footprints placed and the netlist applied
+            current_algorithm: Algorithm that produced the current placement
+            alternatives: Other algorithms to try
+            **placement_kwargs: Passed to _place_components
+
+        Returns:
+            Name of the algorithm whose placement was kept
+        """
+
+        def snapshot():
+            return {
+                fp.reference: (copy.copy(fp.position), fp.rotation)
+                for fp in pcb.footprints
+            }
+
+        best_algorithm = current_algorithm
+        best_summary = PlacementMetrics.from_board(pcb).summary()
+        best_positions = snapshot()
+        logger.info(f"Placement '{current_algorithm}': {best_summary}")
+
+        for algorithm in alternatives:
+            try:
+                self._place_components(pcb, algorithm, **placement_kwargs)
+            except (ValueError, RuntimeError) as e:
+                logger.warning(f"Placement '{algorithm}' failed: {e}")
+                continue
+
+            summary = PlacementMetrics.from_board(pcb).summary()
+            logger.info(f"Placement '{algorithm}': {summary}")
+            if placement_score(summary) < placement_score(best_summary):
+                best_algorithm, best_summary = algorithm, summary
+                best_positions = snapshot()
+
+        for fp in pcb.footprints:
+            position, rotation = best_positions[fp.reference]
+            fp.position = copy.copy(position)
+            fp.rotation = rotation
+
+        logger.info(f"✓ Kept '{best_algorithm}' placement")
+        return best_algorithm
+
+    def _place_components(
+        self,
+        pcb: "PCBBoard",
+        algorithm: str,
+        annealing_options: Optional[Dict[str, Any]] = None,
+        **placement_kwargs,
+    ) -> Any:
+        """
+        Run one placement algorithm on the board.
+
+        "annealing" runs in-process; everything else is delegated to
+        pcb.auto_place_components.
+
+        Args:
+            pcb: PCB board with footprints added
+            algorithm: Placement algorithm name
+            annealing_options: Extra keyword arguments for _anneal_placement
+            **placement_kwargs: component_spacing, group_spacing, board_width
+                and board_height
+
+        Returns:
+            Result of the placement call
+        """
+        if algorithm == "annealing":
+            return self._anneal_placement(
+                pcb, **placement_kwargs, **(annealing_options or {})
+            )
+        return pcb.auto_place_components(
+            algorithm=algorithm,
+            connections=None,  # kicad-pcb-api handles connections internally
+            **placement_kwargs,
+        )
+
+    def _anneal_placement(
+        self,
+        pcb: "PCBBoard",
+        component_spacing: float = 5.0,
+        group_spacing: float = 10.0,
+        board_width: float = 100.0,
+        board_height: float = 100.0,
+        time_limit: Optional[float] = 30.0,
+        starts: int = 1,
+        max_workers: Optional[int] = None,
+    ) -> AnnealingResult:
+        """
+        Place footprints by simulated annealing, starting from a spiral placement.
+
+        The pads must already carry their nets. Courtyards are kept
+        ``component_spacing`` apart and inside the board outline.
+
+        Args:
+            pcb: PCB board with footprints added and the netlist applied
+            component_spacing: Minimum gap between footprints in mm
+            group_spacing: Spacing between groups for the spiral seed placement
+            board_width: Board width in mm
+            board_height: Board height in mm
+            time_limit: Seconds per annealing start
+            starts: Independent starts, run across a process pool
+            max_workers: Worker processes (None uses the CPU count)
+
+        Returns:
+            The annealing result that was applied
+
+        Raises:
+            ValueError: If footprints cannot be placed without overlap, so the
+                caller can retry on a larger board
+        """
+        pcb.auto_place_components(
+            algorithm="spiral",
+            component_spacing=component_spacing,
+            group_spacing=group_spacing,
+            board_width=board_width,
+            board_height=board_height,
+            connections=None,
+        )
+        problem = PlacementProblem.from_board(pcb, spacing=component_spacing)
+        result = anneal_placement(
+            problem,
+            (0.0, 0.0, board_width, board_height),
+            starts=starts,
+            max_workers=max_workers,
+            time_limit=time_limit,
+        )
+        if not result.legal:
+            raise ValueError(
+                f"Could not find valid position for all footprints "
+                f"({result.overlap:.1f}mm² of courtyard overlap after annealing)"
+            )
+
+        for fp in pcb.footprints:
+            position = copy.copy(fp.position)
+            position.x, position.y = result.positions[fp.reference]
+            fp.position = position
+        logger.info(
+            f"Annealing placement: HPWL {result.hpwl:.1f}mm after {result.moves} moves "
+            f"({result.elapsed:.1f}s)"
+        )
+        return result
+
+    def _native_route_pcb(
+        self, pcb: "PCBBoard", track_width: float = 0.25, clearance: float = 0.2
+    ) -> bool:
+        """
+        Route the PCB in-process with the two-layer grid router.
+
+        Unlike Freerouting this needs no JVM or temp files. Tracks and vias
+        are added to the board directly; nets that cannot be completed are
+        left partly routed for manual finishing.
+
+        Args:
+            pcb: The PCB board object, with the netlist already applied
+            track_width: Track width in mm
+            clearance: Copper clearance in mm
+
+        Returns:
+            True if every connection was routed, False otherwise
+        """
+        try:
+            result = GridRouter(track_width=track_width, clearance=clearance).route(
+                board_pads(pcb)
+            )
+
+            net_numbers = {}
+            for name in result.routed_nets + result.failed_nets:
+                net = pcb.get_net_by_name(name)
+                net_numbers[name] = net.number if net else None
+
+            for segment in result.segments:
+                pcb.add_track(
+                    start_x=segment.start[0],
+                    start_y=segment.start[1],
+                    end_x=segment.end[0],
+                    end_y=segment.end[1],
+                    width=segment.width,
+                    layer=segment.layer,
+                    net=net_numbers[segment.net],
+                )
+            for via in result.vias:
+                pcb.add_via(
+                    x=via.position[0],
+                    y=via.position[1],
+                    size=via.diameter,
+                    drill=via.drill,
+                    net=net_numbers[via.net],
+                )
+
+            logger.info(
+                f"Native routing: {len(result.routed_nets)} nets routed, "
+                f"{len(result.segments)} tracks, {len(result.vias)} vias, "
+                f"{result.completion:.0%} of connections"
+            )
+            if result.failed_nets:
+                logger.warning(f"Unrouted nets: {', '.join(result.failed_nets)}")
+
+            # Quick in-process DRC; kicad-cli remains the full check
+            drc = ClearanceChecker.from_board(
+                pcb, routing=result, clearance=clearance
+            ).check()
+            logger.info(
+                f"Clearance pre-check: {len(drc.violations)} violations, "
+                f"{len(drc.unconnected_items)} unconnected items"
+            )
+            return not result.failed_nets
+
+        except Exception as e:
+            logger.error(f"Native routing failed with exception: {e}", exc_info=True)
+            return False
+
     def _auto_route_pcb(
         self, pcb: PCBBoard, passes: int = 4, effort: float = 1.0
     ) -> bool:
@@ -1439,7 +1439,9 @@ class SchematicGenerator:
 
                         comp_width, comp_height = (
                             SymbolBoundingBoxCalculator.get_symbol_dimensions(
-                                symbol_data, pin_net_map=pin_net_map
+                                symbol_data,
+                                pin_net_map=pin_net_map,
+                                lib_id=comp.lib_id,
                             )
                         )
                         logger.debug(
@@ -35,6 +35,7 @@ except ImportError:
 import datetime
 import logging
 import math
+import re
 
 # Configure logging for this module
 import os
@@ -181,6 +182,95 @@ logger = logging.getLogger(__name__)
 TESTPOINT_RADIUS_SCALE_FACTOR = 0.6
 
 
+# Standard KiCad offset between a power symbol and its Value text
+POWER_VALUE_OFFSET = 5.08
+
+# A placed symbol's own UUID is written before its properties, so a single
+# left-to-right scan can attribute each Value property to its symbol.
+_POWER_VALUE_SCAN = re.compile(
+    r'\(uuid "([^"]+)"\)'
+    r'|(\(property "Value" "((?:[^"\\]|\\.)*)"\s*\(at )'
+    r"(-?[\d.]+)\s+(-?[\d.]+)"
+)
+
+
+def power_value_position(
+    position: Tuple[float, float], rotation: float, lib_id: str = ""
+) -> Optional[Tuple[float, float]]:
+    """
+    Calculate where a power symbol's Value text belongs.
+
+    The text sits on the side the symbol points to. GND-type symbols point
+    down at rotation 0, so their offset direction is inverted.
+
+    Args:
+        position: Symbol position (x, y)
+        rotation: Symbol rotation in degrees
+        lib_id: Symbol library ID, used to detect GND/VSS symbols
+
+    Returns:
+        (x, y) for the Value text, or None for non-cardinal rotations
+    """
+    x, y = position[0], position[1]
+    sign = -1 if "GND" in lib_id or "VSS" in lib_id else 1
+    offset = POWER_VALUE_OFFSET * sign
+
+    if rotation == 0:
+        return x, y - offset
+    if rotation == 90:
+        return x - offset, y
+    if rotation == 180:
+        return x, y + offset
+    if rotation == 270:
+        return x + offset, y
+    return None
+
+
+def patch_power_value_positions(
+    content: str, targets: Dict[str, Tuple[str, Tuple[float, float]]]
+) -> Tuple[str, int]:
+    """
+    Rewrite Value property positions of symbols in one pass over the file.
+
+    Args:
+        content: Schematic file content
+        targets: Symbol UUID -> (expected value text, (x, y) Value position)
+
+    Returns:
+        Tuple of (patched content, number of symbols patched)
+    """
+    if not targets:
+        return content, 0
+
+    pending = dict(targets)
+    pieces = []
+    last = 0
+    current = None
+
+    for match in _POWER_VALUE_SCAN.finditer(content):
+        if match.group(1) is not None:
+            current = match.group(1) if match.group(1) in pending else None
+            continue
+        if current is None:
+            continue
+
+        value, (x, y) = pending[current]
+        if match.group(3) == value:
+            pieces.append(content[last : match.start(4)])
+            pieces.append(f"{x} {y}")
+            last = match.end(5)
+            del pending[current]
+            if not pending:
+                break
+        current = None
+
+    if pending:
+        logger.debug(f"{len(pending)} power symbols not found for Value fix")
+
+    pieces.append(content[last:])
+    return "".join(pieces), len(targets) - len(pending)
+
+
 def find_pin_by_identifier(pins, identifier):
     """
     Find a pin by its ID, number, or name.
@@ -872,25 +962,13 @@ class SchematicWriter:
                     width, height = 10.0, 10.0
                 else:
                     # Calculate accurate bounding box including pin labels for proper collision detection
-                    import sys
-
-                    print(
-                        f"\n🔍 PLACEMENT: About to calculate bbox for {placement_key} ({comp.lib_id})",
-                        file=sys.stderr,
-                        flush=True,
-                    )
                     min_x, min_y, max_x, max_y = (
                         SymbolBoundingBoxCalculator.calculate_bounding_box(
-                            lib_data, include_properties=True
+                            lib_data, include_properties=True, lib_id=comp.lib_id
                         )
                     )
                     width = max_x - min_x
                     height = max_y - min_y
-                    print(
-                        f"🔍 PLACEMENT: Calculated bbox for {placement_key}: {width:.2f} x {height:.2f} mm",
-                        file=sys.stderr,
-                        flush=True,
-                    )
 
                 component_bboxes.append((placement_key, width, height))
                 logger.debug(f"  {placement_key}: bbox {width:.1f}x{height:.1f}mm")
@@ -1148,40 +1226,19 @@ class SchematicWriter:
                 power_comp.on_board = True
                 power_comp.dnp = False
 
-                # Fix Value property position - kicad-sch-api places it incorrectly
-                # The Value should be positioned based on symbol rotation:
-                # - 0° (up): Value above symbol
-                # - 90° (left): Value to the left
-                # - 180° (down): Value below symbol
-                # - 270° (right): Value to the right
-                # Standard offset is ~5.08mm from symbol center
+                # Fix Value property position - kicad-sch-api places it incorrectly.
+                # The Value goes on the side the symbol points to (see
+                # power_value_position); the saved file is patched as well in
+                # _fix_power_symbol_text_positions since not every kicad-sch-api
+                # version serializes this attribute.
                 if (
                     hasattr(power_comp, "properties")
                     and "Value" in power_comp.properties
                 ):
                     value_prop = power_comp.properties["Value"]
-                    if hasattr(value_prop, "position"):
-                        # Calculate correct position based on rotation
-                        offset = (
-                            5.08  # Standard KiCad offset for power symbol value text
-                        )
-
-                        if rotation == 0:  # Pointing up
-                            value_prop.position = Point(
-                                position[0], position[1] - offset
-                            )
-                        elif rotation == 90:  # Pointing left
-                            value_prop.position = Point(
-                                position[0] - offset, position[1]
-                            )
-                        elif rotation == 180:  # Pointing down
-                            value_prop.position = Point(
-                                position[0], position[1] + offset
-                            )
-                        elif rotation == 270:  # Pointing right
-                            value_prop.position = Point(
-                                position[0] + offset, position[1]
-                            )
+                    value_pos = power_value_position(position, rotation, lib_id)
+                    if hasattr(value_prop, "position") and value_pos is not None:
+                        value_prop.position = Point(*value_pos)
 
                 logger.debug(
                     f"Created power symbol {reference} (UUID: {power_comp.uuid}) rotation={rotation}"
@@ -1213,6 +1270,9 @@ class SchematicWriter:
         """
         Post-process schematic file to fix power symbol Value property positions.
         kicad-sch-api doesn't expose property positioning API, so we fix it in the file.
+
+        All symbols are patched in a single scan of the file keyed by UUID, so
+        the cost is linear in file size regardless of the power symbol count.
         """
         if not hasattr(self, "_power_symbols_to_fix") or not self._power_symbols_to_fix:
             return
@@ -1221,71 +1281,26 @@ class SchematicWriter:
             f"Fixing Value positions for {len(self._power_symbols_to_fix)} power symbols..."
         )
 
-        import re
+        targets = {}
+        for symbol_info in self._power_symbols_to_fix:
+            value_pos = power_value_position(
+                symbol_info["position"],
+                symbol_info["rotation"],
+                symbol_info.get("lib_id", ""),
+            )
+            if value_pos is not None:  # Skip non-cardinal angles
+                targets[symbol_info["uuid"]] = (symbol_info["value"], value_pos)
 
         with open(sch_file_path, "r") as f:
             content = f.read()
 
-        for symbol_info in self._power_symbols_to_fix:
-            uuid = symbol_info["uuid"]
-            pos = symbol_info["position"]
-            rotation = symbol_info["rotation"]
-            value = symbol_info["value"]
-            lib_id = symbol_info.get("lib_id", "")
-
-            # Calculate correct Value position based on rotation AND symbol type
-            offset = 5.08  # Standard KiCad offset
-
-            # GND-type symbols point DOWN by default, so invert the offset direction
-            is_gnd_type = "GND" in lib_id or "VSS" in lib_id
-
-            if rotation == 0:
-                if is_gnd_type:
-                    # GND at rotation 0 points DOWN, text goes below
-                    value_x, value_y = pos[0], pos[1] + offset
-                else:
-                    # VCC at rotation 0 points UP, text goes above
-                    value_x, value_y = pos[0], pos[1] - offset
-            elif rotation == 90:
-                if is_gnd_type:
-                    # GND at rotation 90 points LEFT, text goes right (away from symbol)
-                    value_x, value_y = pos[0] + offset, pos[1]
-                else:
-                    # VCC at rotation 90 points RIGHT, text goes left (away from symbol)
-                    value_x, value_y = pos[0] - offset, pos[1]
-            elif rotation == 180:
-                if is_gnd_type:
-                    # GND at rotation 180 points UP, text goes above
-                    value_x, value_y = pos[0], pos[1] - offset
-                else:
-                    # VCC at rotation 180 points DOWN, text goes below
-                    value_x, value_y = pos[0], pos[1] + offset
-            elif rotation == 270:
-                if is_gnd_type:
-                    # GND at rotation 270 points RIGHT, text goes left (away from symbol)
-                    value_x, value_y = pos[0] - offset, pos[1]
-                else:
-                    # VCC at rotation 270 points LEFT, text goes right (away from symbol)
-                    value_x, value_y = pos[0] + offset, pos[1]
-            else:
-                continue  # Skip non-cardinal angles
-
-            # Find this symbol's Value property and fix the position
-            # Pattern: Find the symbol with this UUID, then find its Value property
-            symbol_pattern = rf'(\(symbol.*?uuid "{uuid}".*?property "Value" "{re.escape(value)}".*?\(at )[\d.]+\s+[\d.]+(\s+[\d.]+\))'
+        content, patched = patch_power_value_positions(content, targets)
 
-            def replace_value_position(match):
-                return f"{match.group(1)}{value_x} {value_y}{match.group(2)}"
+        if patched:
+            with open(sch_file_path, "w") as f:
+                f.write(content)
 
-            content = re.sub(
-                symbol_pattern, replace_value_position, content, flags=re.DOTALL
-            )
-
-        # Write back
-        with open(sch_file_path, "w") as f:
-            f.write(content)
-
-        logger.debug(f"Fixed Value positions in {sch_file_path}")
+        logger.debug(f"Fixed {patched} Value positions in {sch_file_path}")
         self._power_symbols_to_fix = []  # Clear for next use
 
     def _add_pin_level_net_labels(self):
@@ -1899,7 +1914,7 @@ class SchematicWriter:
                 continue
 
             base_bbox = SymbolBoundingBoxCalculator.calculate_bounding_box(
-                lib_data, include_properties=True
+                lib_data, include_properties=True, lib_id=comp.lib_id
             )
 
             # 2. Convert base bbox to global coordinates
@@ -2050,22 +2065,13 @@ class SchematicWriter:
                 from .symbol_geometry import SymbolBoundingBoxCalculator
 
                 # Calculate component bbox including pin labels for accurate collision detection
-                print(
-                    f"\n🔍 BBOX: Calculating bbox for {comp.reference} at ({comp.position.x:.3f}, {comp.position.y:.3f})",
-                    file=sys.stderr,
-                    flush=True,
-                )
-
                 min_x, min_y, max_x, max_y = (
                     SymbolBoundingBoxCalculator.calculate_bounding_box(
-                        lib_data, include_properties=True
+                        lib_data, include_properties=True, lib_id=comp.lib_id
                     )
                 )
-
-                print(
-                    f"🔍 BBOX: Base component bbox: ({min_x:.2f}, {min_y:.2f}) to ({max_x:.2f}, {max_y:.2f})",
-                    file=sys.stderr,
-                    flush=True,
+                logger.debug(
+                    f"BBOX: Base bbox of {comp.reference}: ({min_x:.2f}, {min_y:.2f}) to ({max_x:.2f}, {max_y:.2f})"
                 )
 
                 # Extend bbox to include all nearby hierarchical labels
@@ -3,11 +3,14 @@ symbol_geometry.py
 
 Calculate accurate bounding boxes for KiCad symbols based on their graphical elements.
 This ensures proper spacing and collision detection in schematic layouts.
+
+Bounding boxes are memoized per library symbol: placement asks for the box
+of every component instance, but a schematic usually has far fewer unique
+symbols than components.
 """
 
 import logging
 import math
-import os
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -29,6 +32,36 @@ class SymbolBoundingBoxCalculator:
         0.65  # Width to height ratio for pin text (proportional font average)
     )
 
+    # (lib_id, include_properties, label signature) -> bounding box
+    _bbox_cache: Dict[Tuple[Any, ...], Tuple[float, float, float, float]] = {}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget memoized bounding boxes, e.g. after symbol libraries change."""
+        cls._bbox_cache.clear()
+
+    @staticmethod
+    def _label_signature(
+        pin_net_map: Optional[Dict[str, str]],
+    ) -> Tuple[Tuple[Any, int], ...]:
+        """
+        Cache key part for pin labels.
+
+        Label extents depend only on each label's length, so symbols whose
+        pins carry different nets of the same lengths share a cache entry.
+        """
+        if not pin_net_map:
+            return ()
+        return tuple(
+            sorted(
+                (
+                    (pin, len(net) if net and net != "~" else 0)
+                    for pin, net in pin_net_map.items()
+                ),
+                key=lambda item: (str(item[0]), item[1]),
+            )
+        )
+
     @classmethod
     def calculate_bounding_box(
         cls,
@@ -36,6 +69,7 @@ class SymbolBoundingBoxCalculator:
         include_properties: bool = True,
         hierarchical_labels: Optional[List[Dict[str, Any]]] = None,
         pin_net_map: Optional[Dict[str, str]] = None,
+        lib_id: Optional[str] = None,
     ) -> Tuple[float, float, float, float]:
         """
         Calculate the actual bounding box of a symbol from its graphical elements.
@@ -45,6 +79,8 @@ class SymbolBoundingBoxCalculator:
             include_properties: Whether to include space for Reference/Value labels
             hierarchical_labels: List of hierarchical labels attached to this symbol
             pin_net_map: Optional mapping of pin numbers to net names (for accurate label sizing)
+            lib_id: Library ID of the symbol ("Device:R"). When given, the result
+                is memoized, so repeated instances of a symbol cost a lookup.
 
         Returns:
             Tuple of (min_x, min_y, max_x, max_y) in mm
@@ -55,16 +91,26 @@ class SymbolBoundingBoxCalculator:
         if not symbol_data:
             raise ValueError("Symbol data is None or empty")
 
-        import sys
+        key = None
+        if lib_id is not None:
+            key = (lib_id, include_properties, cls._label_signature(pin_net_map))
+            cached = cls._bbox_cache.get(key)
+            if cached is not None:
+                return cached
 
-        # Reduced logging frequency - only log if DEBUG environment variable is set
-        debug_enabled = os.getenv("CIRCUIT_SYNTH_DEBUG", "").lower() == "true"
-        if debug_enabled:
-            print(f"\n=== CALCULATING BOUNDING BOX ===", file=sys.stderr, flush=True)
-            print(
-                f"include_properties={include_properties}", file=sys.stderr, flush=True
-            )
+        bbox = cls._compute_bounding_box(symbol_data, include_properties, pin_net_map)
+        if key is not None:
+            cls._bbox_cache[key] = bbox
+        return bbox
 
+    @classmethod
+    def _compute_bounding_box(
+        cls,
+        symbol_data: Dict[str, Any],
+        include_properties: bool,
+        pin_net_map: Optional[Dict[str, str]],
+    ) -> Tuple[float, float, float, float]:
+        """Uncached bounding box calculation behind calculate_bounding_box."""
         min_x = float("inf")
         min_y = float("inf")
         max_x = float("-inf")
@@ -72,7 +118,6 @@ class SymbolBoundingBoxCalculator:
 
         # Process main symbol shapes (handle both 'shapes' and 'graphics' keys)
         shapes = symbol_data.get("shapes", []) or symbol_data.get("graphics", [])
-        print(f"Processing {len(shapes)} main shapes", file=sys.stderr, flush=True)
         for shape in shapes:
             shape_bounds = cls._get_shape_bounds(shape)
             if shape_bounds:
@@ -84,7 +129,6 @@ class SymbolBoundingBoxCalculator:
 
         # Process pins (including their labels)
         pins = symbol_data.get("pins", [])
-        print(f"Processing {len(pins)} main pins", file=sys.stderr, flush=True)
         for pin in pins:
             pin_bounds = cls._get_pin_bounds(pin, pin_net_map)
             if pin_bounds:
@@ -122,17 +166,6 @@ class SymbolBoundingBoxCalculator:
         if min_x == float("inf") or max_x == float("-inf"):
             raise ValueError(f"No valid geometry found in symbol data")
 
-        print(
-            f"After geometry processing: ({min_x:.2f}, {min_y:.2f}) to ({max_x:.2f}, {max_y:.2f})",
-            file=sys.stderr,
-            flush=True,
-        )
-        print(
-            f"  Width: {max_x - min_x:.2f}, Height: {max_y - min_y:.2f}",
-            file=sys.stderr,
-            flush=True,
-        )
-
         # Add small margin for text that might extend beyond shapes
         margin = 0.254  # 10 mils
         min_x -= margin
@@ -169,18 +202,6 @@ class SymbolBoundingBoxCalculator:
             f"Calculated bounding box: ({min_x:.2f}, {min_y:.2f}) to ({max_x:.2f}, {max_y:.2f})"
         )
 
-        print(
-            f"FINAL BBOX: ({min_x:.2f}, {min_y:.2f}) to ({max_x:.2f}, {max_y:.2f})",
-            file=sys.stderr,
-            flush=True,
-        )
-        print(
-            f"  Width: {max_x - min_x:.2f}, Height: {max_y - min_y:.2f}",
-            file=sys.stderr,
-            flush=True,
-        )
-        print("=" * 50 + "\n", file=sys.stderr, flush=True)
-
         return (min_x, min_y, max_x, max_y)
 
     @classmethod
@@ -189,6 +210,7 @@ class SymbolBoundingBoxCalculator:
         symbol_data: Dict[str, Any],
         include_properties: bool = True,
         pin_net_map: Optional[Dict[str, str]] = None,
+        lib_id: Optional[str] = None,
     ) -> Tuple[float, float]:
         """
         Get the width and height of a symbol.
@@ -197,12 +219,13 @@ class SymbolBoundingBoxCalculator:
             symbol_data: Dictionary containing symbol definition
             include_properties: Whether to include space for Reference/Value labels
             pin_net_map: Optional mapping of pin numbers to net names
+            lib_id: Library ID of the symbol, to memoize the result
 
         Returns:
             Tuple of (width, height) in mm
         """
         min_x, min_y, max_x, max_y = cls.calculate_bounding_box(
-            symbol_data, include_properties, pin_net_map=pin_net_map
+            symbol_data, include_properties, pin_net_map=pin_net_map, lib_id=lib_id
         )
         width = max_x - min_x
         height = max_y - min_y
@@ -284,8 +307,6 @@ class SymbolBoundingBoxCalculator:
         cls, pin: Dict[str, Any], pin_net_map: Optional[Dict[str, str]] = None
     ) -> Optional[Tuple[float, float, float, float]]:
         """Get bounding box for a pin including its labels."""
-        import sys
-
         # Handle both formats: 'at' array or separate x/y/orientation
         if "at" in pin:
             at = pin.get("at", [0, 0])
@@ -339,12 +360,6 @@ class SymbolBoundingBoxCalculator:
             # For vertical text: height = char_count * char_height (characters stack vertically)
             name_height = len(label_text) * cls.DEFAULT_TEXT_HEIGHT
 
-            print(
-                f"    label_width={name_width:.2f}, label_height={name_height:.2f} (len={len(label_text)})",
-                file=sys.stderr,
-                flush=True,
-            )
-
             # Adjust bounds based on pin orientation
             # Labels are placed at PIN ENDPOINT with offset, extending AWAY from the component
             # Pin angle indicates where the pin points (into component)
@@ -353,35 +368,15 @@ class SymbolBoundingBoxCalculator:
 
             if angle == 0:  # Pin points right - label extends LEFT from endpoint
                 label_x = end_x - offset - name_width
-                print(
-                    f"    Angle 0 (Right pin): min_x {min_x:.2f} -> {label_x:.2f} (offset={offset:.3f})",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 min_x = min(min_x, label_x)
             elif angle == 180:  # Pin points left - label extends RIGHT from endpoint
                 label_x = end_x + offset + name_width
-                print(
-                    f"    Angle 180 (Left pin): max_x {max_x:.2f} -> {label_x:.2f} (offset={offset:.3f})",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 max_x = max(max_x, label_x)
             elif angle == 90:  # Pin points up - label extends DOWN from endpoint
                 label_y = end_y - offset - name_height
-                print(
-                    f"    Angle 90 (Up pin): min_y {min_y:.2f} -> {label_y:.2f} (offset={offset:.3f})",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 min_y = min(min_y, label_y)
             elif angle == 270:  # Pin points down - label extends UP from endpoint
                 label_y = end_y + offset + name_height
-                print(
-                    f"    Angle 270 (Down pin): max_y {max_y:.2f} -> {label_y:.2f} (offset={offset:.3f})",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 max_y = max(max_y, label_y)
 
         # Pin numbers are typically placed near the component body
@@ -400,9 +395,4 @@ class SymbolBoundingBoxCalculator:
             max_x += margin
             max_y += margin
 
-        print(
-            f"    Pin bounds: ({min_x:.2f}, {min_y:.2f}) to ({max_x:.2f}, {max_y:.2f})",
-            file=sys.stderr,
-            flush=True,
-        )
         return (min_x, min_y, max_x, max_y)
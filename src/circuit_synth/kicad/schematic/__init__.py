@@ -14,7 +14,7 @@ from .connection_updater import ConnectionUpdate, ConnectionUpdater
 
 # Wire management - newly added
 from .wire_manager import ConnectionPoint, WireManager
-from .wire_router import RoutingConstraints, WireRouter
+from .wire_router import ObstacleGrid, RoutedNet, RoutingConstraints, WireRouter
 
 # Other modules (if they exist)
 try:
@@ -96,6 +96,8 @@ __all__ = [
     "ConnectionPoint",
     "WireRouter",
     "RoutingConstraints",
+    "ObstacleGrid",
+    "RoutedNet",
     "ConnectionUpdater",
     "ConnectionUpdate",
     # Synchronization (always available)
@@ -0,0 +1,137 @@
+"""
+Uniform bucket grid of boxes for schematic spatial queries.
+
+Shared by the placement engine's occupancy map and the search engine's
+component and wire point lookups. A box is registered in every cell its
+closed extent touches, so boxes that only meet at an edge still share a
+cell; points are zero-size boxes.
+"""
+
+import math
+from typing import Dict, Hashable, Iterator, Optional, Set, Tuple
+
+Box = Tuple[float, float, float, float]
+
+
+class BucketGrid:
+    """
+    Boxes (x1, y1, x2, y2) stored by key and bucketed into square cells.
+
+    Each box is also listed per grid row for band queries. Boxes with a
+    non-finite edge or spanning more than ``max_cells`` cells are kept in an
+    overflow set that every query includes.
+
+    Args:
+        cell_size: Cell size in mm
+        max_cells: Most cells a single box is registered in
+    """
+
+    def __init__(self, cell_size: float = 25.4, max_cells: int = 256):
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self._boxes: Dict[Hashable, Box] = {}
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._rows: Dict[int, Set[Hashable]] = {}
+        self._overflow: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._boxes
+
+    def box(self, key: Hashable) -> Optional[Box]:
+        """The box stored under ``key``, or None."""
+        return self._boxes.get(key)
+
+    def _span(self, lo: float, hi: float) -> Optional[range]:
+        if not (math.isfinite(lo) and math.isfinite(hi)):
+            return None
+        if hi < lo:
+            lo, hi = hi, lo
+        return range(
+            math.floor(lo / self.cell_size), math.floor(hi / self.cell_size) + 1
+        )
+
+    def _cells_of(self, box: Box) -> Optional[Tuple[range, range]]:
+        cols = self._span(box[0], box[2])
+        rows = self._span(box[1], box[3])
+        if cols is None or rows is None or len(cols) * len(rows) > self.max_cells:
+            return None
+        return cols, rows
+
+    def add(self, key: Hashable, box: Box) -> None:
+        """Store ``box`` under ``key``, replacing any box it had."""
+        if key in self._boxes:
+            self.remove(key)
+        self._boxes[key] = box
+        spans = self._cells_of(box)
+        if spans is None:
+            self._overflow.add(key)
+            return
+        cols, rows = spans
+        for row in rows:
+            self._rows.setdefault(row, set()).add(key)
+            for col in cols:
+                self._cells.setdefault((col, row), set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the box stored under ``key``, if any."""
+        box = self._boxes.pop(key, None)
+        if box is None:
+            return
+        if key in self._overflow:
+            self._overflow.discard(key)
+            return
+        cols, rows = self._cells_of(box)
+        for row in rows:
+            self._discard(self._rows, row, key)
+            for col in cols:
+                self._discard(self._cells, (col, row), key)
+
+    @staticmethod
+    def _discard(buckets: Dict, bucket: Hashable, key: Hashable) -> None:
+        keys = buckets.get(bucket)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del buckets[bucket]
+
+    def candidates(self, box: Box) -> Set[Hashable]:
+        """Keys in the cells ``box`` touches (a superset of those it meets)."""
+        cols = self._span(box[0], box[2])
+        rows = self._span(box[1], box[3])
+        if cols is None or rows is None:
+            return set(self._boxes)
+
+        found = set(self._overflow)
+        # Large boxes are cheaper to answer by walking the occupied cells
+        if len(cols) * len(rows) > len(self._cells):
+            for (col, row), keys in self._cells.items():
+                if col in cols and row in rows:
+                    found.update(keys)
+        else:
+            for row in rows:
+                for col in cols:
+                    keys = self._cells.get((col, row))
+                    if keys:
+                        found.update(keys)
+        return found
+
+    def query(self, box: Box) -> Iterator[Hashable]:
+        """Yield keys whose box meets ``box`` (edges inclusive)."""
+        x1, y1, x2, y2 = box
+        for key in self.candidates(box):
+            bx1, by1, bx2, by2 = self._boxes[key]
+            if bx1 <= x2 and x1 <= bx2 and by1 <= y2 and y1 <= by2:
+                yield key
+
+    def band(self, y1: float, y2: float) -> Set[Hashable]:
+        """Keys in the grid rows from ``y1`` to ``y2``, plus the overflow."""
+        rows = self._span(y1, y2)
+        if rows is None:
+            return set(self._boxes)
+        found = set(self._overflow)
+        for row in rows:
+            found.update(self._rows.get(row, ()))
+        return found
@@ -4,8 +4,9 @@ Net-based component matching using connection tracing.
 
 import logging
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
+from ..signature_index import SignatureIndex, jaccard
 from .connection_tracer import ConnectionTracer
 
 logger = logging.getLogger(__name__)
@@ -21,12 +22,30 @@ class NetMatcher:
         self.tracer = connection_tracer
         self._net_signatures = {}
 
+        # Net signature index over the last KiCad component list seen
+        self._indexed_components: Optional[List[Dict]] = None
+        self._indexed_count = 0
+        self._index: Optional[SignatureIndex] = None
+
     def match_by_connections(
-        self, circuit_component: Dict, kicad_components: List[Dict]
+        self,
+        circuit_component: Dict,
+        kicad_components: List[Dict],
+        min_similarity: float = 0.0,
     ) -> List[Tuple[str, float]]:
         """
         Match a circuit component to KiCad components by net connections.
 
+        KiCad components are indexed by net once per component list. With the
+        default ``min_similarity`` every component sharing a net is scored.
+        A positive threshold switches to rare-net and MinHash LSH candidates,
+        which skips the fan-out of nets such as GND on large designs.
+
+        Args:
+            circuit_component: Circuit component dict with a "pins" mapping
+            kicad_components: List of {"reference": ..., "component": ...}
+            min_similarity: Drop matches below this Jaccard similarity
+
         Returns:
             List of (kicad_ref, confidence) tuples sorted by confidence
         """
@@ -35,20 +54,38 @@ class NetMatcher:
         if not circuit_nets:
             return []
 
-        matches = []
-        for kicad_comp in kicad_components:
-            # Get nets for KiCad component
-            kicad_nets = self._get_component_nets(kicad_comp["reference"])
+        index = self._get_index(kicad_components)
+        candidates = index.candidates(circuit_nets, exhaustive=min_similarity <= 0)
 
-            # Calculate similarity
-            similarity = self._calculate_net_similarity(circuit_nets, kicad_nets)
-            if similarity > 0:
-                matches.append((kicad_comp["reference"], similarity))
+        matches = []
+        for kicad_ref in candidates:
+            similarity = jaccard(circuit_nets, index.tokens(kicad_ref))
+            if similarity > 0 and similarity >= min_similarity:
+                matches.append((kicad_ref, similarity))
 
-        # Sort by confidence
+        # Sort by confidence (stable, so ties keep the KiCad list order)
         matches.sort(key=lambda x: x[1], reverse=True)
         return matches
 
+    def _get_index(self, kicad_components: List[Dict]) -> SignatureIndex:
+        """Build, or reuse, the net signature index for a component list."""
+        if self._indexed_components is kicad_components and self._indexed_count == len(
+            kicad_components
+        ):
+            return self._index
+
+        index = SignatureIndex()
+        for kicad_comp in kicad_components:
+            reference = kicad_comp["reference"]
+            if reference not in index:
+                index.add(reference, self._get_component_nets(reference))
+
+        self._indexed_components = kicad_components
+        self._indexed_count = len(kicad_components)
+        self._index = index
+        logger.debug(f"Indexed nets of {len(index)} KiCad components")
+        return index
+
     def _get_component_nets(self, reference: str) -> Set[str]:
         """Get all nets connected to a component."""
         if reference in self._net_signatures:
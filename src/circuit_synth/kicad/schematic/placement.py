@@ -4,12 +4,14 @@ Provides automatic placement strategies and collision detection.
 """
 
 import logging
+import math
 import time
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
 
 from kicad_sch_api.core.types import Point, Schematic, SchematicSymbol, Sheet
 
+from .bucket_grid import BucketGrid
 from .symbol_geometry import SymbolGeometry
 
 # Python-only implementation
@@ -56,6 +58,70 @@ class ElementBounds:
 ComponentBounds = ElementBounds
 
 
+class OccupancyMap:
+    """
+    Rectangles of placed elements on a :class:`BucketGrid`.
+
+    Touching edges count as overlapping, matching ``ElementBounds.overlaps``.
+    Each rectangle carries an order so queries can report the first
+    overlapping element in schematic order.
+
+    Args:
+        cell_size: Grid cell size in mm
+    """
+
+    MAX_CELLS = 256
+
+    def __init__(self, cell_size: float = 25.4):
+        self.cell_size = cell_size
+        self._grid = BucketGrid(cell_size, self.MAX_CELLS)
+        self._entries: Dict[Hashable, Tuple[ElementBounds, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def add(self, key: Hashable, bounds: ElementBounds, order: int = 0) -> None:
+        """Insert a rectangle under ``key``, replacing any it had."""
+        self._entries[key] = (bounds, order)
+        self._grid.add(key, (bounds.x, bounds.y, bounds.right, bounds.bottom))
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the rectangle stored under ``key``, if any."""
+        if self._entries.pop(key, None) is not None:
+            self._grid.remove(key)
+
+    def order(self, key: Hashable) -> Optional[int]:
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def set_order(self, key: Hashable, order: int) -> None:
+        self._entries[key] = (self._entries[key][0], order)
+
+    def all_bounds(self) -> List[ElementBounds]:
+        """Every rectangle, in order."""
+        return [b for b, _ in sorted(self._entries.values(), key=lambda e: e[1])]
+
+    def first_overlap(self, bounds: ElementBounds) -> Optional[ElementBounds]:
+        """The lowest-ordered rectangle overlapping ``bounds``, or None."""
+        box = (bounds.x, bounds.y, bounds.right, bounds.bottom)
+        best = None
+        for key in self._grid.candidates(box):
+            other, order = self._entries[key]
+            if bounds.overlaps(other) and (best is None or order < best[1]):
+                best = (other, order)
+        return best[0] if best else None
+
+    def in_band(self, top: float, bottom: float) -> Iterator[ElementBounds]:
+        """Rectangles with ``y <= bottom`` and ``bottom edge > top``."""
+        for key in self._grid.band(top, bottom):
+            other = self._entries[key][0]
+            if other.y <= bottom and other.bottom > top:
+                yield other
+
+
 class PlacementStrategy(Enum):
     """Component placement strategies."""
 
@@ -91,6 +157,10 @@ class PlacementEngine:
         self._symbol_geometry = SymbolGeometry()
         # Default to A4 if no sheet size provided
         self.sheet_size = sheet_size if sheet_size else (210.0, 297.0)
+        # Rectangles of placed elements, synced from the schematic on demand
+        self._occupancy = OccupancyMap()
+        self._tracked: Dict[int, Tuple[object, tuple]] = {}
+        self._size_cache: Dict[tuple, Tuple[float, float]] = {}
 
     def find_position(
         self,
@@ -204,7 +274,7 @@ class PlacementEngine:
         width = max(width, ref_width + 2.54, value_width + 2.54)
 
         # Log the estimation for debugging
-        logger.info(
+        logger.debug(
             f"Component {component.reference} ({component.lib_id}): "
             f"symbol=({symbol_width:.1f}x{symbol_height:.1f}), "
             f"max_pin_label_width={max_pin_label_width:.1f}, "
@@ -289,170 +359,8 @@ class PlacementEngine:
         """
         Find the next available position with dynamic spacing based on component size.
         """
-        component_size = self._estimate_component_size(component)
-
-        # Start position
-        x = self.margin
-        y = self.margin
-        row_start_x = self.margin
-
-        # Get existing component bounds
-        occupied_bounds = self._get_occupied_bounds()
-
-        # Increased spacing - 200 mil (5.08mm) between bounding boxes
-        spacing_x = 5.08  # 200 mil
-        spacing_y = 5.08  # 200 mil
-
-        print(f"\n{'='*80}")
-        print(f"🔍 PLACEMENT START: {component.reference}")
-        print(f"{'='*80}")
-        print(f"Component size: ({component_size[0]:.1f}, {component_size[1]:.1f}) mm")
-        print(f"Spacing: ({spacing_x:.1f}, {spacing_y:.1f}) mm")
-        print(f"Sheet size: ({self.sheet_size[0]:.1f}, {self.sheet_size[1]:.1f}) mm")
-        print(f"Margin: {self.margin:.1f} mm")
-        print(f"Starting position: x={x:.1f}, y={y:.1f}")
-        print(f"Number of existing components: {len(occupied_bounds)}")
-
-        logger.info(
-            f"Dynamic placement for {component.reference}: "
-            f"size=({component_size[0]:.1f}, {component_size[1]:.1f}) mm, "
-            f"spacing=({spacing_x:.1f}, {spacing_y:.1f}) mm"
-        )
-
-        # Log existing components
-        logger.debug(f"Existing components: {len(occupied_bounds)}")
-        for i, bounds in enumerate(occupied_bounds):
-            print(
-                f"  📦 Occupied[{i}]: x={bounds.x:.1f}-{bounds.right:.1f}, y={bounds.y:.1f}-{bounds.bottom:.1f}, type={bounds.element_type}"
-            )
-            logger.debug(
-                f"  Occupied[{i}]: x={bounds.x:.1f}-{bounds.right:.1f}, y={bounds.y:.1f}-{bounds.bottom:.1f}"
-            )
-
-        # Grid search for available position
-        max_attempts = 1000
-        attempts = 0
-
-        print(f"\n🔄 Starting position search loop...")
-
-        while attempts < max_attempts:
-            # Create bounds for current position
-            test_bounds = ComponentBounds(
-                x - component_size[0] / 2,
-                y - component_size[1] / 2,
-                component_size[0],
-                component_size[1],
-            )
-
-            print(f"\n  🎯 Attempt {attempts}: Testing position x={x:.1f}, y={y:.1f}")
-            print(
-                f"     Test bounds: x={test_bounds.x:.1f}-{test_bounds.right:.1f}, y={test_bounds.y:.1f}-{test_bounds.bottom:.1f}"
-            )
-
-            # Check if position is available
-            collision = False
-            for i, occupied in enumerate(occupied_bounds):
-                if test_bounds.overlaps(occupied):
-                    collision = True
-                    old_x = x
-                    # If collision detected, jump past the occupied component
-                    x = max(x, occupied.right + spacing_x + component_size[0] / 2)
-                    print(f"     ❌ COLLISION with Occupied[{i}]!")
-                    print(
-                        f"        Occupied bounds: x={occupied.x:.1f}-{occupied.right:.1f}, y={occupied.y:.1f}-{occupied.bottom:.1f}"
-                    )
-                    print(f"        Jumping from x={old_x:.1f} to x={x:.1f}")
-                    logger.debug(f"Collision detected, jumping to x={x:.1f}")
-                    break
-
-            if not collision:
-                # Check if component fits within sheet boundaries
-                if self._check_within_bounds(
-                    x, y, component_size[0], component_size[1]
-                ):
-                    final_pos = self._snap_to_grid((x, y))
-                    print(f"     ✅ FOUND VALID POSITION!")
-                    print(f"        Before snap: ({x:.1f}, {y:.1f})")
-                    print(
-                        f"        After snap:  ({final_pos[0]:.1f}, {final_pos[1]:.1f})"
-                    )
-                    print(f"{'='*80}\n")
-                    return final_pos
-                else:
-                    print(f"     ⚠️  Position out of bounds!")
-                    print(
-                        f"        Sheet boundaries: x=0-{self.sheet_size[0]:.1f}, y=0-{self.sheet_size[1]:.1f}"
-                    )
-
-            # Move to next position with dynamic spacing
-            next_x = x + component_size[0] + spacing_x
-            print(
-                f"     ➡️  Moving horizontally: x={x:.1f} → {next_x:.1f} (component_size={component_size[0]:.1f} + spacing={spacing_x:.1f})"
-            )
-            logger.debug(
-                f"Moving from x={x:.1f} to x={next_x:.1f} (size={component_size[0]:.1f} + spacing={spacing_x:.1f})"
-            )
-            x = next_x
-
-            # Wrap to next row if we exceed sheet width
-            if x + component_size[0] / 2 > self.sheet_size[0] - self.margin:
-                print(f"\n     🔽 WRAPPING TO NEXT ROW (exceeded width)")
-                print(
-                    f"        Current x={x:.1f} + half_width={component_size[0]/2:.1f} > sheet_width={self.sheet_size[0]:.1f} - margin={self.margin:.1f}"
-                )
-
-                # Find the starting x position for the next row
-                # This should be past any components that extend into this row
-                row_start_x = self.margin
-                old_y = y
-
-                print(f"        Checking for components that extend into next row...")
-                for occupied in occupied_bounds:
-                    if (
-                        occupied.y <= y + component_size[1] + spacing_y
-                        and occupied.bottom > y
-                    ):
-                        new_row_start = (
-                            occupied.right + spacing_x + component_size[0] / 2
-                        )
-                        print(
-                            f"          Component at y={occupied.y:.1f}-{occupied.bottom:.1f} extends into row"
-                        )
-                        print(
-                            f"          Adjusting row_start_x from {row_start_x:.1f} to {new_row_start:.1f}"
-                        )
-                        row_start_x = max(row_start_x, new_row_start)
-
-                x = row_start_x
-                y += component_size[1] + spacing_y
-                print(
-                    f"        New row position: x={x:.1f}, y={old_y:.1f} → {y:.1f} (moved down by {component_size[1]:.1f} + {spacing_y:.1f})"
-                )
-                logger.debug(f"Wrapping to next row at x={x:.1f}, y={y:.1f}")
-
-            # Check if we've exceeded sheet height
-            if y + component_size[1] / 2 > self.sheet_size[1] - self.margin:
-                print(f"\n     ⛔ EXCEEDED SHEET HEIGHT!")
-                print(
-                    f"        y={y:.1f} + half_height={component_size[1]/2:.1f} > sheet_height={self.sheet_size[1]:.1f} - margin={self.margin:.1f}"
-                )
-                logger.warning(
-                    f"Component {component.reference} exceeds sheet boundaries"
-                )
-                break
-
-            attempts += 1
-
-        # Fallback
-        print(
-            f"\n⚠️  WARNING: Could not find available position after {attempts} attempts!"
-        )
-        print(f"   Falling back to origin: ({self.margin:.1f}, {self.margin:.1f})")
-        print(f"{'='*80}\n")
-        logger.warning(
-            "Could not find available position with dynamic spacing, using origin"
-        )
-        return (self.margin, self.margin)
+        component_size = self._component_size(component)
+        return self._next_fit(component_size, component.reference)
 
     def _find_next_available_position_with_size(
         self, component_size: Tuple[float, float]
@@ -467,89 +375,83 @@ class PlacementEngine:
         Returns:
             (x, y) position
         """
-        # Start position
-        x = self.margin
-        y = self.margin
-        row_start_x = self.margin
+        return self._next_fit(component_size, "unknown")
+
+    def _next_fit(
+        self, component_size: Tuple[float, float], label: str
+    ) -> Tuple[float, float]:
+        """
+        Scan rows from the top-left margin for the first free spot.
 
-        # Get existing component bounds
-        occupied_bounds = self._get_occupied_bounds()
+        Positions are element centers. On a collision the scan jumps past
+        the first (in schematic order) element hit; when a row runs out it
+        wraps below, starting past anything that reaches into the new row.
+        Collision and row queries go to the occupancy map, so each probe
+        costs a few grid-cell lookups instead of a pass over every element.
+        """
+        width, height = component_size
+        self._sync_occupancy()
+        occupancy = self._occupancy
 
         # Increased spacing - 200 mil (5.08mm) between bounding boxes
         spacing_x = 5.08  # 200 mil
         spacing_y = 5.08  # 200 mil
 
+        logger.debug(
+            f"Dynamic placement for {label}: size=({width:.1f}, {height:.1f}) mm, "
+            f"spacing=({spacing_x:.1f}, {spacing_y:.1f}) mm, "
+            f"{len(occupancy)} existing elements"
+        )
+
+        x = self.margin
+        y = self.margin
+
         # Grid search for available position
         max_attempts = 1000
         attempts = 0
 
         while attempts < max_attempts:
-            # Create bounds for current position
-            test_bounds = ComponentBounds(
-                x - component_size[0] / 2,
-                y - component_size[1] / 2,
-                component_size[0],
-                component_size[1],
-            )
-
-            # Check if position is available
-            collision = False
-            for occupied in occupied_bounds:
-                if test_bounds.overlaps(occupied):
-                    collision = True
-                    # If collision detected, jump past the occupied component
-                    x = max(x, occupied.right + spacing_x + component_size[0] / 2)
-                    break
-
-            if not collision:
-                # Check if component fits within sheet boundaries
-                if self._check_within_bounds(
-                    x, y, component_size[0], component_size[1]
-                ):
-                    final_pos = self._snap_to_grid((x, y))
-                    comp_ref = (
-                        getattr(component, "reference", "unknown")
-                        if component
-                        else "unknown"
-                    )
-                    logger.info(
-                        f"Placing {comp_ref} at ({final_pos[0]:.1f}, {final_pos[1]:.1f})"
-                    )
-                    return final_pos
-                else:
-                    logger.debug(
-                        f"Position ({x:.1f}, {y:.1f}) exceeds sheet boundaries"
-                    )
+            test_bounds = ElementBounds(x - width / 2, y - height / 2, width, height)
+
+            occupied = occupancy.first_overlap(test_bounds)
+            if occupied is not None:
+                # Jump past the occupied element
+                x = max(x, occupied.right + spacing_x + width / 2)
+            elif self._check_within_bounds(x, y, width, height):
+                final_pos = self._snap_to_grid((x, y))
+                logger.debug(
+                    f"Placing {label} at ({final_pos[0]:.1f}, {final_pos[1]:.1f}) "
+                    f"after {attempts} probes"
+                )
+                return final_pos
 
-            # Move to next position
-            x += component_size[0] + spacing_x
+            # Move to next position with dynamic spacing
+            x += width + spacing_x
 
-            # Wrap to next row if we exceed sheet width
-            if x + component_size[0] / 2 > self.sheet_size[0] - self.margin:
-                # Find the starting x position for the next row
+            # Wrap to next row if we exceed sheet width, starting past any
+            # element that extends into the next row
+            if x + width / 2 > self.sheet_size[0] - self.margin:
                 row_start_x = self.margin
-                for occupied in occupied_bounds:
-                    if (
-                        occupied.y <= y + component_size[1] + spacing_y
-                        and occupied.bottom > y
-                    ):
-                        row_start_x = max(
-                            row_start_x,
-                            occupied.right + spacing_x + component_size[0] / 2,
-                        )
+                for occupied in occupancy.in_band(y, y + height + spacing_y):
+                    row_start_x = max(
+                        row_start_x, occupied.right + spacing_x + width / 2
+                    )
 
                 x = row_start_x
-                y += component_size[1] + spacing_y
+                y += height + spacing_y
 
             # Check if we've exceeded sheet height
-            if y + component_size[1] / 2 > self.sheet_size[1] - self.margin:
-                logger.warning("Component exceeds sheet boundaries")
+            if y + height / 2 > self.sheet_size[1] - self.margin:
+                logger.warning(f"Component {label} exceeds sheet boundaries")
                 break
 
             attempts += 1
 
         # Fallback - place at origin if no position found
-        logger.warning("Could not find available position, using origin")
+        logger.warning(
+            f"Could not find available position for {label} after {attempts} "
+            f"attempts, using origin"
+        )
         return (self.margin, self.margin)
 
     def _find_grid_position(
@@ -666,7 +568,7 @@ class PlacementEngine:
 
         # Find nearest available position to center
         center = (avg_x, avg_y)
-        occupied_bounds = self._get_occupied_bounds()
+        self._sync_occupancy()
 
         # Spiral search from center with better spacing
         spacing = 5.08  # 200 mil
@@ -686,14 +588,7 @@ class PlacementEngine:
                     component_size[1],
                 )
 
-                # Check for collisions
-                collision = False
-                for occupied in occupied_bounds:
-                    if test_bounds.overlaps(occupied):
-                        collision = True
-                        break
-
-                if not collision:
+                if self._occupancy.first_overlap(test_bounds) is None:
                     # Check if component fits within sheet boundaries
                     if self._check_within_bounds(
                         x, y, component_size[0], component_size[1]
@@ -709,39 +604,104 @@ class PlacementEngine:
 
     def _get_occupied_bounds(self) -> List[ElementBounds]:
         """Get bounds of all placed elements (components and sheets)."""
-        bounds = []
+        self._sync_occupancy()
+        return self._occupancy.all_bounds()
 
-        # Add component bounds
-        for comp in self.schematic.components:
-            # Estimate size for existing component
-            size = self._estimate_component_size(comp)
+    def _sync_occupancy(self) -> None:
+        """
+        Bring the occupancy map in line with the schematic.
 
-            # Create bounds centered on component position
-            bounds.append(
-                ElementBounds(
-                    comp.position.x - size[0] / 2,
-                    comp.position.y - size[1] / 2,
-                    size[0],
-                    size[1],
-                    "component",
-                )
+        Elements whose position and size-relevant fields are unchanged keep
+        their rectangle, so only new, moved or edited elements are measured
+        again. Components are centered on their position; sheets store
+        their top-left corner.
+        """
+        seen = set()
+        order = 0
+        for comp in self.schematic.components:
+            position = comp.position
+            signature = (
+                position.x,
+                position.y,
+                comp.lib_id,
+                comp.reference,
+                comp.value,
+                len(comp.pins) if comp.pins else 0,
             )
-
-        # Add sheet bounds if sheets exist
-        if hasattr(self.schematic, "sheets"):
-            for sheet in self.schematic.sheets:
-                # Sheets store their position as top-left corner
-                bounds.append(
+            if not self._is_tracked(comp, signature, order):
+                width, height = self._component_size(comp, signature[2:])
+                self._track(
+                    comp,
+                    signature,
+                    order,
                     ElementBounds(
-                        sheet.position.x,
-                        sheet.position.y,
+                        position.x - width / 2,
+                        position.y - height / 2,
+                        width,
+                        height,
+                        "component",
+                    ),
+                )
+            seen.add(id(comp))
+            order += 1
+
+        for sheet in getattr(self.schematic, "sheets", None) or ():
+            position = sheet.position
+            signature = (position.x, position.y, sheet.size[0], sheet.size[1])
+            if not self._is_tracked(sheet, signature, order):
+                self._track(
+                    sheet,
+                    signature,
+                    order,
+                    ElementBounds(
+                        position.x,
+                        position.y,
                         sheet.size[0],
                         sheet.size[1],
                         "sheet",
-                    )
+                    ),
                 )
+            seen.add(id(sheet))
+            order += 1
+
+        if len(seen) != len(self._tracked):
+            for key in [key for key in self._tracked if key not in seen]:
+                del self._tracked[key]
+                self._occupancy.remove(key)
 
-        return bounds
+    def _component_size(
+        self, component: SchematicSymbol, key: Optional[tuple] = None
+    ) -> Tuple[float, float]:
+        """_estimate_component_size, cached per lib_id, reference, value and pin count."""
+        if key is None:
+            key = (
+                component.lib_id,
+                component.reference,
+                component.value,
+                len(component.pins) if component.pins else 0,
+            )
+        size = self._size_cache.get(key)
+        if size is None:
+            size = self._size_cache[key] = self._estimate_component_size(component)
+        return size
+
+    def _is_tracked(self, element, signature: tuple, order: int) -> bool:
+        """True if the map already holds ``element`` as it is now."""
+        entry = self._tracked.get(id(element))
+        if entry is None or entry[0] is not element or entry[1] != signature:
+            return False
+        if self._occupancy.order(id(element)) != order:
+            self._occupancy.set_order(id(element), order)
+        return True
+
+    def _track(
+        self, element, signature: tuple, order: int, bounds: ElementBounds
+    ) -> None:
+        key = id(element)
+        # Keep a reference to the element so its id can't be reused
+        self._tracked[key] = (element, signature)
+        self._occupancy.remove(key)
+        self._occupancy.add(key, bounds, order)
 
     def _snap_to_grid(self, position: Tuple[float, float]) -> Tuple[float, float]:
         """
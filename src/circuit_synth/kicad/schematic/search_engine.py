@@ -5,6 +5,8 @@ This module provides comprehensive search capabilities for finding components,
 nets, and connections within schematics.
 """
 
+import bisect
+import itertools
 import logging
 import re
 from dataclasses import dataclass, field
@@ -23,6 +25,7 @@ from kicad_sch_api.core.types import (
 )
 
 from ..core import BoundingBox
+from .bucket_grid import BucketGrid
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +158,106 @@ class ComponentValueParser:
             return None
 
 
+# Characters that end the literal prefix of a regex or wildcard pattern
+_PATTERN_META = set(".^$*+?{}[]\\|()")
+_QUANTIFIERS = set("*+?{")
+# Wildcard "*" and "?" become ".*" and ".", so only these still quantify
+_WILDCARD_QUANTIFIERS = set("+{")
+
+# Grid cell size for spatial lookups (mm); roughly one symbol footprint
+SPATIAL_CELL_SIZE = 25.4
+
+
+def literal_prefix(pattern: str, match_type: MatchType) -> str:
+    """
+    Literal text every match of ``pattern`` must start with.
+
+    Only anchored patterns have one: wildcards always, regexes when they
+    start with ``^`` and contain no alternation. Returns "" when no prefix
+    can be guaranteed.
+    """
+    if match_type == MatchType.EXACT:
+        return pattern
+    if match_type == MatchType.REGEX:
+        if not pattern.startswith("^") or "|" in pattern:
+            return ""
+        pattern = pattern[1:]
+        quantifiers = _QUANTIFIERS
+    elif match_type == MatchType.WILDCARD:
+        quantifiers = _WILDCARD_QUANTIFIERS
+    else:
+        return ""
+
+    end = 0
+    while end < len(pattern) and pattern[end] not in _PATTERN_META:
+        end += 1
+    # A quantifier makes the character before it optional
+    if end < len(pattern) and pattern[end] in quantifiers:
+        end = max(end - 1, 0)
+    return pattern[:end]
+
+
+class FieldIndex:
+    """
+    Exact and prefix index over one component field.
+
+    Postings are keyed by the raw field value. Lookups are case-insensitive
+    through a lowercase key map, with the sorted lowercase keys serving
+    prefix ranges via bisection.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Set[int]] = {}
+        self._by_lower: Dict[str, Set[str]] = {}
+        self._sorted: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    def add(self, value: str, ordinal: int) -> None:
+        """Record that component ``ordinal`` has ``value`` in this field."""
+        posting = self.postings.get(value)
+        if posting is None:
+            posting = self.postings[value] = set()
+            lower = value.lower()
+            if lower not in self._by_lower:
+                self._by_lower[lower] = set()
+                self._sorted = None
+            self._by_lower[lower].add(value)
+        posting.add(ordinal)
+
+    def remove(self, value: str, ordinal: int) -> None:
+        """Drop component ``ordinal`` from the posting for ``value``."""
+        posting = self.postings.get(value)
+        if posting is None:
+            return
+        posting.discard(ordinal)
+        if not posting:
+            del self.postings[value]
+            lower = value.lower()
+            self._by_lower[lower].discard(value)
+            if not self._by_lower[lower]:
+                del self._by_lower[lower]
+                self._sorted = None
+
+    def exact(self, key: str) -> Set[str]:
+        """Raw values equal to ``key`` ignoring case."""
+        return self._by_lower.get(key.lower(), set())
+
+    def prefix(self, prefix: str) -> List[str]:
+        """Raw values starting with ``prefix`` ignoring case."""
+        if self._sorted is None:
+            self._sorted = sorted(self._by_lower)
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._sorted, prefix)
+        values = []
+        for lower in itertools.islice(self._sorted, start, None):
+            if not lower.startswith(prefix):
+                break
+            values.extend(self._by_lower[lower])
+        return values
+
+
 class SearchEngine:
     """
     Advanced search engine for KiCad schematics.
@@ -166,6 +269,10 @@ class SearchEngine:
     - Connection analysis
     """
 
+    # Component attributes with a dedicated index; other field names are
+    # looked up in component properties and indexed on first use.
+    INDEXED_FIELDS = ("reference", "value", "footprint", "lib_id")
+
     def __init__(self, schematic: Schematic):
         """
         Initialize the search engine.
@@ -174,19 +281,22 @@ class SearchEngine:
             schematic: The schematic to search
         """
         self.schematic = schematic
+        self._parsed_values: Dict[str, Optional[float]] = {}
         self._build_indices()
 
     def _build_indices(self):
         """Build search indices for performance."""
-        # Component indices
-        self._components_by_ref = {
-            comp.reference: comp for comp in self.schematic.components
-        }
-        self._components_by_value = {}
-        for comp in self.schematic.components:
-            if comp.value not in self._components_by_value:
-                self._components_by_value[comp.value] = []
-            self._components_by_value[comp.value].append(comp)
+        # Components are numbered in schematic order so index hits can be
+        # returned in the same order a full scan would produce.
+        self._components: Dict[int, SchematicSymbol] = {}
+        self._ordinals: Dict[int, int] = {}
+        self._indexed: Dict[int, Tuple[Dict[str, str], Optional[Tuple]]] = {}
+        self._next_ordinal = 0
+        self._field_indices = {name: FieldIndex() for name in self.INDEXED_FIELDS}
+        self._property_indices: Dict[str, FieldIndex] = {}
+        self._spatial = BucketGrid(SPATIAL_CELL_SIZE)
+        for component in self.schematic.components:
+            self.index_component(component)
 
         # Net index (simplified - full implementation would trace connections)
         self._nets_by_name = {}
@@ -196,6 +306,118 @@ class SearchEngine:
                     self._nets_by_name[label.text] = []
                 self._nets_by_name[label.text].append(label)
 
+    def rebuild_indices(self):
+        """Rebuild all indices from the schematic (e.g. after reordering)."""
+        self._build_indices()
+
+    def _ensure_indices(self):
+        """
+        Rebuild indices if the component count changed behind our back.
+
+        This is only a constant-time safety net. Callers that add, remove or
+        edit components report each change with :meth:`index_component`,
+        :meth:`unindex_component` or :meth:`reindex_component`.
+        """
+        if len(self.schematic.components) != len(self._components):
+            logger.debug("Component count changed, rebuilding search indices")
+            self._build_indices()
+
+    def index_component(self, component: SchematicSymbol):
+        """
+        Add a component to the indices after it was added to the schematic.
+
+        Args:
+            component: The newly added component
+        """
+        if id(component) in self._ordinals:
+            return
+        ordinal = self._next_ordinal
+        self._next_ordinal += 1
+        self._ordinals[id(component)] = ordinal
+        self._components[ordinal] = component
+        self._add_to_indices(component, ordinal)
+
+    def unindex_component(self, component: SchematicSymbol) -> bool:
+        """
+        Remove a component from the indices after it left the schematic.
+
+        Args:
+            component: The removed component
+
+        Returns:
+            True if the component was indexed
+        """
+        ordinal = self._ordinals.pop(id(component), None)
+        if ordinal is None:
+            return False
+        self._remove_from_indices(ordinal)
+        del self._components[ordinal]
+        return True
+
+    def reindex_component(self, component: SchematicSymbol):
+        """
+        Refresh index entries for a component whose fields or position changed.
+
+        Args:
+            component: The modified component
+        """
+        ordinal = self._ordinals.get(id(component))
+        if ordinal is None:
+            self.index_component(component)
+            return
+        self._remove_from_indices(ordinal)
+        self._add_to_indices(component, ordinal)
+
+    def _add_to_indices(self, component: SchematicSymbol, ordinal: int):
+        values = {}
+        for name, index in self._field_indices.items():
+            value = getattr(component, name, None)
+            if isinstance(value, str):
+                index.add(value, ordinal)
+                values[name] = value
+        for name, index in self._property_indices.items():
+            value = self._property_value(component, name)
+            if value is not None:
+                index.add(value, ordinal)
+                values[name] = value
+
+        point = None
+        position = getattr(component, "position", None)
+        if position is not None:
+            point = (position.x, position.y)
+            self._spatial.add(ordinal, point * 2)
+        self._indexed[ordinal] = (values, point)
+
+    def _remove_from_indices(self, ordinal: int):
+        values, point = self._indexed.pop(ordinal)
+        for name, value in values.items():
+            self._field_index(name).remove(value, ordinal)
+        if point is not None:
+            self._spatial.remove(ordinal)
+
+    @staticmethod
+    def _property_value(component: SchematicSymbol, name: str) -> Optional[str]:
+        value = (getattr(component, "properties", None) or {}).get(name)
+        return value if isinstance(value, str) else None
+
+    def _field_index(self, field: str) -> FieldIndex:
+        """Index for a field, building property indices on first use."""
+        index = self._field_indices.get(field)
+        if index is None:
+            index = self._property_indices.get(field)
+        if index is None:
+            index = self._property_indices[field] = FieldIndex()
+            for ordinal, component in self._components.items():
+                value = self._property_value(component, field)
+                if value is not None:
+                    index.add(value, ordinal)
+                    self._indexed[ordinal][0][field] = value
+        return index
+
+    def _collect(self, ordinals: Set[int]) -> List[SchematicSymbol]:
+        """Components for a set of ordinals, in schematic order."""
+        return [self._components[ordinal] for ordinal in sorted(ordinals)]
+
     def search_components(
         self,
         query: Union[SearchQuery, str] = None,
@@ -219,8 +441,6 @@ class SearchEngine:
         Returns:
             List of matching components
         """
-        results = []
-
         # Handle simple string query
         if isinstance(query, str):
             search_query = SearchQuery()
@@ -255,12 +475,86 @@ class SearchEngine:
                     MatchType.REGEX if use_regex else MatchType.CONTAINS,
                 )
 
-        # Search all components
-        for component in self.schematic.components:
-            if self._matches_query(component, query):
-                results.append(component)
+        self._ensure_indices()
+        return self._collect(self._execute(query))
 
-        return results
+    def _criterion_cost(self, criterion: SearchCriterion) -> Tuple[int, int]:
+        """Rank a criterion: exact lookups, then prefix ranges, then key scans."""
+        if criterion.match_type == MatchType.EXACT:
+            rank = 0
+        elif literal_prefix(criterion.pattern, criterion.match_type):
+            rank = 1
+        else:
+            rank = 2
+        return rank, len(self._field_index(criterion.field))
+
+    def _execute(self, query: SearchQuery) -> Set[int]:
+        """
+        Evaluate a query against the indices.
+
+        AND queries start from the cheapest criterion and then either filter
+        the surviving components directly or intersect with another index
+        lookup, whichever touches fewer entries. OR queries union the lookups.
+        """
+        if not query.criteria:
+            return set(self._components)
+
+        if query.combine_with != "AND":
+            matched = set()
+            for criterion in query.criteria:
+                matched |= self._lookup(criterion)
+            return matched
+
+        first, *rest = sorted(query.criteria, key=self._criterion_cost)
+        matched = self._lookup(first)
+        for criterion in rest:
+            if not matched:
+                break
+            if len(matched) < len(self._field_index(criterion.field)):
+                matched = {
+                    ordinal
+                    for ordinal in matched
+                    if self._matches_criterion(self._components[ordinal], criterion)
+                }
+            else:
+                matched &= self._lookup(criterion)
+        return matched
+
+    def _lookup(self, criterion: SearchCriterion) -> Set[int]:
+        """Components matching one criterion, via its field index."""
+        index = self._field_index(criterion.field)
+        if criterion.match_type == MatchType.EXACT:
+            values = index.exact(criterion.pattern)
+        else:
+            prefix = literal_prefix(criterion.pattern, criterion.match_type)
+            values = index.prefix(prefix) if prefix else list(index.postings)
+
+        # Candidate keys are verified with the regular matcher, so the index
+        # only narrows the search and never changes what matches.
+        matched = set()
+        for value in values:
+            if self._matches_pattern(
+                value,
+                criterion.pattern,
+                criterion.match_type,
+                criterion.case_sensitive,
+            ):
+                matched |= index.postings[value]
+        return matched
+
+    def _matches_criterion(
+        self, component: SchematicSymbol, criterion: SearchCriterion
+    ) -> bool:
+        """Check a single criterion against a component."""
+        field_value = self._get_component_field(component, criterion.field)
+        if field_value is None:
+            return False
+        return self._matches_pattern(
+            field_value,
+            criterion.pattern,
+            criterion.match_type,
+            criterion.case_sensitive,
+        )
 
     def _matches_query(self, component: SchematicSymbol, query: SearchQuery) -> bool:
         """Check if component matches search query."""
@@ -367,51 +661,54 @@ class SearchEngine:
         Returns:
             List of matching components
         """
-        results = []
+        self._ensure_indices()
+        index = self._field_indices["value"]
+        matched = set()
 
         if tolerance is not None:
             # Parse target value
             target_value = ComponentValueParser.parse_value(value_pattern)
             if target_value is None:
-                return results
+                return []
 
             # Search with tolerance
             min_value = target_value * (1 - tolerance)
             max_value = target_value * (1 + tolerance)
 
-            for component in self.schematic.components:
-                comp_value = ComponentValueParser.parse_value(component.value)
+            # Each distinct value string is parsed once and cached
+            for value, ordinals in index.postings.items():
+                if value not in self._parsed_values:
+                    self._parsed_values[value] = ComponentValueParser.parse_value(value)
+                comp_value = self._parsed_values[value]
                 if comp_value is not None:
                     if min_value <= comp_value <= max_value:
-                        results.append(component)
+                        matched |= ordinals
         else:
             # Exact string match
             if value_pattern is not None:
-                for component in self.schematic.components:
-                    if component.value and value_pattern in component.value:
-                        results.append(component)
+                for value, ordinals in index.postings.items():
+                    if value and value_pattern in value:
+                        matched |= ordinals
 
-        return results
+        return self._collect(matched)
 
     def search_by_footprint(self, footprint_pattern: str) -> List[SchematicSymbol]:
         """Search components by footprint."""
-        results = []
+        self._ensure_indices()
+        matched = set()
 
-        for component in self.schematic.components:
-            if component.footprint and footprint_pattern in component.footprint:
-                results.append(component)
+        for footprint, ordinals in self._field_indices["footprint"].postings.items():
+            if footprint and footprint_pattern in footprint:
+                matched |= ordinals
 
-        return results
+        return self._collect(matched)
 
     def find_components_in_area(self, area: BoundingBox) -> List[SchematicSymbol]:
         """Find all components within a bounding box."""
-        results = []
-
-        for component in self.schematic.components:
-            if area.contains_point(component.position.x, component.position.y):
-                results.append(component)
-
-        return results
+        self._ensure_indices()
+        return self._collect(
+            set(self._spatial.query((area.min_x, area.min_y, area.max_x, area.max_y)))
+        )
 
     def find_unconnected_pins(self) -> Dict[str, List[str]]:
         """
@@ -426,21 +723,19 @@ class SearchEngine:
         # Full implementation would need symbol library data
         # and actual connection tracing
 
-        # For now, check if component has any wires nearby
+        # For now, check if component has any wires nearby. Wire points are
+        # bucketed once so each component only inspects nearby grid cells.
+        wire_points = BucketGrid(SPATIAL_CELL_SIZE)
+        for wire in self.schematic.wires:
+            for point in wire.points:
+                wire_points.add(len(wire_points), (point.x, point.y) * 2)
+
         for component in self.schematic.components:
-            # Check if any wires are near the component
-            has_connection = False
             comp_bbox = component.get_bounding_box()
-
-            for wire in self.schematic.wires:
-                for point in wire.points:
-                    if comp_bbox.contains_point(point.x, point.y):
-                        has_connection = True
-                        break
-                if has_connection:
-                    break
-
-            if not has_connection:
+            nearby = wire_points.query(
+                (comp_bbox.min_x, comp_bbox.min_y, comp_bbox.max_x, comp_bbox.max_y)
+            )
+            if next(nearby, None) is None:
                 unconnected[component.reference] = ["all"]  # Placeholder
 
         return unconnected
@@ -478,18 +773,15 @@ class SearchEngine:
 
     def find_duplicate_references(self) -> List[Tuple[str, List[SchematicSymbol]]]:
         """Find components with duplicate reference designators."""
-        ref_map = {}
+        self._ensure_indices()
+        postings = self._field_indices["reference"].postings
 
-        for component in self.schematic.components:
-            if component.reference:
-                if component.reference not in ref_map:
-                    ref_map[component.reference] = []
-                ref_map[component.reference].append(component)
-
-        duplicates = []
-        for ref, components in ref_map.items():
-            if len(components) > 1:
-                duplicates.append((ref, components))
+        duplicates = [
+            (ref, self._collect(ordinals))
+            for ref, ordinals in postings.items()
+            if ref and len(ordinals) > 1
+        ]
+        duplicates.sort(key=lambda item: self._ordinals[id(item[1][0])])
 
         return duplicates
 
@@ -70,8 +70,10 @@ class SymbolGeometry:
             return bounds
         except Exception as e:
             logger.warning(f"Failed to parse symbol {lib_id}: {e}")
-            # Fall back to defaults
+            # Fall back to defaults, remembering them so a missing symbol is
+            # only looked up (and reported) once
             default_bounds = self._get_default_bounds(lib_id)
+            self._cache[lib_id] = default_bounds
             logger.info(
                 f"Using default bounds for {lib_id}: {default_bounds[0]:.2f} x {default_bounds[1]:.2f} mm"
             )
@@ -1,14 +1,27 @@
 """
 Matching strategies for component synchronization.
+
+Each strategy can report its candidate pairs with scores through
+``score_components``. The synchronizer then solves one global assignment
+per strategy with ``solve_assignment`` instead of taking first matches
+greedily.
 """
 
+import math
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from collections import defaultdict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
 
 from .net_matcher import NetMatcher
 from .search_engine import MatchType, SearchEngine
 
+# circuit_id -> {kicad_reference: score}, higher scores are better matches
+CandidateScores = Dict[str, Dict[str, float]]
+
 
 class SyncStrategy(ABC):
     """Base class for component matching strategies."""
@@ -25,6 +38,128 @@ class SyncStrategy(ABC):
         """
         pass
 
+    def score_components(
+        self, circuit_components: Dict[str, Dict], kicad_components: Dict[str, Any]
+    ) -> CandidateScores:
+        """
+        Score every candidate pair this strategy accepts, in bulk.
+
+        The default wraps ``match_components`` with a score of 1.0 per match.
+        Strategies override this to report all candidates so conflicts can be
+        resolved by :func:`solve_assignment`.
+
+        Returns:
+            Dictionary mapping circuit_id -> {kicad_reference: score}
+        """
+        return {
+            circuit_id: {kicad_ref: 1.0}
+            for circuit_id, kicad_ref in self.match_components(
+                circuit_components, kicad_components
+            ).items()
+        }
+
+
+class MatchMap:
+    """
+    Bidirectional circuit_id <-> kicad_reference map with O(1) conflict checks.
+    """
+
+    def __init__(self):
+        self._by_circuit: Dict[str, str] = {}
+        self._by_kicad: Dict[str, str] = {}
+
+    def add(self, circuit_id: str, kicad_ref: str) -> bool:
+        """
+        Record a match unless either side is already matched.
+
+        Returns:
+            True if the match was added, False on conflict
+        """
+        if circuit_id in self._by_circuit or kicad_ref in self._by_kicad:
+            return False
+        self._by_circuit[circuit_id] = kicad_ref
+        self._by_kicad[kicad_ref] = circuit_id
+        return True
+
+    def has_circuit(self, circuit_id: str) -> bool:
+        return circuit_id in self._by_circuit
+
+    def has_kicad(self, kicad_ref: str) -> bool:
+        return kicad_ref in self._by_kicad
+
+    def kicad_for(self, circuit_id: str) -> Optional[str]:
+        return self._by_circuit.get(circuit_id)
+
+    def circuit_for(self, kicad_ref: str) -> Optional[str]:
+        return self._by_kicad.get(kicad_ref)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._by_circuit.items())
+
+    def to_dict(self) -> Dict[str, str]:
+        return dict(self._by_circuit)
+
+    def __len__(self) -> int:
+        return len(self._by_circuit)
+
+
+def solve_assignment(scores: CandidateScores) -> Dict[str, str]:
+    """
+    Pick a one-to-one set of matches that maximizes the total score.
+
+    The candidate graph is split into connected components, so unambiguous
+    pairs are taken directly. Only the contested clusters go through the
+    Hungarian algorithm, which keeps large, mostly one-to-one syncs linear.
+
+    Args:
+        scores: circuit_id -> {kicad_reference: score}, scores > 0
+
+    Returns:
+        Dictionary mapping circuit_id -> kicad_reference
+    """
+    by_kicad: Dict[str, list] = defaultdict(list)
+    for circuit_id, candidates in scores.items():
+        for kicad_ref in candidates:
+            by_kicad[kicad_ref].append(circuit_id)
+
+    matches = {}
+    visited = set()
+    for start, candidates in scores.items():
+        if start in visited or not candidates:
+            continue
+
+        # Collect the connected cluster of circuit ids and KiCad refs
+        circuit_ids, kicad_refs = [], {}
+        stack = [start]
+        visited.add(start)
+        while stack:
+            circuit_id = stack.pop()
+            circuit_ids.append(circuit_id)
+            for kicad_ref in scores[circuit_id]:
+                if kicad_ref in kicad_refs:
+                    continue
+                kicad_refs[kicad_ref] = len(kicad_refs)
+                for other in by_kicad[kicad_ref]:
+                    if other not in visited:
+                        visited.add(other)
+                        stack.append(other)
+
+        if len(circuit_ids) == 1 and len(kicad_refs) == 1:
+            matches[start] = next(iter(kicad_refs))
+            continue
+
+        # Maximize total score; missing edges cost nothing and are dropped
+        cost = np.zeros((len(circuit_ids), len(kicad_refs)))
+        for row, circuit_id in enumerate(circuit_ids):
+            for kicad_ref, score in scores[circuit_id].items():
+                cost[row, kicad_refs[kicad_ref]] = -score
+        refs = list(kicad_refs)
+        for row, col in zip(*linear_sum_assignment(cost)):
+            if cost[row, col] < 0:
+                matches[circuit_ids[row]] = refs[col]
+
+    return matches
+
 
 class UUIDMatchStrategy(SyncStrategy):
     """
@@ -51,18 +186,18 @@ class UUIDMatchStrategy(SyncStrategy):
         Returns:
             Dict mapping circuit_id -> kicad_reference for matched components
         """
-        matches = {}
+        # Index KiCad components by UUID once (first reference wins)
+        refs_by_uuid = {}
+        for kicad_ref, kicad_comp in kicad_components.items():
+            kicad_uuid = getattr(kicad_comp, "uuid", None)
+            if kicad_uuid:
+                refs_by_uuid.setdefault(kicad_uuid, kicad_ref)
 
+        matches = {}
         for circuit_id, circuit_comp in circuit_components.items():
             circuit_uuid = circuit_comp.get("uuid")
-            if not circuit_uuid:
-                continue
-
-            # Find KiCad component with matching UUID
-            for kicad_ref, kicad_comp in kicad_components.items():
-                if hasattr(kicad_comp, "uuid") and kicad_comp.uuid == circuit_uuid:
-                    matches[circuit_id] = kicad_ref
-                    break
+            if circuit_uuid and circuit_uuid in refs_by_uuid:
+                matches[circuit_id] = refs_by_uuid[circuit_uuid]
 
         return matches
 
@@ -94,6 +229,16 @@ class ReferenceMatchStrategy(SyncStrategy):
 
         return matches
 
+    def score_components(
+        self, circuit_components: Dict[str, Dict], kicad_components: Dict[str, Any]
+    ) -> CandidateScores:
+        """Score exact reference matches with dictionary lookups."""
+        return {
+            circuit_id: {circuit_comp["reference"]: 1.0}
+            for circuit_id, circuit_comp in circuit_components.items()
+            if circuit_comp["reference"] in kicad_components
+        }
+
 
 class ValueFootprintStrategy(SyncStrategy):
     """Match components by value and footprint."""
@@ -129,10 +274,47 @@ class ValueFootprintStrategy(SyncStrategy):
 
         return matches
 
+    def score_components(
+        self, circuit_components: Dict[str, Dict], kicad_components: Dict[str, Any]
+    ) -> CandidateScores:
+        """
+        Score value/footprint candidates, preferring the closest position.
+
+        Candidates that are equally good on value and footprint are ranked
+        by distance, so the assignment keeps components where they were.
+        """
+        scores = {}
+        for circuit_id, circuit_comp in circuit_components.items():
+            candidates = self.search_engine.search_by_value(circuit_comp["value"])
+
+            footprint = circuit_comp.get("footprint")
+            if footprint and candidates:
+                candidates = [c for c in candidates if c.footprint == footprint]
+
+            position = circuit_comp.get("position")
+            entry = {}
+            for candidate in candidates:
+                if candidate.reference not in kicad_components:
+                    continue
+                candidate_pos = getattr(candidate, "position", None)
+                if position is not None and candidate_pos is not None:
+                    distance = math.hypot(
+                        position.x - candidate_pos.x, position.y - candidate_pos.y
+                    )
+                    entry[candidate.reference] = 1.0 / (1.0 + distance)
+                else:
+                    entry[candidate.reference] = 0.5
+            if entry:
+                scores[circuit_id] = entry
+        return scores
+
 
 class ConnectionMatchStrategy(SyncStrategy):
     """Match components by their connections."""
 
+    # Matches must be strictly more similar than this (Jaccard over nets)
+    MIN_CONFIDENCE = 0.7
+
     def __init__(self, net_matcher: NetMatcher):
         self.net_matcher = net_matcher
 
@@ -154,18 +336,40 @@ class ConnectionMatchStrategy(SyncStrategy):
 
             # Get matches by connection
             connection_matches = self.net_matcher.match_by_connections(
-                circuit_comp, kicad_list
+                circuit_comp, kicad_list, min_similarity=self.MIN_CONFIDENCE
             )
 
             # Take best match with high confidence
             for kicad_ref, confidence in connection_matches:
-                if confidence > 0.7 and kicad_ref not in used_refs:
+                if confidence > self.MIN_CONFIDENCE and kicad_ref not in used_refs:
                     matches[circuit_id] = kicad_ref
                     used_refs.add(kicad_ref)
                     break
 
         return matches
 
+    def score_components(
+        self, circuit_components: Dict[str, Dict], kicad_components: Dict[str, Any]
+    ) -> CandidateScores:
+        """Report every high-confidence connection match with its confidence."""
+        kicad_list = [
+            {"reference": ref, "component": comp}
+            for ref, comp in kicad_components.items()
+        ]
+
+        scores = {}
+        for circuit_id, circuit_comp in circuit_components.items():
+            entry = {
+                kicad_ref: confidence
+                for kicad_ref, confidence in self.net_matcher.match_by_connections(
+                    circuit_comp, kicad_list, min_similarity=self.MIN_CONFIDENCE
+                )
+                if confidence > self.MIN_CONFIDENCE and kicad_ref in kicad_components
+            }
+            if entry:
+                scores[circuit_id] = entry
+        return scores
+
 
 class PositionRenameStrategy(SyncStrategy):
     """
@@ -242,6 +446,52 @@ class PositionRenameStrategy(SyncStrategy):
 
         return matches
 
+    def score_components(
+        self, circuit_components: Dict[str, Dict], kicad_components: Dict[str, Any]
+    ) -> CandidateScores:
+        """
+        Score rename candidates found through a spatial hash of KiCad positions.
+
+        Only KiCad components in the 3x3 grid cells around a circuit
+        component are compared. Closer components score higher.
+        """
+        cell = self.position_tolerance
+        grid = defaultdict(list)
+        for kicad_ref, kicad_comp in kicad_components.items():
+            pos = getattr(kicad_comp, "position", None)
+            if pos is not None:
+                grid[(math.floor(pos.x / cell), math.floor(pos.y / cell))].append(
+                    kicad_ref
+                )
+
+        scores = {}
+        for circuit_id, circuit_comp in circuit_components.items():
+            if circuit_comp["reference"] in kicad_components:
+                continue
+            circuit_pos = circuit_comp.get("position")
+            if not circuit_pos:
+                continue
+
+            cx = math.floor(circuit_pos.x / cell)
+            cy = math.floor(circuit_pos.y / cell)
+            entry = {}
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for kicad_ref in grid.get((cx + dx, cy + dy), ()):
+                        kicad_comp = kicad_components[kicad_ref]
+                        if not self._positions_match(
+                            circuit_pos, kicad_comp.position
+                        ) or not self._properties_match(circuit_comp, kicad_comp):
+                            continue
+                        distance = math.hypot(
+                            circuit_pos.x - kicad_comp.position.x,
+                            circuit_pos.y - kicad_comp.position.y,
+                        )
+                        entry[kicad_ref] = 1.0 / (1.0 + distance)
+            if entry:
+                scores[circuit_id] = entry
+        return scores
+
     def _positions_match(self, pos1: Any, pos2: Any) -> bool:
         """
         Check if positions match within tolerance.
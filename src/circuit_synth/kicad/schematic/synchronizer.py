@@ -23,11 +23,13 @@ from .net_matcher import NetMatcher
 from .search_engine import SearchEngine, SearchQueryBuilder
 from .sync_strategies import (
     ConnectionMatchStrategy,
+    MatchMap,
     PositionRenameStrategy,
     ReferenceMatchStrategy,
     SyncStrategy,
     UUIDMatchStrategy,
     ValueFootprintStrategy,
+    solve_assignment,
 )
 
 logger = logging.getLogger(__name__)
@@ -238,34 +240,26 @@ class APISynchronizer:
         try:
             # Extract components from circuit
             circuit_components = self._extract_circuit_components(circuit)
-            logger.info(f"=== CIRCUIT COMPONENTS EXTRACTED ===")
+            logger.debug(f"=== CIRCUIT COMPONENTS EXTRACTED ===")
             for comp_id, comp_data in circuit_components.items():
-                logger.info(f"  Circuit Component: {comp_id}")
-                logger.info(f"    Reference: {comp_data.get('reference')}")
-                logger.info(f"    Value: {comp_data.get('value')}")
-                logger.info(f"    Symbol: {comp_data.get('symbol')}")
+                logger.debug(
+                    f"  Circuit Component: {comp_id} "
+                    f"(ref={comp_data.get('reference')}, value={comp_data.get('value')}, "
+                    f"symbol={comp_data.get('symbol')})"
+                )
 
             kicad_components = {c.reference: c for c in self.schematic.components}
-            logger.info(f"=== KICAD COMPONENTS FOUND ===")
+            logger.debug(f"=== KICAD COMPONENTS FOUND ===")
             for ref, comp in kicad_components.items():
-                logger.info(f"  KiCad Component: {ref}")
-                logger.info(f"    Value: {getattr(comp, 'value', 'N/A')}")
-                logger.info(f"    Symbol: {getattr(comp, 'lib_id', 'N/A')}")
-                logger.info(
-                    f"    Position: ({getattr(comp, 'at_x', 'N/A')}, {getattr(comp, 'at_y', 'N/A')})"
+                logger.debug(
+                    f"  KiCad Component: {ref} "
+                    f"(value={getattr(comp, 'value', 'N/A')}, symbol={getattr(comp, 'lib_id', 'N/A')})"
                 )
 
             # Match components using strategies
             matches = self._match_components(circuit_components, kicad_components)
             report.matched = matches
 
-            logger.info(f"=== MATCHING RESULTS ===")
-            logger.info(f"  Total circuit components: {len(circuit_components)}")
-            logger.info(f"  Total KiCad components: {len(kicad_components)}")
-            logger.info(f"  Total matches found: {len(matches)}")
-            for circuit_id, kicad_ref in matches.items():
-                logger.info(f"    MATCHED: {circuit_id} -> {kicad_ref}")
-
             # Process matches
             self._process_matches(circuit_components, kicad_components, matches, report)
 
@@ -916,6 +910,7 @@ class APISynchronizer:
                     logger.warning(f"Could not remove old power symbol {old_power_symbol.reference} - new symbol added but old may remain")
                     # Don't return False - new symbol is in place, so partial success
                 else:
+                    self.search_engine.unindex_component(old_power_symbol)
                     logger.debug(f"Removed old power symbol {old_power_symbol.reference} ({old_name})")
 
                 logger.info(f"Replaced power symbol at {component_ref} pin {pin_number}: '{old_name}' -> '{new_net_name}'")
@@ -1038,48 +1033,49 @@ class APISynchronizer:
     def _match_components(
         self, circuit_components: Dict, kicad_components: Dict
     ) -> Dict[str, str]:
-        """Match components using multiple strategies."""
-        all_matches = {}
+        """
+        Match components using multiple strategies.
 
-        logger.info(f"=== COMPONENT MATCHING STRATEGIES ===")
+        Strategies run in priority order. Each one scores candidates among the
+        components still unmatched on both sides, and its matches are chosen by
+        a global assignment rather than first-come-first-served.
+        """
+        match_map = MatchMap()
+
+        logger.debug("=== COMPONENT MATCHING STRATEGIES ===")
         for i, strategy in enumerate(self.strategies):
             strategy_name = strategy.__class__.__name__
-            logger.info(f"  Strategy {i+1}: {strategy_name}")
 
-            matches = strategy.match_components(circuit_components, kicad_components)
-            logger.info(f"    Found {len(matches)} matches:")
-            for circuit_id, kicad_ref in matches.items():
-                logger.info(f"      {circuit_id} -> {kicad_ref}")
+            remaining_circuit = {
+                circuit_id: comp
+                for circuit_id, comp in circuit_components.items()
+                if not match_map.has_circuit(circuit_id)
+            }
+            remaining_kicad = {
+                ref: comp
+                for ref, comp in kicad_components.items()
+                if not match_map.has_kicad(ref)
+            }
+            if not remaining_circuit or not remaining_kicad:
+                break
 
-            # Add new matches that don't conflict
-            new_matches_added = 0
-            for circuit_id, kicad_ref in matches.items():
-                if (
-                    circuit_id not in all_matches
-                    and kicad_ref not in all_matches.values()
-                ):
-                    all_matches[circuit_id] = kicad_ref
-                    new_matches_added += 1
-                    logger.info(f"      ADDED: {circuit_id} -> {kicad_ref}")
-                else:
-                    if circuit_id in all_matches:
-                        logger.info(
-                            f"      SKIPPED (circuit_id conflict): {circuit_id} already matched to {all_matches[circuit_id]}"
-                        )
-                    if kicad_ref in all_matches.values():
-                        existing_circuit_id = [
-                            k for k, v in all_matches.items() if v == kicad_ref
-                        ][0]
-                        logger.info(
-                            f"      SKIPPED (kicad_ref conflict): {kicad_ref} already matched to {existing_circuit_id}"
-                        )
+            scores = strategy.score_components(remaining_circuit, remaining_kicad)
+            assignment = solve_assignment(scores)
 
-            logger.info(
-                f"    New matches added from this strategy: {new_matches_added}"
+            for circuit_id, kicad_ref in assignment.items():
+                match_map.add(circuit_id, kicad_ref)
+                logger.debug(f"      {strategy_name}: {circuit_id} -> {kicad_ref}")
+
+            logger.debug(
+                f"  Strategy {i+1}: {strategy_name} - {len(scores)} candidates, "
+                f"{len(assignment)} matched"
             )
 
-        logger.info(f"  Final matches after all strategies: {len(all_matches)}")
-        return all_matches
+        logger.info(
+            f"Matched {len(match_map)} of {len(circuit_components)} circuit components "
+            f"to {len(kicad_components)} KiCad components"
+        )
+        return match_map.to_dict()
 
     def _process_matches(
         self,
@@ -1103,6 +1099,7 @@ class APISynchronizer:
                     new_ref=circuit_ref
                 )
                 if success:
+                    self.search_engine.reindex_component(kicad_comp)
                     report.renamed.append((kicad_ref, circuit_ref))
                     # Update kicad_components dict key for subsequent operations
                     kicad_components[circuit_ref] = kicad_components.pop(kicad_ref)
@@ -1126,6 +1123,7 @@ class APISynchronizer:
                     lib_id=circuit_comp.get("symbol"),
                 )
                 if success:
+                    self.search_engine.reindex_component(kicad_comp)
                     report.modified.append(kicad_ref)
 
     def _needs_update(self, circuit_comp: Dict, kicad_comp: SchematicSymbol) -> bool:
@@ -1214,6 +1212,7 @@ class APISynchronizer:
             else:
                 logger.info(f"      -> REMOVING (preserve_user_components=False)")
                 self.component_manager.remove_component(kicad_ref)
+                self.search_engine.unindex_component(kicad_comp)
                 report.removed.append(kicad_ref)
 
     def _add_component(self, comp_data: Dict, report: SyncReport):
@@ -1230,6 +1229,8 @@ class APISynchronizer:
         )
 
         if component:
+            # The manager may wrap the symbol it returns, so the search
+            # engine picks the new component up through its count check
             report.added.append(comp_data["id"])
 
     def _determine_library_id(self, comp_data: Dict) -> str:
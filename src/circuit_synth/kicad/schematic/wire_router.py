@@ -3,17 +3,43 @@ Wire routing algorithms for KiCad schematics.
 
 This module provides various wire routing algorithms for creating
 aesthetically pleasing and electrically correct wire connections.
+Obstacle-aware routing runs A* over an ObstacleGrid, a bitmap of the
+schematic grid that is rasterized once per sheet and shared by every net
+routed on it.
 """
 
+import heapq
 import logging
 import math
-from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple
-
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 from kicad_sch_api.core.types import Point
 
 logger = logging.getLogger(__name__)
 
+Rect = Tuple[float, float, float, float]
+
+# Grid steps as (column, row) offsets: right, left, down, up. Directions 0
+# and 1 are horizontal, and d ^ 1 is the opposite of d. _NO_DIR marks the
+# first state of a search, before any step has been taken.
+_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_NO_DIR = 4
+_FREE = -1
+_UNNAMED_NET = -2  # Net id for one-off route_smart wires; owns no cells
+_EPS = 1e-6
+
 
 @dataclass
 class RoutingConstraints:
@@ -24,6 +50,318 @@ class RoutingConstraints:
     prefer_horizontal: bool = True
     avoid_diagonal: bool = True
     max_segments: int = 5
+    bend_penalty: float = 4.0  # Cost of a corner, in grid steps
+    crossing_penalty: float = 2.0  # Cost of crossing another net's wire
+
+
+@dataclass
+class RoutedNet:
+    """Wires produced for one net by WireRouter.route_nets."""
+
+    name: Hashable
+    wires: List[List[Point]] = field(default_factory=list)
+    junctions: List[Point] = field(default_factory=list)
+    unrouted: List[Tuple[float, float]] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """True when every pin of the net was connected."""
+        return not self.unrouted
+
+
+class ObstacleGrid:
+    """
+    Obstacle and wire occupancy bitmap over the schematic routing grid.
+
+    Obstacle rectangles are rasterized once. A grid point is blocked when it
+    lies strictly inside a rectangle, so wires may run along a symbol's
+    outline and start at pins sitting on it. A rectangle too thin to hold a
+    grid point blocks the grid line nearest its centre instead.
+
+    Wires added to the grid are recorded per net: which net runs
+    horizontally and vertically through each point, and which net owns the
+    pins, corners and wire ends there. Wires of other nets may cross at a
+    right angle but may not overlap, turn on or touch those points, since
+    any of that would connect the two nets.
+
+    Args:
+        obstacles: Obstacle rectangles (x1, y1, x2, y2)
+        grid_size: Grid pitch in mm
+        points: Extra points the grid must cover, such as the pins to route
+        margin: Free grid lines kept around the covered area
+    """
+
+    def __init__(
+        self,
+        obstacles: Iterable[Rect] = (),
+        grid_size: float = 2.54,
+        points: Iterable[Tuple[float, float]] = (),
+        margin: int = 4,
+    ):
+        self.grid_size = grid_size
+        rects = [
+            (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+            for x1, y1, x2, y2 in obstacles
+        ]
+        points = list(points)
+        xs = [r[0] for r in rects] + [r[2] for r in rects] + [p[0] for p in points]
+        ys = [r[1] for r in rects] + [r[3] for r in rects] + [p[1] for p in points]
+        xs = xs or [0.0]
+        ys = ys or [0.0]
+
+        self.col0 = math.floor(min(xs) / grid_size + _EPS) - margin
+        self.row0 = math.floor(min(ys) / grid_size + _EPS) - margin
+        self.cols = math.ceil(max(xs) / grid_size - _EPS) - self.col0 + margin + 1
+        self.rows = math.ceil(max(ys) / grid_size - _EPS) - self.row0 + margin + 1
+        size = self.cols * self.rows
+
+        # The search indexes the bytearray directly; the numpy view over the
+        # same memory is for rasterizing and inspection.
+        self._blocked = bytearray(size)
+        self.blocked = np.frombuffer(self._blocked, dtype=np.bool_).reshape(
+            self.rows, self.cols
+        )
+        for rect in rects:
+            self._rasterize(rect)
+
+        self._h_owner = [_FREE] * size
+        self._v_owner = [_FREE] * size
+        self._node_owner = [_FREE] * size
+        self._net_ids: Dict[Hashable, int] = {}
+
+    def _grid_span(self, lo: float, hi: float) -> Tuple[int, int]:
+        """Grid lines strictly between lo and hi, or the one nearest them."""
+        first = math.floor(lo / self.grid_size + _EPS) + 1
+        last = math.ceil(hi / self.grid_size - _EPS) - 1
+        if first > last:
+            first = last = round((lo + hi) / 2 / self.grid_size)
+        return first, last
+
+    def _rasterize(self, rect: Rect) -> None:
+        col1, col2 = self._grid_span(rect[0], rect[2])
+        row1, row2 = self._grid_span(rect[1], rect[3])
+        self.blocked[
+            row1 - self.row0 : row2 - self.row0 + 1,
+            col1 - self.col0 : col2 - self.col0 + 1,
+        ] = True
+
+    def net_id(self, net: Hashable) -> int:
+        """Small integer identifying ``net`` in the occupancy tables."""
+        return self._net_ids.setdefault(net, len(self._net_ids))
+
+    def index(self, point: Tuple[float, float]) -> Optional[int]:
+        """Cell index of the grid point nearest ``point``, None if off the grid."""
+        col = round(point[0] / self.grid_size) - self.col0
+        row = round(point[1] / self.grid_size) - self.row0
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return None
+
+    def point(self, index: int) -> Tuple[float, float]:
+        """Coordinates of a cell index."""
+        row, col = divmod(index, self.cols)
+        return (
+            round((col + self.col0) * self.grid_size, 4),
+            round((row + self.row0) * self.grid_size, 4),
+        )
+
+    def covers(self, points: Iterable[Tuple[float, float]]) -> bool:
+        """True if every point lies on the grid."""
+        return all(self.index(p) is not None for p in points)
+
+    def is_blocked(self, point: Tuple[float, float]) -> bool:
+        """True if ``point`` is inside an obstacle or off the grid."""
+        index = self.index(point)
+        return index is None or bool(self._blocked[index])
+
+    def is_free(self, index: int) -> bool:
+        """True if no obstacle or wire occupies a cell."""
+        return (
+            not self._blocked[index]
+            and self._h_owner[index] == _FREE
+            and self._v_owner[index] == _FREE
+            and self._node_owner[index] == _FREE
+        )
+
+    def can_join(self, index: int, net: int) -> bool:
+        """True if a wire of ``net`` may end or turn at a cell."""
+        return (
+            self._h_owner[index] in (_FREE, net)
+            and self._v_owner[index] in (_FREE, net)
+            and self._node_owner[index] in (_FREE, net)
+        )
+
+    def segment_clear(
+        self, start: Tuple[float, float], end: Tuple[float, float]
+    ) -> bool:
+        """
+        Check that nothing lies on a segment between its end points.
+
+        The segment is sampled at every grid point it passes (twice per
+        pitch for diagonals); its end points themselves are not tested.
+        """
+        first, last = self.index(start), self.index(end)
+        if first is None or last is None:
+            return False
+        g = self.grid_size
+        samples = 2 * max(
+            math.ceil(abs(end[0] - start[0]) / g),
+            math.ceil(abs(end[1] - start[1]) / g),
+        )
+        for i in range(1, samples):
+            t = i / samples
+            index = self.index(
+                (start[0] + (end[0] - start[0]) * t, start[1] + (end[1] - start[1]) * t)
+            )
+            if index not in (first, last) and not self.is_free(index):
+                return False
+        return True
+
+    def add_pins(self, points: Iterable[Tuple[float, float]], net: Hashable) -> None:
+        """Reserve pin positions for ``net`` so other nets keep off them."""
+        net_id = self.net_id(net)
+        for point in points:
+            index = self.index(point)
+            if index is not None:
+                self._node_owner[index] = net_id
+
+    def add_wire(self, points: Sequence[Tuple[float, float]], net: Hashable) -> None:
+        """
+        Record an existing axis-aligned wire so routed nets avoid it.
+
+        Args:
+            points: Wire vertices
+            net: Net the wire belongs to
+        """
+        net_id = self.net_id(net)
+        for a, b in zip(points, points[1:]):
+            first, last = self.index(a), self.index(b)
+            if first is None or last is None:
+                continue
+            row1, col1 = divmod(first, self.cols)
+            row2, col2 = divmod(last, self.cols)
+            if row1 != row2 and col1 != col2:
+                continue
+            step = 1 if row1 == row2 else self.cols
+            if last < first:
+                step = -step
+            self.add_path(range(first, last + step, step), net_id)
+
+    def add_path(self, cells: Sequence[int], net: int) -> None:
+        """Mark a path of adjacent cells, as found by find_path, for ``net``."""
+        node_owner = self._node_owner
+        node_owner[cells[0]] = node_owner[cells[-1]] = net
+        for i in range(1, len(cells)):
+            a, b = cells[i - 1], cells[i]
+            owner = self._h_owner if abs(b - a) == 1 else self._v_owner
+            owner[a] = owner[b] = net
+            if i + 1 < len(cells) and cells[i + 1] - b != b - a:
+                node_owner[b] = net
+
+    def find_path(
+        self,
+        source: int,
+        targets: Set[int],
+        net: int,
+        bend_penalty: float = 4.0,
+        crossing_penalty: float = 2.0,
+        prefer_horizontal: bool = True,
+    ) -> Optional[List[int]]:
+        """
+        A* search for the cheapest path from ``source`` to any target cell.
+
+        Each step costs 1, each corner ``bend_penalty`` and each crossing of
+        another net's wire ``crossing_penalty``. Search states are (cell,
+        heading) pairs so corners can be priced, and the heuristic is the
+        Manhattan distance to the bounding box of the targets. Target cells
+        may lie inside obstacles, which lets pins sit within a symbol body.
+
+        Args:
+            source: Start cell
+            targets: Cells that end the search
+            net: Net id of the wire being routed
+            bend_penalty: Cost of a corner in grid steps
+            crossing_penalty: Cost of crossing another net in grid steps
+            prefer_horizontal: Expand horizontal steps first on ties
+
+        Returns:
+            Cells from ``source`` to the target reached, or None
+        """
+        if source in targets:
+            return [source]
+        if not targets:
+            return None
+
+        cols, rows = self.cols, self.rows
+        blocked = self._blocked
+        h_owner, v_owner = self._h_owner, self._v_owner
+        node_owner = self._node_owner
+        target_cols = [t % cols for t in targets]
+        target_rows = [t // cols for t in targets]
+        col_lo, col_hi = min(target_cols), max(target_cols)
+        row_lo, row_hi = min(target_rows), max(target_rows)
+        order = (0, 1, 2, 3) if prefer_horizontal else (2, 3, 0, 1)
+
+        start = source * 5 + _NO_DIR
+        best = {start: 0.0}
+        came_from: Dict[int, int] = {}
+        heap = [(0.0, 0, 0, 0.0, start)]
+        pushed = 0
+        while heap:
+            _, _, _, cost, state = heapq.heappop(heap)
+            if cost > best[state]:
+                continue
+            index, heading = divmod(state, 5)
+            if index in targets:
+                path = [index]
+                while state in came_from:
+                    state = came_from[state]
+                    path.append(state // 5)
+                path.reverse()
+                return path
+
+            row, col = divmod(index, cols)
+            may_turn = heading == _NO_DIR or (
+                h_owner[index] in (_FREE, net) and v_owner[index] in (_FREE, net)
+            )
+            for direction in order:
+                turning = heading != _NO_DIR and direction != heading
+                if turning and (not may_turn or direction == heading ^ 1):
+                    continue
+                dc, dr = _STEPS[direction]
+                c, r = col + dc, row + dr
+                if not (0 <= c < cols and 0 <= r < rows):
+                    continue
+                nxt = r * cols + c
+                if blocked[nxt] and nxt not in targets:
+                    continue
+                if node_owner[nxt] not in (_FREE, net):
+                    continue
+                if direction < 2:
+                    along, across = h_owner[nxt], v_owner[nxt]
+                else:
+                    along, across = v_owner[nxt], h_owner[nxt]
+                if along not in (_FREE, net):
+                    continue
+
+                new_cost = cost + 1.0
+                if turning:
+                    new_cost += bend_penalty
+                if across not in (_FREE, net):
+                    new_cost += crossing_penalty
+                new_state = nxt * 5 + direction
+                if new_cost < best.get(new_state, math.inf):
+                    best[new_state] = new_cost
+                    came_from[new_state] = state
+                    remaining = max(col_lo - c, 0, c - col_hi) + max(
+                        row_lo - r, 0, r - row_hi
+                    )
+                    pushed += 1
+                    heapq.heappush(
+                        heap,
+                        (new_cost + remaining, remaining, pushed, new_cost, new_state),
+                    )
+        return None
 
 
 class WireRouter:
@@ -45,6 +383,7 @@ class WireRouter:
             constraints: Routing constraints to use
         """
         self.constraints = constraints or RoutingConstraints()
+        self._grid_cache: Optional[Tuple[tuple, ObstacleGrid]] = None
 
     def route_direct(
         self, start: Tuple[float, float], end: Tuple[float, float]
@@ -143,18 +482,21 @@ class WireRouter:
         self,
         start: Tuple[float, float],
         end: Tuple[float, float],
-        obstacles: Optional[List[Tuple[float, float, float, float]]] = None,
+        obstacles: Union[ObstacleGrid, List[Rect], None] = None,
     ) -> List[Point]:
         """
         Route using obstacle-aware pathfinding.
 
-        This is a simplified version that tries to avoid obstacles
-        by routing around them.
+        A clear straight connection is used as is. Otherwise the wire is
+        found with A* on the routing grid, which trades length against
+        corners and never passes through an obstacle. Obstacle lists are
+        rasterized once and reused while the same list is passed again.
 
         Args:
             start: Starting point (x, y)
             end: Ending point (x, y)
-            obstacles: List of obstacle rectangles (x1, y1, x2, y2)
+            obstacles: List of obstacle rectangles (x1, y1, x2, y2), or a
+                prepared ObstacleGrid
 
         Returns:
             List of points defining the wire path
@@ -163,39 +505,177 @@ class WireRouter:
             # No obstacles, use Manhattan routing
             return self.route_manhattan(start, end)
 
-        # For now, implement a simple version that tries alternate paths
-        # A full implementation would use A* or similar pathfinding
+        if isinstance(obstacles, ObstacleGrid):
+            grid = obstacles
+        else:
+            grid = self._grid_for(obstacles, (start, end))
 
-        # Try direct path first
-        if not self._path_intersects_obstacles(start, end, obstacles):
+        aligned = abs(end[0] - start[0]) < 0.01 or abs(end[1] - start[1]) < 0.01
+        if (aligned or not self.constraints.avoid_diagonal) and grid.segment_clear(
+            start, end
+        ):
             return self.route_direct(start, end)
 
-        # Try L-shaped paths
-        # Horizontal first
-        mid_point1 = (end[0], start[1])
-        if not self._path_intersects_obstacles(
-            start, mid_point1, obstacles
-        ) and not self._path_intersects_obstacles(mid_point1, end, obstacles):
-            return [
-                Point(start[0], start[1]),
-                Point(mid_point1[0], mid_point1[1]),
-                Point(end[0], end[1]),
-            ]
-
-        # Vertical first
-        mid_point2 = (start[0], end[1])
-        if not self._path_intersects_obstacles(
-            start, mid_point2, obstacles
-        ) and not self._path_intersects_obstacles(mid_point2, end, obstacles):
-            return [
-                Point(start[0], start[1]),
-                Point(mid_point2[0], mid_point2[1]),
-                Point(end[0], end[1]),
-            ]
-
-        # If simple paths don't work, fall back to Manhattan
-        # (In a full implementation, we'd try more complex paths)
-        return self.route_manhattan(start, end)
+        source, target = grid.index(start), grid.index(end)
+        path = None
+        if source is not None and target is not None:
+            path = self._find_path(grid, source, {target}, _UNNAMED_NET)
+        if path is None:
+            logger.debug(f"No obstacle-free route from {start} to {end}")
+            return self.route_manhattan(start, end)
+        return self._path_to_points(grid, path, start, end)
+
+    def route_nets(
+        self,
+        nets: Dict[Hashable, Sequence[Tuple[float, float]]],
+        obstacles: Union[ObstacleGrid, List[Rect], None] = None,
+    ) -> Dict[Hashable, RoutedNet]:
+        """
+        Route many nets on one shared obstacle grid.
+
+        Every pin is reserved for its net up front, then nets are routed
+        shortest first and each finished wire is added to the grid, so
+        later nets go around earlier ones and only cross them at right
+        angles. The pins of a net are joined one at a time, nearest first,
+        to whatever part of the net is already routed; junctions are placed
+        where three or more connections meet.
+
+        Args:
+            nets: Net name -> pin positions
+            obstacles: Obstacle rectangles (x1, y1, x2, y2), or an
+                ObstacleGrid to route on and extend
+
+        Returns:
+            Net name -> RoutedNet, in the order of ``nets``. Pins that could
+            not be reached are listed in RoutedNet.unrouted, for the caller
+            to connect with labels instead.
+        """
+        if isinstance(obstacles, ObstacleGrid):
+            grid = obstacles
+        else:
+            grid = ObstacleGrid(
+                obstacles or (),
+                self.constraints.grid_size,
+                points=[pin for pins in nets.values() for pin in pins],
+            )
+
+        for name, pins in nets.items():
+            grid.add_pins(pins, name)
+
+        def span(name):
+            pins = nets[name]
+            if not pins:
+                return 0.0
+            xs = [p[0] for p in pins]
+            ys = [p[1] for p in pins]
+            return max(xs) - min(xs) + max(ys) - min(ys)
+
+        routed = {
+            name: self._route_net(grid, name, nets[name])
+            for name in sorted(nets, key=span)
+        }
+        return {name: routed[name] for name in nets}
+
+    def _route_net(
+        self, grid: ObstacleGrid, name: Hashable, pins: Sequence[Tuple[float, float]]
+    ) -> RoutedNet:
+        """Connect the pins of one net into a tree of wires on ``grid``."""
+        result = RoutedNet(name)
+        net = grid.net_id(name)
+
+        pin_at: Dict[int, Tuple[float, float]] = {}
+        for pin in pins:
+            index = grid.index(pin)
+            if index is None:
+                result.unrouted.append(pin)
+            else:
+                pin_at.setdefault(index, pin)
+        if not pin_at:
+            return result
+
+        remaining = list(pin_at)
+        connected = [remaining.pop(0)]
+        tree = set(connected)
+        degree: Dict[int, int] = dict.fromkeys(pin_at, 1)
+        cols = grid.cols
+
+        def distance(a, b):
+            return abs(a % cols - b % cols) + abs(a // cols - b // cols)
+
+        while remaining:
+            source = min(
+                remaining, key=lambda c: min(distance(c, t) for t in connected)
+            )
+            remaining.remove(source)
+            if source in tree:
+                connected.append(source)
+                continue
+
+            targets = {cell for cell in tree if grid.can_join(cell, net)}
+            path = self._find_path(grid, source, targets, net)
+            if path is None:
+                result.unrouted.append(pin_at[source])
+                continue
+
+            grid.add_path(path, net)
+            tree.update(path)
+            connected.append(source)
+            for a, b in zip(path, path[1:]):
+                degree[a] = degree.get(a, 0) + 1
+                degree[b] = degree.get(b, 0) + 1
+            result.wires.append(
+                self._path_to_points(
+                    grid,
+                    path,
+                    pin_at[source],
+                    pin_at.get(path[-1], grid.point(path[-1])),
+                )
+            )
+
+        result.junctions = [
+            Point(*grid.point(cell)) for cell, count in degree.items() if count >= 3
+        ]
+        return result
+
+    def _grid_for(
+        self, obstacles: List[Rect], points: Sequence[Tuple[float, float]]
+    ) -> ObstacleGrid:
+        """Rasterize ``obstacles``, reusing the last grid built for the same list."""
+        key = tuple(tuple(rect) for rect in obstacles)
+        if self._grid_cache is not None:
+            cached_key, grid = self._grid_cache
+            if cached_key == key and grid.covers(points):
+                return grid
+        grid = ObstacleGrid(obstacles, self.constraints.grid_size, points=points)
+        self._grid_cache = (key, grid)
+        return grid
+
+    def _find_path(
+        self, grid: ObstacleGrid, source: int, targets: Set[int], net: int
+    ) -> Optional[List[int]]:
+        return grid.find_path(
+            source,
+            targets,
+            net,
+            bend_penalty=self.constraints.bend_penalty,
+            crossing_penalty=self.constraints.crossing_penalty,
+            prefer_horizontal=self.constraints.prefer_horizontal,
+        )
+
+    def _path_to_points(
+        self,
+        grid: ObstacleGrid,
+        path: List[int],
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+    ) -> List[Point]:
+        """Corner points of a cell path, ending exactly on ``start`` and ``end``."""
+        points = [Point(*grid.point(cell)) for cell in path]
+        if abs(points[0].x - start[0]) > 0.01 or abs(points[0].y - start[1]) > 0.01:
+            points.insert(0, Point(start[0], start[1]))
+        if abs(points[-1].x - end[0]) > 0.01 or abs(points[-1].y - end[1]) > 0.01:
+            points.append(Point(end[0], end[1]))
+        return self.optimize_path(points)
 
     def route_bus(
         self,
@@ -253,60 +733,6 @@ class WireRouter:
         """Snap a coordinate value to the grid."""
         return round(value / self.constraints.grid_size) * self.constraints.grid_size
 
-    def _path_intersects_obstacles(
-        self,
-        start: Tuple[float, float],
-        end: Tuple[float, float],
-        obstacles: List[Tuple[float, float, float, float]],
-    ) -> bool:
-        """
-        Check if a line segment intersects any obstacles.
-
-        Args:
-            start: Start point of line segment
-            end: End point of line segment
-            obstacles: List of obstacle rectangles (x1, y1, x2, y2)
-
-        Returns:
-            True if path intersects any obstacle
-        """
-        for obs in obstacles:
-            if self._line_intersects_rect(start, end, obs):
-                return True
-        return False
-
-    def _line_intersects_rect(
-        self,
-        p1: Tuple[float, float],
-        p2: Tuple[float, float],
-        rect: Tuple[float, float, float, float],
-    ) -> bool:
-        """
-        Check if a line segment intersects a rectangle.
-
-        This is a simplified check that works for axis-aligned rectangles.
-        """
-        x1, y1, x2, y2 = rect
-
-        # Check if line is completely outside rectangle bounds
-        if (
-            max(p1[0], p2[0]) < x1
-            or min(p1[0], p2[0]) > x2
-            or max(p1[1], p2[1]) < y1
-            or min(p1[1], p2[1]) > y2
-        ):
-            return False
-
-        # Check if either endpoint is inside rectangle
-        if x1 <= p1[0] <= x2 and y1 <= p1[1] <= y2:
-            return True
-        if x1 <= p2[0] <= x2 and y1 <= p2[1] <= y2:
-            return True
-
-        # For a more complete check, we'd need to test line-rectangle intersection
-        # This simplified version is sufficient for basic routing
-        return False
-
     def optimize_path(self, points: List[Point]) -> List[Point]:
         """
         Optimize a wire path by removing unnecessary points.
@@ -0,0 +1,167 @@
+"""
+Candidate generation for connectivity-based component matching.
+
+Matching components by the nets they touch is a set-similarity problem.
+Scoring every old x new pair is quadratic, so this module narrows the field
+first. An inverted index (token -> keys) catches pairs that share a rare
+net, and MinHash signatures bucketed with LSH catch pairs whose net sets
+are similar overall. Callers then compute exact scores only on the
+candidates that come back.
+"""
+
+import hashlib
+import logging
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime for the universal hash family; token hashes are reduced
+# below it so a * x + b stays inside uint64.
+_PRIME = (1 << 31) - 1
+
+
+def jaccard(a: Set, b: Set) -> float:
+    """Jaccard similarity of two sets (0.0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+class MinHasher:
+    """
+    MinHash signatures over sets of hashable tokens.
+
+    Token hashes come from blake2b rather than ``hash()``, so signatures are
+    stable across processes and Python hash seeds.
+
+    Args:
+        num_perm: Number of hash permutations (signature length)
+        seed: Seed for the permutation parameters
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._token_hashes: Dict[Hashable, int] = {}
+
+    def _hash_token(self, token: Hashable) -> int:
+        value = self._token_hashes.get(token)
+        if value is None:
+            digest = hashlib.blake2b(repr(token).encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little") % _PRIME
+            self._token_hashes[token] = value
+        return value
+
+    def signature(self, tokens: Iterable[Hashable]) -> np.ndarray:
+        """
+        Compute the MinHash signature of a token set.
+
+        Returns:
+            uint64 array of length ``num_perm``
+        """
+        hashes = np.fromiter(
+            (self._hash_token(t) for t in tokens), dtype=np.uint64
+        ).reshape(1, -1)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1)
+
+
+class SignatureIndex:
+    """
+    Candidate index over token sets: rare-token postings plus MinHash LSH.
+
+    With ``bands`` bands of ``num_perm / bands`` rows, two sets with Jaccard
+    similarity ``s`` share an LSH bucket with probability
+    ``1 - (1 - s**rows)**bands``. The defaults (64 permutations, 16 bands)
+    find pairs at s=0.7 about 99% of the time and pairs at s=0.3 about 12%
+    of the time. Tokens shared by at most ``max_posting`` keys are also
+    looked up directly, so a pair sharing a distinctive net is always found.
+
+    Args:
+        num_perm: MinHash signature length
+        bands: Number of LSH bands (must divide ``num_perm``)
+        max_posting: Posting-list size up to which a token counts as rare
+        seed: Seed for the MinHash permutations
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        max_posting: int = 32,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_posting = max_posting
+
+        self.postings: Dict[Hashable, List[Hashable]] = defaultdict(list)
+        self._buckets: Dict[tuple, List[Hashable]] = defaultdict(list)
+        self._order: Dict[Hashable, int] = {}
+        self._tokens: Dict[Hashable, frozenset] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._order
+
+    def tokens(self, key: Hashable) -> frozenset:
+        """Token set indexed for ``key``."""
+        return self._tokens[key]
+
+    def _band_keys(self, tokens: Iterable[Hashable]) -> List[tuple]:
+        bands = self.hasher.signature(tokens).reshape(self.bands, self.rows)
+        return [(band, row.tobytes()) for band, row in enumerate(bands)]
+
+    def add(self, key: Hashable, tokens: Iterable[Hashable]) -> None:
+        """Index ``key`` under its token set."""
+        if key in self._order:
+            raise KeyError(f"{key!r} is already indexed")
+        tokens = frozenset(tokens)
+        self._order[key] = len(self._order)
+        self._tokens[key] = tokens
+        for token in tokens:
+            self.postings[token].append(key)
+        if tokens:
+            for band_key in self._band_keys(tokens):
+                self._buckets[band_key].append(key)
+
+    def candidates(
+        self, tokens: Iterable[Hashable], exhaustive: bool = False
+    ) -> List[Hashable]:
+        """
+        Keys that plausibly resemble ``tokens``, in insertion order.
+
+        Args:
+            tokens: Token set to look up
+            exhaustive: Return every key sharing at least one token instead of
+                the rare-token and LSH candidates
+
+        Returns:
+            Candidate keys in the order they were added
+        """
+        tokens = frozenset(tokens)
+        if not tokens:
+            return []
+
+        found = set()
+        for token in tokens:
+            posting = self.postings.get(token)
+            if posting and (exhaustive or len(posting) <= self.max_posting):
+                found.update(posting)
+        if not exhaustive:
+            for band_key in self._band_keys(tokens):
+                found.update(self._buckets.get(band_key, ()))
+
+        return sorted(found, key=self._order.__getitem__)
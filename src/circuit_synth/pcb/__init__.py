@@ -31,6 +31,22 @@ class PCBParser:
 
 
 # Keep circuit-synth specific extensions that don't depend on kicad-pcb-api
+from .annealing_placer import (
+    AnnealingResult,
+    PlacementProblem,
+    anneal,
+    anneal_placement,
+)
+from .clearance_drc import ClearanceChecker, check_clearances
+from .export_orchestrator import ExportJob, ExportOrchestrator, ExportReport
+from .grid_router import (
+    GridRouter,
+    RoutePad,
+    RoutingResult,
+    board_pads,
+    estimate_routability,
+)
+from .placement_metrics import PlacementMetrics
 from .kicad_cli import DRCResult, KiCadCLI, KiCadCLIError, get_kicad_cli
 
 __all__ = [
@@ -41,4 +57,19 @@ __all__ = [
     "get_kicad_cli",
     "DRCResult",
     "KiCadCLIError",
+    "ExportJob",
+    "ExportOrchestrator",
+    "ExportReport",
+    "GridRouter",
+    "RoutePad",
+    "RoutingResult",
+    "board_pads",
+    "estimate_routability",
+    "PlacementMetrics",
+    "PlacementProblem",
+    "AnnealingResult",
+    "anneal",
+    "anneal_placement",
+    "ClearanceChecker",
+    "check_clearances",
 ]
@@ -0,0 +1,434 @@
+"""
+Simulated-annealing footprint placement.
+
+Starts from an existing placement (typically the spiral placer's) and
+improves it by randomly displacing and swapping footprints, accepting
+uphill moves with the Metropolis probability as the temperature falls.
+
+The cost of a placement is its total HPWL plus a penalty proportional to
+the area by which footprint courtyards overlap. Courtyards are held in a
+NumPy array and a SpatialGrid, and pins in a PlacementMetrics, so
+each move is priced from the nets and neighbours of the footprints it
+touches rather than from the whole board.
+
+Several independent starts can run across a process pool; the best legal
+result is kept.
+"""
+
+import logging
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .grid_router import board_pads, pad_rect
+from .placement_metrics import PlacementMetrics
+from .spatial_grid import SpatialGrid
+
+logger = logging.getLogger(__name__)
+
+Bounds = Tuple[float, float, float, float]
+
+# Moves between temperature, weight and window updates
+_BATCH = 256
+# Final temperature as a fraction of the initial one
+_FINAL_TEMPERATURE = 1e-4
+# Acceptance rate the move window is steered towards
+_TARGET_ACCEPTANCE = 0.44
+
+
+@dataclass
+class PlacementProblem:
+    """
+    Footprints, courtyards and pins of a board to be placed.
+
+    Attributes:
+        refs: Footprint references
+        courtyards: (n, 4) courtyard rectangles (x1, y1, x2, y2) relative to
+            each footprint's position
+        positions: (n, 2) starting footprint positions
+        pins: (reference, net, dx, dy) per netted pad, with the pad offset
+            from its footprint position in board axes
+    """
+
+    refs: List[str]
+    courtyards: np.ndarray
+    positions: np.ndarray
+    pins: List[Tuple[str, str, float, float]] = field(default_factory=list)
+
+    @classmethod
+    def from_board(
+        cls, pcb, spacing: float = 0.0, margin: float = 0.25
+    ) -> "PlacementProblem":
+        """
+        Build a problem from a board whose pads already carry their nets.
+
+        A courtyard is the bounding box of the footprint's pads grown by
+        ``margin``, plus half of ``spacing`` on every side so that placed
+        courtyards end up at least ``spacing`` apart.
+        """
+        grow = margin + spacing / 2
+        refs, courtyards, positions = [], [], {}
+        for fp in pcb.footprints:
+            x0, y0 = fp.position.x, fp.position.y
+            rects = [pad_rect(fp, pad) for pad in fp.pads] or [(x0, y0, 1.0, 1.0)]
+            refs.append(fp.reference)
+            positions[fp.reference] = (x0, y0)
+            courtyards.append(
+                (
+                    min(x - w / 2 for x, _, w, _ in rects) - x0 - grow,
+                    min(y - h / 2 for _, y, _, h in rects) - y0 - grow,
+                    max(x + w / 2 for x, _, w, _ in rects) - x0 + grow,
+                    max(y + h / 2 for _, y, _, h in rects) - y0 + grow,
+                )
+            )
+        pins = [
+            (
+                pad.ref,
+                pad.net,
+                pad.x - positions[pad.ref][0],
+                pad.y - positions[pad.ref][1],
+            )
+            for pad in board_pads(pcb)
+        ]
+        return cls(
+            refs,
+            np.array(courtyards, dtype=float).reshape(-1, 4),
+            np.array([positions[ref] for ref in refs], dtype=float).reshape(-1, 2),
+            pins,
+        )
+
+
+@dataclass
+class AnnealingResult:
+    """Outcome of one annealing run."""
+
+    positions: Dict[str, Tuple[float, float]]
+    hpwl: float
+    overlap: float
+    moves: int = 0
+    accepted: int = 0
+    seed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def legal(self) -> bool:
+        """True if no two courtyards overlap."""
+        return self.overlap <= 1e-9
+
+
+class _Annealer:
+    """Placement state with incremental HPWL and courtyard overlap."""
+
+    def __init__(self, problem: PlacementProblem, bounds: Bounds):
+        self.refs = list(problem.refs)
+        self.count = len(self.refs)
+        courtyards = np.asarray(problem.courtyards, dtype=float).reshape(-1, 4)
+        positions = np.asarray(problem.positions, dtype=float).reshape(-1, 2)
+        self.metrics = PlacementMetrics(
+            {ref: tuple(xy) for ref, xy in zip(self.refs, positions)}, problem.pins
+        )
+        # Scalar copies: per-move arithmetic on a few floats is faster in lists
+        self.yard = courtyards.tolist()
+        self.pos = positions.tolist()
+
+        sides = courtyards[:, 2:] - courtyards[:, :2]
+        self.mean_side = float(sides.mean()) if self.count else 1.0
+        self.grid = SpatialGrid(max(2 * self.mean_side, 1e-3))
+        for i in range(self.count):
+            self.grid.add(i, self.box(i, *self.pos[i]))
+
+        # Allowed range of each footprint position keeping its courtyard on board
+        bx1, by1, bx2, by2 = bounds
+        self.span = max(bx2 - bx1, by2 - by1, 1e-3)
+        self.limits = []
+        for x1, y1, x2, y2 in self.yard:
+            lo_x, hi_x = bx1 - x1, bx2 - x2
+            lo_y, hi_y = by1 - y1, by2 - y2
+            if lo_x > hi_x:
+                lo_x = hi_x = (lo_x + hi_x) / 2
+            if lo_y > hi_y:
+                lo_y = hi_y = (lo_y + hi_y) / 2
+            self.limits.append((lo_x, hi_x, lo_y, hi_y))
+        for i in range(self.count):
+            x, y = self.clamp(i, *self.pos[i])
+            if (x, y) != tuple(self.pos[i]):
+                self.move(i, x, y)
+
+        self.overlap = sum(self.overlap_of(i, *self.pos[i]) for i in range(self.count))
+        self.overlap /= 2
+
+        nets_per_fp = len(problem.pins) / max(self.count, 1)
+        self.default_weight = max(nets_per_fp, 1.0) / max(self.mean_side, 1e-3)
+
+    def box(self, i: int, x: float, y: float) -> Tuple[float, float, float, float]:
+        x1, y1, x2, y2 = self.yard[i]
+        return x + x1, y + y1, x + x2, y + y2
+
+    def clamp(self, i: int, x: float, y: float) -> Tuple[float, float]:
+        lo_x, hi_x, lo_y, hi_y = self.limits[i]
+        return min(max(x, lo_x), hi_x), min(max(y, lo_y), hi_y)
+
+    def overlap_of(self, i: int, x: float, y: float) -> float:
+        """Courtyard area footprint ``i`` at (x, y) shares with the others."""
+        ax1, ay1, ax2, ay2 = self.box(i, x, y)
+        total = 0.0
+        for j in self.grid.near((ax1, ay1, ax2, ay2)):
+            if j == i:
+                continue
+            px, py = self.pos[j]
+            bx1, by1, bx2, by2 = self.yard[j]
+            w = min(ax2, px + bx2) - max(ax1, px + bx1)
+            if w > 0:
+                h = min(ay2, py + by2) - max(ay1, py + by1)
+                if h > 0:
+                    total += w * h
+        return total
+
+    def move(self, i: int, x: float, y: float) -> float:
+        """Move footprint ``i``; returns the change in HPWL."""
+        self.grid.remove(i, self.box(i, *self.pos[i]))
+        self.pos[i] = [x, y]
+        self.grid.add(i, self.box(i, x, y))
+        return self.metrics.move(self.refs[i], x, y)
+
+    def relocate(self, i: int, x: float, y: float) -> Tuple[float, float]:
+        """Move footprint ``i``; returns the change in (HPWL, overlap)."""
+        d_overlap = self.overlap_of(i, x, y) - self.overlap_of(i, *self.pos[i])
+        d_hpwl = self.move(i, x, y)
+        self.overlap += d_overlap
+        return d_hpwl, d_overlap
+
+    def shift_delta(self, i: int, x: float, y: float) -> Tuple[float, float]:
+        """Change in (HPWL, overlap) if footprint ``i`` moved, without moving it."""
+        return (
+            self.metrics.move_delta(self.refs[i], x, y),
+            self.overlap_of(i, x, y) - self.overlap_of(i, *self.pos[i]),
+        )
+
+    def random_shift(self, rng: random.Random, radius: float):
+        i = rng.randrange(self.count)
+        x, y = self.pos[i]
+        return (
+            i,
+            *self.clamp(
+                i, x + rng.uniform(-radius, radius), y + rng.uniform(-radius, radius)
+            ),
+        )
+
+    def partner(self, rng: random.Random, i: int, radius: float) -> int:
+        """A random swap partner for ``i``, preferably within ``radius``."""
+        if radius < 8 * self.grid.cell:
+            x, y = self.pos[i]
+            near = self.grid.near((x - radius, y - radius, x + radius, y + radius))
+            near.discard(i)
+            if near:
+                return rng.choice(sorted(near))
+        j = rng.randrange(self.count - 1)
+        return j + (j >= i)
+
+    def position_map(self) -> Dict[str, Tuple[float, float]]:
+        return {ref: (float(x), float(y)) for ref, (x, y) in zip(self.refs, self.pos)}
+
+
+def _accept(delta: float, temperature: float, rng: random.Random) -> bool:
+    return delta <= 0 or rng.random() < math.exp(-delta / temperature)
+
+
+def _legalize(state: _Annealer) -> None:
+    """Greedily move overlapping footprints to the nearest free spot."""
+    step = max(state.mean_side / 2, 0.1)
+    rings = math.ceil(state.span / step)
+    order = sorted(
+        range(state.count), key=lambda i: -state.overlap_of(i, *state.pos[i])
+    )
+    for i in order:
+        if state.overlap_of(i, *state.pos[i]) <= 0:
+            continue
+        x0, y0 = state.pos[i]
+        for ring in range(1, rings + 1):
+            spots = set()
+            for k in range(-ring, ring + 1):
+                for dx, dy in ((k, -ring), (k, ring), (-ring, k), (ring, k)):
+                    spots.add(state.clamp(i, x0 + dx * step, y0 + dy * step))
+            free = [spot for spot in spots if state.overlap_of(i, *spot) <= 0]
+            if free:
+                best = min(
+                    sorted(free),
+                    key=lambda spot: state.metrics.move_delta(state.refs[i], *spot),
+                )
+                state.relocate(i, *best)
+                break
+
+
+def anneal(
+    problem: PlacementProblem,
+    bounds: Bounds,
+    seed: int = 0,
+    time_limit: Optional[float] = 30.0,
+    max_moves: Optional[int] = None,
+    overlap_weight: Optional[float] = None,
+    swap_rate: float = 0.2,
+    initial_acceptance: float = 0.4,
+) -> AnnealingResult:
+    """
+    Improve one placement by simulated annealing.
+
+    The temperature falls geometrically with progress, measured as the
+    larger of moves made over ``max_moves`` and time spent over
+    ``time_limit``. Without a time limit a run is fully determined by its
+    seed. The move window adapts to keep about 44% of moves accepted, and
+    the overlap penalty rises tenfold over the run so that courtyards are
+    pulled apart by the end. Any overlap left is removed greedily.
+
+    Args:
+        problem: Footprints and pins, in their starting positions
+        bounds: Board area (x1, y1, x2, y2) courtyards must stay inside
+        seed: Random seed
+        time_limit: Seconds to spend, or None for no limit
+        max_moves: Move budget (default: 400 per footprint)
+        overlap_weight: Initial cost per mm² of courtyard overlap (default:
+            pins per footprint over mean courtyard side)
+        swap_rate: Fraction of moves that swap two footprints
+        initial_acceptance: Target acceptance of uphill moves at the start
+
+    Returns:
+        Final positions and their metrics
+    """
+    started = time.monotonic()
+    state = _Annealer(problem, bounds)
+    rng = random.Random(seed)
+    moves = accepted = 0
+    if state.count < 2:
+        return AnnealingResult(
+            state.position_map(), state.metrics.total_hpwl, state.overlap, seed=seed
+        )
+
+    max_moves = max_moves or 400 * state.count
+    weight0 = overlap_weight or state.default_weight
+    radius, min_radius = state.span, max(state.mean_side / 2, 0.05)
+
+    # Start hot enough that the requested share of uphill moves is accepted
+    uphill = []
+    for _ in range(200):
+        d_hpwl, d_overlap = state.shift_delta(*state.random_shift(rng, radius))
+        cost = d_hpwl + weight0 * d_overlap
+        if cost > 0:
+            uphill.append(cost)
+    t0 = (sum(uphill) / len(uphill)) / -math.log(initial_acceptance) if uphill else 1.0
+
+    progress = 0.0
+    while progress < 1.0:
+        temperature = t0 * _FINAL_TEMPERATURE**progress
+        weight = weight0 * (1 + 9 * progress)
+        batch_accepted = 0
+        for _ in range(_BATCH):
+            if rng.random() < swap_rate:
+                i = rng.randrange(state.count)
+                j = state.partner(rng, i, radius)
+                (xi, yi), (xj, yj) = state.pos[i], state.pos[j]
+                h1, o1 = state.relocate(i, *state.clamp(i, xj, yj))
+                h2, o2 = state.relocate(j, *state.clamp(j, xi, yi))
+                if _accept(h1 + h2 + weight * (o1 + o2), temperature, rng):
+                    batch_accepted += 1
+                else:
+                    state.relocate(j, xj, yj)
+                    state.relocate(i, xi, yi)
+            else:
+                i, x, y = state.random_shift(rng, radius)
+                d_hpwl, d_overlap = state.shift_delta(i, x, y)
+                if _accept(d_hpwl + weight * d_overlap, temperature, rng):
+                    state.move(i, x, y)
+                    state.overlap += d_overlap
+                    batch_accepted += 1
+        moves += _BATCH
+        accepted += batch_accepted
+
+        rate = batch_accepted / _BATCH
+        radius = min(
+            max(radius * (1 - _TARGET_ACCEPTANCE + rate), min_radius), state.span
+        )
+        progress = moves / max_moves
+        if time_limit is not None:
+            progress = max(progress, (time.monotonic() - started) / time_limit)
+
+    if state.overlap > 1e-9:
+        _legalize(state)
+    # Recompute to shed drift from many incremental updates
+    overlap = sum(state.overlap_of(i, *state.pos[i]) for i in range(state.count)) / 2
+    return AnnealingResult(
+        positions=state.position_map(),
+        hpwl=float(state.metrics.hpwl.sum()),
+        overlap=overlap,
+        moves=moves,
+        accepted=accepted,
+        seed=seed,
+        elapsed=time.monotonic() - started,
+    )
+
+
+def _anneal_task(
+    task: Tuple[PlacementProblem, Bounds, int, Dict[str, Any]],
+) -> Union[AnnealingResult, str]:
+    """Process-pool entry point; never raises so one bad run can't stop a batch."""
+    problem, bounds, seed, options = task
+    try:
+        return anneal(problem, bounds, seed=seed, **options)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def anneal_placement(
+    problem: PlacementProblem,
+    bounds: Bounds,
+    starts: int = 1,
+    max_workers: Optional[int] = None,
+    seed: int = 0,
+    **options,
+) -> AnnealingResult:
+    """
+    Run several independent annealing starts and keep the best.
+
+    Legal placements beat overlapping ones; ties go to the lowest HPWL.
+
+    Args:
+        problem: Footprints and pins, in their starting positions
+        bounds: Board area (x1, y1, x2, y2)
+        starts: Number of runs, seeded ``seed``, ``seed + 1``, ...
+        max_workers: Worker processes. None uses the CPU count, 1 runs inline.
+        seed: Seed of the first run
+        **options: Passed to anneal()
+
+    Returns:
+        Best result over all starts
+
+    Raises:
+        RuntimeError: If every start failed
+    """
+    tasks = [(problem, bounds, seed + k, options) for k in range(max(starts, 1))]
+    if max_workers == 1 or len(tasks) == 1:
+        outputs = [_anneal_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, math.ceil(len(tasks) / (workers * 4)))
+            outputs = list(pool.map(_anneal_task, tasks, chunksize=chunksize))
+
+    results = [out for out in outputs if isinstance(out, AnnealingResult)]
+    errors = [out for out in outputs if isinstance(out, str)]
+    for error in errors:
+        logger.warning(f"Annealing run failed: {error}")
+    if not results:
+        raise RuntimeError(f"All {len(tasks)} annealing runs failed: {errors[0]}")
+
+    best = min(results, key=lambda r: (not r.legal, r.hpwl))
+    logger.debug(
+        f"Annealing kept seed {best.seed} of {len(tasks)}: HPWL {best.hpwl:.1f}mm, "
+        f"{best.moves} moves, {best.accepted} accepted"
+    )
+    return best
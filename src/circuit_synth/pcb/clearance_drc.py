@@ -0,0 +1,484 @@
+"""
+In-process clearance DRC.
+
+A fast pre-check of the most common design rules, without saving the
+board or starting kicad-cli:
+
+- clearance: copper of different nets closer than the minimum gap
+- courtyards_overlap: footprint courtyards that overlap
+- copper_edge_clearance: copper too close to (or outside) the board edge
+- unconnected_items: nets whose pads, tracks and vias are not all joined
+
+Pads are treated as their (rotated) bounding rectangles, tracks as
+capsules and vias as discs. Every item lives in a SpatialGrid, so a check
+only compares neighbours. After footprints move, only the items that
+moved and the nets they carry are re-checked.
+
+Results use the same DRCResult, and the same violation dictionaries, as
+KiCadCLI.run_drc, which remains the full check for release.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .grid_router import (
+    LAYERS,
+    RoutedVia,
+    RoutePad,
+    RoutingResult,
+    TrackSegment,
+    _pad_layers,
+    pad_rect,
+)
+from .kicad_cli import DRCResult
+from .spatial_grid import Box, SpatialGrid
+
+logger = logging.getLogger(__name__)
+
+COURTYARD = "courtyard"
+# Items of the same net closer than this are connected
+_TOUCH = 1e-6
+
+
+@dataclass
+class _Item:
+    """One pad, track, via or courtyard."""
+
+    kind: str  # "rect" or "capsule"
+    shape: Tuple[float, ...]  # rect: x1, y1, x2, y2; capsule: x1, y1, x2, y2, r
+    layers: Tuple[str, ...]
+    net: Optional[str]
+    description: str
+    ref: Optional[str] = None
+
+    @property
+    def box(self) -> Box:
+        if self.kind == "rect":
+            return self.shape[:4]
+        x1, y1, x2, y2, r = self.shape
+        return min(x1, x2) - r, min(y1, y2) - r, max(x1, x2) + r, max(y1, y2) + r
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.shape[0] + self.shape[2]) / 2, (self.shape[1] + self.shape[3]) / 2
+
+    def shifted(self, dx: float, dy: float) -> Tuple[float, ...]:
+        x1, y1, x2, y2 = self.shape[:4]
+        return (x1 + dx, y1 + dy, x2 + dx, y2 + dy, *self.shape[4:])
+
+
+def _point_segment(px, py, ax, ay, bx, by) -> float:
+    dx, dy = bx - ax, by - ay
+    length2 = dx * dx + dy * dy
+    t = 0.0 if length2 == 0 else ((px - ax) * dx + (py - ay) * dy) / length2
+    t = min(max(t, 0.0), 1.0)
+    return math.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+def _segments_cross(ax, ay, bx, by, cx, cy, dx, dy) -> bool:
+    def orient(px, py, qx, qy, rx, ry):
+        return (qx - px) * (ry - py) - (qy - py) * (rx - px)
+
+    d1 = orient(ax, ay, bx, by, cx, cy)
+    d2 = orient(ax, ay, bx, by, dx, dy)
+    d3 = orient(cx, cy, dx, dy, ax, ay)
+    d4 = orient(cx, cy, dx, dy, bx, by)
+    return d1 * d2 < 0 and d3 * d4 < 0
+
+
+def _segment_segment(a, b) -> float:
+    ax, ay, bx, by = a
+    cx, cy, dx, dy = b
+    if _segments_cross(ax, ay, bx, by, cx, cy, dx, dy):
+        return 0.0
+    return min(
+        _point_segment(ax, ay, cx, cy, dx, dy),
+        _point_segment(bx, by, cx, cy, dx, dy),
+        _point_segment(cx, cy, ax, ay, bx, by),
+        _point_segment(dx, dy, ax, ay, bx, by),
+    )
+
+
+def _point_rect(px, py, rect) -> float:
+    x1, y1, x2, y2 = rect
+    return math.hypot(max(x1 - px, 0.0, px - x2), max(y1 - py, 0.0, py - y2))
+
+
+def _segment_rect(segment, rect) -> float:
+    ax, ay, bx, by = segment
+    x1, y1, x2, y2 = rect
+    if _point_rect(ax, ay, rect) == 0 or _point_rect(bx, by, rect) == 0:
+        return 0.0
+    edges = ((x1, y1, x2, y1), (x2, y1, x2, y2), (x2, y2, x1, y2), (x1, y2, x1, y1))
+    return min(_segment_segment(segment, edge) for edge in edges)
+
+
+def _rect_rect(a, b) -> float:
+    return math.hypot(
+        max(a[0] - b[2], b[0] - a[2], 0.0), max(a[1] - b[3], b[1] - a[3], 0.0)
+    )
+
+
+def _gap(a: _Item, b: _Item) -> float:
+    """Edge-to-edge distance between two items (negative if capsules overlap)."""
+    if a.kind == "rect" and b.kind == "rect":
+        return _rect_rect(a.shape, b.shape)
+    if a.kind == "rect":
+        a, b = b, a
+    if b.kind == "rect":
+        return _segment_rect(a.shape[:4], b.shape) - a.shape[4]
+    return _segment_segment(a.shape[:4], b.shape[:4]) - a.shape[4] - b.shape[4]
+
+
+def _overlap_area(a: Box, b: Box) -> float:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    return w * h if w > 0 and h > 0 else 0.0
+
+
+class ClearanceChecker:
+    """
+    Incremental clearance, courtyard, board-edge and connectivity checker.
+
+    Add items, call check(), then move footprints and call check() again;
+    only what changed is re-examined.
+
+    Args:
+        clearance: Minimum copper gap between different nets in mm
+        edge_clearance: Minimum gap between copper and the board edge in mm
+        bounds: Board outline (x1, y1, x2, y2), or None to skip edge checks
+        cell: Spatial grid cell size in mm
+    """
+
+    def __init__(
+        self,
+        clearance: float = 0.2,
+        edge_clearance: float = 0.3,
+        bounds: Optional[Box] = None,
+        cell: float = 2.0,
+    ):
+        self.clearance = clearance
+        self.edge_clearance = edge_clearance
+        self.bounds = bounds
+        self.items: List[_Item] = []
+        self.grid = SpatialGrid(cell)
+        self._footprints: Dict[str, List[int]] = {}
+        self._net_items: Dict[str, Set[int]] = {}
+        # Violation key -> KiCad-style violation dictionary
+        self._violations: Dict[Tuple, Dict[str, Any]] = {}
+        self._item_keys: Dict[int, Set[Tuple]] = {}
+        self._unconnected: Dict[str, List[Dict[str, Any]]] = {}
+        self._dirty: Set[int] = set()
+        self._dirty_nets: Set[str] = set()
+
+    @classmethod
+    def from_board(
+        cls,
+        pcb,
+        routing: Optional[RoutingResult] = None,
+        courtyard_margin: float = 0.25,
+        **options,
+    ) -> "ClearanceChecker":
+        """
+        Load the pads and courtyards of a board, plus optional routed copper.
+
+        Courtyards are the pad bounding box of each footprint grown by
+        ``courtyard_margin``.
+
+        Args:
+            pcb: Board whose footprints carry positions and pads
+            routing: Tracks and vias to check along with the pads
+            courtyard_margin: Courtyard growth around the pads in mm
+            **options: Passed to the constructor
+        """
+        checker = cls(**options)
+        for fp in pcb.footprints:
+            rects = []
+            for pad in fp.pads:
+                x, y, w, h = pad_rect(fp, pad)
+                rects.append((x - w / 2, y - h / 2, x + w / 2, y + h / 2))
+                net = getattr(pad, "net_name", None) or None
+                number = getattr(pad, "number", "?")
+                checker.add_pad(
+                    RoutePad(net, x, y, w, h, _pad_layers(pad), fp.reference),
+                    description=f"Pad {number} [{net or '<no net>'}] of {fp.reference}",
+                )
+            if rects:
+                checker.add_courtyard(
+                    fp.reference,
+                    (
+                        min(r[0] for r in rects) - courtyard_margin,
+                        min(r[1] for r in rects) - courtyard_margin,
+                        max(r[2] for r in rects) + courtyard_margin,
+                        max(r[3] for r in rects) + courtyard_margin,
+                    ),
+                )
+        if routing is not None:
+            for segment in routing.segments:
+                checker.add_track(segment)
+            for via in routing.vias:
+                checker.add_via(via)
+        return checker
+
+    def _add(self, item: _Item) -> int:
+        index = len(self.items)
+        self.items.append(item)
+        self.grid.add(index, item.box)
+        if item.ref is not None:
+            self._footprints.setdefault(item.ref, []).append(index)
+        if item.net is not None and item.layers != (COURTYARD,):
+            self._net_items.setdefault(item.net, set()).add(index)
+            self._dirty_nets.add(item.net)
+        self._dirty.add(index)
+        return index
+
+    def add_pad(self, pad: RoutePad, description: Optional[str] = None) -> int:
+        """Add a pad; a falsy net means the pad is on no net."""
+        return self._add(
+            _Item(
+                "rect",
+                (
+                    pad.x - pad.width / 2,
+                    pad.y - pad.height / 2,
+                    pad.x + pad.width / 2,
+                    pad.y + pad.height / 2,
+                ),
+                tuple(pad.layers),
+                pad.net or None,
+                description or f"Pad [{pad.net or '<no net>'}] of {pad.ref}",
+                pad.ref or None,
+            )
+        )
+
+    def add_track(self, segment: TrackSegment) -> int:
+        """Add a straight track segment."""
+        return self._add(
+            _Item(
+                "capsule",
+                (*segment.start, *segment.end, segment.width / 2),
+                (segment.layer,),
+                segment.net,
+                f"Track [{segment.net}] on {segment.layer}, length {segment.length:.4f} mm",
+            )
+        )
+
+    def add_via(self, via: RoutedVia) -> int:
+        """Add a through via."""
+        x, y = via.position
+        return self._add(
+            _Item(
+                "capsule",
+                (x, y, x, y, via.diameter / 2),
+                LAYERS,
+                via.net,
+                f"Via [{via.net}] on F.Cu - B.Cu",
+            )
+        )
+
+    def add_courtyard(self, ref: str, rect: Box) -> int:
+        """Add the courtyard rectangle of a footprint."""
+        return self._add(
+            _Item("rect", tuple(rect), (COURTYARD,), None, f"Footprint {ref}", ref)
+        )
+
+    def move_footprint(self, ref: str, dx: float, dy: float) -> None:
+        """Shift a footprint's pads and courtyard; re-checked on the next check()."""
+        for index in self._footprints.get(ref, []):
+            item = self.items[index]
+            self.grid.remove(index, item.box)
+            item.shape = item.shifted(dx, dy)
+            self.grid.add(index, item.box)
+            self._dirty.add(index)
+            if item.net is not None:
+                self._dirty_nets.add(item.net)
+
+    def _drop(self, index: int) -> None:
+        for key in self._item_keys.pop(index, ()):
+            self._violations.pop(key, None)
+            for other in key[1:]:
+                if other != index:
+                    self._item_keys.get(other, set()).discard(key)
+
+    def _record(self, key: Tuple, violation: Dict[str, Any]) -> None:
+        self._violations[key] = violation
+        for index in key[1:]:
+            self._item_keys.setdefault(index, set()).add(key)
+
+    def _entry(self, item: _Item) -> Dict[str, Any]:
+        x, y = item.center
+        return {"description": item.description, "pos": {"x": x, "y": y}}
+
+    def _check_item(self, index: int) -> None:
+        item = self.items[index]
+        if item.layers == (COURTYARD,):
+            for other in self.grid.near(item.box):
+                peer = self.items[other]
+                if other == index or peer.layers != (COURTYARD,):
+                    continue
+                area = _overlap_area(item.box, peer.box)
+                if area > 0:
+                    self._record(
+                        ("courtyards_overlap", *sorted((index, other))),
+                        {
+                            "type": "courtyards_overlap",
+                            "description": f"Courtyards overlap ({area:.4f} mm²)",
+                            "severity": "error",
+                            "items": [self._entry(item), self._entry(peer)],
+                        },
+                    )
+            return
+
+        x1, y1, x2, y2 = item.box
+        reach = self.clearance
+        for other in self.grid.near((x1 - reach, y1 - reach, x2 + reach, y2 + reach)):
+            peer = self.items[other]
+            if other == index or peer.layers == (COURTYARD,):
+                continue
+            if item.net is not None and item.net == peer.net:
+                continue
+            if not set(item.layers) & set(peer.layers):
+                continue
+            gap = _gap(item, peer)
+            if gap < self.clearance - 1e-9:
+                self._record(
+                    ("clearance", *sorted((index, other))),
+                    {
+                        "type": "clearance",
+                        "description": (
+                            f"Clearance violation (clearance {self.clearance:.4f} mm; "
+                            f"actual {max(gap, 0.0):.4f} mm)"
+                        ),
+                        "severity": "error",
+                        "items": [self._entry(item), self._entry(peer)],
+                    },
+                )
+
+        if self.bounds is not None:
+            bx1, by1, bx2, by2 = self.bounds
+            gap = min(x1 - bx1, y1 - by1, bx2 - x2, by2 - y2)
+            if gap < self.edge_clearance - 1e-9:
+                self._record(
+                    ("copper_edge_clearance", index),
+                    {
+                        "type": "copper_edge_clearance",
+                        "description": (
+                            f"Board edge clearance violation (clearance "
+                            f"{self.edge_clearance:.4f} mm; actual {gap:.4f} mm)"
+                        ),
+                        "severity": "error",
+                        "items": [self._entry(item)],
+                    },
+                )
+
+    def _check_net(self, net: str) -> None:
+        members = sorted(self._net_items.get(net, ()))
+        parent = {index: index for index in members}
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for index in members:
+            item = self.items[index]
+            x1, y1, x2, y2 = item.box
+            box = (x1 - _TOUCH, y1 - _TOUCH, x2 + _TOUCH, y2 + _TOUCH)
+            for other in self.grid.near(box):
+                if other <= index or other not in parent:
+                    continue
+                peer = self.items[other]
+                if set(item.layers) & set(peer.layers) and _gap(item, peer) <= _TOUCH:
+                    parent[find(index)] = find(other)
+
+        groups: Dict[int, List[int]] = {}
+        for index in members:
+            groups.setdefault(find(index), []).append(index)
+        islands = sorted(groups.values(), key=len, reverse=True)
+
+        # One missing connection per extra island, to its nearest joined item
+        entries = []
+        joined = list(islands[0]) if islands else []
+        for island in islands[1:]:
+            a = np.array([self.items[i].center for i in joined])
+            b = np.array([self.items[i].center for i in island])
+            dist = np.linalg.norm(a[:, None] - b[None], axis=2)
+            i, j = np.unravel_index(int(np.argmin(dist)), dist.shape)
+            entries.append(
+                {
+                    "type": "unconnected_items",
+                    "description": "Missing connection between items",
+                    "severity": "error",
+                    "items": [
+                        self._entry(self.items[joined[i]]),
+                        self._entry(self.items[island[j]]),
+                    ],
+                }
+            )
+            joined.extend(island)
+        if entries:
+            self._unconnected[net] = entries
+        else:
+            self._unconnected.pop(net, None)
+
+    def check(self) -> DRCResult:
+        """
+        Check everything added or moved since the last call.
+
+        Returns:
+            DRCResult with all current violations and unconnected items
+        """
+        dirty, self._dirty = self._dirty, set()
+        for index in dirty:
+            self._drop(index)
+        for index in sorted(dirty):
+            self._check_item(index)
+
+        nets, self._dirty_nets = self._dirty_nets, set()
+        for net in sorted(nets):
+            self._check_net(net)
+
+        violations = list(self._violations.values())
+        unconnected = [
+            entry
+            for net in sorted(self._unconnected)
+            for entry in self._unconnected[net]
+        ]
+        return DRCResult(
+            success=not violations,
+            violations=violations,
+            warnings=[],
+            unconnected_items=unconnected,
+        )
+
+
+def check_clearances(
+    pads: Iterable[RoutePad],
+    segments: Iterable[TrackSegment] = (),
+    vias: Iterable[RoutedVia] = (),
+    **options,
+) -> DRCResult:
+    """
+    One-shot clearance check of pads, tracks and vias.
+
+    Args:
+        pads: Pads in board coordinates
+        segments: Track segments
+        vias: Vias
+        **options: Passed to ClearanceChecker
+
+    Returns:
+        DRCResult with violations and unconnected items
+    """
+    checker = ClearanceChecker(**options)
+    for pad in pads:
+        checker.add_pad(pad)
+    for segment in segments:
+        checker.add_track(segment)
+    for via in vias:
+        checker.add_via(via)
+    return checker.check()
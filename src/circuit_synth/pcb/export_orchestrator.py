@@ -0,0 +1,515 @@
+"""
+Parallel kicad-cli export orchestration for manufacturing outputs.
+
+Each kicad-cli export (gerbers, drill, position, SVG, DRC) is an independent
+subprocess that only reads the ``.kicad_pcb`` file, so a release build does
+not need to run them one after another. This module provides:
+- A small job graph (``ExportJob``) with optional dependencies between jobs
+- Concurrent execution with a bounded worker count
+- Skipping of jobs whose inputs are unchanged, based on content hashes
+- A structured timing report (``ExportReport``) for every run
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .kicad_cli import KiCadCLI, KiCadCLIError
+
+logger = logging.getLogger(__name__)
+
+# Name of the manifest written next to the outputs to remember input hashes
+CACHE_FILENAME = ".export_cache.json"
+CACHE_VERSION = 2
+
+
+class ExportGraphError(KiCadCLIError):
+    """Raised when the export job graph is invalid (duplicates, cycles, ...)."""
+
+    pass
+
+
+@dataclass
+class ExportJob:
+    """
+    A single kicad-cli export in the job graph.
+
+    Args:
+        name: Unique job name (e.g. "gerbers", "drill")
+        action: Callable receiving the KiCadCLI instance and returning the result
+        inputs: Files whose content determines whether the job must re-run
+        outputs: Files the job produces at fixed paths; a job is only skipped
+                 if all of them still exist
+        depends_on: Names of jobs that must finish before this one starts
+        params: Extra values folded into the cache key (export options)
+        collect: Optional callable returning the job result from existing
+                 outputs, used when the job is skipped
+        generated: Optional callable mapping the job result to the files it
+                   wrote, for jobs whose file names are only known after the
+                   run. They are recorded in the cache manifest and must all
+                   still exist for the job to be skipped.
+    """
+
+    name: str
+    action: Callable[[KiCadCLI], Any]
+    inputs: List[Path] = field(default_factory=list)
+    outputs: List[Path] = field(default_factory=list)
+    depends_on: List[str] = field(default_factory=list)
+    params: Dict[str, Any] = field(default_factory=dict)
+    collect: Optional[Callable[[], Any]] = None
+    generated: Optional[Callable[[Any], Sequence[Optional[Path]]]] = None
+
+
+@dataclass
+class JobTiming:
+    """Timing and status of one job in an export run."""
+
+    name: str
+    status: str  # "completed", "skipped", "failed" or "cancelled"
+    start: float = 0.0
+    end: float = 0.0
+    input_hash: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Wall time spent in the job in seconds."""
+        return max(0.0, self.end - self.start)
+
+
+@dataclass
+class ExportReport:
+    """Result of an orchestrated export run."""
+
+    jobs: Dict[str, JobTiming]
+    results: Dict[str, Any]
+    wall_time: float
+    max_workers: int
+
+    @property
+    def success(self) -> bool:
+        """True if no job failed or was cancelled."""
+        return all(t.status in ("completed", "skipped") for t in self.jobs.values())
+
+    @property
+    def serial_time(self) -> float:
+        """Sum of individual job durations (time a sequential run would take)."""
+        return sum(t.duration for t in self.jobs.values())
+
+    @property
+    def speedup(self) -> float:
+        """Ratio of serial time to wall time."""
+        if self.wall_time <= 0:
+            return 1.0
+        return self.serial_time / self.wall_time
+
+    @property
+    def skipped(self) -> List[str]:
+        """Names of jobs skipped because their inputs were unchanged."""
+        return [name for name, t in self.jobs.items() if t.status == "skipped"]
+
+    @property
+    def failed(self) -> List[str]:
+        """Names of jobs that failed."""
+        return [name for name, t in self.jobs.items() if t.status == "failed"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the timing report (results are not included)."""
+        return {
+            "success": self.success,
+            "wall_time": self.wall_time,
+            "serial_time": self.serial_time,
+            "speedup": self.speedup,
+            "max_workers": self.max_workers,
+            "jobs": {
+                name: {**asdict(t), "duration": t.duration}
+                for name, t in self.jobs.items()
+            },
+        }
+
+
+def hash_files(paths: Sequence[Union[str, Path]], params: Optional[Dict] = None) -> str:
+    """
+    Compute a content hash over a set of files and export parameters.
+
+    Args:
+        paths: Files to hash (missing files contribute a marker, not an error)
+        params: Optional JSON-serializable parameters to include
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        path = Path(path)
+        digest.update(str(path.name).encode("utf-8"))
+        if not path.exists():
+            digest.update(b"<missing>")
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    if params:
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ExportOrchestrator:
+    """
+    Run a graph of kicad-cli export jobs concurrently.
+
+    Jobs without unmet dependencies are submitted to a thread pool (each job
+    spends its time waiting on a kicad-cli subprocess, so threads are enough).
+    With ``cache_dir`` set, the input hash of every successful job is stored in
+    a manifest and unchanged jobs are skipped on the next run.
+
+    Example:
+        >>> orchestrator = ExportOrchestrator(cli, max_workers=4, cache_dir=out)
+        >>> orchestrator.add_manufacturing_jobs(pcb_file, out)
+        >>> report = orchestrator.run()
+        >>> print(f"{report.wall_time:.1f}s (x{report.speedup:.1f})")
+    """
+
+    def __init__(
+        self,
+        cli: KiCadCLI,
+        max_workers: int = 4,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            cli: KiCadCLI instance used by all jobs
+            max_workers: Maximum number of concurrent kicad-cli processes
+            cache_dir: Directory holding the input-hash manifest. If None,
+                      every job runs on every call to run().
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.cli = cli
+        self.max_workers = max_workers
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._jobs: Dict[str, ExportJob] = {}
+
+    @property
+    def jobs(self) -> Dict[str, ExportJob]:
+        """Registered jobs by name."""
+        return dict(self._jobs)
+
+    def add_job(self, job: ExportJob) -> ExportJob:
+        """Register a job. Names must be unique."""
+        if job.name in self._jobs:
+            raise ExportGraphError(f"Duplicate export job: {job.name}")
+        self._jobs[job.name] = job
+        return job
+
+    def add_manufacturing_jobs(
+        self,
+        pcb_file: Union[str, Path],
+        output_dir: Union[str, Path],
+        layers: Optional[List[str]] = None,
+        protel_extensions: bool = True,
+        include_drill: bool = True,
+        drill_format: str = "excellon",
+        include_pos: bool = False,
+        include_svg: bool = False,
+        include_drc: bool = False,
+    ) -> List[ExportJob]:
+        """
+        Register the standard set of manufacturing exports for a board.
+
+        Args:
+            pcb_file: Path to the .kicad_pcb file
+            output_dir: Directory for Gerber and drill files
+            layers: Gerber layers to export (None exports the kicad-cli default)
+            protel_extensions: Use Protel filename extensions for Gerbers
+            include_drill: Export drill files
+            drill_format: Drill file format (excellon, gerber)
+            include_pos: Export a pick and place CSV
+            include_svg: Export an SVG render of the board
+            include_drc: Run DRC as part of the job graph
+
+        Returns:
+            List of registered jobs
+        """
+        pcb_path = Path(pcb_file)
+        output_path = Path(output_dir)
+        stem = pcb_path.stem
+        added = []
+
+        added.append(
+            self.add_job(
+                ExportJob(
+                    name="gerbers",
+                    action=lambda cli: cli.export_gerbers(
+                        pcb_file=pcb_path,
+                        output_dir=output_path,
+                        layers=layers,
+                        protel_extensions=protel_extensions,
+                    ),
+                    inputs=[pcb_path],
+                    params={"layers": layers, "protel_extensions": protel_extensions},
+                    collect=lambda: sorted(
+                        set(output_path.glob("*.gbr")) | set(output_path.glob("*.g*"))
+                    ),
+                    generated=lambda files: files,
+                )
+            )
+        )
+
+        if include_drill:
+            added.append(
+                self.add_job(
+                    ExportJob(
+                        name="drill",
+                        action=lambda cli: cli.export_drill(
+                            pcb_file=pcb_path,
+                            output_dir=output_path,
+                            format=drill_format,
+                            units="mm",
+                        ),
+                        inputs=[pcb_path],
+                        # Gerber-format drill files land next to the Gerbers and
+                        # would be picked up by the Gerber file glob mid-run
+                        depends_on=["gerbers"] if drill_format == "gerber" else [],
+                        params={"format": drill_format},
+                        collect=lambda: tuple(
+                            p if p.exists() else None
+                            for p in (
+                                output_path / f"{stem}-PTH.drl",
+                                output_path / f"{stem}-NPTH.drl",
+                            )
+                        ),
+                        generated=lambda files: files,
+                    )
+                )
+            )
+
+        if include_pos:
+            pos_file = output_path / f"{stem}-pos.csv"
+            added.append(
+                self.add_job(
+                    ExportJob(
+                        name="pos",
+                        action=lambda cli: cli.export_pos(
+                            pcb_file=pcb_path, output_file=pos_file
+                        ),
+                        inputs=[pcb_path],
+                        outputs=[pos_file],
+                        collect=lambda: pos_file,
+                    )
+                )
+            )
+
+        if include_svg:
+            svg_file = output_path / f"{stem}.svg"
+            added.append(
+                self.add_job(
+                    ExportJob(
+                        name="svg",
+                        action=lambda cli: cli.export_svg(
+                            pcb_file=pcb_path,
+                            output_file=svg_file,
+                            layers=["F.Cu", "B.Cu", "Edge.Cuts"],
+                        ),
+                        inputs=[pcb_path],
+                        outputs=[svg_file],
+                        collect=lambda: svg_file,
+                    )
+                )
+            )
+
+        if include_drc:
+            drc_file = output_path / f"{stem}.drc"
+            added.append(
+                self.add_job(
+                    ExportJob(
+                        name="drc",
+                        action=lambda cli: cli.run_drc(
+                            pcb_file=pcb_path, output_file=drc_file
+                        ),
+                        inputs=[pcb_path],
+                        outputs=[drc_file],
+                    )
+                )
+            )
+
+        return added
+
+    def _validate_graph(self) -> None:
+        """Check that all dependencies exist and the graph is acyclic."""
+        for job in self._jobs.values():
+            for dep in job.depends_on:
+                if dep not in self._jobs:
+                    raise ExportGraphError(
+                        f"Export job '{job.name}' depends on unknown job '{dep}'"
+                    )
+
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ExportGraphError(f"Cycle in export job graph at '{name}'")
+            visiting.add(name)
+            for dep in self._jobs[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._jobs:
+            visit(name)
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_dir is None:
+            return {}
+        cache_file = self.cache_dir / CACHE_FILENAME
+        if not cache_file.exists():
+            return {}
+        try:
+            with open(cache_file, "r") as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+                return {}
+            return data.get("jobs", {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable export cache {cache_file}: {e}")
+            return {}
+
+    def _save_cache(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = self.cache_dir / CACHE_FILENAME
+        with open(cache_file, "w") as f:
+            json.dump(
+                {"version": CACHE_VERSION, "jobs": entries},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+
+    def _is_up_to_date(self, job: ExportJob, input_hash: str, cache: Dict) -> bool:
+        entry = cache.get(job.name)
+        if self.cache_dir is None or not isinstance(entry, dict):
+            return False
+        if entry.get("hash") != input_hash:
+            return False
+        outputs = list(job.outputs) + entry.get("files", [])
+        return all(Path(p).exists() for p in outputs)
+
+    def run(self, force: bool = False) -> ExportReport:
+        """
+        Execute all registered jobs.
+
+        Args:
+            force: Run every job even if its inputs are unchanged
+
+        Returns:
+            ExportReport with per-job timings and results
+        """
+        self._validate_graph()
+        stored = self._load_cache()
+        cache = {} if force else stored
+        new_cache = dict(stored)
+        cache_lock = threading.Lock()
+
+        timings: Dict[str, JobTiming] = {}
+        results: Dict[str, Any] = {}
+        pending = dict(self._jobs)
+        running = {}
+        run_start = time.perf_counter()
+
+        def execute(job: ExportJob, input_hash: str) -> None:
+            timing = timings[job.name]
+            timing.start = time.perf_counter() - run_start
+            try:
+                result = job.action(self.cli)
+                results[job.name] = result
+                timing.status = "completed"
+                files = job.generated(result) if job.generated is not None else []
+                with cache_lock:
+                    new_cache[job.name] = {
+                        "hash": input_hash,
+                        "files": [str(p) for p in files if p is not None],
+                    }
+            except Exception as e:
+                timing.status = "failed"
+                timing.error = str(e)
+                with cache_lock:
+                    new_cache.pop(job.name, None)
+                logger.error(f"Export job '{job.name}' failed: {e}")
+            finally:
+                timing.end = time.perf_counter() - run_start
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for name, job in list(pending.items()):
+                    dep_states = [
+                        timings[d].status if d in timings else None
+                        for d in job.depends_on
+                    ]
+                    if any(s in ("failed", "cancelled") for s in dep_states):
+                        timings[name] = JobTiming(
+                            name=name,
+                            status="cancelled",
+                            error="dependency failed",
+                        )
+                        del pending[name]
+                        continue
+                    if not all(s in ("completed", "skipped") for s in dep_states):
+                        continue
+
+                    del pending[name]
+                    input_hash = hash_files(job.inputs, job.params)
+                    if self._is_up_to_date(job, input_hash, cache):
+                        now = time.perf_counter() - run_start
+                        timings[name] = JobTiming(
+                            name=name,
+                            status="skipped",
+                            start=now,
+                            end=now,
+                            input_hash=input_hash,
+                        )
+                        if job.collect is not None:
+                            results[name] = job.collect()
+                        logger.debug(f"Export job '{name}' up to date, skipping")
+                        continue
+
+                    timings[name] = JobTiming(
+                        name=name, status="running", input_hash=input_hash
+                    )
+                    running[executor.submit(execute, job, input_hash)] = name
+
+                if not running:
+                    if pending:
+                        # Skipped/cancelled jobs may have unblocked others
+                        continue
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    running.pop(future)
+
+        wall_time = time.perf_counter() - run_start
+        self._save_cache(new_cache)
+
+        report = ExportReport(
+            jobs=timings,
+            results=results,
+            wall_time=wall_time,
+            max_workers=self.max_workers,
+        )
+        logger.info(
+            f"Exported {len(timings)} jobs in {wall_time:.2f}s "
+            f"(serial {report.serial_time:.2f}s, skipped {len(report.skipped)})"
+        )
+        return report
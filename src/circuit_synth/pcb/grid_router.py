@@ -0,0 +1,577 @@
+"""
+In-process two-layer grid router for simple PCBs.
+
+A lightweight alternative to Freerouting that needs no JVM, no DSN export and
+no temp files. The board is rasterized into one NumPy occupancy grid per
+copper layer, with a pitch of track width plus clearance so tracks in
+neighbouring cells are always far enough apart. Nets are routed shortest
+first (by bounding-box HPWL) with A* over (layer, cell) states: front copper
+prefers horizontal runs, back copper vertical ones, and a via costs extra.
+A net that cannot be completed rips up the nets in its way and is routed
+again before them.
+
+The result is good enough for simple two-layer boards and, with rip-up
+disabled, gives a fast routability estimate while comparing placements.
+"""
+
+import heapq
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LAYERS = ("F.Cu", "B.Cu")
+
+_FREE = -1
+_BLOCKED = -2
+
+# (column, row) steps; steps 0 and 1 are horizontal
+_STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+@dataclass
+class RoutePad:
+    """A copper pad to connect, in board coordinates (mm)."""
+
+    net: str
+    x: float
+    y: float
+    width: float = 1.0
+    height: float = 1.0
+    layers: Tuple[str, ...] = ("F.Cu",)
+    ref: str = ""
+
+
+@dataclass
+class TrackSegment:
+    """A straight piece of routed track."""
+
+    net: str
+    layer: str
+    start: Tuple[float, float]
+    end: Tuple[float, float]
+    width: float
+
+    @property
+    def length(self) -> float:
+        return math.hypot(self.end[0] - self.start[0], self.end[1] - self.start[1])
+
+
+@dataclass
+class RoutedVia:
+    """A through via placed by the router."""
+
+    net: str
+    position: Tuple[float, float]
+    diameter: float
+    drill: float
+
+
+@dataclass
+class RoutingResult:
+    """Tracks and vias produced by GridRouter.route."""
+
+    segments: List[TrackSegment] = field(default_factory=list)
+    vias: List[RoutedVia] = field(default_factory=list)
+    routed_nets: List[str] = field(default_factory=list)
+    failed_nets: List[str] = field(default_factory=list)
+    connections: int = 0
+    unrouted_connections: int = 0
+    ripups: int = 0
+
+    @property
+    def completion(self) -> float:
+        """Fraction of pad-to-pad connections routed (1.0 when there are none)."""
+        if not self.connections:
+            return 1.0
+        return 1.0 - self.unrouted_connections / self.connections
+
+    @property
+    def track_length(self) -> float:
+        """Total routed track length in mm."""
+        return sum(segment.length for segment in self.segments)
+
+
+def hpwl(points: Sequence[Tuple[float, float]]) -> float:
+    """Half-perimeter of the bounding box of ``points``."""
+    if not points:
+        return 0.0
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return max(xs) - min(xs) + max(ys) - min(ys)
+
+
+def _pad_layers(pad) -> Tuple[str, ...]:
+    layers = getattr(pad, "layers", None) or ["F.Cu"]
+    if any(layer == "*.Cu" for layer in layers):
+        return LAYERS
+    copper = tuple(layer for layer in LAYERS if layer in layers)
+    return copper or ("F.Cu",)
+
+
+def pad_rect(fp, pad) -> Tuple[float, float, float, float]:
+    """
+    Board position and size of a footprint pad.
+
+    The pad offset is rotated by the footprint's rotation, and the size is
+    that of the rotated pad's bounding box.
+
+    Returns:
+        (x, y, width, height) in mm
+    """
+    angle = math.radians(getattr(fp, "rotation", 0) or 0)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    offset = getattr(pad, "position", None)
+    dx, dy = (offset.x, offset.y) if offset is not None else (0.0, 0.0)
+    width, height = getattr(pad, "size", None) or (1.0, 1.0)
+    return (
+        fp.position.x + dx * cos_a + dy * sin_a,
+        fp.position.y - dx * sin_a + dy * cos_a,
+        abs(width * cos_a) + abs(height * sin_a),
+        abs(width * sin_a) + abs(height * cos_a),
+    )
+
+
+def board_pads(pcb) -> List[RoutePad]:
+    """
+    Collect the netted pads of a board as RoutePad objects.
+
+    Pads without a net, and pads on "unconnected-..." nets, are left out.
+
+    Args:
+        pcb: Board whose ``footprints`` carry ``position``, ``rotation`` and
+            ``pads`` (with ``position``, ``size``, ``layers``, ``net_name``)
+
+    Returns:
+        Pads in board coordinates
+    """
+    pads = []
+    for fp in pcb.footprints:
+        for pad in fp.pads:
+            net = getattr(pad, "net_name", None)
+            if not net or net.startswith("unconnected-"):
+                continue
+            x, y, width, height = pad_rect(fp, pad)
+            pads.append(
+                RoutePad(net, x, y, width, height, _pad_layers(pad), fp.reference)
+            )
+    return pads
+
+
+class GridRouter:
+    """
+    Two-layer maze router on a uniform grid.
+
+    Args:
+        bounds: Routing area (x1, y1, x2, y2) in mm; defaults to the pads'
+            bounding box grown by ``margin``
+        track_width: Track width in mm
+        clearance: Copper-to-copper clearance in mm
+        via_diameter: Via pad diameter in mm
+        via_drill: Via drill diameter in mm
+        pitch: Grid pitch in mm; defaults to track width plus clearance
+        via_cost: Cost of a via, in grid steps
+        wrong_way_cost: Cost of a step against the layer's preferred direction
+        max_ripups: Rip-up budget for the whole board (0 disables rip-up)
+        margin: Border added around the pads when ``bounds`` is not given
+    """
+
+    def __init__(
+        self,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+        track_width: float = 0.25,
+        clearance: float = 0.2,
+        via_diameter: float = 0.6,
+        via_drill: float = 0.3,
+        pitch: Optional[float] = None,
+        via_cost: float = 8.0,
+        wrong_way_cost: float = 2.0,
+        max_ripups: int = 50,
+        margin: float = 2.0,
+    ):
+        self.bounds = bounds
+        self.track_width = track_width
+        self.clearance = clearance
+        self.via_diameter = via_diameter
+        self.via_drill = via_drill
+        self.pitch = pitch or track_width + clearance
+        self.via_cost = via_cost
+        self.wrong_way_cost = wrong_way_cost
+        self.max_ripups = max_ripups
+        self.margin = margin
+
+        # Cells another net must keep out of around a via centre
+        reach = via_diameter / 2 + clearance + track_width / 2
+        span = math.ceil(reach / self.pitch)
+        self._via_keepout = [
+            (dc, dr)
+            for dc in range(-span, span + 1)
+            for dr in range(-span, span + 1)
+            if math.hypot(dc, dr) * self.pitch < reach - 1e-9
+        ]
+
+    # ------------------------------------------------------------------
+    # Grid setup
+    # ------------------------------------------------------------------
+
+    def _setup(self, pads: List[RoutePad]) -> None:
+        if self.bounds is not None:
+            x1, y1, x2, y2 = self.bounds
+        else:
+            x1 = min(p.x - p.width / 2 for p in pads) - self.margin
+            y1 = min(p.y - p.height / 2 for p in pads) - self.margin
+            x2 = max(p.x + p.width / 2 for p in pads) + self.margin
+            y2 = max(p.y + p.height / 2 for p in pads) + self.margin
+        self.origin = (x1, y1)
+        self.cols = int((x2 - x1) / self.pitch) + 1
+        self.rows = int((y2 - y1) / self.pitch) + 1
+        self.cells = self.cols * self.rows
+
+        # owner[layer, row, col]: _FREE, a net id, or _BLOCKED where pads of
+        # different nets compete for the same cell. base holds pad copper
+        # and keepouts only, so ripping up a net restores it.
+        self.base = np.full((len(LAYERS), self.rows, self.cols), _FREE, np.int32)
+        self.pad_cells: List[List[int]] = []
+        reach = self.clearance + self.track_width / 2
+        for pad, net in zip(pads, self._pad_nets):
+            for layer in (LAYERS.index(name) for name in pad.layers):
+                keepout = self._rect_slices(pad, reach)
+                region = self.base[layer][keepout]
+                region[(region != _FREE) & (region != net)] = _BLOCKED
+                region[region == _FREE] = net
+        for pad, net in zip(pads, self._pad_nets):
+            terminals = []
+            row_slice, col_slice = self._rect_slices(pad, 0.0)
+            rows = range(row_slice.start, row_slice.stop)
+            cols = range(col_slice.start, col_slice.stop)
+            if not rows or not cols:
+                rows = [self._row(pad.y)]
+                cols = [self._col(pad.x)]
+            for layer in (LAYERS.index(name) for name in pad.layers):
+                for r in rows:
+                    for c in cols:
+                        self.base[layer, r, c] = net
+                        terminals.append(layer * self.cells + r * self.cols + c)
+            self.pad_cells.append(terminals)
+        self.owner = self.base.copy()
+
+    def _col(self, x: float) -> int:
+        return min(max(round((x - self.origin[0]) / self.pitch), 0), self.cols - 1)
+
+    def _row(self, y: float) -> int:
+        return min(max(round((y - self.origin[1]) / self.pitch), 0), self.rows - 1)
+
+    def _rect_slices(self, pad: RoutePad, grow: float) -> Tuple[slice, slice]:
+        """Rows and columns whose cell centres lie inside a grown pad."""
+        x1 = pad.x - pad.width / 2 - grow - self.origin[0]
+        x2 = pad.x + pad.width / 2 + grow - self.origin[0]
+        y1 = pad.y - pad.height / 2 - grow - self.origin[1]
+        y2 = pad.y + pad.height / 2 + grow - self.origin[1]
+        cols = slice(
+            max(math.ceil(x1 / self.pitch - 1e-9), 0),
+            min(math.floor(x2 / self.pitch + 1e-9) + 1, self.cols),
+        )
+        rows = slice(
+            max(math.ceil(y1 / self.pitch - 1e-9), 0),
+            min(math.floor(y2 / self.pitch + 1e-9) + 1, self.rows),
+        )
+        return rows, cols
+
+    def _point(self, state: int) -> Tuple[float, float]:
+        row, col = divmod(state % self.cells, self.cols)
+        return (
+            round(self.origin[0] + col * self.pitch, 4),
+            round(self.origin[1] + row * self.pitch, 4),
+        )
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def route(self, pads: Iterable[RoutePad]) -> RoutingResult:
+        """
+        Route every net with two or more pads.
+
+        Args:
+            pads: Pads to connect, grouped into nets by ``RoutePad.net``
+
+        Returns:
+            RoutingResult with the tracks and vias of each routed net
+        """
+        pads = list(pads)
+        result = RoutingResult()
+        members: Dict[str, List[int]] = {}
+        for index, pad in enumerate(pads):
+            members.setdefault(pad.net, []).append(index)
+        names = [name for name, idx in members.items() if len(idx) > 1]
+        if not names:
+            return result
+
+        net_ids = {name: i for i, name in enumerate(members)}
+        self._pad_nets = [net_ids[pad.net] for pad in pads]
+        self._setup(pads)
+
+        self._paths: Dict[int, List[List[int]]] = {}
+        self._claimed: Dict[int, List[int]] = {}
+        self._missing: Dict[int, int] = {}
+        result.connections = sum(len(members[name]) - 1 for name in names)
+
+        queue = sorted(
+            names,
+            key=lambda name: hpwl([(pads[i].x, pads[i].y) for i in members[name]]),
+        )
+        attempts: Dict[str, int] = {}
+        while queue:
+            name = queue.pop(0)
+            net = net_ids[name]
+            blocked = self._route_net(net, members[name])
+            if blocked is None:
+                continue
+            if result.ripups >= self.max_ripups or attempts.get(name, 0) >= 3:
+                continue
+            source, targets = blocked
+            victims = self._blockers(net, source, targets)
+            if not victims:
+                continue
+            attempts[name] = attempts.get(name, 0) + 1
+            result.ripups += 1
+            self._rip_up(net)
+            for victim in victims:
+                self._rip_up(victim)
+            victim_names = [n for n in names if net_ids[n] in victims]
+            logger.debug(f"Net {name} ripped up {', '.join(victim_names)}")
+            queue = [name] + [n for n in queue if n not in victim_names] + victim_names
+
+        for name in names:
+            net = net_ids[name]
+            missing = self._missing.get(net, 0)
+            result.unrouted_connections += missing
+            (result.failed_nets if missing else result.routed_nets).append(name)
+            self._emit(name, net, result)
+
+        logger.debug(
+            f"Routed {len(result.routed_nets)}/{len(names)} nets, "
+            f"completion {result.completion:.0%}, {result.ripups} rip-ups"
+        )
+        return result
+
+    def _route_net(
+        self, net: int, pad_indices: List[int]
+    ) -> Optional[Tuple[List[int], Set[int]]]:
+        """
+        Grow a tree over the pads of ``net``, nearest pad first.
+
+        Returns:
+            None if every pad was connected, else the source and target
+            states of the first connection that failed
+        """
+        self._paths[net] = []
+        self._claimed[net] = []
+        copper = set(self.pad_cells[pad_indices[0]])
+        joined = [pad_indices[0]]
+        remaining = list(pad_indices[1:])
+        first_failure = None
+        missing = 0
+        while remaining:
+            pad = min(
+                remaining,
+                key=lambda i: min(self._distance(i, j) for j in joined),
+            )
+            remaining.remove(pad)
+            sources = self.pad_cells[pad]
+            if copper.intersection(sources):
+                joined.append(pad)
+                copper.update(sources)
+                continue
+            path = self._search(net, sources, copper)
+            if path is None:
+                missing += 1
+                if first_failure is None:
+                    first_failure = (sources, set(copper))
+                continue
+            self._commit(net, path)
+            copper.update(path)
+            copper.update(sources)
+            joined.append(pad)
+        self._missing[net] = missing
+        return first_failure
+
+    def _distance(self, a: int, b: int) -> int:
+        cells_a, cells_b = self.pad_cells[a][0], self.pad_cells[b][0]
+        ra, ca = divmod(cells_a % self.cells, self.cols)
+        rb, cb = divmod(cells_b % self.cells, self.cols)
+        return abs(ra - rb) + abs(ca - cb)
+
+    def _search(
+        self,
+        net: int,
+        sources: Sequence[int],
+        targets: Set[int],
+        ripup_cost: Optional[float] = None,
+    ) -> Optional[List[int]]:
+        """
+        A* from any source state to any target state.
+
+        With ``ripup_cost`` set, cells held by other nets' tracks may be
+        entered at that extra cost; pad copper never may.
+        """
+        cols, rows, cells = self.cols, self.rows, self.cells
+        owner = self.owner.ravel().tolist()
+        base = self.base.ravel().tolist() if ripup_cost is not None else None
+        via_cost, wrong_way = self.via_cost, self.wrong_way_cost
+        keepout = self._via_keepout
+
+        target_cols = [t % cells % cols for t in targets]
+        target_rows = [t % cells // cols for t in targets]
+        col_lo, col_hi = min(target_cols), max(target_cols)
+        row_lo, row_hi = min(target_rows), max(target_rows)
+
+        def enter_cost(state):
+            holder = owner[state]
+            if holder == _FREE or holder == net:
+                return 0.0
+            if base is not None and holder >= 0 and base[state] in (_FREE, net):
+                return ripup_cost
+            return None
+
+        best = {}
+        came_from = {}
+        heap = []
+        for state in sources:
+            best[state] = 0.0
+            heap.append((0.0, 0.0, state))
+        heapq.heapify(heap)
+        while heap:
+            _, cost, state = heapq.heappop(heap)
+            if cost > best[state]:
+                continue
+            if state in targets:
+                path = [state]
+                while state in came_from:
+                    state = came_from[state]
+                    path.append(state)
+                path.reverse()
+                return path
+
+            layer, cell = divmod(state, cells)
+            row, col = divmod(cell, cols)
+            moves = []
+            for direction, (dc, dr) in enumerate(_STEPS):
+                c, r = col + dc, row + dr
+                if 0 <= c < cols and 0 <= r < rows:
+                    step = 1.0 if (direction < 2) == (layer == 0) else wrong_way
+                    moves.append((state + dr * cols + dc, step))
+            other = (1 - layer) * cells + cell
+            via_ok = True
+            for dc, dr in keepout:
+                c, r = col + dc, row + dr
+                if 0 <= c < cols and 0 <= r < rows:
+                    idx = r * cols + c
+                    if enter_cost(idx) is None or enter_cost(cells + idx) is None:
+                        via_ok = False
+                        break
+            if via_ok:
+                moves.append((other, via_cost))
+
+            for nxt, step in moves:
+                extra = enter_cost(nxt)
+                if extra is None:
+                    continue
+                new_cost = cost + step + extra
+                if new_cost < best.get(nxt, math.inf):
+                    best[nxt] = new_cost
+                    came_from[nxt] = state
+                    r, c = divmod(nxt % cells, cols)
+                    remaining = max(col_lo - c, 0, c - col_hi) + max(
+                        row_lo - r, 0, r - row_hi
+                    )
+                    heapq.heappush(heap, (new_cost + remaining, new_cost, nxt))
+        return None
+
+    def _commit(self, net: int, path: List[int]) -> None:
+        owner = self.owner.reshape(-1)
+        claimed = self._claimed[net]
+        for prev, state in zip(path, path[1:]):
+            if state % self.cells == prev % self.cells:
+                row, col = divmod(state % self.cells, self.cols)
+                for dc, dr in self._via_keepout:
+                    c, r = col + dc, row + dr
+                    if 0 <= c < self.cols and 0 <= r < self.rows:
+                        for layer in range(len(LAYERS)):
+                            claimed.append(layer * self.cells + r * self.cols + c)
+        claimed.extend(path)
+        for state in claimed:
+            if owner[state] == _FREE:
+                owner[state] = net
+        self._paths[net].append(path)
+
+    def _rip_up(self, net: int) -> None:
+        owner = self.owner.reshape(-1)
+        base = self.base.reshape(-1)
+        states = np.array(self._claimed.get(net, []), dtype=np.int64)
+        if states.size:
+            mine = states[owner[states] == net]
+            owner[mine] = base[mine]
+        self._paths[net] = []
+        self._claimed[net] = []
+
+    def _blockers(self, net: int, sources: List[int], targets: Set[int]) -> Set[int]:
+        """Nets whose tracks lie on the cheapest path that may cross tracks."""
+        self._rip_up(net)
+        path = self._search(net, sources, targets, ripup_cost=20.0)
+        if path is None:
+            return set()
+        owner = self.owner.reshape(-1)
+        return {int(owner[s]) for s in path if owner[s] >= 0 and owner[s] != net}
+
+    def _emit(self, name: str, net: int, result: RoutingResult) -> None:
+        """Turn the cell paths of a net into track segments and vias."""
+        for path in self._paths.get(net, []):
+            run_start = path[0]
+            for i in range(1, len(path)):
+                prev, state = path[i - 1], path[i]
+                if state % self.cells == prev % self.cells:
+                    if prev != run_start:
+                        self._add_segment(result, name, run_start, prev)
+                    result.vias.append(
+                        RoutedVia(
+                            name, self._point(state), self.via_diameter, self.via_drill
+                        )
+                    )
+                    run_start = state
+                    continue
+                nxt = path[i + 1] if i + 1 < len(path) else None
+                if nxt is None or nxt - state != state - prev:
+                    self._add_segment(result, name, run_start, state)
+                    run_start = state
+
+    def _add_segment(
+        self, result: RoutingResult, name: str, start: int, end: int
+    ) -> None:
+        result.segments.append(
+            TrackSegment(
+                net=name,
+                layer=LAYERS[start // self.cells],
+                start=self._point(start),
+                end=self._point(end),
+                width=self.track_width,
+            )
+        )
+
+
+def estimate_routability(pads: Iterable[RoutePad], **router_options) -> float:
+    """
+    Quick routability estimate: the completion of a single routing pass.
+
+    Rip-up is off unless ``max_ripups`` is passed, so this is cheap enough to
+    call while comparing candidate placements.
+
+    Returns:
+        Fraction of connections routed (0.0 - 1.0)
+    """
+    router_options.setdefault("max_ripups", 0)
+    return GridRouter(**router_options).route(pads).completion
@@ -350,7 +350,7 @@ class KiCadCLI:
         self.run_command(args, cwd=pcb_path.parent)
 
         # Find generated files
-        gerber_files = list(output_path.glob("*.gbr")) + list(output_path.glob("*.g*"))
+        gerber_files = set(output_path.glob("*.gbr")) | set(output_path.glob("*.g*"))
         return sorted(gerber_files)
 
     def export_drill(
@@ -0,0 +1,281 @@
+"""
+Placement quality metrics for PCB footprints.
+
+Scores a placement by the wiring it implies, before anything is routed:
+
+- HPWL: half-perimeter of each net's pin bounding box, the standard
+  placement wirelength estimate
+- Ratsnest length: total length of each net's minimum spanning tree over
+  its pins, which is what KiCad draws as airwires
+- Crossings: how many airwires of different nets cross each other
+
+Pin positions are held in NumPy arrays grouped by net. Moving a footprint
+only touches its own pins and re-measures only the nets they belong to,
+so a placer can evaluate a move in time proportional to those nets rather
+than the whole board.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .grid_router import board_pads
+
+logger = logging.getLogger(__name__)
+
+Segment = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+def mst_edges(points: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Euclidean minimum spanning tree of a point set (Prim, O(k^2)).
+
+    Args:
+        points: (k, 2) array of coordinates
+
+    Returns:
+        k - 1 edges as index pairs
+    """
+    count = len(points)
+    if count < 2:
+        return []
+    in_tree = np.zeros(count, dtype=bool)
+    in_tree[0] = True
+    dist = np.linalg.norm(points - points[0], axis=1)
+    parent = np.zeros(count, dtype=np.int64)
+    edges = []
+    for _ in range(count - 1):
+        candidates = np.where(in_tree, np.inf, dist)
+        nxt = int(np.argmin(candidates))
+        edges.append((int(parent[nxt]), nxt))
+        in_tree[nxt] = True
+        new_dist = np.linalg.norm(points - points[nxt], axis=1)
+        closer = new_dist < dist
+        dist[closer] = new_dist[closer]
+        parent[closer] = nxt
+    return edges
+
+
+def count_crossings(segments: np.ndarray, groups: np.ndarray) -> int:
+    """
+    Count pairs of segments from different groups that properly cross.
+
+    Segments sharing an end point or merely touching do not count.
+
+    Args:
+        segments: (n, 4) array of x1, y1, x2, y2
+        groups: (n,) group label per segment (e.g. net index)
+
+    Returns:
+        Number of crossing pairs
+    """
+    count = len(segments)
+    if count < 2:
+        return 0
+    p, q = segments[:, 0:2], segments[:, 2:4]
+    lo = np.minimum(p, q)
+    hi = np.maximum(p, q)
+
+    def orient(a, b, c):
+        return np.sign(
+            (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1])
+            - (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0])
+        )
+
+    total = 0
+    for start in range(0, count, 256):
+        rows = slice(start, min(start + 256, count))
+        i = np.arange(rows.start, rows.stop)[:, None]
+        j = np.arange(count)[None, :]
+        # Bounding boxes must overlap before the orientation tests matter
+        mask = (
+            (j > i)
+            & (groups[rows, None] != groups[None, :])
+            & (lo[rows, None, 0] <= hi[None, :, 0])
+            & (lo[None, :, 0] <= hi[rows, None, 0])
+            & (lo[rows, None, 1] <= hi[None, :, 1])
+            & (lo[None, :, 1] <= hi[rows, None, 1])
+        )
+        a, b = p[rows, None], q[rows, None]
+        c, d = p[None, :], q[None, :]
+        crosses = (orient(a, b, c) * orient(a, b, d) < 0) & (
+            orient(c, d, a) * orient(c, d, b) < 0
+        )
+        total += int(np.count_nonzero(mask & crosses))
+    return total
+
+
+class PlacementMetrics:
+    """
+    Incrementally maintained wirelength metrics for one placement.
+
+    Args:
+        footprints: Reference -> (x, y) footprint position
+        pins: (reference, net, dx, dy) per pin, with the pad offset from
+            its footprint position already rotated into board axes. Nets
+            with fewer than two pins are ignored.
+    """
+
+    def __init__(
+        self,
+        footprints: Dict[str, Tuple[float, float]],
+        pins: Iterable[Tuple[str, str, float, float]],
+    ):
+        self.refs = list(footprints)
+        self._fp_index = {ref: i for i, ref in enumerate(self.refs)}
+        self.positions = np.array(
+            [footprints[ref] for ref in self.refs], dtype=float
+        ).reshape(-1, 2)
+
+        by_net: Dict[str, List[Tuple[int, float, float]]] = {}
+        for ref, net, dx, dy in pins:
+            if ref in self._fp_index:
+                by_net.setdefault(net, []).append((self._fp_index[ref], dx, dy))
+        self.nets = [net for net, members in by_net.items() if len(members) > 1]
+
+        # Pins sorted by net: net n owns pins net_start[n]:net_start[n + 1]
+        flat = [member for net in self.nets for member in by_net[net]]
+        sizes = [len(by_net[net]) for net in self.nets]
+        self.net_start = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self.pin_fp = np.array([m[0] for m in flat], dtype=np.int64)
+        self.pin_offset = np.array([m[1:] for m in flat], dtype=float).reshape(-1, 2)
+        self.pin_net = np.repeat(np.arange(len(self.nets)), sizes)
+
+        self._fp_pins = [[] for _ in self.refs]
+        for pin, fp in enumerate(self.pin_fp):
+            self._fp_pins[fp].append(pin)
+        self._fp_pins = [np.array(p, dtype=np.int64) for p in self._fp_pins]
+        self._fp_nets = [np.unique(self.pin_net[p]) for p in self._fp_pins]
+
+        self.pin_xy = self.positions[self.pin_fp] + self.pin_offset
+        self.hpwl = self._all_hpwl()
+        self.total_hpwl = float(self.hpwl.sum())
+        self._mst: Dict[int, List[Segment]] = {}
+
+    @classmethod
+    def from_board(cls, pcb) -> "PlacementMetrics":
+        """Build metrics from a board whose pads already carry their nets."""
+        footprints = {
+            fp.reference: (fp.position.x, fp.position.y) for fp in pcb.footprints
+        }
+        pins = [
+            (
+                pad.ref,
+                pad.net,
+                pad.x - footprints[pad.ref][0],
+                pad.y - footprints[pad.ref][1],
+            )
+            for pad in board_pads(pcb)
+        ]
+        return cls(footprints, pins)
+
+    def _all_hpwl(self) -> np.ndarray:
+        if not self.nets:
+            return np.zeros(0)
+        starts = self.net_start[:-1]
+        lo = np.minimum.reduceat(self.pin_xy, starts, axis=0)
+        hi = np.maximum.reduceat(self.pin_xy, starts, axis=0)
+        return (hi - lo).sum(axis=1)
+
+    def _net_hpwl(self, net: int, pin_xy: np.ndarray) -> float:
+        xy = pin_xy[self.net_start[net] : self.net_start[net + 1]]
+        return float((xy.max(axis=0) - xy.min(axis=0)).sum())
+
+    def position(self, ref: str) -> Tuple[float, float]:
+        """Current position of a footprint."""
+        x, y = self.positions[self._fp_index[ref]]
+        return float(x), float(y)
+
+    def net_hpwl(self, net: str) -> float:
+        """HPWL of one net."""
+        return float(self.hpwl[self.nets.index(net)])
+
+    def move_delta(self, ref: str, x: float, y: float) -> float:
+        """
+        Change in total HPWL if ``ref`` moved to (x, y), without moving it.
+
+        Only the nets on the footprint's pins are re-measured.
+        """
+        fp = self._fp_index[ref]
+        pins = self._fp_pins[fp]
+        if not len(pins):
+            return 0.0
+        saved = self.pin_xy[pins].copy()
+        self.pin_xy[pins] = (x, y) + self.pin_offset[pins]
+        try:
+            return float(
+                sum(
+                    self._net_hpwl(net, self.pin_xy) - self.hpwl[net]
+                    for net in self._fp_nets[fp]
+                )
+            )
+        finally:
+            self.pin_xy[pins] = saved
+
+    def move(self, ref: str, x: float, y: float) -> float:
+        """
+        Move a footprint and update the metrics of its nets.
+
+        Returns:
+            Change in total HPWL
+        """
+        fp = self._fp_index[ref]
+        self.positions[fp] = (x, y)
+        pins = self._fp_pins[fp]
+        if not len(pins):
+            return 0.0
+        self.pin_xy[pins] = (x, y) + self.pin_offset[pins]
+        delta = 0.0
+        for net in self._fp_nets[fp]:
+            value = self._net_hpwl(net, self.pin_xy)
+            delta += value - self.hpwl[net]
+            self.hpwl[net] = value
+            self._mst.pop(int(net), None)
+        self.total_hpwl += delta
+        return delta
+
+    def ratsnest(self) -> List[Tuple[str, Segment]]:
+        """Airwires of every net as (net, ((x1, y1), (x2, y2))), MST per net."""
+        lines = []
+        for net, name in enumerate(self.nets):
+            edges = self._mst.get(net)
+            if edges is None:
+                xy = self.pin_xy[self.net_start[net] : self.net_start[net + 1]]
+                edges = [
+                    (tuple(map(float, xy[a])), tuple(map(float, xy[b])))
+                    for a, b in mst_edges(xy)
+                ]
+                self._mst[net] = edges
+            lines.extend((name, edge) for edge in edges)
+        return lines
+
+    def ratsnest_length(self) -> float:
+        """Total airwire length (sum of per-net MST lengths)."""
+        return float(
+            sum(np.hypot(b[0] - a[0], b[1] - a[1]) for _, (a, b) in self.ratsnest())
+        )
+
+    def crossings(self) -> int:
+        """Number of crossing airwire pairs from different nets."""
+        lines = self.ratsnest()
+        if not lines:
+            return 0
+        segments = np.array([[*a, *b] for _, (a, b) in lines], dtype=float)
+        index = {name: i for i, name in enumerate(self.nets)}
+        groups = np.array([index[name] for name, _ in lines])
+        return count_crossings(segments, groups)
+
+    def summary(self) -> Dict[str, float]:
+        """All metrics as a dictionary for logging and comparison."""
+        return {
+            "nets": len(self.nets),
+            "hpwl": round(self.total_hpwl, 3),
+            "ratsnest": round(self.ratsnest_length(), 3),
+            "crossings": self.crossings(),
+        }
+
+
+def placement_score(summary: Dict[str, float]) -> Tuple[float, float]:
+    """Sort key for summaries: shortest ratsnest first, then fewest crossings."""
+    return summary["ratsnest"], summary["crossings"]
@@ -1,78 +1,182 @@
 """
 Simple ratsnest generation - just flatten netlist connections to KiCad ratsnest format.
+
+Both files are read with a single-pass S-expression tokenizer: the netlist
+sweep indexes each net's (reference, pin) nodes, and the PCB sweep records
+the top-level net declarations and the span of every pad and its net. Net
+assignment is then a dictionary lookup per pad, and the board is rebuilt
+from slices in one write, so the cost stays linear in the file sizes.
 """
 
 import re
-from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+# One token per match: "(", ")", a quoted string (with escapes) or a bare atom
+_TOKEN = re.compile(r'\(|\)|"(?:[^"\\]|\\.)*"|[^\s()"]+')
 
-def add_ratsnest_to_pcb(pcb_file: str, netlist_file: str) -> bool:
+
+def _atom(token: str) -> str:
+    """Token text without surrounding quotes (escapes are left as written)."""
+    if len(token) >= 2 and token[0] == '"':
+        return token[1:-1]
+    return token
+
+
+class _Frame:
+    """An open list while sweeping: its head, arguments and start offset."""
+
+    __slots__ = ("head", "start", "args", "data")
+
+    def __init__(self, start: int):
+        self.head: Optional[str] = None
+        self.start = start
+        self.args: List[str] = []
+        self.data: Dict[str, object] = {}
+
+
+def _sweep(text: str):
     """
-    Import netlist connectivity into PCB file.
+    Yield (frame, parent, end) for every list as it closes.
 
-    KiCad generates ratsnest lines dynamically based on net connectivity,
-    so we don't add explicit ratsnest tokens. Instead, we ensure the PCB
-    has proper net definitions that match the netlist.
+    ``parent`` is the enclosing frame (None at top level) and ``end`` the
+    offset just past the closing parenthesis.
     """
+    stack: List[_Frame] = []
+    for match in _TOKEN.finditer(text):
+        token = match.group()
+        if token == "(":
+            stack.append(_Frame(match.start()))
+        elif token == ")":
+            if not stack:
+                continue
+            frame = stack.pop()
+            yield frame, (stack[-1] if stack else None), match.end()
+        elif stack:
+            frame = stack[-1]
+            if frame.head is None:
+                frame.head = token
+            else:
+                frame.args.append(_atom(token))
 
-    # Read netlist to extract net information
-    with open(netlist_file, "r") as f:
-        netlist = f.read()
-
-    # Extract nets and their connections
-    nets = {}
-    net_pattern = (
-        r'\(net\s+\(code\s+"(\d+)"\)\s+\(name\s+"([^"]+)"\)(.*?)(?=\(net\s+\(code|$)'
-    )
-    for net_code, net_name, net_content in re.findall(net_pattern, netlist, re.DOTALL):
-        if net_name == "":
+
+def _netlist_nets(netlist: str) -> Dict[str, List[Tuple[str, str]]]:
+    """Net name -> (reference, pin) nodes, in netlist order."""
+    nets: Dict[str, List[Tuple[str, str]]] = {}
+    for frame, parent, _ in _sweep(netlist):
+        if parent is None:
             continue
+        if frame.head in ("code", "name", "ref", "pin"):
+            if frame.args:
+                parent.data[frame.head] = frame.args[0]
+        elif frame.head == "node" and parent.head == "net":
+            ref, pin = frame.data.get("ref"), frame.data.get("pin")
+            if ref is not None and pin is not None:
+                parent.data.setdefault("nodes", []).append((ref.split("/")[-1], pin))
+        elif frame.head == "net" and frame.data.get("name") and "nodes" in frame.data:
+            nets.setdefault(frame.data["name"], []).extend(frame.data["nodes"])
+    return nets
+
 
-        # Get pads on this net
-        pads = []
-        for ref, pin in re.findall(
-            r'\(node\s+\(ref\s+"([^"]+)"\)\s+\(pin\s+"([^"]+)"\)', net_content
-        ):
-            clean_ref = ref.split("/")[-1] if "/" in ref else ref
-            pads.append((clean_ref, pin))
+def add_ratsnest_to_pcb(pcb_file: str, netlist_file: str) -> bool:
+    """
+    Import netlist connectivity into PCB file.
 
-        if pads:
-            nets[net_code] = {"name": net_name, "pads": pads}
+    KiCad generates ratsnest lines dynamically based on net connectivity,
+    so we don't add explicit ratsnest tokens. Instead, we ensure the PCB
+    has proper net definitions that match the netlist and that every pad
+    named in the netlist is assigned to its net, matched by (reference,
+    pad number). Nets already declared in the PCB keep their codes; new
+    ones are numbered after the highest existing code.
 
+    Returns:
+        True if the netlist had any connected nets, False otherwise
+    """
+    with open(netlist_file, "r") as f:
+        nets = _netlist_nets(f.read())
     if not nets:
         return False
 
-    # Read PCB file
     with open(pcb_file, "r") as f:
         pcb_content = f.read()
 
-    # Check if nets are already properly defined
-    existing_nets = re.findall(r'\(net (\d+) "([^"]*)"', pcb_content)
-    existing_net_dict = {code: name for code, name in existing_nets}
-
-    # Add missing net definitions
-    new_net_definitions = []
-    for net_code, net_info in nets.items():
-        if net_code not in existing_net_dict:
-            new_net_definitions.append(f'\t(net {net_code} "{net_info["name"]}")')
-
-    if new_net_definitions:
-        # Find where to insert net definitions (after net 0)
-        net_0_pos = pcb_content.find('(net 0 "")')
-        if net_0_pos != -1:
-            # Find end of net 0 line
-            net_0_end = pcb_content.find("\n", net_0_pos)
-            if net_0_end != -1:
-                # Insert new net definitions
-                pcb_content = (
-                    pcb_content[:net_0_end]
-                    + "\n"
-                    + "\n".join(new_net_definitions)
-                    + pcb_content[net_0_end:]
-                )
+    declared: Dict[str, int] = {}
+    last_declaration: Optional[Tuple[int, int]] = None
+    board_end: Optional[int] = None
+    # (footprint frame, pad number, pad net span or None, pad closing offset)
+    pads: List[Tuple[_Frame, str, Optional[Tuple[int, int]], int]] = []
+
+    for frame, parent, end in _sweep(pcb_content):
+        head = frame.head
+        if parent is None:
+            if head == "kicad_pcb":
+                board_end = end - 1
+        elif head == "net" and parent.head == "kicad_pcb" and frame.args:
+            if frame.args[0].isdigit():
+                name = frame.args[1] if len(frame.args) > 1 else ""
+                declared.setdefault(name, int(frame.args[0]))
+                last_declaration = (frame.start, end)
+        elif head == "net" and parent.head == "pad":
+            parent.data["net"] = (frame.start, end)
+        elif head == "pad" and parent.head == "footprint" and frame.args:
+            pads.append((parent, frame.args[0], frame.data.get("net"), end - 1))
+        elif parent.head == "footprint" and len(frame.args) > 1:
+            if (head == "property" and frame.args[0] == "Reference") or (
+                head == "fp_text" and frame.args[0] == "reference"
+            ):
+                parent.data["reference"] = frame.args[1]
+
+    pad_nets = {node: name for name, nodes in nets.items() for node in nodes}
+    next_code = max(declared.values(), default=0) + 1
+    new_declarations = []
+    edits: List[Tuple[int, int, str]] = []
+
+    def code_of(name: str) -> int:
+        nonlocal next_code
+        if name not in declared:
+            declared[name] = next_code
+            new_declarations.append(name)
+            next_code += 1
+        return declared[name]
+
+    # Declare every netlist net, even ones whose pads are not on the board
+    for name in nets:
+        code_of(name)
+
+    for footprint, number, net_span, pad_end in pads:
+        name = pad_nets.get((footprint.data.get("reference"), number))
+        if name is None:
+            continue
+        net = f'(net {code_of(name)} "{name}")'
+        if net_span is None:
+            edits.append((pad_end, pad_end, " " + net))
+        elif pcb_content[net_span[0] : net_span[1]] != net:
+            edits.append((*net_span, net))
+
+    if new_declarations:
+        if last_declaration is not None:
+            line_start = pcb_content.rfind("\n", 0, last_declaration[0]) + 1
+            indent = pcb_content[line_start : last_declaration[0]]
+            where = last_declaration[1]
+        elif board_end is not None:
+            indent, where = "\t", board_end
+        else:
+            return True
+        text = "".join(
+            f'\n{indent}(net {declared[name]} "{name}")' for name in new_declarations
+        )
+        edits.append((where, where, text))
+
+    if edits:
+        edits.sort(key=lambda edit: edit[0])
+        parts, cursor = [], 0
+        for start, end, text in edits:
+            parts.append(pcb_content[cursor:start])
+            parts.append(text)
+            cursor = end
+        parts.append(pcb_content[cursor:])
 
         # Write updated PCB file
         with open(pcb_file, "w") as f:
-            f.write(pcb_content)
+            f.write("".join(parts))
 
     return True
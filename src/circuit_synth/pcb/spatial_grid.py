@@ -0,0 +1,53 @@
+"""
+Uniform bucket grid for finding rectangles near a query box.
+
+Items are registered under every cell their bounding box touches, so a
+query only looks at the few buckets around it. Used by the annealing
+placer for courtyards and by the clearance DRC for copper.
+"""
+
+import math
+from typing import Dict, Hashable, Set, Tuple
+
+Box = Tuple[float, float, float, float]
+
+
+class SpatialGrid:
+    """
+    Bucket grid of axis-aligned boxes (x1, y1, x2, y2).
+
+    Args:
+        cell: Cell size in mm; about twice the typical item size works well
+    """
+
+    def __init__(self, cell: float):
+        self.cell = cell
+        self.buckets: Dict[Tuple[int, int], Set[Hashable]] = {}
+
+    def _keys(self, box: Box):
+        c = self.cell
+        for cx in range(math.floor(box[0] / c), math.floor(box[2] / c) + 1):
+            for cy in range(math.floor(box[1] / c), math.floor(box[3] / c) + 1):
+                yield cx, cy
+
+    def add(self, item: Hashable, box: Box) -> None:
+        """Register ``item`` under every cell ``box`` touches."""
+        for key in self._keys(box):
+            self.buckets.setdefault(key, set()).add(item)
+
+    def remove(self, item: Hashable, box: Box) -> None:
+        """Unregister ``item``; ``box`` must be the one it was added with."""
+        for key in self._keys(box):
+            bucket = self.buckets[key]
+            bucket.discard(item)
+            if not bucket:
+                del self.buckets[key]
+
+    def near(self, box: Box) -> Set[Hashable]:
+        """Items in the cells ``box`` touches (a superset of those it overlaps)."""
+        found: Set[Hashable] = set()
+        for key in self._keys(box):
+            bucket = self.buckets.get(key)
+            if bucket:
+                found |= bucket
+        return found
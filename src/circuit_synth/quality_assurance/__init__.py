@@ -10,6 +10,7 @@ from .fmea_analyzer import (
     UniversalFMEAAnalyzer,
     analyze_any_circuit,
 )
+from .fmea_batch import FMEABatchResult, analyze_circuit_batch
 from .fmea_report_generator import (
     REPORTLAB_AVAILABLE,
     FMEAReportGenerator,
@@ -48,6 +49,8 @@ __all__ = [
     "analyze_any_circuit",
     "ComponentType",
     "FailureMode",
+    "FMEABatchResult",
+    "analyze_circuit_batch",
     # Validation
     "ValidationIssue",
     "validate",
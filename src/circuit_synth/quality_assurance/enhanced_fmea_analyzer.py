@@ -9,7 +9,8 @@ import os
 import random
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .fmea_analyzer import ComponentType, FailureMode, UniversalFMEAAnalyzer
 from .fmea_report_generator import FMEAReportGenerator
@@ -17,72 +18,97 @@ from .fmea_report_generator import FMEAReportGenerator
 # import yaml  # No longer needed, using JSON
 
 
+_knowledge_base_cache: Dict[Path, Mapping] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _read_knowledge_base(kb_path: Path) -> Dict:
+    """Read every JSON file of an FMEA knowledge base directory"""
+    kb = {
+        "component_specific": {},
+        "environmental": {},
+        "manufacturing": {},
+        "standards": {},
+    }
+
+    if not kb_path.exists():
+        print(f"Warning: Knowledge base not found at {kb_path}")
+        return kb
+
+    sections = {
+        "component_specific": kb_path / "failure_modes" / "component_specific",
+        "environmental": kb_path / "failure_modes" / "environmental",
+        "manufacturing": kb_path / "failure_modes" / "manufacturing",
+        "standards": kb_path / "standards",
+    }
+    for section, section_path in sections.items():
+        if not section_path.exists():
+            continue
+        for json_file in section_path.glob("*.json"):
+            try:
+                with open(json_file, "r") as f:
+                    kb[section][json_file.stem] = json.load(f)
+            except Exception as e:
+                print(f"Error loading {json_file}: {e}")
+
+    return kb
+
+
+def load_knowledge_base(kb_path: Optional[Path] = None) -> Mapping:
+    """
+    Load an FMEA knowledge base once per process.
+
+    The result is an immutable view (mappingproxies and tuples) shared by
+    every analyzer using the same directory, so creating analyzers is cheap
+    and none of them can change the data under the others.
+
+    Args:
+        kb_path: Knowledge base directory (default: knowledge_base/fmea)
+
+    Returns:
+        Read-only mapping with component_specific, environmental,
+        manufacturing and standards sections
+    """
+    kb_path = Path(kb_path or Path("knowledge_base") / "fmea").resolve()
+    kb = _knowledge_base_cache.get(kb_path)
+    if kb is None:
+        kb = _freeze(_read_knowledge_base(kb_path))
+        _knowledge_base_cache[kb_path] = kb
+    return kb
+
+
 class EnhancedFMEAAnalyzer(UniversalFMEAAnalyzer):
     """Enhanced FMEA analyzer that uses the comprehensive knowledge base"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, verbose: bool = True, kb_path: Optional[Path] = None):
+        super().__init__(verbose=verbose)
+        self.kb_path = kb_path
         self.knowledge_base = self._load_knowledge_base()
 
-    def _load_knowledge_base(self) -> Dict:
-        """Load the comprehensive FMEA knowledge base"""
-        kb = {
-            "component_specific": {},
-            "environmental": {},
-            "manufacturing": {},
-            "standards": {},
-        }
+    def _load_knowledge_base(self) -> Mapping:
+        """Load the comprehensive FMEA knowledge base (shared, read-only)"""
+        return load_knowledge_base(self.kb_path)
 
-        kb_path = Path("knowledge_base") / "fmea"
-        if not kb_path.exists():
-            print(f"Warning: Knowledge base not found at {kb_path}")
-            return kb
-
-        # Load component-specific failure modes
-        component_path = kb_path / "failure_modes" / "component_specific"
-        if component_path.exists():
-            for json_file in component_path.glob("*.json"):
-                try:
-                    with open(json_file, "r") as f:
-                        component_type = json_file.stem
-                        kb["component_specific"][component_type] = json.load(f)
-                except Exception as e:
-                    print(f"Error loading {json_file}: {e}")
-
-        # Load environmental failure modes
-        env_path = kb_path / "failure_modes" / "environmental"
-        if env_path.exists():
-            for json_file in env_path.glob("*.json"):
-                try:
-                    with open(json_file, "r") as f:
-                        env_type = json_file.stem
-                        kb["environmental"][env_type] = json.load(f)
-                except Exception as e:
-                    print(f"Error loading {json_file}: {e}")
-
-        # Load manufacturing defects
-        mfg_path = kb_path / "failure_modes" / "manufacturing"
-        if mfg_path.exists():
-            for json_file in mfg_path.glob("*.json"):
-                try:
-                    with open(json_file, "r") as f:
-                        mfg_type = json_file.stem
-                        kb["manufacturing"][mfg_type] = json.load(f)
-                except Exception as e:
-                    print(f"Error loading {json_file}: {e}")
-
-        # Load standards
-        standards_path = kb_path / "standards"
-        if standards_path.exists():
-            for json_file in standards_path.glob("*.json"):
-                try:
-                    with open(json_file, "r") as f:
-                        standard_type = json_file.stem
-                        kb["standards"][standard_type] = json.load(f)
-                except Exception as e:
-                    print(f"Error loading {json_file}: {e}")
+    def _component_signature(self, component_info: Dict) -> tuple:
+        # The environmental modes also look at an explicit "type" field
+        return super()._component_signature(component_info) + (
+            component_info.get("type"),
+        )
 
-        return kb
+    def _context_signature(self, circuit_context: Dict) -> tuple:
+        return (
+            circuit_context.get("environment", "indoor"),
+            bool(circuit_context.get("safety_critical", False)),
+            circuit_context.get("production_volume", "medium"),
+        )
 
     def analyze_component(
         self, component_info: Dict, circuit_context: Dict
@@ -5,13 +5,14 @@ Analyzes any circuit design and generates comprehensive FMEA reports
 """
 
 import ast
-import json
+import dataclasses
 import os
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..core.netlist_snapshot import load_circuit_json
 from .circuit_parser import extract_components_from_python
 from .fmea_report_generator import FMEAReportGenerator
 
@@ -127,6 +128,8 @@ class UniversalFMEAAnalyzer:
         self.verbose = verbose
         self.components_analyzed = 0
         self.failure_modes = []
+        # (component signature, context signature) -> (ref, failure modes)
+        self._failure_mode_cache: Dict[tuple, Tuple[str, List[FailureMode]]] = {}
 
     def identify_component_type(self, component_info: Dict) -> ComponentType:
         """Identify component type from symbol or reference"""
@@ -259,6 +262,70 @@ class UniversalFMEAAnalyzer:
 
         return failure_modes
 
+    def _component_signature(self, component_info: Dict) -> tuple:
+        """Everything about a component, except its reference, that
+        analyze_component looks at.
+
+        Components with the same signature (type, symbol, package, value)
+        get the same failure modes, so designs full of repeated parts only
+        derive them once. Subclasses whose analysis reads more fields must
+        extend this.
+        """
+        ref = component_info.get("ref", "")
+        return (
+            self.identify_component_type(component_info),
+            ref.startswith("J"),
+            component_info.get("symbol", ""),
+            component_info.get("footprint", ""),
+            component_info.get("value", ""),
+        )
+
+    def _context_signature(self, circuit_context: Dict) -> tuple:
+        """Circuit context fields that analyze_component depends on."""
+        return ()
+
+    def analyze_component_cached(
+        self, component_info: Dict, circuit_context: Dict
+    ) -> List[FailureMode]:
+        """
+        analyze_component, memoized per component signature.
+
+        A cache hit copies the stored failure modes and swaps in this
+        component's reference, so callers may modify the results.
+        """
+        try:
+            key = (
+                self._component_signature(component_info),
+                self._context_signature(circuit_context),
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable field values (e.g. nested dicts) can't be memoized
+            return self.analyze_component(component_info, circuit_context)
+
+        ref = str(component_info.get("ref", "Unknown"))
+        cached = self._failure_mode_cache.get(key)
+        if cached is None:
+            modes = self.analyze_component(component_info, circuit_context)
+            self._failure_mode_cache[key] = (
+                ref,
+                [dataclasses.replace(fm) for fm in modes],
+            )
+            return modes
+
+        cached_ref, cached_modes = cached
+        return [
+            dataclasses.replace(
+                fm,
+                component=(
+                    ref + fm.component[len(cached_ref) :]
+                    if fm.component.startswith(cached_ref)
+                    else fm.component
+                ),
+            )
+            for fm in cached_modes
+        ]
+
     def _adjust_severity(self, base: int, component: Dict, context: Dict) -> int:
         """Adjust severity based on component criticality"""
         # Critical components get higher severity
@@ -360,12 +427,12 @@ class UniversalFMEAAnalyzer:
         nets = {}
 
         if file_path.suffix == ".json":
-            # Parse JSON netlist
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                components = data.get("components", {})
-                nets = data.get("nets", {})
-                circuit_data["component_count"] = len(components)
+            # Parse JSON netlist; only the root sheet is analyzed, so a
+            # snapshot sibling lets us skip parsing the subcircuits
+            data = load_circuit_json(file_path, include_children=False)
+            components = data.get("components", {})
+            nets = data.get("nets", {})
+            circuit_data["component_count"] = len(components)
 
         elif file_path.suffix == ".py":
             # Parse Python circuit file using dedicated parser
@@ -414,7 +481,7 @@ class UniversalFMEAAnalyzer:
                 # Handle different component formats
                 comp_info = {"ref": comp_ref, "symbol": str(comp_info)}
 
-            comp_failures = self.analyze_component(comp_info, circuit_context)
+            comp_failures = self.analyze_component_cached(comp_info, circuit_context)
             self.failure_modes.extend(comp_failures)
             self.components_analyzed += 1
 
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Batch FMEA analysis across many circuit designs.
+
+Designs are fanned out over a process pool. Each worker builds one analyzer
+for its whole share of the batch, so the FMEA knowledge base is loaded once
+per worker (once in total on fork-based platforms, where workers inherit
+the parent's copy) and failure modes derived for a component signature are
+reused by every later design containing the same part.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from .fmea_analyzer import UniversalFMEAAnalyzer
+
+# Analyzer shared by all tasks run in this (worker) process
+_worker_analyzer: Optional[UniversalFMEAAnalyzer] = None
+
+
+@dataclass
+class FMEABatchResult:
+    """FMEA outcome for one design of a batch"""
+
+    path: str
+    circuit_data: Dict = field(default_factory=dict)
+    failure_modes: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def max_rpn(self) -> int:
+        return max((fm["rpn"] for fm in self.failure_modes), default=0)
+
+    def count_at_least(self, rpn: int) -> int:
+        """Number of failure modes with an RPN of at least ``rpn``"""
+        return sum(1 for fm in self.failure_modes if fm["rpn"] >= rpn)
+
+
+def find_circuit_file(path: Union[str, Path]) -> Optional[Path]:
+    """
+    Pick the circuit file to analyze for a file or design directory.
+
+    A directory resolves to its first JSON netlist, else main.py, else its
+    first Python file.
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return path
+
+    json_files = sorted(path.glob("*.json"))
+    if json_files:
+        return json_files[0]
+    if (path / "main.py").exists():
+        return path / "main.py"
+    py_files = sorted(path.glob("*.py"))
+    return py_files[0] if py_files else None
+
+
+def find_designs(root: Union[str, Path]) -> List[Path]:
+    """
+    Circuit files for every design under ``root``.
+
+    Each subdirectory holding a circuit is one design, and so is each
+    circuit file directly inside ``root``.
+    """
+    root = Path(root)
+    designs = []
+    for entry in sorted(root.iterdir()):
+        if entry.is_dir():
+            circuit_file = find_circuit_file(entry)
+            if circuit_file is not None:
+                designs.append(circuit_file)
+        elif entry.suffix in (".json", ".py"):
+            designs.append(entry)
+    return designs
+
+
+def _make_analyzer(enhanced: bool, kb_path: Optional[Path]) -> UniversalFMEAAnalyzer:
+    if enhanced:
+        from .enhanced_fmea_analyzer import EnhancedFMEAAnalyzer
+
+        return EnhancedFMEAAnalyzer(verbose=False, kb_path=kb_path)
+    return UniversalFMEAAnalyzer(verbose=False)
+
+
+def _init_worker(enhanced: bool, kb_path: Optional[Path]) -> None:
+    global _worker_analyzer
+    _worker_analyzer = _make_analyzer(enhanced, kb_path)
+
+
+def _analyze(path: str) -> FMEABatchResult:
+    """Process-pool entry point; never raises so one bad design can't stop a batch."""
+    try:
+        circuit_data, failure_modes = _worker_analyzer.analyze_circuit_file(path)
+        return FMEABatchResult(path, circuit_data, failure_modes)
+    except Exception as e:
+        return FMEABatchResult(path, error=f"{type(e).__name__}: {e}")
+
+
+def analyze_circuit_batch(
+    paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    enhanced: bool = False,
+    kb_path: Optional[Path] = None,
+) -> List[FMEABatchResult]:
+    """
+    Run FMEA on many circuit files in parallel.
+
+    Args:
+        paths: Circuit files (.py or .json)
+        max_workers: Worker processes. None uses the CPU count, 1 runs inline.
+        enhanced: Use EnhancedFMEAAnalyzer and the FMEA knowledge base
+        kb_path: Knowledge base directory for the enhanced analyzer
+
+    Returns:
+        One FMEABatchResult per path, in input order
+    """
+    paths = [str(p) for p in paths]
+    if enhanced:
+        # Load before forking so workers inherit the parsed knowledge base
+        from .enhanced_fmea_analyzer import load_knowledge_base
+
+        load_knowledge_base(kb_path)
+
+    if max_workers == 1 or len(paths) <= 1:
+        _init_worker(enhanced, kb_path)
+        return [_analyze(path) for path in paths]
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, math.ceil(len(paths) / (workers * 4)))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(enhanced, kb_path),
+    ) as pool:
+        return list(pool.map(_analyze, paths, chunksize=chunksize))
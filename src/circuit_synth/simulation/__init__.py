@@ -8,6 +8,8 @@ Main Components:
 - CircuitSimulator: Main simulation interface
 - SpiceConverter: Converts circuit-synth to SPICE format
 - SimulationResult: Results container with plotting capabilities
+- BatchSimulator: Parallel parameter sweeps and Monte Carlo analysis
+- MNASolver: Built-in linear DC/AC solver (backend="mna", no ngspice needed)
 - AnalysisTypes: DC, AC, Transient analysis support
 
 Example Usage:
@@ -28,8 +30,10 @@ Example Usage:
 from .analysis import ACAnalysis, DCAnalysis, TransientAnalysis
 from .converter import SpiceConverter
 from .manufacturer_models import ManufacturerModels, get_manufacturer_models
+from .mna import MNAError, MNASolver
 from .models import ModelLibrary, SpiceModel, get_model_library
 from .simulator import CircuitSimulator, SimulationResult
+from .sweep import BatchResult, BatchSimulator, Tolerance
 from .testbench import TestBenchGenerator, generate_testbench_for_circuit
 from .visualization import SimulationVisualizer, enhance_simulation_result
 
@@ -40,6 +44,11 @@ __all__ = [
     "CircuitSimulator",
     "SimulationResult",
     "SpiceConverter",
+    "BatchSimulator",
+    "BatchResult",
+    "Tolerance",
+    "MNASolver",
+    "MNAError",
     "DCAnalysis",
     "ACAnalysis",
     "TransientAnalysis",
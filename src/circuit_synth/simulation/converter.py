@@ -7,7 +7,7 @@ to SPICE netlists that can be simulated with PySpice/ngspice.
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +20,40 @@ except ImportError:
     PYSPICE_AVAILABLE = False
 
 
+# Pin-name aliases (upper case) for ordering the terminals of multi-terminal
+# devices, in the order SPICE expects them
+BJT_TERMINALS = (("C", "COLLECTOR"), ("B", "BASE"), ("E", "EMITTER"))
+MOSFET_TERMINALS = (
+    ("D", "DRAIN"),
+    ("G", "GATE"),
+    ("S", "SOURCE"),
+    ("B", "BULK", "SUB", "SUBSTRATE"),
+)
+OPAMP_TERMINALS = (
+    ("~", "OUT", "OUTPUT", "VOUT"),
+    ("+", "IN+", "+IN", "NON_INV", "NONINV"),
+    ("-", "IN-", "-IN", "INV"),
+)
+
+
 class SpiceConverter:
     """Converts circuit-synth circuits to PySpice format."""
 
-    def __init__(self, circuit_synth_circuit):
+    def __init__(self, circuit_synth_circuit, netlist_ir=None):
+        """
+        Args:
+            circuit_synth_circuit: Circuit to convert
+            netlist_ir: Optional prebuilt ``NetlistIR`` of the circuit; when
+                        given, pin-to-net indexing reads it instead of
+                        walking the nets
+        """
         self.circuit = circuit_synth_circuit
+        self.netlist_ir = netlist_ir
         self.spice_circuit = None
         self.voltage_sources = []
         self.node_map = {}
+        # Component ref -> [(pin number, pin name, SPICE node)] in symbol pin order
+        self.pin_index: Dict[str, List[Tuple[str, str, Any]]] = {}
 
     def convert(self) -> "SpiceCircuit":
         """Convert circuit-synth circuit to PySpice circuit."""
@@ -41,6 +67,9 @@ class SpiceConverter:
         # Map circuit-synth nets to SPICE nodes
         self._map_nodes()
 
+        # Index component pins to nodes once, instead of per component
+        self._build_pin_index()
+
         # Add components to SPICE circuit
         self._add_components()
 
@@ -72,9 +101,83 @@ class SpiceConverter:
             else:
                 self.node_map[net_name] = net_name
 
+    def _iter_nets(self):
+        """Iterate over net objects for both dict and list net containers."""
+        nets = self.circuit.nets
+        if hasattr(nets, "values"):
+            return nets.values()
+        if hasattr(nets, "__iter__"):
+            return nets
+        return ()
+
+    def _iter_components(self):
+        """Iterate over components for both dict and list containers."""
+        components = self.circuit.components
+        if hasattr(components, "values"):
+            return components.values()
+        return components
+
+    @staticmethod
+    def _pin_number_key(pin) -> Tuple[int, Any]:
+        """Sort key placing numeric pin numbers first, in numeric order."""
+        num = str(getattr(pin, "num", ""))
+        return (0, int(num)) if num.isdigit() else (1, num)
+
+    def _build_pin_index(self):
+        """
+        Build the component -> ordered pin -> SPICE node table in one pass.
+
+        Every net is visited once and each pin is attributed to its owning
+        component directly, so conversion is linear in the number of pins.
+        Pins are kept in the symbol's pin order (the order the component
+        loaded them), falling back to pin number order.
+        """
+        if self.netlist_ir is not None:
+            # The IR already lists each component's connected pins in symbol order
+            self.pin_index = {
+                ref: [
+                    (str(num), str(name), self.node_map.get(net, net))
+                    for num, name, net in pins
+                ]
+                for ref, pins in self.netlist_ir.pin_nets().items()
+            }
+            return
+
+        pins_by_ref: Dict[str, List[Tuple[Any, Any]]] = {}
+        owners: Dict[str, Any] = {}
+
+        for net in self._iter_nets():
+            net_name = getattr(net, "name", str(net))
+            node = self.node_map.get(net_name, net_name)
+            for pin in getattr(net, "pins", ()):
+                component = getattr(pin, "_component", None)
+                ref = getattr(component, "ref", None)
+                if not ref:
+                    continue
+                owners.setdefault(ref, component)
+                pins_by_ref.setdefault(ref, []).append((pin, node))
+
+        self.pin_index = {}
+        for ref, entries in pins_by_ref.items():
+            try:
+                symbol_order = {id(p): i for i, p in enumerate(owners[ref])}
+            except TypeError:
+                symbol_order = {}
+            unordered = len(symbol_order)
+            entries.sort(
+                key=lambda entry: (
+                    symbol_order.get(id(entry[0]), unordered),
+                    self._pin_number_key(entry[0]),
+                )
+            )
+            self.pin_index[ref] = [
+                (str(getattr(pin, "num", "")), str(getattr(pin, "name", "")), node)
+                for pin, node in entries
+            ]
+
     def _add_components(self):
         """Add circuit-synth components to SPICE circuit."""
-        for component in self.circuit.components:
+        for component in self._iter_components():
             self._add_component(component)
 
     def _add_component(self, component):
@@ -156,7 +259,7 @@ class SpiceConverter:
 
     def _add_opamp(self, component, ref: str, value: str):
         """Add op-amp to SPICE circuit (simplified model)."""
-        nodes = self._get_component_nodes(component)
+        nodes = self._get_component_nodes(component, OPAMP_TERMINALS, required=3)
         if len(nodes) < 3:
             logger.warning(
                 f"Op-amp {ref} needs at least 3 connections, got {len(nodes)}"
@@ -173,7 +276,7 @@ class SpiceConverter:
 
     def _add_bjt_transistor(self, component, ref: str, value: str):
         """Add BJT transistor to SPICE circuit."""
-        nodes = self._get_component_nodes(component)
+        nodes = self._get_component_nodes(component, BJT_TERMINALS, required=3)
         if len(nodes) < 3:
             logger.warning(f"BJT {ref} needs 3 connections (C,B,E), got {len(nodes)}")
             return
@@ -191,7 +294,7 @@ class SpiceConverter:
 
     def _add_mosfet(self, component, ref: str, value: str):
         """Add MOSFET to SPICE circuit."""
-        nodes = self._get_component_nodes(component)
+        nodes = self._get_component_nodes(component, MOSFET_TERMINALS, required=3)
         if len(nodes) < 3:
             logger.warning(
                 f"MOSFET {ref} needs at least 3 connections (D,G,S), got {len(nodes)}"
@@ -259,45 +362,54 @@ class SpiceConverter:
             f"Added current source {ref}: {nodes[0]} -> {nodes[1]} = {current}A"
         )
 
-    def _get_component_nodes(self, component) -> List[str]:
-        """Get the SPICE nodes connected to a component."""
-        nodes = []
-
-        # Get component connections from the circuit
-        # circuit.nets is a dict, iterate over values
-        if hasattr(self.circuit.nets, "values"):
-            nets_to_check = self.circuit.nets.values()
-        else:
-            nets_to_check = self.circuit.nets
+    def _get_component_nodes(
+        self,
+        component,
+        terminals: Optional[Sequence[Tuple[str, ...]]] = None,
+        required: int = 0,
+    ) -> List[str]:
+        """
+        Get the SPICE nodes connected to a component.
+
+        Args:
+            component: circuit-synth component
+            terminals: Optional pin-name aliases per SPICE terminal, in SPICE
+                       order (e.g. collector, base, emitter). Matching stops at
+                       the first terminal that has no connected pin.
+            required: Minimum number of terminals that must match by name;
+                      otherwise the nodes are returned in symbol pin order.
+
+        Returns:
+            List of SPICE nodes, one per connected pin
+        """
+        ref = getattr(component, "ref", "")
+        if not self.pin_index:
+            self._build_pin_index()
+        entries = self.pin_index.get(ref, [])
 
-        for net in nets_to_check:
-            net_name = getattr(net, "name", str(net))
+        nodes = []
+        if terminals:
+            for aliases in terminals:
+                match = next(
+                    (
+                        node
+                        for num, name, node in entries
+                        if name.upper() in aliases or num.upper() in aliases
+                    ),
+                    None,
+                )
+                if match is None:
+                    break
+                nodes.append(match)
+            if len(nodes) < required:
+                nodes = []
 
-            # Check if this net has pins connected to our component
-            if hasattr(net, "pins"):
-                for pin in net.pins:
-                    # Each pin has a reference back to its component
-                    # The pin string format is like "Pin(~ of R1, net=VIN)"
-                    pin_str = str(pin)
-                    component_ref = getattr(component, "ref", "")
-
-                    # Check if this pin belongs to our component
-                    if f" of {component_ref}," in pin_str:
-                        # Map to SPICE node name
-                        spice_node = self.node_map.get(net_name, net_name)
-                        if spice_node not in nodes:
-                            nodes.append(spice_node)
-                        break
-
-        # Sort nodes to ensure consistent pin ordering (important for SPICE)
-        # Convert all to strings first to avoid type comparison issues
-        nodes.sort(key=str)
+        if not nodes:
+            nodes = [node for _, _, node in entries]
 
         # If we didn't find connections, log for debugging
         if not nodes:
-            logger.warning(
-                f"No connections found for component {getattr(component, 'ref', 'unknown')}"
-            )
+            logger.warning(f"No connections found for component {ref or 'unknown'}")
 
         return nodes
 
@@ -10,6 +10,8 @@ import os
 import platform
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -39,74 +41,230 @@ except ImportError as e:
 
 
 class SimulationResult:
-    """Container for SPICE simulation results with analysis capabilities."""
+    """
+    Container for SPICE simulation results with analysis capabilities.
+
+    Node voltages are stored column-wise: one contiguous NumPy matrix of shape
+    (nodes, points) plus a node-name index. The matrix is only built the first
+    time results are accessed, and waveforms are returned as views into it,
+    so long transient runs are never converted to Python lists.
+    """
+
+    # Analysis attributes holding the sweep axis, in lookup order
+    AXIS_ATTRIBUTES = ("time", "frequency", "sweep")
 
     def __init__(self, analysis_result, analysis_type: str):
         self.analysis = analysis_result
         self.analysis_type = analysis_type
-        self._voltages = {}
-        self._currents = {}
-
-        # Extract voltages and currents from analysis
-        if hasattr(analysis_result, "nodes"):
-            for node in analysis_result.nodes:
-                if hasattr(analysis_result, node):
-                    self._voltages[node] = analysis_result[node]
-
-    def get_voltage(self, node: str) -> Union[float, List[float]]:
-        """Get voltage at a specific node."""
-        if node in self._voltages:
-            voltage = self._voltages[node]
-            # Handle scalar or array results
-            if hasattr(voltage, "__len__") and len(voltage) == 1:
-                return float(voltage[0])
-            elif hasattr(voltage, "__len__"):
-                return [float(v) for v in voltage]
-            else:
-                return float(voltage)
-        else:
-            # Try direct access
+        self._matrix: Optional[np.ndarray] = None
+        self._node_index: Dict[str, int] = {}
+        self._branch_matrix: Optional[np.ndarray] = None
+        self._branch_index: Dict[str, int] = {}
+        self._axis: Optional[np.ndarray] = None
+        self._axis_name: Optional[str] = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        nodes: List[str],
+        matrix: np.ndarray,
+        analysis_type: str,
+        axis: Optional[np.ndarray] = None,
+        axis_name: Optional[str] = None,
+    ) -> "SimulationResult":
+        """Build a result directly from a (nodes, points) matrix."""
+        result = cls(None, analysis_type)
+        result._matrix = np.ascontiguousarray(np.atleast_2d(matrix))
+        if result._matrix.shape[0] != len(nodes):
+            raise ValueError("Matrix must have one row per node")
+        result._node_index = {str(name): i for i, name in enumerate(nodes)}
+        result._branch_matrix = np.empty((0, result._matrix.shape[1]))
+        result._axis = None if axis is None else np.asarray(axis)
+        result._axis_name = axis_name
+        return result
+
+    @classmethod
+    def load_npz(cls, path: Union[str, os.PathLike]) -> "SimulationResult":
+        """Load a result written by to_npz()."""
+        with np.load(path, allow_pickle=False) as data:
+            axis = data["axis"] if data["axis"].size else None
+            axis_name = str(data["axis_name"]) or None
+            return cls.from_arrays(
+                [str(n) for n in data["nodes"]],
+                data["voltages"],
+                str(data["analysis_type"]),
+                axis=axis,
+                axis_name=axis_name,
+            )
+
+    @staticmethod
+    def _stack(waveforms: Dict) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Copy waveforms once into a contiguous (rows, points) matrix."""
+        names = [str(name) for name in waveforms]
+        arrays = [np.asarray(w).ravel() for w in waveforms.values()]
+        if not arrays:
+            return np.empty((0, 0)), {}
+        points = max(a.size for a in arrays)
+        dtype = np.result_type(*arrays, np.float64)
+        matrix = np.full((len(arrays), points), np.nan, dtype=dtype)
+        for row, values in enumerate(arrays):
+            matrix[row, : values.size] = values
+        return matrix, {name: i for i, name in enumerate(names)}
+
+    def _materialize(self):
+        """Build the node matrix, branch matrix and axis on first access."""
+        if self._matrix is not None:
+            return
+        self._matrix, self._node_index = self._stack(
+            getattr(self.analysis, "nodes", None) or {}
+        )
+        self._branch_matrix, self._branch_index = self._stack(
+            getattr(self.analysis, "branches", None) or {}
+        )
+        for attr in self.AXIS_ATTRIBUTES:
             try:
-                voltage = self.analysis[node]
-                if hasattr(voltage, "__len__") and len(voltage) == 1:
-                    return float(voltage[0])
-                elif hasattr(voltage, "__len__"):
-                    return [float(v) for v in voltage]
-                else:
-                    return float(voltage)
-            except:
-                raise KeyError(f"Node '{node}' not found in simulation results")
+                axis = getattr(self.analysis, attr)
+            except Exception:
+                continue
+            if axis is not None:
+                self._axis = np.asarray(axis).ravel()
+                self._axis_name = attr
+                break
+
+    @staticmethod
+    def _find(index: Dict[str, int], name: str) -> Optional[int]:
+        """Exact, then case-insensitive lookup (ngspice lower-cases names)."""
+        if name in index:
+            return index[name]
+        lowered = name.lower()
+        for key, row in index.items():
+            if key.lower() == lowered:
+                return row
+        return None
+
+    @staticmethod
+    def _scalar_or_view(values: np.ndarray):
+        if values.size == 1:
+            value = values[0]
+            return complex(value) if np.iscomplexobj(values) else float(value)
+        return values
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """All node waveforms as a (nodes, points) matrix."""
+        self._materialize()
+        return self._matrix
+
+    @property
+    def node_index(self) -> Dict[str, int]:
+        """Node name -> row in `matrix`."""
+        self._materialize()
+        return dict(self._node_index)
+
+    @property
+    def axis(self) -> Optional[np.ndarray]:
+        """Sweep axis (time, frequency or swept source value), if any."""
+        self._materialize()
+        return self._axis
+
+    def get_waveform(self, node: str) -> np.ndarray:
+        """Get a node's values as a zero-copy view into the result matrix."""
+        self._materialize()
+        row = self._find(self._node_index, node)
+        if row is None:
+            raise KeyError(f"Node '{node}' not found in simulation results")
+        return self._matrix[row]
+
+    def get_voltage(self, node: str) -> Union[float, complex, np.ndarray]:
+        """
+        Get voltage at a specific node.
+
+        Returns a float (complex for AC) for single-point results, otherwise a
+        read-only-by-convention view of the node's row in the result matrix.
+        """
+        self._materialize()
+        row = self._find(self._node_index, node)
+        if row is not None:
+            return self._scalar_or_view(self._matrix[row])
+        # Try direct access for names that are not listed as nodes
+        try:
+            voltage = np.asarray(self.analysis[node]).ravel()
+        except Exception:
+            raise KeyError(f"Node '{node}' not found in simulation results")
+        return self._scalar_or_view(voltage)
 
-    def get_current(self, component: str) -> Union[float, List[float]]:
+    def get_current(self, component: str) -> Union[float, complex, np.ndarray]:
         """Get current through a specific component."""
+        self._materialize()
+        for name in (component, f"V{component}"):
+            row = self._find(self._branch_index, name)
+            if row is not None:
+                return self._scalar_or_view(self._branch_matrix[row])
         # PySpice current notation: I(Vcomponent) for voltage sources
         current_name = f"I({component})"
         try:
-            current = self.analysis[current_name]
-            if hasattr(current, "__len__") and len(current) == 1:
-                return float(current[0])
-            elif hasattr(current, "__len__"):
-                return [float(i) for i in current]
-            else:
-                return float(current)
-        except:
+            current = np.asarray(self.analysis[current_name]).ravel()
+        except Exception:
             raise KeyError(f"Current for component '{component}' not found")
+        return self._scalar_or_view(current)
 
     def list_nodes(self) -> List[str]:
         """List all available voltage nodes."""
-        nodes = []
-        if hasattr(self.analysis, "nodes"):
-            nodes.extend(self.analysis.nodes)
-        # Also check for direct access
-        for attr in dir(self.analysis):
-            if not attr.startswith("_") and attr not in ["nodes", "branches"]:
-                try:
-                    val = getattr(self.analysis, attr)
-                    if hasattr(val, "__len__") or isinstance(val, (int, float)):
-                        nodes.append(attr)
-                except:
-                    pass
-        return list(set(nodes))
+        self._materialize()
+        return list(self._node_index)
+
+    def to_npz(self, path: Union[str, os.PathLike], compressed: bool = False):
+        """
+        Write node voltages to a NumPy .npz file.
+
+        The file holds `voltages` (nodes x points), `nodes`, `axis`,
+        `axis_name` and `analysis_type`; load it with SimulationResult.load_npz.
+        """
+        self._materialize()
+        save = np.savez_compressed if compressed else np.savez
+        save(
+            path,
+            voltages=self._matrix,
+            nodes=np.array(list(self._node_index), dtype=str),
+            axis=self._axis if self._axis is not None else np.empty(0),
+            axis_name=np.array(self._axis_name or ""),
+            analysis_type=np.array(self.analysis_type),
+        )
+        logger.info(f"Exported simulation results to {path}")
+
+    def to_arrow(self, path: Union[str, os.PathLike]):
+        """
+        Write node voltages to an Arrow IPC (Feather v2) file, one column per node.
+
+        Complex (AC) waveforms are split into `<node>.real` and `<node>.imag`
+        columns. Requires pyarrow.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+        except ImportError as e:
+            raise ImportError(
+                "Arrow export requires pyarrow. Install with: pip install pyarrow"
+            ) from e
+
+        self._materialize()
+        columns, names = [], []
+        if self._axis is not None:
+            columns.append(pa.array(self._axis))
+            names.append(self._axis_name or "axis")
+        for name, row in self._node_index.items():
+            values = self._matrix[row]
+            if np.iscomplexobj(values):
+                columns.extend([pa.array(values.real), pa.array(values.imag)])
+                names.extend([f"{name}.real", f"{name}.imag"])
+            else:
+                columns.append(pa.array(values))
+                names.append(name)
+        table = pa.Table.from_arrays(columns, names=names).replace_schema_metadata(
+            {"analysis_type": self.analysis_type}
+        )
+        feather.write_feather(table, str(path))
+        logger.info(f"Exported simulation results to {path}")
 
     def plot(self, *nodes, title: Optional[str] = None):
         """Plot voltage results (requires matplotlib)."""
@@ -118,11 +276,15 @@ class SimulationResult:
 
         plt.figure(figsize=(10, 6))
 
+        axis = self.axis
         for node in nodes:
             try:
                 voltage = self.get_voltage(node)
-                if isinstance(voltage, list):
-                    plt.plot(voltage, label=f"V({node})")
+                if isinstance(voltage, np.ndarray):
+                    if axis is not None and len(axis) == len(voltage):
+                        plt.plot(axis, np.abs(voltage), label=f"V({node})")
+                    else:
+                        plt.plot(np.abs(voltage), label=f"V({node})")
                 else:
                     plt.axhline(y=voltage, label=f"V({node}) = {voltage:.3f}V")
             except KeyError as e:
@@ -137,17 +299,30 @@ class SimulationResult:
 
 
 class CircuitSimulator:
-    """Main interface for SPICE simulation of circuit-synth designs."""
+    """
+    Main interface for SPICE simulation of circuit-synth designs.
 
-    def __init__(self, circuit_synth_circuit):
+    Two backends are available:
+    - "ngspice": full SPICE simulation through PySpice and ngspice
+    - "mna": built-in linear solver for R/L/C/source networks, running
+      in-process without ngspice (operating point and AC analysis only)
+    """
+
+    BACKENDS = ("ngspice", "mna")
+
+    def __init__(self, circuit_synth_circuit, backend: str = "ngspice"):
         if not PYSPICE_AVAILABLE:
             raise ImportError(
                 "PySpice not available. Install with: pip install PySpice\n"
                 "Also ensure ngspice is installed on your system."
             )
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown simulation backend: {backend}")
 
         self.circuit_synth_circuit = circuit_synth_circuit
+        self.backend = backend
         self.spice_circuit = None
+        self._mna_solver = None
         self._convert_to_spice()
 
     def _convert_to_spice(self):
@@ -156,12 +331,35 @@ class CircuitSimulator:
 
         converter = SpiceConverter(self.circuit_synth_circuit)
         self.spice_circuit = converter.convert()
+        self._mna_solver = None
+
+    def _select_backend(self, backend: Optional[str]) -> str:
+        backend = backend or self.backend
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown simulation backend: {backend}")
+        return backend
+
+    def _get_mna_solver(self):
+        """Build (once) the MNA solver from the converted netlist."""
+        if self._mna_solver is None:
+            from .mna import MNASolver
 
-    def operating_point(self) -> SimulationResult:
-        """Run DC operating point analysis."""
+            self._mna_solver = MNASolver.from_netlist(str(self.spice_circuit))
+        return self._mna_solver
+
+    def operating_point(self, backend: Optional[str] = None) -> SimulationResult:
+        """
+        Run DC operating point analysis.
+
+        Args:
+            backend: "ngspice" or "mna" (defaults to the simulator's backend)
+        """
         if not self.spice_circuit:
             raise RuntimeError("SPICE circuit not initialized")
 
+        if self._select_backend(backend) == "mna":
+            return SimulationResult(self._get_mna_solver().operating_point(), "dc_op")
+
         simulator = self.spice_circuit.simulator(temperature=25, nominal_temperature=25)
         analysis = simulator.operating_point()
 
@@ -180,12 +378,34 @@ class CircuitSimulator:
         return SimulationResult(analysis, "dc_sweep")
 
     def ac_analysis(
-        self, start_freq: float, stop_freq: float, points: int = 100
+        self,
+        start_freq: float,
+        stop_freq: float,
+        points: int = 100,
+        backend: Optional[str] = None,
+        ac_source: Optional[str] = None,
     ) -> SimulationResult:
-        """Run AC analysis."""
+        """
+        Run AC analysis.
+
+        Args:
+            start_freq: Start frequency in Hz
+            stop_freq: Stop frequency in Hz
+            points: Points per decade
+            backend: "ngspice" or "mna" (defaults to the simulator's backend)
+            ac_source: MNA backend only - source to drive with AC magnitude 1
+                       instead of the netlist's AC specifications
+        """
         if not self.spice_circuit:
             raise RuntimeError("SPICE circuit not initialized")
 
+        if self._select_backend(backend) == "mna":
+            from .mna import frequency_points
+
+            freqs = frequency_points(start_freq, stop_freq, points, "dec")
+            analysis = self._get_mna_solver().ac(freqs, ac_source=ac_source)
+            return SimulationResult(analysis, "ac")
+
         simulator = self.spice_circuit.simulator(temperature=25, nominal_temperature=25)
         analysis = simulator.ac(
             start_frequency=start_freq @ u_Hz,
@@ -208,6 +428,58 @@ class CircuitSimulator:
 
         return SimulationResult(analysis, "transient")
 
+    def monte_carlo(
+        self,
+        tolerances: Dict,
+        runs: int = 100,
+        analysis: str = "op",
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        **analysis_kwargs,
+    ):
+        """
+        Run a Monte Carlo tolerance analysis across a process pool.
+
+        Args:
+            tolerances: Component ref -> Tolerance (or relative tolerance float)
+            runs: Number of random variants
+            analysis: "op", "dc", "ac" or "transient"
+            max_workers: Worker processes (None uses the CPU count)
+            seed: Random seed for reproducible runs
+
+        Returns:
+            BatchResult with stacked node voltages and summary statistics
+        """
+        from .sweep import BatchSimulator
+
+        batch = BatchSimulator(self, max_workers=max_workers, backend=self.backend)
+        return batch.monte_carlo(
+            tolerances, runs=runs, analysis=analysis, seed=seed, **analysis_kwargs
+        )
+
+    def parameter_sweep(
+        self,
+        grid: Dict,
+        analysis: str = "op",
+        max_workers: Optional[int] = None,
+        **analysis_kwargs,
+    ):
+        """
+        Run every combination of explicit component values across a process pool.
+
+        Args:
+            grid: Component ref -> list of values
+            analysis: "op", "dc", "ac" or "transient"
+            max_workers: Worker processes (None uses the CPU count)
+
+        Returns:
+            BatchResult with stacked node voltages and summary statistics
+        """
+        from .sweep import BatchSimulator
+
+        batch = BatchSimulator(self, max_workers=max_workers, backend=self.backend)
+        return batch.parameter_sweep(grid, analysis=analysis, **analysis_kwargs)
+
     def list_components(self) -> List[str]:
         """List all components in the SPICE circuit."""
         if not self.spice_circuit:
@@ -0,0 +1,513 @@
+"""
+Batch parameter sweeps and Monte Carlo analysis for circuit-synth designs.
+
+The circuit is converted to a SPICE netlist once. Each variant only rewrites
+the value field of the swept elements in that netlist text, so building a
+variant costs a few string substitutions instead of a full circuit
+conversion. Variants are simulated across a process pool (one ngspice
+instance per worker) and collected into stacked NumPy arrays.
+
+Example Usage:
+    from circuit_synth.simulation import BatchSimulator, Tolerance
+
+    batch = BatchSimulator(my_filter())
+    result = batch.monte_carlo(
+        {"R1": Tolerance(0.01), "C1": Tolerance(0.10, "gaussian")},
+        runs=500,
+        analysis="ac",
+        start_freq=10,
+        stop_freq=1e5,
+    )
+    print(result.statistics("VOUT"))
+    print(result.yield_fraction("VOUT", low=0.69, high=0.72, index=-1))
+"""
+
+import itertools
+import logging
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .mna import parse_spice_value
+
+logger = logging.getLogger(__name__)
+
+# SPICE element prefixes whose value is the 4th token of the element line
+SWEEPABLE_PREFIXES = ("R", "C", "L", "V", "I")
+
+_NUMBER_RE = re.compile(r"^([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)")
+
+# A runner takes (netlist, analysis, analysis kwargs) and returns the sweep
+# axis (None for operating point) and a mapping of node name -> values
+Runner = Callable[
+    [str, str, Dict[str, Any]], Tuple[Optional[np.ndarray], Dict[str, np.ndarray]]
+]
+
+
+@dataclass
+class Tolerance:
+    """
+    Component tolerance distribution for Monte Carlo analysis.
+
+    Args:
+        tolerance: Relative tolerance, e.g. 0.05 for 5%
+        distribution: "uniform" (flat within +/- tolerance) or "gaussian"
+                      (tolerance is treated as the 3-sigma limit)
+    """
+
+    tolerance: float
+    distribution: str = "uniform"
+
+    def __post_init__(self):
+        if self.tolerance < 0:
+            raise ValueError("tolerance must be non-negative")
+        if self.distribution not in ("uniform", "gaussian"):
+            raise ValueError(f"Unknown distribution: {self.distribution}")
+
+    def sample(self, nominal: float, runs: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw `runs` values around `nominal`."""
+        if self.distribution == "gaussian":
+            deviation = rng.normal(0.0, self.tolerance / 3.0, runs)
+            deviation = np.clip(deviation, -self.tolerance, self.tolerance)
+        else:
+            deviation = rng.uniform(-self.tolerance, self.tolerance, runs)
+        return nominal * (1.0 + deviation)
+
+
+@dataclass
+class BatchResult:
+    """
+    Stacked results of a batch of simulations.
+
+    Attributes:
+        analysis_type: Analysis that was run ("op", "dc", "ac", "transient")
+        parameters: Element ref -> array of values used, shape (runs,)
+        axis: Sweep axis shared by all runs (time, frequency or source value),
+              None for operating point
+        voltages: Node name -> array of shape (runs, points)
+        failed: Boolean mask of runs that did not produce results
+    """
+
+    analysis_type: str
+    parameters: Dict[str, np.ndarray]
+    axis: Optional[np.ndarray]
+    voltages: Dict[str, np.ndarray]
+    failed: np.ndarray
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def runs(self) -> int:
+        """Number of variants in the batch."""
+        return len(self.failed)
+
+    def list_nodes(self) -> List[str]:
+        """List the nodes available in the batch."""
+        return sorted(self.voltages)
+
+    def get_voltage(self, node: str, index: Optional[int] = None) -> np.ndarray:
+        """
+        Get node values for all successful runs.
+
+        Args:
+            node: Node name
+            index: Optional point on the sweep axis. If given, returns one
+                   value per run (shape (runs,)), else shape (runs, points).
+                   AC results are returned as magnitudes.
+        """
+        if node not in self.voltages:
+            raise KeyError(f"Node '{node}' not found in batch results")
+        values = self.voltages[node][~self.failed]
+        if np.iscomplexobj(values):
+            values = np.abs(values)
+        if index is not None:
+            return values[:, index]
+        return values
+
+    def statistics(self, node: str, index: Optional[int] = None) -> Dict[str, Any]:
+        """Mean, standard deviation, extremes and 1%/99% percentiles per point."""
+        values = self.get_voltage(node, index)
+        return {
+            "mean": values.mean(axis=0),
+            "std": values.std(axis=0),
+            "min": values.min(axis=0),
+            "max": values.max(axis=0),
+            "p01": np.percentile(values, 1, axis=0),
+            "p99": np.percentile(values, 99, axis=0),
+        }
+
+    def worst_case(
+        self, node: str, index: Optional[int] = None, mode: str = "max"
+    ) -> Dict[str, Any]:
+        """
+        Find the run with the extreme value at a node.
+
+        Args:
+            node: Node name
+            index: Point on the sweep axis (defaults to the last point)
+            mode: "max" or "min"
+
+        Returns:
+            Dict with the run index, its value and the parameters that produced it
+        """
+        values = self.get_voltage(node, -1 if index is None else index)
+        pick = int(np.argmax(values) if mode == "max" else np.argmin(values))
+        run = int(np.flatnonzero(~self.failed)[pick])
+        return {
+            "run": run,
+            "value": float(values[pick]),
+            "parameters": {ref: float(v[run]) for ref, v in self.parameters.items()},
+        }
+
+    def yield_fraction(
+        self,
+        node: str,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+        index: Optional[int] = None,
+    ) -> float:
+        """
+        Fraction of all runs whose node value stays within [low, high].
+
+        Failed runs count as out of spec. With no index, every point on the
+        sweep axis must be within limits.
+        """
+        values = self.get_voltage(node, index)
+        ok = np.ones(values.shape, dtype=bool)
+        if low is not None:
+            ok &= values >= low
+        if high is not None:
+            ok &= values <= high
+        if ok.ndim > 1:
+            ok = ok.all(axis=1)
+        return float(ok.sum()) / self.runs if self.runs else 0.0
+
+    def histogram(
+        self, node: str, index: Optional[int] = None, bins: int = 20
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram (counts, bin edges) of node values at one sweep point."""
+        values = self.get_voltage(node, -1 if index is None else index)
+        return np.histogram(values, bins=bins)
+
+
+class NetlistTemplate:
+    """
+    SPICE netlist text with addressable element values.
+
+    Parses the netlist once and records where each sweepable element's value
+    lives, so variants are produced by replacing those tokens only.
+    """
+
+    def __init__(self, netlist: str):
+        self.lines = [line for line in netlist.splitlines() if line.strip()]
+        if self.lines and self.lines[-1].strip().lower() == ".end":
+            self.lines.pop()
+        self._elements: Dict[str, int] = {}
+        # Element -> (suffix as written, its scale factor), e.g. ("kOhm", 1e3)
+        self._suffixes: Dict[str, Tuple[str, float]] = {}
+        self.nominal: Dict[str, float] = {}
+
+        for i, line in enumerate(self.lines):
+            tokens = line.split()
+            if len(tokens) < 4 or tokens[0][0].upper() not in SWEEPABLE_PREFIXES:
+                continue
+            match = _NUMBER_RE.match(tokens[3])
+            if not match:
+                continue
+            name = tokens[0].upper()
+            suffix = tokens[3][match.end() :]
+            self._elements[name] = i
+            self._suffixes[name] = (suffix, parse_spice_value("1" + suffix))
+            self.nominal[name] = parse_spice_value(tokens[3])
+
+    def resolve(self, ref: str) -> str:
+        """Map a component ref (R1) to its element name (RR1 or R1)."""
+        key = ref.upper()
+        if key in self._elements:
+            return key
+        for prefix in SWEEPABLE_PREFIXES:
+            if prefix + key in self._elements:
+                return prefix + key
+        raise KeyError(f"No sweepable SPICE element for '{ref}'")
+
+    def nominal_value(self, ref: str) -> float:
+        """Nominal value of an element as written in the netlist."""
+        return self.nominal[self.resolve(ref)]
+
+    def render(self, values: Dict[str, float]) -> str:
+        """
+        Return netlist text with the given element values substituted.
+
+        Values are in base units and are written with the element's original
+        suffix, so ``1kOhm`` swept to 2200 renders as ``2.2kOhm``.
+        """
+        lines = list(self.lines)
+        for ref, value in values.items():
+            name = self.resolve(ref)
+            i = self._elements[name]
+            suffix, scale = self._suffixes[name]
+            tokens = lines[i].split()
+            if scale == 1.0:
+                tokens[3] = repr(float(value)) + suffix
+            else:
+                # Round off the division error, e.g. 47e-9 / 1e-9
+                tokens[3] = format(float(value) / scale, ".15g") + suffix
+            lines[i] = " ".join(tokens)
+        return "\n".join(lines) + "\n"
+
+
+def analysis_card(analysis: str, kwargs: Dict[str, Any]) -> str:
+    """Build the SPICE control card for an analysis."""
+    if analysis == "op":
+        return ".op"
+    if analysis == "dc":
+        return (
+            f".dc {kwargs['source']} {kwargs['start']} {kwargs['stop']} "
+            f"{kwargs['step']}"
+        )
+    if analysis == "ac":
+        return (
+            f".ac {kwargs.get('variation', 'dec')} {kwargs.get('points', 100)} "
+            f"{kwargs['start_freq']} {kwargs['stop_freq']}"
+        )
+    if analysis == "transient":
+        return f".tran {kwargs['step_time']} {kwargs['end_time']}"
+    raise ValueError(f"Unknown analysis type: {analysis}")
+
+
+_NGSPICE = None
+
+
+def run_ngspice(
+    netlist: str, analysis: str, kwargs: Dict[str, Any]
+) -> Tuple[Optional[np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Simulate a netlist with the shared ngspice library.
+
+    One ngspice instance is created per worker process and reused for every
+    variant that process handles.
+    """
+    global _NGSPICE
+    from PySpice.Spice.NgSpice.Shared import NgSpiceShared
+
+    if _NGSPICE is None:
+        _NGSPICE = NgSpiceShared.new_instance()
+    ngspice = _NGSPICE
+    ngspice.destroy()
+    ngspice.load_circuit(netlist + analysis_card(analysis, kwargs) + "\n.end\n")
+    ngspice.run()
+    result = ngspice.plot(None, ngspice.last_plot).to_analysis()
+
+    voltages = {
+        str(name): np.asarray(waveform).ravel()
+        for name, waveform in result.nodes.items()
+    }
+    axis = None
+    for attr in ("time", "frequency", "sweep"):
+        if hasattr(result, attr):
+            axis = np.asarray(getattr(result, attr)).ravel()
+            break
+    return axis, voltages
+
+
+def _simulate(
+    task: Tuple[Runner, str, str, Dict[str, Any]],
+) -> Tuple[Optional[np.ndarray], Dict[str, np.ndarray], Optional[str]]:
+    """Process-pool entry point; never raises so one bad run can't stop a batch."""
+    runner, netlist, analysis, kwargs = task
+    try:
+        axis, voltages = runner(netlist, analysis, kwargs)
+        return axis, voltages, None
+    except Exception as e:
+        return None, {}, f"{type(e).__name__}: {e}"
+
+
+class BatchSimulator:
+    """
+    Run many variants of one circuit in parallel.
+
+    Args:
+        circuit: circuit-synth Circuit, CircuitSimulator or SPICE netlist text
+        max_workers: Worker processes. None uses the CPU count, 1 runs inline.
+        runner: Function simulating one netlist (overrides backend)
+        backend: "ngspice" or "mna" (built-in linear solver, op/ac only)
+    """
+
+    ANALYSES = ("op", "dc", "ac", "transient")
+
+    def __init__(
+        self,
+        circuit: Any,
+        max_workers: Optional[int] = None,
+        runner: Optional[Runner] = None,
+        backend: str = "ngspice",
+    ):
+        self.template = NetlistTemplate(self._base_netlist(circuit))
+        self.max_workers = max_workers
+        if runner is None:
+            if backend == "mna":
+                from .mna import run_mna
+
+                runner = run_mna
+            elif backend == "ngspice":
+                runner = run_ngspice
+            else:
+                raise ValueError(f"Unknown simulation backend: {backend}")
+        self.runner = runner
+
+    @staticmethod
+    def _base_netlist(circuit: Any) -> str:
+        if isinstance(circuit, str):
+            return circuit
+        spice_circuit = getattr(circuit, "spice_circuit", None)
+        if spice_circuit is None:
+            from .converter import SpiceConverter
+
+            spice_circuit = SpiceConverter(circuit).convert()
+        return str(spice_circuit)
+
+    def monte_carlo(
+        self,
+        tolerances: Dict[str, Union[Tolerance, float]],
+        runs: int = 100,
+        analysis: str = "op",
+        seed: Optional[int] = None,
+        **analysis_kwargs,
+    ) -> BatchResult:
+        """
+        Run a Monte Carlo tolerance analysis.
+
+        Args:
+            tolerances: Component ref -> Tolerance (a float means uniform)
+            runs: Number of random variants
+            analysis: "op", "dc", "ac" or "transient"
+            seed: Random seed for reproducible runs
+            **analysis_kwargs: Analysis parameters (see analysis_card)
+        """
+        rng = np.random.default_rng(seed)
+        parameters = {}
+        for ref, tol in tolerances.items():
+            if not isinstance(tol, Tolerance):
+                tol = Tolerance(float(tol))
+            parameters[ref] = tol.sample(self.template.nominal_value(ref), runs, rng)
+        return self.run(parameters, analysis, **analysis_kwargs)
+
+    def parameter_sweep(
+        self,
+        grid: Dict[str, Sequence[float]],
+        analysis: str = "op",
+        **analysis_kwargs,
+    ) -> BatchResult:
+        """
+        Run every combination of explicit parameter values.
+
+        Args:
+            grid: Component ref -> values to try (cartesian product is run)
+            analysis: "op", "dc", "ac" or "transient"
+            **analysis_kwargs: Analysis parameters (see analysis_card)
+        """
+        refs = list(grid)
+        combos = list(itertools.product(*(grid[ref] for ref in refs)))
+        parameters = {
+            ref: np.array([combo[i] for combo in combos], dtype=float)
+            for i, ref in enumerate(refs)
+        }
+        return self.run(parameters, analysis, **analysis_kwargs)
+
+    def run(
+        self, parameters: Dict[str, np.ndarray], analysis: str = "op", **analysis_kwargs
+    ) -> BatchResult:
+        """
+        Simulate one variant per row of the parameter arrays.
+
+        Args:
+            parameters: Component ref -> array of values, all the same length
+            analysis: "op", "dc", "ac" or "transient"
+        """
+        if analysis not in self.ANALYSES:
+            raise ValueError(f"Unknown analysis type: {analysis}")
+        lengths = {len(v) for v in parameters.values()}
+        if len(lengths) > 1:
+            raise ValueError("All parameter arrays must have the same length")
+        runs = lengths.pop() if lengths else 1
+        for ref in parameters:
+            self.template.resolve(ref)  # fail fast on unknown refs
+
+        tasks = [
+            (
+                self.runner,
+                self.template.render({ref: v[i] for ref, v in parameters.items()}),
+                analysis,
+                analysis_kwargs,
+            )
+            for i in range(runs)
+        ]
+
+        if self.max_workers == 1 or runs == 1:
+            outputs = [_simulate(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                workers = self.max_workers or os.cpu_count() or 1
+                chunksize = max(1, math.ceil(runs / (workers * 4)))
+                outputs = list(pool.map(_simulate, tasks, chunksize=chunksize))
+
+        return self._stack(analysis, parameters, runs, outputs)
+
+    @staticmethod
+    def _stack(
+        analysis: str,
+        parameters: Dict[str, np.ndarray],
+        runs: int,
+        outputs: List[
+            Tuple[Optional[np.ndarray], Dict[str, np.ndarray], Optional[str]]
+        ],
+    ) -> BatchResult:
+        """Stack per-run outputs into (runs, points) arrays."""
+        failed = np.zeros(runs, dtype=bool)
+        errors = {}
+        axis = None
+        nodes: Dict[str, Tuple[int, Any]] = {}
+
+        for i, (run_axis, voltages, error) in enumerate(outputs):
+            if error is not None:
+                failed[i] = True
+                errors[i] = error
+                continue
+            if axis is None and run_axis is not None:
+                axis = np.asarray(run_axis)
+            for node, values in voltages.items():
+                values = np.atleast_1d(values)
+                size, dtype = nodes.get(node, (0, np.float64))
+                if np.iscomplexobj(values):
+                    dtype = np.complex128
+                nodes[node] = (max(size, values.size), dtype)
+
+        stacked = {}
+        for node, (size, dtype) in nodes.items():
+            data = np.full((runs, size), np.nan, dtype=dtype)
+            for i, (_, voltages, error) in enumerate(outputs):
+                if error is None and node in voltages:
+                    values = np.atleast_1d(voltages[node])
+                    data[i, : values.size] = values
+            stacked[node] = data
+
+        if errors:
+            logger.warning(
+                f"{len(errors)} of {runs} simulation runs failed; "
+                f"first error: {next(iter(errors.values()))}"
+            )
+
+        return BatchResult(
+            analysis_type=analysis,
+            parameters={
+                ref: np.asarray(v, dtype=float) for ref, v in parameters.items()
+            },
+            axis=axis,
+            voltages=stacked,
+            failed=failed,
+            errors=errors,
+        )
@@ -76,7 +76,7 @@ class SimulationVisualizer:
         for node in nodes:
             try:
                 voltage = self.result.get_voltage(node)
-                if isinstance(voltage, list):
+                if isinstance(voltage, (list, np.ndarray)):
                     if time_array is not None:
                         ax.plot(
                             time_array * 1000, voltage, label=f"V({node})", linewidth=2
@@ -135,7 +135,9 @@ class SimulationVisualizer:
             output_voltage = self.result.get_voltage(output_node)
             input_voltage = self.result.get_voltage(input_node)
 
-            if isinstance(output_voltage, list) and isinstance(input_voltage, list):
+            if isinstance(output_voltage, (list, np.ndarray)) and isinstance(
+                input_voltage, (list, np.ndarray)
+            ):
                 # Calculate gain in dB
                 gain = np.array(output_voltage) / np.array(input_voltage)
                 gain_db = 20 * np.log10(np.abs(gain))
@@ -154,7 +156,9 @@ class SimulationVisualizer:
         # Phase plot
         ax2 = fig.add_subplot(gs[1])
         try:
-            if isinstance(output_voltage, list) and isinstance(input_voltage, list):
+            if isinstance(output_voltage, (list, np.ndarray)) and isinstance(
+                input_voltage, (list, np.ndarray)
+            ):
                 # Calculate phase
                 gain_complex = np.array(output_voltage) / np.array(input_voltage)
                 phase = np.angle(gain_complex, deg=True)
@@ -204,7 +208,7 @@ class SimulationVisualizer:
         for node in nodes:
             try:
                 voltage = self.result.get_voltage(node)
-                if isinstance(voltage, list):
+                if isinstance(voltage, (list, np.ndarray)):
                     node_data[node] = voltage
                     max_length = max(max_length, len(voltage))
                     headers.append(f"V({node})")
@@ -251,7 +255,7 @@ class SimulationVisualizer:
         for node in self.result.list_nodes():
             try:
                 voltage = self.result.get_voltage(node)
-                if isinstance(voltage, list):
+                if isinstance(voltage, (list, np.ndarray)):
                     data["nodes"][node] = [float(v) for v in voltage]
                 else:
                     data["nodes"][node] = float(voltage)
@@ -361,7 +365,7 @@ Summary:
                 for node in nodes:
                     try:
                         voltage = self.result.get_voltage(node)
-                        if isinstance(voltage, list):
+                        if isinstance(voltage, (list, np.ndarray)):
                             # Show first and last values for arrays
                             if len(voltage) > 0:
                                 table_data.append(
@@ -411,7 +415,7 @@ Summary:
         for node in nodes:
             try:
                 voltage = self.result.get_voltage(node)
-                if isinstance(voltage, list):
+                if isinstance(voltage, (list, np.ndarray)):
                     fig.add_trace(
                         go.Scatter(
                             y=voltage,
@@ -15,15 +15,17 @@ Features:
 Usage:
     kicad-to-python <kicad_project> <python_file_or_directory>
     kicad-to-python <kicad_project> <python_file_or_directory> --backup
+    kicad-to-python <kicad_project> <python_file_or_directory> --watch
 """
 
 import argparse
 import json
 import logging
 import sys
+import time
 import warnings
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from circuit_synth.tools.utilities.kicad_parser import KiCadParser
 
@@ -38,6 +40,42 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class SchematicWatcher:
+    """Detect changed schematic sheets in a project directory by polling stat"""
+
+    def __init__(self, project_dir: Path, pattern: str = "*.kicad_sch"):
+        self.project_dir = Path(project_dir)
+        self.pattern = pattern
+        self._signatures = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        signatures = {}
+        for path in self.project_dir.glob(self.pattern):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed between glob and stat
+            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def poll(self) -> List[Path]:
+        """
+        Check the project for sheet changes since the last poll.
+
+        Returns:
+            Sorted paths of sheets that were added, modified or removed
+        """
+        current = self._scan()
+        changed = {
+            path
+            for path, signature in current.items()
+            if self._signatures.get(path) != signature
+        }
+        changed.update(path for path in self._signatures if path not in current)
+        self._signatures = current
+        return sorted(changed)
+
+
 class KiCadToPythonSyncer:
     """Main synchronization class"""
 
@@ -313,12 +351,34 @@ class KiCadToPythonSyncer:
             logger.info(f"Successfully exported JSON (fallback): {json_path}")
             return json_path
 
-    def update_json_from_schematic(self) -> None:
+    def _project_dir(self) -> Path:
+        """Directory holding the KiCad project's schematic files"""
+        if self.kicad_project.suffix in (".kicad_pro", ".json"):
+            return self.kicad_project.parent
+        return self.kicad_project
+
+    def _get_parser(self, project_dir: Path) -> KiCadParser:
+        """Return the parser for ``project_dir``, reusing it between syncs.
+
+        The parser caches per-sheet parse results, so keeping one instance
+        alive means repeated syncs only re-read sheets that changed on disk.
+        """
+        parser = getattr(self, "_parser", None)
+        if parser is None or getattr(self, "_parser_dir", None) != project_dir:
+            parser = KiCadParser(str(project_dir))
+            self._parser = parser
+            self._parser_dir = project_dir
+        return parser
+
+    def update_json_from_schematic(self) -> bool:
         """Regenerate JSON netlist from .kicad_sch file.
 
         Parses the .kicad_sch schematic file using KiCadParser and regenerates
         the JSON netlist. This ensures the JSON is always in sync with the latest
-        schematic edits.
+        schematic edits. The file is only rewritten when its content changes.
+
+        Returns:
+            True if the netlist differs from the one previously loaded
 
         Raises:
             RuntimeError: If parsing fails or JSON generation fails
@@ -326,13 +386,12 @@ class KiCadToPythonSyncer:
         """
         try:
             # Determine .kicad_sch file location
+            project_dir = self._project_dir()
             if self.kicad_project.suffix == ".kicad_pro":
-                project_dir = self.kicad_project.parent
                 project_name = self.kicad_project.stem
                 kicad_sch = project_dir / f"{project_name}.kicad_sch"
             elif self.kicad_project.suffix == ".json":
                 # Handle JSON file paths - extract parent directory and look for .kicad_sch
-                project_dir = self.kicad_project.parent
                 project_name = self.kicad_project.stem
                 kicad_sch = project_dir / f"{project_name}.kicad_sch"
 
@@ -345,7 +404,6 @@ class KiCadToPythonSyncer:
                         )
                     kicad_sch = sch_files[0]
             else:
-                project_dir = self.kicad_project
                 # Find first .kicad_sch in directory
                 sch_files = list(project_dir.glob("*.kicad_sch"))
                 if not sch_files:
@@ -361,7 +419,7 @@ class KiCadToPythonSyncer:
 
             # Parse .kicad_sch using KiCadParser
             # Use the project directory, not self.kicad_project (which might be a JSON file)
-            parser = KiCadParser(str(project_dir))
+            parser = self._get_parser(project_dir)
             circuits = parser.parse_circuits()
 
             if not circuits:
@@ -371,15 +429,21 @@ class KiCadToPythonSyncer:
             main_circuit = circuits.get("main") or list(circuits.values())[0]
 
             # Regenerate JSON netlist from parsed circuit
-            logger.info(f"Writing updated JSON to {self.json_path}")
             json_data = main_circuit.to_circuit_synth_json()
+            if json_data == getattr(self, "json_data", None):
+                logger.info("JSON netlist unchanged")
+                return False
+
+            logger.info(f"Writing updated JSON to {self.json_path}")
             with open(self.json_path, "w") as f:
                 json.dump(json_data, f, indent=2)
+            self.json_data = json_data
 
             logger.info(
                 f"JSON regenerated: {len(main_circuit.components)} components, "
                 f"{len(main_circuit.nets)} nets"
             )
+            return True
 
         except Exception as e:
             logger.error(f"Failed to regenerate JSON from schematic: {e}")
@@ -478,19 +542,86 @@ class KiCadToPythonSyncer:
         """
         logger.info("=== Starting KiCad to Python Synchronization ===")
 
+        # Step 0: Regenerate JSON from .kicad_sch (ensure latest edits)
+        logger.info("Step 0: Regenerating JSON from .kicad_sch")
         try:
-            # Step 0: Regenerate JSON from .kicad_sch (ensure latest edits)
-            logger.info("Step 0: Regenerating JSON from .kicad_sch")
-            try:
-                self.update_json_from_schematic()
-                # Reload JSON after regeneration
-                self.json_data = self._load_json()
-            except (FileNotFoundError, RuntimeError) as e:
-                logger.warning(
-                    f"Could not regenerate JSON from schematic ({e}). "
-                    f"Proceeding with existing JSON..."
-                )
+            self.update_json_from_schematic()
+        except (FileNotFoundError, RuntimeError) as e:
+            logger.warning(
+                f"Could not regenerate JSON from schematic ({e}). "
+                f"Proceeding with existing JSON..."
+            )
+        except Exception as e:
+            logger.error(f"Synchronization failed: {e}")
+            return False
+
+        return self._generate_python()
+
+    def watch(self, interval: float = 0.5, max_cycles: Optional[int] = None) -> bool:
+        """Keep the Python side in sync with the schematic until interrupted.
+
+        Runs a full sync, then polls the project's .kicad_sch files. When a
+        sheet changes, only that sheet is re-parsed (the parser keeps every
+        other sheet cached), and code is regenerated only if the netlist
+        actually changed. Generated modules whose content is unchanged are
+        not rewritten.
+
+        Args:
+            interval: Seconds between polls
+            max_cycles: Stop after this many polls (None runs until Ctrl-C)
+
+        Returns:
+            Result of the most recent sync
+        """
+        watcher = SchematicWatcher(self._project_dir())
+        success = self.sync()
+
+        # Back up once at startup rather than on every save
+        create_backup, self.create_backup = self.create_backup, False
+        logger.info(f"Watching {watcher.project_dir} for schematic changes")
+        try:
+            cycles = 0
+            while max_cycles is None or cycles < max_cycles:
+                time.sleep(interval)
+                cycles += 1
+                changed = watcher.poll()
+                if not changed:
+                    continue
+
+                # KiCad saves hierarchical sheets one after another; wait for
+                # the burst to settle before syncing.
+                while True:
+                    time.sleep(min(interval, 0.1))
+                    more = watcher.poll()
+                    if not more:
+                        break
+                    changed = sorted(set(changed) | set(more))
+
+                logger.info(f"Changed sheets: {[path.name for path in changed]}")
+                start = time.perf_counter()
+                success = self.sync_changes()
+                elapsed = time.perf_counter() - start
+                logger.info(f"Sync finished in {elapsed * 1000:.0f} ms")
+        except KeyboardInterrupt:
+            logger.info("Stopped watching")
+        finally:
+            self.create_backup = create_backup
+
+        return success
+
+    def sync_changes(self) -> bool:
+        """Regenerate Python code only if the schematic netlist changed."""
+        try:
+            if not self.update_json_from_schematic():
+                return True
+        except Exception as e:
+            logger.error(f"Could not regenerate JSON from schematic: {e}")
+            return False
+        return self._generate_python()
 
+    def _generate_python(self) -> bool:
+        """Convert the loaded JSON to circuits and write the Python code."""
+        try:
             # Step 1: Convert JSON to Circuit objects
             logger.info("Step 1: Converting JSON to Circuit objects")
             circuits = self._json_to_circuits()
@@ -654,6 +785,17 @@ def main():
     parser.add_argument(
         "--backup", action="store_true", help="Create backup before applying changes"
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-sync whenever a schematic sheet is saved",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Polling interval in seconds for --watch (default: 0.5)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
@@ -689,7 +831,10 @@ def main():
         create_backup=args.backup,
     )
 
-    success = syncer.sync()
+    if args.watch:
+        success = syncer.watch(interval=args.interval)
+    else:
+        success = syncer.sync()
     return 0 if success else 1
 
 
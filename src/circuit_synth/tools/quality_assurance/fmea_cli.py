@@ -4,6 +4,7 @@ FMEA CLI Command for Circuit-Synth
 Provides command-line interface for FMEA analysis of circuits
 """
 
+import json
 from pathlib import Path
 
 import click
@@ -23,7 +24,27 @@ console = Console()
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.option("--top", "-t", default=10, help="Number of top risks to display")
 @click.option("--threshold", default=125, help="RPN threshold for high risk")
-def main(circuit_path: str, output: str, verbose: bool, top: int, threshold: int):
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Analyze every design under CIRCUIT_PATH (one per subdirectory or file)",
+)
+@click.option(
+    "--jobs", "-j", type=int, default=None, help="Worker processes for --batch"
+)
+@click.option(
+    "--enhanced", is_flag=True, help="Use the FMEA knowledge base (knowledge_base/fmea)"
+)
+def main(
+    circuit_path: str,
+    output: str,
+    verbose: bool,
+    top: int,
+    threshold: int,
+    batch: bool,
+    jobs: int,
+    enhanced: bool,
+):
     """
     Perform FMEA analysis on a circuit design
 
@@ -36,6 +57,8 @@ def main(circuit_path: str, output: str, verbose: bool, top: int, threshold: int
         cs-fmea my_circuit.py -o analysis.pdf
 
         cs-fmea circuit.json --top 20 --threshold 150
+
+        cs-fmea revisions/ --batch -j 8 -o fmea_results.json
     """
 
     console.print(
@@ -44,6 +67,10 @@ def main(circuit_path: str, output: str, verbose: bool, top: int, threshold: int
         )
     )
 
+    if batch:
+        _run_batch(circuit_path, output, verbose, top, threshold, jobs, enhanced)
+        return
+
     # Determine output filename
     if output is None:
         path = Path(circuit_path)
@@ -58,30 +85,22 @@ def main(circuit_path: str, output: str, verbose: bool, top: int, threshold: int
     try:
         # Perform analysis
         from circuit_synth.quality_assurance.fmea_analyzer import UniversalFMEAAnalyzer
+        from circuit_synth.quality_assurance.fmea_batch import find_circuit_file
 
-        analyzer = UniversalFMEAAnalyzer(verbose=verbose)
+        if enhanced:
+            from circuit_synth.quality_assurance.enhanced_fmea_analyzer import (
+                EnhancedFMEAAnalyzer,
+            )
 
-        # Parse circuit
-        path = Path(circuit_path)
-        if path.is_dir():
-            # Look for circuit files
-            json_files = list(path.glob("*.json"))
-            py_files = list(path.glob("*.py"))
-
-            if json_files:
-                circuit_file = json_files[0]
-            elif py_files:
-                # Find main circuit file
-                main_file = path / "main.py"
-                if main_file.exists():
-                    circuit_file = main_file
-                else:
-                    circuit_file = py_files[0]
-            else:
-                console.print("❌ No circuit files found", style="red")
-                return
+            analyzer = EnhancedFMEAAnalyzer(verbose=verbose)
         else:
-            circuit_file = path
+            analyzer = UniversalFMEAAnalyzer(verbose=verbose)
+
+        # Parse circuit
+        circuit_file = find_circuit_file(circuit_path)
+        if circuit_file is None:
+            console.print("❌ No circuit files found", style="red")
+            return
 
         console.print(f"🔧 Parsing: {circuit_file.name}", style="yellow")
 
@@ -210,5 +229,76 @@ def main(circuit_path: str, output: str, verbose: bool, top: int, threshold: int
             console.print(traceback.format_exc(), style="dim red")
 
 
+def _run_batch(
+    root: str,
+    output: str,
+    verbose: bool,
+    top: int,
+    threshold: int,
+    jobs: int,
+    enhanced: bool,
+):
+    """Analyze every design under ``root`` and summarize the results"""
+    from circuit_synth.quality_assurance.fmea_batch import (
+        analyze_circuit_batch,
+        find_designs,
+    )
+
+    if not Path(root).is_dir():
+        console.print("❌ --batch needs a directory of designs", style="red")
+        return
+
+    designs = find_designs(root)
+    if not designs:
+        console.print("❌ No circuit files found", style="red")
+        return
+
+    console.print(f"📂 Analyzing {len(designs)} designs under: {root}", style="cyan")
+    results = analyze_circuit_batch(designs, max_workers=jobs, enhanced=enhanced)
+
+    ranked = sorted(results, key=lambda r: r.max_rpn, reverse=True)
+    table = Table(title="FMEA Batch Results", show_header=True)
+    table.add_column("Design", style="cyan")
+    table.add_column("Failure Modes", justify="right")
+    table.add_column("Critical (≥300)", justify="right")
+    table.add_column(f"High (≥{threshold})", justify="right")
+    table.add_column("Max RPN", justify="right", style="bold")
+
+    for result in ranked[:top]:
+        name = str(Path(result.path).relative_to(root))
+        if not result.ok:
+            table.add_row(name, "-", "-", "-", "error", style="red")
+            continue
+        table.add_row(
+            name,
+            str(len(result.failure_modes)),
+            str(result.count_at_least(300)),
+            str(result.count_at_least(threshold) - result.count_at_least(300)),
+            str(result.max_rpn),
+        )
+    console.print(table)
+
+    failed = [r for r in results if not r.ok]
+    if failed:
+        console.print(f"❌ {len(failed)} designs failed", style="red")
+        if verbose:
+            for result in failed:
+                console.print(f"  {result.path}: {result.error}", style="dim red")
+
+    if output:
+        summary = [
+            {
+                "path": result.path,
+                "error": result.error,
+                "circuit": result.circuit_data,
+                "failure_modes": result.failure_modes,
+            }
+            for result in results
+        ]
+        with open(output, "w") as f:
+            json.dump(summary, f, indent=2)
+        console.print(f"✅ Results written: {output}", style="green")
+
+
 if __name__ == "__main__":
     main()
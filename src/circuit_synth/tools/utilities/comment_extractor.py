@@ -8,14 +8,76 @@ across KiCad ↔ Python synchronization cycles.
 """
 
 import ast
+import hashlib
 import logging
 import subprocess
 import tokenize
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Black output keyed by (content hash, line length). Black is deterministic,
+# so a cached entry is exactly what re-running it would produce.
+FORMAT_CACHE_SIZE = 512
+_format_cache: "OrderedDict[Tuple[bytes, int], str]" = OrderedDict()
+
+
+def _format_key(code: str, line_length: int) -> Tuple[bytes, int]:
+    digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+    return digest, line_length
+
+
+def _remember_format(key: Tuple[bytes, int], formatted: str) -> None:
+    _format_cache[key] = formatted
+    _format_cache.move_to_end(key)
+    while len(_format_cache) > FORMAT_CACHE_SIZE:
+        _format_cache.popitem(last=False)
+
+
+def format_python_source(code: str, line_length: int = 88) -> str:
+    """
+    Format Python source with Black, skipping work already done.
+
+    Sources are looked up by content hash first, and Black only runs on a
+    miss. Each result is also recorded as its own fixed point, so formatting
+    previously generated (unchanged) output never runs Black again.
+
+    Args:
+        code: Python source to format
+        line_length: Maximum line length (use 200+ to force single-line calls)
+
+    Returns:
+        Formatted source, or the original source if Black fails
+    """
+    key = _format_key(code, line_length)
+    cached = _format_cache.get(key)
+    if cached is not None:
+        _format_cache.move_to_end(key)
+        return cached
+
+    try:
+        import black
+
+        mode = black.Mode(
+            line_length=line_length,
+            string_normalization=True,
+            is_pyi=False,
+        )
+        formatted = black.format_str(code, mode=mode)
+    except ImportError as e:
+        logger.warning(f"Failed to format code with Black: {e}, using original code")
+        return code
+    except Exception as e:
+        logger.warning(f"Failed to format code with Black: {e}, using original code")
+        _remember_format(key, code)
+        return code
+
+    _remember_format(key, formatted)
+    _remember_format(_format_key(formatted, line_length), formatted)
+    return formatted
+
 
 class CommentExtractor:
     """Extract and preserve comments from Python source code."""
@@ -35,21 +97,7 @@ class CommentExtractor:
         Returns:
             Formatted code, or original code if Black fails
         """
-        try:
-            import black
-
-            # Format the code using Black
-            mode = black.Mode(
-                line_length=line_length,
-                string_normalization=True,
-                is_pyi=False,
-            )
-            formatted = black.format_str(code, mode=mode)
-            logger.debug(f"Successfully formatted code with Black (line_length={line_length})")
-            return formatted
-        except Exception as e:
-            logger.warning(f"Failed to format code with Black: {e}, using original code")
-            return code
+        return format_python_source(code, line_length)
 
     def extract_comments_from_function(
         self, file_path: Path, function_name: str = "main", content: Optional[str] = None
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Precomputed lookup tables for circuit hierarchy trees.
+
+Code generation asks the same questions about the sheet hierarchy for every
+net: who is a circuit's parent, how deep is it, and which circuit is the
+lowest common ancestor of a set of users. This module compiles a
+parent -> children mapping once into parent and depth tables plus an Euler
+tour with a sparse table over it, so each of those questions is answered
+in O(1) (or O(k) for a set of k circuits).
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HierarchyIndex:
+    """
+    Parent, depth and LCA tables for a hierarchy tree.
+
+    A child listed under several parents keeps the last parent seen, and
+    circuits that never appear as a child are treated as roots. Nodes in
+    different trees of a forest have no common ancestor.
+
+    Args:
+        hierarchy_tree: Parent -> children mapping
+    """
+
+    def __init__(self, hierarchy_tree: Dict[str, List[str]]):
+        self.tree = hierarchy_tree
+        self.parent: Dict[str, str] = {}
+        for parent, children in hierarchy_tree.items():
+            for child in children:
+                self.parent[child] = parent
+
+        nodes = list(hierarchy_tree)
+        nodes.extend(child for child in self.parent if child not in hierarchy_tree)
+
+        self.depth: Dict[str, int] = {}
+        self.root: Dict[str, str] = {}
+        self._first: Dict[str, int] = {}
+        self._tour: List[str] = []
+        self._tour_depth: List[int] = []
+
+        for node in nodes:
+            if node not in self.parent:
+                self._walk(node)
+        # Anything left sits on a parent cycle with no root above it
+        for node in nodes:
+            if node not in self.depth:
+                logger.warning(f"Hierarchy cycle through '{node}', treating as root")
+                self._walk(node)
+
+        self._build_sparse_table()
+
+    def _walk(self, root: str) -> None:
+        """Append the Euler tour of the subtree under ``root``."""
+        self._visit(root, 0, root)
+        stack = [(root, iter(self._children(root)))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    self._tour.append(parent)
+                    self._tour_depth.append(self.depth[parent])
+                continue
+            self._visit(child, self.depth[node] + 1, root)
+            stack.append((child, iter(self._children(child))))
+
+    def _children(self, node: str) -> List[str]:
+        # Only follow edges that agree with the parent table, so shared or
+        # cyclic children are entered exactly once.
+        return [
+            child
+            for child in self.tree.get(node, [])
+            if self.parent.get(child) == node and child not in self.depth
+        ]
+
+    def _visit(self, node: str, depth: int, root: str) -> None:
+        self.depth[node] = depth
+        self.root[node] = root
+        self._first[node] = len(self._tour)
+        self._tour.append(node)
+        self._tour_depth.append(depth)
+
+    def _build_sparse_table(self) -> None:
+        """Range-minimum table over tour depths: _sparse[k][i] covers 2**k."""
+        self._sparse: List[List[int]] = [list(range(len(self._tour)))]
+        span = 1
+        while span * 2 <= len(self._tour):
+            previous = self._sparse[-1]
+            row = []
+            for i in range(len(self._tour) - span * 2 + 1):
+                left, right = previous[i], previous[i + span]
+                row.append(
+                    left if self._tour_depth[left] <= self._tour_depth[right] else right
+                )
+            self._sparse.append(row)
+            span *= 2
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.depth
+
+    def get_depth(self, node: str) -> int:
+        """Depth of ``node`` (0 for roots and unknown circuits)."""
+        return self.depth.get(node, 0)
+
+    def get_ancestors(self, node: str) -> List[str]:
+        """Ancestors of ``node`` from its parent up to the root."""
+        ancestors = []
+        seen = {node}
+        current = self.parent.get(node)
+        while current is not None and current not in seen:
+            ancestors.append(current)
+            seen.add(current)
+            current = self.parent.get(current)
+        return ancestors
+
+    def lca(self, a: str, b: str) -> Optional[str]:
+        """Lowest common ancestor of two circuits, or None if there is none."""
+        if a == b:
+            return a
+        if a not in self.depth or b not in self.depth:
+            return None
+        if self.root[a] != self.root[b]:
+            return None
+
+        lo, hi = sorted((self._first[a], self._first[b]))
+        level = (hi - lo + 1).bit_length() - 1
+        left = self._sparse[level][lo]
+        right = self._sparse[level][hi - (1 << level) + 1]
+        if self._tour_depth[left] <= self._tour_depth[right]:
+            return self._tour[left]
+        return self._tour[right]
+
+    def lca_of(self, nodes: List[str]) -> Optional[str]:
+        """Lowest common ancestor of a set of circuits, or None."""
+        if not nodes:
+            return None
+        result = nodes[0]
+        for node in nodes[1:]:
+            result = self.lca(result, node)
+            if result is None:
+                return None
+        return result
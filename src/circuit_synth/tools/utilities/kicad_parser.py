@@ -12,7 +12,7 @@ import re
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from circuit_synth.tools.utilities.kicad_netlist_parser import KiCadNetlistParser
 from circuit_synth.tools.utilities.models import Circuit, Component, Net
@@ -37,6 +37,10 @@ class KiCadParser:
 
         self.project_dir = self.kicad_project.parent
         self.netlist_parser = KiCadNetlistParser()
+
+        # Per-sheet parse results, validated against each file's stat
+        # signature so a long-lived parser only re-reads sheets that changed.
+        self._sheet_cache: Dict[Tuple[str, Path], Tuple[Tuple[int, int], Any]] = {}
         self.root_schematic = self._find_root_schematic()
 
     def _find_root_schematic(self) -> Optional[Path]:
@@ -400,8 +404,36 @@ class KiCadParser:
 
         return hierarchical_tree
 
+    def _cached_sheet_parse(
+        self, kind: str, schematic_file: Path, parse: Callable[[Path], Any]
+    ) -> Any:
+        """Return a cached parse of ``schematic_file`` unless the file changed"""
+        try:
+            stat = schematic_file.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return parse(schematic_file)
+
+        key = (kind, schematic_file)
+        cached = self._sheet_cache.get(key)
+        if cached and cached[0] == signature:
+            logger.debug(f"Using cached {kind} for unchanged {schematic_file.name}")
+            return cached[1]
+
+        result = parse(schematic_file)
+        self._sheet_cache[key] = (signature, result)
+        return result
+
     def _parse_sheet_instances(self, main_sch_file: Path) -> Dict[str, str]:
         """Parse main schematic to find hierarchical sheet instances and their relationships"""
+        return dict(
+            self._cached_sheet_parse(
+                "sheet_instances", main_sch_file, self._read_sheet_instances
+            )
+        )
+
+    def _read_sheet_instances(self, main_sch_file: Path) -> Dict[str, str]:
+        """Read hierarchical sheet instances from a schematic file"""
         logger.info(
             f"🔍 HIERARCHICAL DEBUG: Parsing sheet instances from {main_sch_file}"
         )
@@ -605,6 +637,15 @@ class KiCadParser:
         self, schematic_file: Path
     ) -> Tuple[List[Component], List[str]]:
         """Parse a single schematic file to extract components and net names"""
+        components, net_names = self._cached_sheet_parse(
+            "symbols", schematic_file, self._read_schematic_file
+        )
+        return list(components), list(net_names)
+
+    def _read_schematic_file(
+        self, schematic_file: Path
+    ) -> Tuple[List[Component], List[str]]:
+        """Read components and net names from a schematic file"""
         logger.info(f"Parsing schematic: {schematic_file.name}")
 
         components = []
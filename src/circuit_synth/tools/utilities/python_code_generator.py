@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from circuit_synth.tools.utilities.comment_extractor import CommentExtractor
+from circuit_synth.tools.utilities.hierarchy_index import HierarchyIndex
 from circuit_synth.tools.utilities.models import Circuit, Component, Net
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class PythonCodeGenerator:
         """Initialize the Python code generator"""
         self.project_name = project_name
         self.comment_extractor = CommentExtractor()
+        self._hierarchy: Optional[HierarchyIndex] = None
 
     def _generate_project_call(self) -> str:
         """Generate the circuit.generate_kicad_netlist() and circuit.generate_kicad_project() calls"""
@@ -436,6 +438,35 @@ class PythonCodeGenerator:
             logger.error(f"❌ CODE_UPDATE: Failed to update {target_path}: {e}")
             return False
 
+    def _write_if_changed(self, path: Path, content: str) -> bool:
+        """
+        Write a generated file unless it already holds exactly this content.
+
+        Leaving unchanged modules alone keeps their mtimes stable, so editors
+        and import caches only see the files a schematic edit affected.
+
+        Returns:
+            bool: True if the file was written
+        """
+        try:
+            if path.read_text() == content:
+                return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        path.write_text(content)
+        return True
+
+    def _hierarchy_index(self, hierarchy_tree: Dict[str, List[str]]) -> HierarchyIndex:
+        """
+        Get the compiled lookup tables for a hierarchy tree.
+
+        The index is reused for as long as the same tree object is passed in;
+        the tree must not be mutated while code is being generated from it.
+        """
+        if self._hierarchy is None or self._hierarchy.tree is not hierarchy_tree:
+            self._hierarchy = HierarchyIndex(hierarchy_tree)
+        return self._hierarchy
+
     def _get_ancestors(
         self, circuit_name: str, child_to_parent: Dict[str, str]
     ) -> List[str]:
@@ -475,20 +506,7 @@ class PythonCodeGenerator:
         if circuit_name == "main":
             return 0
 
-        # Build reverse mapping: child -> parent
-        child_to_parent = {}
-        for parent, children in hierarchy_tree.items():
-            for child in children:
-                child_to_parent[child] = parent
-
-        depth = 0
-        current = circuit_name
-
-        while current in child_to_parent:
-            depth += 1
-            current = child_to_parent[current]
-
-        return depth
+        return self._hierarchy_index(hierarchy_tree).get_depth(circuit_name)
 
     def _find_lowest_common_ancestor(
         self, net_users: List[str], hierarchy_tree: Dict[str, List[str]]
@@ -506,35 +524,10 @@ class PythonCodeGenerator:
         if len(net_users) == 1:
             return net_users[0]
 
-        # Build reverse mapping: child -> parent
-        child_to_parent = {}
-        for parent, children in hierarchy_tree.items():
-            for child in children:
-                child_to_parent[child] = parent
-
-        # Find all ancestors for each net user
-        all_ancestors = []
-        for user in net_users:
-            ancestors = self._get_ancestors(user, child_to_parent)
-            # Include the user itself in its ancestor path
-            ancestors_set = set([user] + ancestors)
-            all_ancestors.append(ancestors_set)
-
-        # Find common ancestors
-        if not all_ancestors:
-            return "main"  # Fallback to root
-
-        common_ancestors = set.intersection(*all_ancestors)
-
-        if not common_ancestors:
-            return "main"  # Fallback to root
-
-        # Return the deepest (lowest) common ancestor
-        # The deepest ancestor has the highest depth value in the tree
-        deepest_ancestor = max(
-            common_ancestors, key=lambda x: self._get_depth(x, hierarchy_tree)
-        )
-        return deepest_ancestor
+        # Euler-tour LCA over the precomputed tables; users with no common
+        # ancestor (different trees, or not in the hierarchy) fall back to root
+        ancestor = self._hierarchy_index(hierarchy_tree).lca_of(list(net_users))
+        return ancestor if ancestor is not None else "main"
 
     def _determine_net_scope(
         self, net_name: str, net_users: List[str], hierarchy_tree: Dict[str, List[str]]
@@ -612,14 +605,19 @@ class PythonCodeGenerator:
                 f"🔍 NET_ANALYSIS: Built fallback hierarchy tree: {hierarchy_tree}"
             )
 
+        # Compile the hierarchy once for all LCA queries below
+        self._hierarchy = HierarchyIndex(hierarchy_tree)
+
         # Collect all nets and their usage across circuits
         net_usage = {}  # net_name -> set of circuit names that use it
+        net_objects = {}  # (circuit_name, net_name) -> first matching Net
 
         for circuit_name, circuit in circuits.items():
             for net in circuit.nets:
                 if net.name not in net_usage:
                     net_usage[net.name] = set()
                 net_usage[net.name].add(circuit_name)
+                net_objects.setdefault((circuit_name, net.name), net)
 
         logger.info(f"🔍 NET_ANALYSIS: Net usage analysis:")
         for net_name, using_circuits in net_usage.items():
@@ -641,11 +639,7 @@ class PythonCodeGenerator:
             )
 
             # Get net object from one of the using circuits
-            net_obj = next(
-                net
-                for net in circuits[list(using_circuits)[0]].nets
-                if net.name == net_name
-            )
+            net_obj = net_objects[(list(using_circuits)[0], net_name)]
             hierarchical_nets[net_scope][net_name] = net_obj
 
             # All circuits that use this net (except the scope circuit) should receive it as parameter
@@ -747,9 +741,10 @@ class PythonCodeGenerator:
                     )
                 else:
                     # Write subcircuit file
-                    with open(subcircuit_file, "w") as f:
-                        f.write(subcircuit_code)
-                    logger.info(f"🗂️ MULTI_FILE: ✅ Created {subcircuit_file}")
+                    if self._write_if_changed(subcircuit_file, subcircuit_code):
+                        logger.info(f"🗂️ MULTI_FILE: ✅ Created {subcircuit_file}")
+                    else:
+                        logger.info(f"🗂️ MULTI_FILE: Unchanged {subcircuit_file}")
 
                 subcircuit_files_created.append(name)
 
@@ -765,9 +760,10 @@ class PythonCodeGenerator:
                 return main_code
             else:
                 # Write main file
-                with open(main_python_file, "w") as f:
-                    f.write(main_code)
-                logger.info(f"🗂️ MULTI_FILE: ✅ Created {main_python_file}")
+                if self._write_if_changed(main_python_file, main_code):
+                    logger.info(f"🗂️ MULTI_FILE: ✅ Created {main_python_file}")
+                else:
+                    logger.info(f"🗂️ MULTI_FILE: Unchanged {main_python_file}")
                 return main_code
 
         except Exception as e:
@@ -1337,8 +1333,10 @@ class PythonCodeGenerator:
                     return updated_code
                 else:
                     python_file.parent.mkdir(parents=True, exist_ok=True)
-                    python_file.write_text(updated_code)
-                    logger.info("File update completed")
+                    if self._write_if_changed(python_file, updated_code):
+                        logger.info("File update completed")
+                    else:
+                        logger.info("File already up to date")
                     return updated_code
             else:
                 logger.error("Failed to generate updated code")
@@ -6,11 +6,16 @@ Tests comment extraction and reinsertion during code generation.
 """
 
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 
-from circuit_synth.tools.utilities.comment_extractor import CommentExtractor
+from circuit_synth.tools.utilities import comment_extractor
+from circuit_synth.tools.utilities.comment_extractor import (
+    CommentExtractor,
+    format_python_source,
+)
 
 
 class TestCommentExtractor:
@@ -603,3 +608,51 @@ if __name__ == '__main__':
         assert (
             one_time_idx < generate_idx
         ), "After-function content should appear BEFORE boilerplate"
+
+
+class TestFormatCache:
+    """Test content-hash cached Black formatting"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, monkeypatch):
+        monkeypatch.setattr(comment_extractor, "_format_cache", OrderedDict())
+
+    @pytest.fixture
+    def format_calls(self, monkeypatch):
+        black = pytest.importorskip("black")
+        calls = []
+        original = black.format_str
+
+        def counting_format_str(code, mode):
+            calls.append(code)
+            return original(code, mode=mode)
+
+        monkeypatch.setattr(black, "format_str", counting_format_str)
+        return calls
+
+    def test_repeated_source_formatted_once(self, format_calls):
+        sources = ["x=1\n", "y = [1,2]\n", "x=1\n"]
+
+        result = [format_python_source(code) for code in sources]
+
+        assert result == ["x = 1\n", "y = [1, 2]\n", "x = 1\n"]
+        assert len(format_calls) == 2
+
+    def test_formatted_output_is_not_reformatted(self, format_calls):
+        extractor = CommentExtractor()
+        formatted = extractor._format_code_with_black("def f( a ):\n  return a\n")
+
+        assert extractor._format_code_with_black(formatted) == formatted
+        assert extractor._format_code_with_black("def f( a ):\n  return a\n")
+        assert len(format_calls) == 1
+
+    def test_line_length_is_part_of_the_key(self, format_calls):
+        code = "f(aaaaaaaaaa, bbbbbbbbbb, cccccccccc, dddddddddd, eeeeeeeeee, ffffffffff, gg)\n"
+        assert format_python_source(code, line_length=40) != code
+        assert format_python_source(code, line_length=200) == code
+        assert len(format_calls) == 2
+
+    def test_invalid_code_returned_unchanged(self, format_calls):
+        assert format_python_source("def broken(:\n") == "def broken(:\n"
+        assert format_python_source("def broken(:\n") == "def broken(:\n"
+        assert len(format_calls) == 1
@@ -15,7 +15,10 @@ import pytest
 
 from circuit_synth.tools.kicad_integration.kicad_to_python_sync import (
     KiCadToPythonSyncer,
+    SchematicWatcher,
 )
+from circuit_synth.tools.utilities.kicad_parser import KiCadParser
+from circuit_synth.tools.utilities.python_code_generator import PythonCodeGenerator
 
 
 class TestKiCadToPythonSyncerRefactored:
@@ -330,5 +333,89 @@ class TestKiCadToPythonSyncerRefactored:
                     mock_update.assert_called_once()
 
 
+class TestWatchMode:
+    """Tests for incremental watch-mode synchronization"""
+
+    def test_watcher_reports_changed_sheets(self, tmp_path):
+        """Watcher reports modified, added and removed sheets once each."""
+        sheet_a = tmp_path / "a.kicad_sch"
+        sheet_a.write_text("(kicad_sch)")
+        watcher = SchematicWatcher(tmp_path)
+        assert watcher.poll() == []
+
+        sheet_a.write_text("(kicad_sch (version 1))")
+        assert watcher.poll() == [sheet_a]
+        assert watcher.poll() == []
+
+        sheet_b = tmp_path / "b.kicad_sch"
+        sheet_b.write_text("(kicad_sch)")
+        sheet_a.unlink()
+        assert watcher.poll() == [sheet_a, sheet_b]
+
+    def test_parser_rereads_only_changed_sheets(self, tmp_path):
+        """A long-lived parser serves unchanged sheets from its cache."""
+        (tmp_path / "test.kicad_pro").write_text("{}")
+        sheet_a = tmp_path / "a.kicad_sch"
+        sheet_b = tmp_path / "b.kicad_sch"
+        sheet_a.write_text("(kicad_sch)")
+        sheet_b.write_text("(kicad_sch)")
+        parser = KiCadParser(str(tmp_path))
+
+        with patch.object(
+            parser, "_read_schematic_file", wraps=parser._read_schematic_file
+        ) as read:
+            parser._parse_schematic_file(sheet_a)
+            parser._parse_schematic_file(sheet_b)
+            sheet_a.write_text("(kicad_sch (version 1))")
+            parser._parse_schematic_file(sheet_a)
+            parser._parse_schematic_file(sheet_b)
+
+        assert [call.args[0] for call in read.call_args_list] == [
+            sheet_a,
+            sheet_b,
+            sheet_a,
+        ]
+
+    def test_unchanged_module_not_rewritten(self, tmp_path):
+        """Generated files are only written when their content changes."""
+        generator = PythonCodeGenerator()
+        target = tmp_path / "main.py"
+
+        assert generator._write_if_changed(target, "x = 1\n")
+        assert not generator._write_if_changed(target, "x = 1\n")
+        assert generator._write_if_changed(target, "x = 2\n")
+        assert target.read_text() == "x = 2\n"
+
+    def test_watch_regenerates_only_when_netlist_changes(self, tmp_path):
+        """Saving a sheet re-syncs, but code is only regenerated on change."""
+        json_file = tmp_path / "test.json"
+        json_file.write_text('{"name": "test", "components": {}, "nets": {}}')
+        sheet = tmp_path / "test.kicad_sch"
+        sheet.write_text("(kicad_sch)")
+        syncer = KiCadToPythonSyncer(
+            str(json_file), str(tmp_path / "out.py"), create_backup=True
+        )
+
+        # Poll sleeps edit the sheet; the following settle sleeps do nothing
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) in (1, 3):
+                sheet.write_text(sheet.read_text() + " ")
+
+        module = "circuit_synth.tools.kicad_integration.kicad_to_python_sync"
+        with patch(f"{module}.time.sleep", side_effect=fake_sleep), patch.object(
+            syncer, "update_json_from_schematic", side_effect=[False, True, False]
+        ) as update, patch.object(
+            syncer, "_generate_python", return_value=True
+        ) as generate:
+            assert syncer.watch(interval=0.01, max_cycles=3)
+
+        assert update.call_count == 3
+        assert generate.call_count == 2
+        assert syncer.create_backup
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,3 +1,4 @@
+import io
 import json
 import os
 import re
@@ -7,8 +8,11 @@ from pathlib import Path
 
 from circuit_synth.kicad.netlist_exporter import (
     PinType,
+    SExpressionWriter,
+    _index_path_suffixes,
     cleanup_whitespace,
     convert_json_to_netlist,
+    format_s_expr,
     generate_netlist,
     load_circuit_json,
 )
@@ -562,5 +566,85 @@ class TestNetlistExporter(unittest.TestCase):
                 output_path.unlink()
 
 
+class TestSExpressionWriter(unittest.TestCase):
+    """
+    Tests for the streaming S-expression writer.
+    """
+
+    NETLIST = [
+        "export",
+        ["version", "E"],
+        ["components", ["comp", ["ref", "R1"], ["value", "10k )"], ["empty"]]],
+        [
+            "libraries",
+            [
+                "library",
+                ["logical", "Device"],
+                ["uri", "/usr/share/kicad/symbols/Device.kicad_sym"],
+            ],
+        ],
+        [
+            "nets",
+            [
+                "net",
+                ["code", 1],
+                ["name", "/sub/VIN"],
+                ["node", ["ref", "R1"], ["pin", "1"], ["pintype", "passive"]],
+                [
+                    "node",
+                    ["ref", "R2"],
+                    ["pin", "2"],
+                    ["pintype", "passive"],
+                    ["pinfunction", "A\r\n\n\nB"],
+                ],
+            ],
+        ],
+    ]
+
+    def test_streamed_output_matches_cleaned_format(self):
+        expected = cleanup_whitespace(format_s_expr(self.NETLIST).replace("\r\n", "\n"))
+
+        buffer = io.StringIO()
+        SExpressionWriter(buffer, cleanup=True).write(self.NETLIST)
+
+        self.assertEqual(buffer.getvalue(), expected)
+        self.assertIn("symbols//Device", expected)
+        self.assertIn("(empty)", expected)
+
+    def test_raw_output_is_unchanged(self):
+        text = format_s_expr(self.NETLIST)
+        self.assertTrue(text.startswith('(export (version "E")'))
+        self.assertIn('(value "10k )")', text)
+        self.assertIn('          (node (ref "R1") (pin "1") (pintype "passive"))', text)
+
+    def test_failed_conversion_keeps_existing_netlist(self):
+        bad = {
+            "name": "bad",
+            "components": {"R1": {"symbol": "R", "ref": "R1", "value": "1k"}},
+            "nets": {},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / "bad.json"
+            json_path.write_text(json.dumps(bad))
+            output_path = Path(tmp) / "bad.net"
+            output_path.write_text("(export previous)")
+
+            with self.assertRaises(ValueError):
+                convert_json_to_netlist(json_path, output_path)
+
+            self.assertEqual(output_path.read_text(), "(export previous)")
+            self.assertEqual(sorted(os.listdir(tmp)), ["bad.json", "bad.net"])
+
+    def test_path_suffix_index_keeps_first_match(self):
+        index = {}
+        for name in ["/a/VIN", "/b/VIN", "/a/b/SIG"]:
+            _index_path_suffixes(index, name)
+
+        self.assertEqual(index["VIN"], "/a/VIN")
+        self.assertEqual(index["b/SIG"], "/a/b/SIG")
+        self.assertEqual(index["SIG"], "/a/b/SIG")
+        self.assertNotIn("GND", index)
+
+
 if __name__ == "__main__":
     unittest.main()
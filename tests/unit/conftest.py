@@ -0,0 +1,38 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def make_footprint():
+    """
+    Factory for duck-typed board footprints with pads along the x axis.
+
+    ``make_footprint(ref, x, y, pads, layers=("F.Cu",), rotation=0,
+    size=(1.0, 1.0))`` builds a footprint at (x, y). ``pads`` holds
+    ``(net, dx)`` pairs, or ``(net, dx, layers)`` to give one pad its own
+    layers; pads are numbered from 1.
+    """
+
+    def make(ref, x, y, pads, layers=("F.Cu",), rotation=0, size=(1.0, 1.0)):
+        return SimpleNamespace(
+            reference=ref,
+            position=SimpleNamespace(x=x, y=y),
+            rotation=rotation,
+            pads=[
+                SimpleNamespace(
+                    number=str(i + 1),
+                    net_name=pad[0],
+                    position=SimpleNamespace(x=pad[1], y=0.0),
+                    size=size,
+                    layers=list(pad[2] if len(pad) > 2 else layers),
+                )
+                for i, pad in enumerate(pads)
+            ],
+        )
+
+    return make
@@ -0,0 +1,194 @@
+"""
+Unit tests for simulated-annealing footprint placement.
+"""
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from circuit_synth.kicad.pcb_gen.pcb_generator import PCBGenerator
+from circuit_synth.pcb.annealing_placer import (
+    PlacementProblem,
+    anneal,
+    anneal_placement,
+)
+from circuit_synth.pcb.placement_metrics import PlacementMetrics
+
+PITCH = 5.0
+
+
+def _scrambled_problem(count=48, seed=2):
+    """Footprints wired to their grid neighbours, placed in shuffled order."""
+    rng = random.Random(seed)
+    cols = int(count**0.5)
+    refs = [f"U{i}" for i in range(count)]
+    pins = []
+    for i in range(count):
+        right, below = i + 1, i + cols
+        if (i + 1) % cols and right < count:
+            pins += [(refs[i], f"H{i}", 1.0, 0.0), (refs[right], f"H{i}", -1.0, 0.0)]
+        if below < count:
+            pins += [(refs[i], f"V{i}", 0.0, 1.0), (refs[below], f"V{i}", 0.0, -1.0)]
+
+    order = refs[:]
+    rng.shuffle(order)
+    slot = {ref: k for k, ref in enumerate(order)}
+    positions = np.array(
+        [
+            ((slot[ref] % cols) * PITCH + 3, (slot[ref] // cols) * PITCH + 3)
+            for ref in refs
+        ]
+    )
+    courtyards = np.tile([-1.5, -1.5, 1.5, 1.5], (count, 1))
+    rows = -(-count // cols)
+    bounds = (0.0, 0.0, cols * PITCH + 6, rows * PITCH + 6)
+    return PlacementProblem(refs, courtyards, positions, pins), bounds
+
+
+def _overlap(problem, positions):
+    boxes = np.array(
+        [
+            np.add(problem.courtyards[i], positions[ref] * 2)
+            for i, ref in enumerate(problem.refs)
+        ]
+    )
+    w = np.minimum(boxes[:, None, 2], boxes[None, :, 2]) - np.maximum(
+        boxes[:, None, 0], boxes[None, :, 0]
+    )
+    h = np.minimum(boxes[:, None, 3], boxes[None, :, 3]) - np.maximum(
+        boxes[:, None, 1], boxes[None, :, 1]
+    )
+    area = np.clip(w, 0, None) * np.clip(h, 0, None)
+    np.fill_diagonal(area, 0)
+    return area.sum() / 2, boxes
+
+
+class TestAnneal:
+    """Test single annealing runs."""
+
+    def test_shortens_ratsnest_without_overlap(self):
+        problem, bounds = _scrambled_problem()
+        start = PlacementMetrics(
+            dict(zip(problem.refs, map(tuple, problem.positions))), problem.pins
+        )
+
+        result = anneal(problem, bounds, seed=1, time_limit=None, max_moves=20000)
+        placed = PlacementMetrics(result.positions, problem.pins)
+
+        assert result.legal
+        assert result.hpwl == pytest.approx(placed.total_hpwl)
+        assert placed.ratsnest_length() < 0.6 * start.ratsnest_length()
+
+        overlap, boxes = _overlap(problem, result.positions)
+        assert overlap == pytest.approx(0.0, abs=1e-9)
+        assert boxes[:, :2].min() >= -1e-9
+        assert np.all(boxes[:, 2] <= bounds[2] + 1e-9)
+        assert np.all(boxes[:, 3] <= bounds[3] + 1e-9)
+
+    def test_deterministic_without_time_limit(self):
+        problem, bounds = _scrambled_problem(count=20)
+        first = anneal(problem, bounds, seed=3, time_limit=None, max_moves=3000)
+        second = anneal(problem, bounds, seed=3, time_limit=None, max_moves=3000)
+        assert first.positions == second.positions
+
+    def test_overlapping_start_is_legalized(self):
+        problem, bounds = _scrambled_problem(count=16)
+        problem.positions[:] = (10.0, 10.0)
+        result = anneal(problem, bounds, time_limit=None, max_moves=512)
+        assert result.legal
+        assert _overlap(problem, result.positions)[0] == pytest.approx(0.0, abs=1e-9)
+
+
+class TestAnnealPlacement:
+    """Test multi-start annealing."""
+
+    def test_keeps_best_start(self):
+        problem, bounds = _scrambled_problem(count=20)
+        options = dict(time_limit=None, max_moves=2000)
+        runs = [anneal(problem, bounds, seed=s, **options) for s in (5, 6, 7)]
+
+        best = anneal_placement(
+            problem, bounds, starts=3, max_workers=1, seed=5, **options
+        )
+
+        assert best.hpwl == min(run.hpwl for run in runs)
+
+    def test_all_starts_failing_raises(self):
+        problem, bounds = _scrambled_problem(count=4)
+        with pytest.raises(RuntimeError, match="annealing runs failed"):
+            anneal_placement(problem, bounds, max_workers=1, bogus=1)
+
+
+class TestFromBoard:
+    """Test building a placement problem from board footprints."""
+
+    def test_courtyards_and_pins(self, make_footprint):
+        pcb = SimpleNamespace(
+            footprints=[
+                make_footprint(
+                    "R1", 10, 20, [("A", -1.0), ("unconnected-(R1-Pad2)", 1.0)]
+                ),
+                make_footprint("R2", 30, 20, [("A", -1.0), ("B", 1.0)]),
+            ]
+        )
+        problem = PlacementProblem.from_board(pcb, spacing=1.0, margin=0.25)
+
+        assert problem.refs == ["R1", "R2"]
+        assert problem.courtyards[0] == pytest.approx([-2.25, -1.25, 2.25, 1.25])
+        assert problem.positions.tolist() == [[10, 20], [30, 20]]
+        assert sorted(problem.pins) == [
+            ("R1", "A", -1.0, 0.0),
+            ("R2", "A", -1.0, 0.0),
+            ("R2", "B", 1.0, 0.0),
+        ]
+
+
+class TestGeneratorAnnealing:
+    """Test PCBGenerator's annealing placement dispatch."""
+
+    def test_refines_spiral_placement(self, make_footprint):
+        pcb = SimpleNamespace(
+            footprints=[
+                make_footprint("R1", 50, 50, [("A", 1.0)]),
+                make_footprint("R2", 50, 50, [("B", 1.0)]),
+                make_footprint("R3", 50, 50, [("A", -1.0), ("B", 1.0)]),
+            ]
+        )
+        seeded = {"R1": (5, 5), "R2": (25, 5), "R3": (45, 5)}
+
+        def auto_place_components(algorithm, **kwargs):
+            assert algorithm == "spiral"
+            for fp in pcb.footprints:
+                fp.position = SimpleNamespace(x=seeded[fp.reference][0], y=5)
+
+        pcb.auto_place_components = auto_place_components
+        generator = PCBGenerator.__new__(PCBGenerator)
+
+        result = generator._place_components(
+            pcb,
+            "annealing",
+            component_spacing=1.0,
+            group_spacing=2.0,
+            board_width=50.0,
+            board_height=20.0,
+            annealing_options={"time_limit": None, "starts": 1},
+        )
+
+        assert result.legal
+        placed = PlacementMetrics.from_board(pcb)
+        assert placed.total_hpwl == pytest.approx(result.hpwl)
+        assert placed.total_hpwl < 40.0
+
+    def test_overlap_asks_for_bigger_board(self, make_footprint):
+        pcb = SimpleNamespace(
+            footprints=[make_footprint(f"R{i}", 5, 5, [("A", 0.0)]) for i in range(6)]
+        )
+        pcb.auto_place_components = lambda algorithm, **kwargs: None
+        generator = PCBGenerator.__new__(PCBGenerator)
+
+        with pytest.raises(ValueError, match="Could not find valid position"):
+            generator._anneal_placement(
+                pcb, component_spacing=1.0, board_width=4.0, board_height=4.0
+            )
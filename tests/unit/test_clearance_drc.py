@@ -0,0 +1,144 @@
+"""
+Unit tests for the in-process clearance DRC.
+"""
+
+import random
+from types import SimpleNamespace
+
+from circuit_synth.pcb.clearance_drc import ClearanceChecker, check_clearances
+from circuit_synth.pcb.grid_router import GridRouter, RoutedVia, RoutePad, TrackSegment
+
+# Paste and mask layers must not count as copper
+PAD_LAYERS = ("F.Cu", "F.Paste", "F.Mask")
+
+
+def _types(result):
+    return sorted(v["type"] for v in result.violations)
+
+
+def _signature(result):
+    return sorted(
+        (v["type"], tuple(sorted(item["description"] for item in v["items"])))
+        for v in result.violations + result.unconnected_items
+    )
+
+
+class TestClearance:
+    """Test copper clearance between nets."""
+
+    def test_pad_to_pad(self):
+        close = check_clearances(
+            [RoutePad("A", 0, 0), RoutePad("B", 1.1, 0)], clearance=0.2
+        )
+        apart = check_clearances(
+            [RoutePad("A", 0, 0), RoutePad("B", 1.3, 0)], clearance=0.2
+        )
+
+        assert _types(close) == ["clearance"]
+        assert "actual 0.1000 mm" in close.violations[0]["description"]
+        assert not close.success
+        assert apart.success
+
+    def test_same_net_and_other_layer_ignored(self):
+        pads = [RoutePad("A", 0, 0), RoutePad("A", 1.05, 0)]
+        tracks = [TrackSegment("B", "B.Cu", (-2, 0), (3, 0), 0.25)]
+        assert check_clearances(pads, tracks).violations == []
+
+    def test_track_and_via(self):
+        pads = [RoutePad("A", 0, 0)]
+        tracks = [TrackSegment("B", "F.Cu", (-2, 0.7), (2, 0.7), 0.2)]
+        vias = [RoutedVia("C", (2.5, 0.0), 0.6, 0.3)]
+        result = check_clearances(pads, tracks, vias, clearance=0.2)
+
+        # Track edge is 0.1 mm above the pad and 0.4 mm from the via
+        assert _types(result) == ["clearance"]
+        descriptions = {i["description"] for i in result.violations[0]["items"]}
+        assert any(d.startswith("Track [B]") for d in descriptions)
+
+    def test_crossing_tracks(self):
+        tracks = [
+            TrackSegment("A", "F.Cu", (0, 0), (4, 4), 0.2),
+            TrackSegment("B", "F.Cu", (0, 4), (4, 0), 0.2),
+        ]
+        result = check_clearances([], tracks)
+        assert "actual 0.0000 mm" in result.violations[0]["description"]
+
+    def test_routed_board_is_clean_and_connected(self):
+        pads = [
+            RoutePad("A", 0, 0),
+            RoutePad("A", 10, 0),
+            RoutePad("B", 5, -5),
+            RoutePad("B", 5, 5),
+        ]
+        routed = GridRouter(track_width=0.25, clearance=0.2).route(pads)
+        result = check_clearances(pads, routed.segments, routed.vias, clearance=0.2)
+
+        assert result.success
+        assert result.unconnected_items == []
+
+
+class TestBoardRules:
+    """Test courtyard, board-edge and connectivity rules."""
+
+    def test_courtyard_overlap_and_incremental_move(self, make_footprint):
+        pcb = SimpleNamespace(
+            footprints=[
+                make_footprint("R1", 10, 10, [("A", -0.8), ("B", 0.8)], PAD_LAYERS),
+                make_footprint("R2", 12, 10, [("B", -0.8), ("C", 0.8)], PAD_LAYERS),
+            ]
+        )
+        checker = ClearanceChecker.from_board(pcb)
+        assert "courtyards_overlap" in _types(checker.check())
+
+        checker.move_footprint("R2", 5.0, 0.0)
+        result = checker.check()
+        assert result.success
+        # Net B now spans two pads with nothing joining them
+        assert len(result.unconnected_items) == 1
+        assert "[B]" in result.unconnected_items[0]["items"][0]["description"]
+
+    def test_board_edge(self):
+        result = check_clearances(
+            [RoutePad("A", 0.6, 5), RoutePad("B", 5, 5)],
+            bounds=(0, 0, 10, 10),
+            edge_clearance=0.3,
+        )
+        assert _types(result) == ["copper_edge_clearance"]
+
+    def test_unconnected_until_tracked(self):
+        pads = [RoutePad("A", 0, 0), RoutePad("A", 5, 0), RoutePad("A", 5, 5)]
+        assert len(check_clearances(pads).unconnected_items) == 2
+
+        tracks = [
+            TrackSegment("A", "F.Cu", (0, 0), (5, 0), 0.25),
+            TrackSegment("A", "F.Cu", (5, 0), (5, 5), 0.25),
+        ]
+        assert check_clearances(pads, tracks).unconnected_items == []
+
+    def test_incremental_matches_full_check(self, make_footprint):
+        rng = random.Random(3)
+        footprints = [
+            make_footprint(
+                f"U{i}",
+                rng.uniform(0, 30),
+                rng.uniform(0, 30),
+                [(f"N{rng.randrange(8)}", -1.0), (f"N{rng.randrange(8)}", 1.0)],
+                PAD_LAYERS,
+            )
+            for i in range(40)
+        ]
+        pcb = SimpleNamespace(footprints=footprints)
+        options = dict(clearance=0.3, bounds=(0, 0, 31, 31))
+        checker = ClearanceChecker.from_board(pcb, **options)
+        checker.check()
+
+        for _ in range(30):
+            fp = rng.choice(footprints)
+            dx, dy = rng.uniform(-3, 3), rng.uniform(-3, 3)
+            checker.move_footprint(fp.reference, dx, dy)
+            fp.position = SimpleNamespace(x=fp.position.x + dx, y=fp.position.y + dy)
+
+        incremental = checker.check()
+        full = ClearanceChecker.from_board(pcb, **options).check()
+        assert incremental.violations
+        assert _signature(incremental) == _signature(full)
@@ -295,6 +295,119 @@ class TestDebugKnowledgeBase:
             assert len(similar) > 0
 
 
+class TestKnowledgeBaseIndex:
+    """Test the indexed symptom search in DebugKnowledgeBase"""
+
+    WORDS = ["rail", "low", "hot", "noise", "usb", "i2c", "reset", "no", "power"]
+
+    @staticmethod
+    def _brute_force(kb, symptoms, category=None, min_similarity=0.3):
+        """Reference search scoring every pattern in Python"""
+        patterns = [p for p, _ in kb._scan_patterns(symptoms, category, -1, None)]
+        matches = [
+            (p, p.matches_symptoms(symptoms))
+            for p in patterns
+            if p.matches_symptoms(symptoms) >= min_similarity
+        ]
+        matches.sort(key=lambda x: (x[1], x[0].success_rate), reverse=True)
+        return [(p.pattern_id, s) for p, s in matches]
+
+    def test_matches_brute_force(self, tmp_path):
+        import random
+
+        rng = random.Random(5)
+        kb = DebugKnowledgeBase(db_path=tmp_path / "kb.db")
+        for i in range(60):
+            symptoms = [
+                " ".join(rng.choice(self.WORDS).upper() for _ in range(3))
+                for _ in range(rng.randint(1, 3))
+            ]
+            kb.add_pattern(
+                DebugPattern(
+                    pattern_id=f"p{i}",
+                    category=rng.choice(["power", "digital"]),
+                    symptoms=symptoms,
+                    root_cause="cause",
+                    solutions=[],
+                    component_types=[],
+                    success_rate=rng.choice([0.5, 0.9]),
+                )
+            )
+
+        for _ in range(50):
+            query = [" ".join(rng.sample(self.WORDS, rng.randint(1, 4)))]
+            category = rng.choice([None, "power"])
+            threshold = rng.choice([0.1, 0.3, 0.5])
+            result = kb.search_patterns(query, category, threshold)
+            assert [(p.pattern_id, s) for p, s in result] == self._brute_force(
+                kb, query, category, threshold
+            )
+
+    def test_decoded_patterns_are_cached(self, tmp_path):
+        kb = DebugKnowledgeBase(db_path=tmp_path / "kb.db")
+        first = kb.search_patterns(["USB device not recognized"], limit=1)
+        second = kb.search_patterns(["USB device not recognized"], limit=1)
+        assert len(first) == 1
+        assert first[0][0] is second[0][0]
+
+    def test_updates_invalidate_cache(self, tmp_path):
+        kb = DebugKnowledgeBase(db_path=tmp_path / "kb.db")
+        pattern = DebugPattern(
+            pattern_id="fuse",
+            category="power",
+            symptoms=["Board dead"],
+            root_cause="Blown fuse",
+            solutions=[],
+            component_types=[],
+        )
+        kb.add_pattern(pattern)
+        assert kb.search_patterns(["board dead"])[0][0].occurrence_count == 1
+
+        kb.record_debug_session(
+            {
+                "session_id": "s1",
+                "board_name": "b",
+                "symptoms": ["Board dead"],
+                "success": True,
+            }
+        )
+        assert kb.search_patterns(["board dead"])[0][0].occurrence_count == 2
+
+        pattern.symptoms = ["Fuse open"]
+        kb.add_pattern(pattern)
+        assert kb.search_patterns(["board dead"]) == []
+        assert kb.search_patterns(["fuse open"])[0][0].symptoms == ["Fuse open"]
+
+    def test_existing_database_is_indexed(self, tmp_path):
+        path = tmp_path / "kb.db"
+        kb = DebugKnowledgeBase(db_path=path)
+        kb.add_pattern(
+            DebugPattern(
+                pattern_id="fuse",
+                category="power",
+                symptoms=["Board dead"],
+                root_cause="Blown fuse",
+                solutions=[],
+                component_types=[],
+            )
+        )
+        kb.conn.execute("DELETE FROM debug_pattern_terms")
+        kb.conn.execute("DELETE FROM debug_pattern_term_counts")
+        kb.conn.commit()
+        kb.conn.close()
+
+        reopened = DebugKnowledgeBase(db_path=path)
+        assert reopened.search_patterns(["board dead"])[0][0].pattern_id == "fuse"
+
+    def test_search_text_covers_root_causes(self, tmp_path):
+        kb = DebugKnowledgeBase(db_path=tmp_path / "kb.db")
+        results = kb.search_text("differential pair")
+        assert results
+        assert "differential pair" in results[0][0].root_cause
+        assert kb.search_text("differential", category="power") == []
+        assert kb.search_text("") == []
+
+
 class TestTestGuidance:
     """Test TestGuidance class"""
 
@@ -0,0 +1,261 @@
+"""
+Unit tests for the parallel kicad-cli export orchestrator.
+
+A small fake kicad-cli script stands in for KiCad: it sleeps to simulate
+export time, writes the expected output files and logs each invocation.
+"""
+
+import os
+import stat
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from circuit_synth.pcb.export_orchestrator import (
+    ExportGraphError,
+    ExportJob,
+    ExportOrchestrator,
+    hash_files,
+)
+from circuit_synth.pcb.kicad_cli import KiCadCLI
+
+EXPORT_DELAY = 0.4
+
+FAKE_KICAD_CLI = textwrap.dedent("""\
+    #!{python}
+    import sys, time
+    from pathlib import Path
+
+    args = sys.argv[1:]
+    with open({log!r}, "a") as f:
+        f.write(" ".join(args[:3]) + "\\n")
+    time.sleep({delay})
+
+    if "--fail" in Path(args[-1]).read_text():
+        sys.exit(3)
+
+    out = Path(args[args.index("--output") + 1])
+    stem = Path(args[-1]).stem
+    kind = args[2] if args[1] == "export" else args[1]
+    if kind == "gerbers":
+        out.mkdir(parents=True, exist_ok=True)
+        for layer in ("F_Cu", "B_Cu", "Edge_Cuts"):
+            (out / f"{{stem}}-{{layer}}.gbr").write_text("G04*")
+    elif kind == "drill":
+        out.mkdir(parents=True, exist_ok=True)
+        (out / f"{{stem}}-PTH.drl").write_text("M48")
+        (out / f"{{stem}}-NPTH.drl").write_text("M48")
+    elif kind == "drc":
+        out.write_text('{{"violations": [], "warnings": [], "unconnected_items": []}}')
+    else:
+        out.write_text(kind)
+    """)
+
+
+@pytest.fixture
+def fake_cli(tmp_path):
+    """Create a KiCadCLI pointing at the fake kicad-cli script."""
+    log = tmp_path / "calls.log"
+    script = tmp_path / "kicad-cli"
+    script.write_text(
+        FAKE_KICAD_CLI.format(python=sys.executable, log=str(log), delay=EXPORT_DELAY)
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return KiCadCLI(str(script)), log
+
+
+@pytest.fixture
+def board(tmp_path):
+    """Create a dummy board file."""
+    pcb = tmp_path / "board.kicad_pcb"
+    pcb.write_text("(kicad_pcb (version 20240108))")
+    return pcb
+
+
+def _calls(log: Path):
+    return log.read_text().splitlines() if log.exists() else []
+
+
+def _peak_overlap(timings):
+    """Largest number of job start/end intervals that overlap at one time."""
+    return max(
+        sum(1 for other in timings if other.start <= t.start < other.end)
+        for t in timings
+    )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake kicad-cli is a POSIX script")
+class TestExportOrchestrator:
+    """Test concurrent execution, caching and timing reports."""
+
+    def test_exports_run_concurrently(self, fake_cli, board, tmp_path):
+        cli, log = fake_cli
+        out = tmp_path / "out"
+        orchestrator = ExportOrchestrator(cli, max_workers=4, cache_dir=out)
+        orchestrator.add_manufacturing_jobs(
+            board, out, include_pos=True, include_svg=True, include_drc=True
+        )
+
+        report = orchestrator.run()
+
+        assert report.success
+        assert set(report.jobs) == {"gerbers", "drill", "pos", "svg", "drc"}
+        assert len(_calls(log)) == 5
+        assert report.serial_time >= 5 * EXPORT_DELAY
+        # With 4 workers, several jobs must be in flight at the same time
+        assert _peak_overlap(report.jobs.values()) >= 2
+        assert len(report.results["gerbers"]) == 3
+        assert all(report.results["drill"])
+        assert report.results["drc"].success
+
+    def test_worker_limit_is_respected(self, fake_cli, board, tmp_path):
+        cli, _ = fake_cli
+        out = tmp_path / "out"
+        orchestrator = ExportOrchestrator(cli, max_workers=1)
+        orchestrator.add_manufacturing_jobs(board, out, include_pos=True)
+
+        report = orchestrator.run()
+
+        assert report.success
+        timings = sorted(report.jobs.values(), key=lambda t: t.start)
+        for earlier, later in zip(timings, timings[1:]):
+            assert later.start >= earlier.end
+
+    def test_unchanged_board_is_skipped(self, fake_cli, board, tmp_path):
+        cli, log = fake_cli
+        out = tmp_path / "out"
+
+        first = ExportOrchestrator(cli, cache_dir=out)
+        first.add_manufacturing_jobs(board, out)
+        first.run()
+        assert len(_calls(log)) == 2
+
+        second = ExportOrchestrator(cli, cache_dir=out)
+        second.add_manufacturing_jobs(board, out)
+        report = second.run()
+
+        assert len(_calls(log)) == 2
+        assert sorted(report.skipped) == ["drill", "gerbers"]
+        # Skipped jobs still report their existing outputs
+        assert len(report.results["gerbers"]) == 3
+        assert all(report.results["drill"])
+
+        board.write_text("(kicad_pcb (version 20240108) (net 1 GND))")
+        third = ExportOrchestrator(cli, cache_dir=out)
+        third.add_manufacturing_jobs(board, out)
+        report = third.run()
+
+        assert len(_calls(log)) == 4
+        assert report.skipped == []
+
+    def test_deleted_outputs_rerun(self, fake_cli, board, tmp_path):
+        cli, log = fake_cli
+        out = tmp_path / "out"
+
+        first = ExportOrchestrator(cli, cache_dir=out)
+        first.add_manufacturing_jobs(board, out)
+        gerbers = first.run().results["gerbers"]
+        gerbers[0].unlink()
+
+        # The output directory still exists, but a Gerber file is gone
+        second = ExportOrchestrator(cli, cache_dir=out)
+        second.add_manufacturing_jobs(board, out)
+        report = second.run()
+
+        assert report.skipped == ["drill"]
+        assert len(_calls(log)) == 3
+        assert gerbers[0].exists()
+
+    def test_force_and_changed_options_rerun(self, fake_cli, board, tmp_path):
+        cli, log = fake_cli
+        out = tmp_path / "out"
+
+        orchestrator = ExportOrchestrator(cli, cache_dir=out)
+        orchestrator.add_manufacturing_jobs(board, out, include_drill=False)
+        orchestrator.run()
+        orchestrator.run(force=True)
+        assert len(_calls(log)) == 2
+
+        changed = ExportOrchestrator(cli, cache_dir=out)
+        changed.add_manufacturing_jobs(board, out, layers=["F.Cu"], include_drill=False)
+        changed.run()
+        assert len(_calls(log)) == 3
+
+    def test_failure_cancels_dependents(self, fake_cli, board, tmp_path):
+        cli, log = fake_cli
+        board.write_text("(kicad_pcb --fail)")
+        out = tmp_path / "out"
+        orchestrator = ExportOrchestrator(cli, cache_dir=out)
+        orchestrator.add_manufacturing_jobs(board, out, drill_format="gerber")
+
+        report = orchestrator.run()
+
+        assert not report.success
+        assert report.failed == ["gerbers"]
+        assert report.jobs["drill"].status == "cancelled"
+        assert len(_calls(log)) == 1
+
+    def test_timing_report_serializes(self, fake_cli, board, tmp_path):
+        cli, _ = fake_cli
+        orchestrator = ExportOrchestrator(cli)
+        orchestrator.add_manufacturing_jobs(board, tmp_path / "out")
+
+        data = orchestrator.run().to_dict()
+
+        assert data["success"] is True
+        assert set(data["jobs"]) == {"gerbers", "drill"}
+        assert data["jobs"]["gerbers"]["duration"] >= EXPORT_DELAY
+
+
+class TestExportGraph:
+    """Test job graph validation and hashing helpers."""
+
+    def _cli(self, tmp_path):
+        return KiCadCLI(str(tmp_path / "kicad-cli"))
+
+    def test_duplicate_job_rejected(self, tmp_path):
+        orchestrator = ExportOrchestrator(self._cli(tmp_path))
+        orchestrator.add_job(ExportJob(name="a", action=lambda cli: None))
+        with pytest.raises(ExportGraphError):
+            orchestrator.add_job(ExportJob(name="a", action=lambda cli: None))
+
+    def test_cycle_rejected(self, tmp_path):
+        orchestrator = ExportOrchestrator(self._cli(tmp_path))
+        orchestrator.add_job(ExportJob("a", lambda cli: None, depends_on=["b"]))
+        orchestrator.add_job(ExportJob("b", lambda cli: None, depends_on=["a"]))
+        with pytest.raises(ExportGraphError):
+            orchestrator.run()
+
+    def test_unknown_dependency_rejected(self, tmp_path):
+        orchestrator = ExportOrchestrator(self._cli(tmp_path))
+        orchestrator.add_job(ExportJob("a", lambda cli: None, depends_on=["x"]))
+        with pytest.raises(ExportGraphError):
+            orchestrator.run()
+
+    def test_dependencies_run_in_order(self, tmp_path):
+        order = []
+        orchestrator = ExportOrchestrator(self._cli(tmp_path), max_workers=4)
+        orchestrator.add_job(
+            ExportJob("last", lambda cli: order.append("last"), depends_on=["mid"])
+        )
+        orchestrator.add_job(
+            ExportJob("mid", lambda cli: order.append("mid"), depends_on=["first"])
+        )
+        orchestrator.add_job(ExportJob("first", lambda cli: order.append("first")))
+
+        report = orchestrator.run()
+
+        assert report.success
+        assert order == ["first", "mid", "last"]
+
+    def test_hash_files_tracks_content_and_params(self, tmp_path):
+        f = tmp_path / "board.kicad_pcb"
+        f.write_text("a")
+        h1 = hash_files([f])
+        assert hash_files([f]) == h1
+        assert hash_files([f], {"layers": ["F.Cu"]}) != h1
+        f.write_text("b")
+        assert hash_files([f]) != h1
+        assert hash_files([tmp_path / "missing"]) != h1
@@ -4,6 +4,8 @@ Unit tests for FMEA analyzer functionality
 Tests component analysis, failure mode detection, and RPN calculations
 """
 
+import json
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,11 +13,19 @@ from unittest.mock import MagicMock, patch
 from circuit_synth.quality_assurance.circuit_parser import (
     extract_components_from_python,
 )
+from circuit_synth.quality_assurance.enhanced_fmea_analyzer import (
+    EnhancedFMEAAnalyzer,
+    load_knowledge_base,
+)
 from circuit_synth.quality_assurance.fmea_analyzer import (
     ComponentType,
     FailureMode,
     UniversalFMEAAnalyzer,
 )
+from circuit_synth.quality_assurance.fmea_batch import (
+    analyze_circuit_batch,
+    find_designs,
+)
 
 
 class TestFMEAAnalyzer(unittest.TestCase):
@@ -345,5 +355,105 @@ class TestFailureMode(unittest.TestCase):
         self.assertLess(rpn, 50)
 
 
+class TestBatchFMEA(unittest.TestCase):
+    """Test memoized and batched FMEA analysis"""
+
+    COMPONENTS = {
+        "R1": {"symbol": "Device:R", "value": "10k", "footprint": "R_0603"},
+        "R2": {"symbol": "Device:R", "value": "10k", "footprint": "R_0603"},
+        "R10": {"symbol": "Device:R", "value": "10k", "footprint": "R_0603"},
+        "J1": {"symbol": "Connector:USB_C_Receptacle", "value": "USB_C"},
+        "J2": {"symbol": "Connector:USB_C_Receptacle", "value": "USB_C"},
+        "P1": {"symbol": "Connector:USB_C_Receptacle", "value": "USB_C"},
+        "U1": {"symbol": "RF_Module:ESP32-C6-MINI-1", "value": "ESP32"},
+        "C1": {"symbol": "Device:C", "value": "100nF", "footprint": "C_0402"},
+    }
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_design(self, name, components):
+        design = self.root / name
+        design.mkdir()
+        path = design / "circuit.json"
+        path.write_text(json.dumps({"components": components, "nets": {}}))
+        return path
+
+    def test_memoized_analysis_matches_direct(self):
+        analyzer = UniversalFMEAAnalyzer(verbose=False)
+        context = {"nets": {}}
+        for ref, info in self.COMPONENTS.items():
+            info = dict(info, ref=ref)
+            direct = analyzer.analyze_component(info, context)
+            cached = analyzer.analyze_component_cached(info, context)
+            self.assertEqual(
+                [fm.to_dict() for fm in cached], [fm.to_dict() for fm in direct]
+            )
+
+        # R1/R2/R10 and J1/J2 share signatures; P1 differs by its prefix
+        self.assertEqual(len(analyzer._failure_mode_cache), 5)
+
+    def test_batch_matches_sequential(self):
+        paths = [
+            self._write_design(f"rev{i}", dict(list(self.COMPONENTS.items())[i:]))
+            for i in range(4)
+        ]
+        (self.root / "broken").mkdir()
+        (self.root / "broken" / "circuit.json").write_text("{not json")
+
+        designs = find_designs(self.root)
+        self.assertEqual(len(designs), 5)
+
+        results = analyze_circuit_batch(designs, max_workers=2)
+
+        self.assertEqual([r.path for r in results], [str(d) for d in designs])
+        self.assertFalse(results[0].ok)
+        for path, result in zip(paths, results[1:]):
+            self.assertTrue(result.ok)
+            expected = UniversalFMEAAnalyzer(verbose=False).analyze_circuit_file(
+                str(path)
+            )
+            self.assertEqual((result.circuit_data, result.failure_modes), expected)
+
+    def test_knowledge_base_loaded_once_and_read_only(self):
+        kb_dir = self.root / "fmea" / "failure_modes" / "component_specific"
+        kb_dir.mkdir(parents=True)
+        (kb_dir / "resistors.json").write_text(
+            json.dumps(
+                {
+                    "thick_film_chip": {
+                        "failure_modes": [
+                            {"mechanism": "Sulfur corrosion", "causes": ["H2S"]}
+                        ]
+                    }
+                }
+            )
+        )
+
+        kb = load_knowledge_base(self.root / "fmea")
+        analyzer = EnhancedFMEAAnalyzer(verbose=False, kb_path=self.root / "fmea")
+
+        self.assertIs(analyzer.knowledge_base, kb)
+        with self.assertRaises(TypeError):
+            kb["component_specific"]["resistors"] = {}
+        modes = analyzer.analyze_component(
+            {"ref": "R1", "symbol": "Device:R", "footprint": "R_0603"}, {}
+        )
+        self.assertIn("Sulfur corrosion", [fm.failure_mode for fm in modes])
+
+        results = analyze_circuit_batch(
+            [self._write_design("kb", self.COMPONENTS)],
+            enhanced=True,
+            kb_path=self.root / "fmea",
+        )
+        self.assertIn(
+            "Sulfur corrosion", [fm["failure_mode"] for fm in results[0].failure_modes]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
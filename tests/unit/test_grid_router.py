@@ -0,0 +1,197 @@
+"""
+Unit tests for the in-process two-layer grid router.
+"""
+
+import math
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from circuit_synth.pcb.grid_router import (
+    LAYERS,
+    GridRouter,
+    RoutePad,
+    board_pads,
+    estimate_routability,
+)
+
+TRACK = 0.25
+CLEARANCE = 0.2
+
+
+def _samples(segment, step=0.05):
+    (x1, y1), (x2, y2) = segment.start, segment.end
+    count = max(1, math.ceil(segment.length / step))
+    return [
+        (x1 + (x2 - x1) * i / count, y1 + (y2 - y1) * i / count)
+        for i in range(count + 1)
+    ]
+
+
+def _gap_to_pad(point, pad):
+    dx = max(abs(point[0] - pad.x) - pad.width / 2, 0.0)
+    dy = max(abs(point[1] - pad.y) - pad.height / 2, 0.0)
+    return math.hypot(dx, dy)
+
+
+def _assert_clearances(pads, result):
+    """Brute-force copper clearance check between different nets."""
+    for layer in LAYERS:
+        points, nets = [], []
+        for segment in result.segments:
+            if segment.layer == layer:
+                samples = _samples(segment)
+                points.extend(samples)
+                nets.extend([segment.net] * len(samples))
+        points = np.array(points).reshape(-1, 2)
+        nets = np.array(nets)
+
+        for start in range(0, len(points), 256):
+            chunk = points[start : start + 256]
+            gaps = np.linalg.norm(chunk[:, None] - points[None], axis=2)
+            foreign = nets[start : start + 256, None] != nets[None]
+            assert np.all(gaps[foreign] >= TRACK + CLEARANCE - 1e-6)
+
+        for pad in pads:
+            if layer in pad.layers:
+                dx = np.maximum(np.abs(points[:, 0] - pad.x) - pad.width / 2, 0)
+                dy = np.maximum(np.abs(points[:, 1] - pad.y) - pad.height / 2, 0)
+                gaps = np.hypot(dx, dy)[nets != pad.net]
+                assert np.all(gaps >= CLEARANCE + TRACK / 2 - 1e-6)
+
+        for via in result.vias:
+            gaps = np.linalg.norm(points - via.position, axis=1)[nets != via.net]
+            assert np.all(gaps >= via.diameter / 2 + CLEARANCE + TRACK / 2 - 1e-6)
+
+
+def _connected(pads, result, net):
+    """True if the tracks and vias of a net join all its pads."""
+    points = [(p.x, p.y) for p in pads if p.net == net]
+    pieces = [s for s in result.segments if s.net == net]
+    parent = list(range(len(points) + len(pieces)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def touches(p, segment):
+        return min(math.dist(p, q) for q in _samples(segment)) < 1e-6
+
+    pad_objects = [p for p in pads if p.net == net]
+    for j, segment in enumerate(pieces):
+        for i, pad in enumerate(pad_objects):
+            if any(_gap_to_pad(q, pad) < 1e-6 for q in (segment.start, segment.end)):
+                parent[find(i)] = find(len(points) + j)
+        for k, other in enumerate(pieces):
+            if k != j and (
+                touches(segment.start, other) or touches(segment.end, other)
+            ):
+                parent[find(len(points) + j)] = find(len(points) + k)
+    return len({find(i) for i in range(len(points))}) == 1
+
+
+class TestGridRouter:
+    """Test routing, clearances and connectivity."""
+
+    def test_simple_board_fully_routed(self):
+        pads = [
+            RoutePad("A", 0, 0),
+            RoutePad("A", 10, 0),
+            RoutePad("B", 5, -5),
+            RoutePad("B", 5, 5),
+            RoutePad("C", 2, 3, layers=("F.Cu", "B.Cu")),
+            RoutePad("C", 8, -3),
+            RoutePad("C", 9, 4),
+        ]
+        result = GridRouter(track_width=TRACK, clearance=CLEARANCE).route(pads)
+
+        assert result.completion == 1.0
+        assert sorted(result.routed_nets) == ["A", "B", "C"]
+        assert result.connections == 4
+        for net in "ABC":
+            assert _connected(pads, result, net)
+        _assert_clearances(pads, result)
+        # A and B cross, so one of them changes layer
+        assert result.vias
+
+    def test_random_board_respects_clearance(self):
+        rng = random.Random(4)
+        pads = []
+        for n in range(12):
+            for _ in range(rng.choice([2, 3])):
+                # Keep pads of the random layout legally apart
+                while True:
+                    x, y = round(rng.uniform(0, 20), 1), round(rng.uniform(0, 15), 1)
+                    if all(math.dist((x, y), (p.x, p.y)) > 1.5 for p in pads):
+                        break
+                pads.append(RoutePad(f"N{n}", x, y, 0.8, 0.6))
+        result = GridRouter(track_width=TRACK, clearance=CLEARANCE).route(pads)
+
+        assert result.completion > 0.8
+        _assert_clearances(pads, result)
+        for net in result.routed_nets:
+            assert _connected(pads, result, net)
+
+    def test_ripup_improves_dense_board(self):
+        rng = random.Random(0)
+        pads = []
+        for n in range(18):
+            for _ in range(rng.choice([2, 3])):
+                while True:
+                    x, y = round(rng.uniform(0, 12), 1), round(rng.uniform(0, 10), 1)
+                    if all(math.dist((x, y), (p.x, p.y)) > 1.3 for p in pads):
+                        break
+                pads.append(RoutePad(f"N{n}", x, y, 0.8, 0.6))
+        bounds = (-1, -1, 13, 11)
+
+        single_pass = GridRouter(bounds, max_ripups=0).route(pads)
+        result = GridRouter(bounds).route(pads)
+
+        assert result.ripups > 0
+        assert result.completion > single_pass.completion
+        _assert_clearances(pads, result)
+
+    def test_single_pad_nets_ignored(self):
+        result = GridRouter().route([RoutePad("A", 0, 0), RoutePad("B", 5, 5)])
+        assert result.connections == 0
+        assert result.completion == 1.0
+        assert result.segments == []
+
+    def test_walled_in_pad_reports_failure(self):
+        # A ring of through-hole GND pads around a lone pad of net X
+        pads = [RoutePad("X", 0, 0), RoutePad("X", 10, 0)]
+        ring = [(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3)]
+        for dx, dy in ring:
+            if max(abs(dx), abs(dy)) == 2:
+                pads.append(RoutePad("GND", dx, dy, 1.0, 1.0, ("F.Cu", "B.Cu")))
+        result = GridRouter().route(pads)
+
+        assert "X" in result.failed_nets
+        assert result.completion < 1.0
+        assert estimate_routability(pads) == pytest.approx(result.completion)
+
+
+class TestBoardPads:
+    """Test extraction of pads from board footprints."""
+
+    def test_rotated_footprint(self, make_footprint):
+        fp = make_footprint(
+            "R1",
+            10.0,
+            20.0,
+            [("VCC", 1.0), ("unconnected-(R1-Pad2)", -1.0, ["*.Cu"])],
+            layers=["F.Cu", "F.Paste", "F.Mask"],
+            rotation=90,
+            size=(1.0, 0.5),
+        )
+
+        (route_pad,) = board_pads(SimpleNamespace(footprints=[fp]))
+
+        assert route_pad.ref == "R1"
+        assert (route_pad.x, route_pad.y) == pytest.approx((10.0, 19.0))
+        assert (route_pad.width, route_pad.height) == pytest.approx((0.5, 1.0))
+        assert route_pad.layers == ("F.Cu",)
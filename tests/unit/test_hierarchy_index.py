@@ -0,0 +1,104 @@
+"""
+Unit tests for precomputed hierarchy tables used in net scoping.
+"""
+
+import random
+
+import pytest
+
+from circuit_synth.tools.utilities.hierarchy_index import HierarchyIndex
+from circuit_synth.tools.utilities.models import Circuit, Net
+from circuit_synth.tools.utilities.python_code_generator import PythonCodeGenerator
+
+
+def _chain_lca(users, tree):
+    """Reference LCA: intersect ancestor chains and take the deepest."""
+    parent = {c: p for p, children in tree.items() for c in children}
+
+    def chain(node):
+        nodes = [node]
+        while nodes[-1] in parent:
+            nodes.append(parent[nodes[-1]])
+        return nodes
+
+    common = set.intersection(*(set(chain(u)) for u in users))
+    if not common:
+        return "main"
+    return max(common, key=lambda n: len(chain(n)))
+
+
+def _random_tree(rng, size):
+    names = ["main"] + [f"sheet{i}" for i in range(1, size)]
+    tree = {name: [] for name in names}
+    for i, name in enumerate(names[1:], start=1):
+        tree[names[rng.randrange(i)]].append(name)
+    return tree
+
+
+class TestHierarchyIndex:
+    """Test parent, depth and LCA tables."""
+
+    @pytest.fixture
+    def index(self):
+        return HierarchyIndex(
+            {
+                "main": ["power", "mcu"],
+                "power": ["ldo", "buck"],
+                "mcu": ["usb"],
+                "usb": [],
+            }
+        )
+
+    def test_depth_and_ancestors(self, index):
+        assert index.get_depth("main") == 0
+        assert index.get_depth("usb") == 2
+        assert index.get_depth("unknown") == 0
+        assert index.get_ancestors("buck") == ["power", "main"]
+
+    def test_lca(self, index):
+        assert index.lca("ldo", "buck") == "power"
+        assert index.lca("ldo", "usb") == "main"
+        assert index.lca("usb", "mcu") == "mcu"
+        assert index.lca_of(["ldo", "buck", "usb"]) == "main"
+        assert index.lca("ldo", "unknown") is None
+
+    def test_forest_has_no_common_root(self):
+        index = HierarchyIndex({"a": ["a1"], "b": ["b1"]})
+        assert index.lca("a1", "b1") is None
+        assert index.lca("a1", "a") == "a"
+
+    def test_cycles_terminate(self):
+        index = HierarchyIndex({"a": ["b"], "b": ["a"]})
+        assert set(index.depth) == {"a", "b"}
+        assert index.get_ancestors("a") == ["b"]
+
+    def test_matches_ancestor_chains_on_random_trees(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            tree = _random_tree(rng, rng.randrange(2, 60))
+            index = HierarchyIndex(tree)
+            names = list(tree)
+            for _ in range(50):
+                users = rng.sample(names, rng.randrange(2, min(6, len(names)) + 1))
+                assert (index.lca_of(users) or "main") == _chain_lca(users, tree)
+
+
+class TestNetScoping:
+    """Test that the code generator scopes nets with the compiled tables."""
+
+    def test_shared_nets_created_at_lca(self):
+        tree = {"main": ["power", "mcu"], "power": ["ldo"], "mcu": [], "ldo": []}
+        circuits = {
+            "main": Circuit("main", [], [Net("VBAT", [])], ""),
+            "power": Circuit("power", [], [Net("EN", [])], ""),
+            "ldo": Circuit("ldo", [], [Net("EN", []), Net("SDA", [])], ""),
+            "mcu": Circuit("mcu", [], [Net("SDA", []), Net("LOCAL", [])], ""),
+        }
+
+        nets, shared = PythonCodeGenerator()._analyze_hierarchical_nets(circuits, tree)
+
+        assert set(nets["power"]) == {"EN"}
+        assert set(nets["main"]) == {"VBAT", "SDA"}
+        assert set(nets["mcu"]) == {"LOCAL"}
+        assert shared["ldo"] == sorted(shared["ldo"]) == ["EN", "SDA"]
+        assert shared["mcu"] == ["SDA"]
@@ -0,0 +1,175 @@
+"""
+Unit tests for the built-in MNA linear circuit solver.
+"""
+
+import numpy as np
+import pytest
+
+from circuit_synth.simulation import mna
+from circuit_synth.simulation.mna import (
+    MNAError,
+    MNASolver,
+    MNAUnsupportedError,
+    frequency_points,
+    parse_spice_value,
+    run_mna,
+)
+from circuit_synth.simulation.sweep import BatchSimulator
+
+RC_LOWPASS = """.title rc
+V1 in 0 DC 0 AC 1
+R1 in out 1k
+C1 out 0 159.155n
+"""
+
+
+class TestParsing:
+    """Test SPICE value and netlist parsing."""
+
+    @pytest.mark.parametrize(
+        "token,expected",
+        [
+            ("1000.0", 1000.0),
+            ("4.7k", 4700.0),
+            ("10MEG", 10e6),
+            ("10m", 10e-3),
+            ("100nF", 100e-9),
+            ("5.0V", 5.0),
+            ("1e-06", 1e-6),
+            ("2.2uH", 2.2e-6),
+        ],
+    )
+    def test_parse_spice_value(self, token, expected):
+        assert parse_spice_value(token) == pytest.approx(expected)
+
+    def test_unsupported_element_rejected(self):
+        with pytest.raises(MNAUnsupportedError):
+            MNASolver.from_netlist("D1 a 0 DefaultDiode\nR1 a 0 1k\n")
+
+    def test_empty_netlist_rejected(self):
+        with pytest.raises(MNAError):
+            MNASolver.from_netlist(".title empty\n")
+
+    def test_frequency_points_match_spice_decades(self):
+        freqs = frequency_points(10, 1e4, 10, "dec")
+        assert len(freqs) == 31
+        assert freqs[0] == pytest.approx(10)
+        assert freqs[-1] == pytest.approx(1e4)
+
+
+class TestOperatingPoint:
+    """Test DC operating point solutions."""
+
+    def test_voltage_divider(self):
+        solver = MNASolver.from_netlist("V1 vin 0 10\nR1 vin out 1k\nR2 out 0 3k\n")
+        result = solver.operating_point()
+        assert result["out"][0] == pytest.approx(7.5)
+        assert result.vin[0] == pytest.approx(10.0)
+        # Source current flows out of the + terminal: -10V / 4k
+        assert result["I(V1)"][0] == pytest.approx(-2.5e-3)
+
+    def test_capacitor_open_inductor_short(self):
+        solver = MNASolver.from_netlist(
+            "V1 a 0 5\nR1 a b 100\nL1 b c 1m\nR2 c 0 100\nC1 c 0 1u\n"
+        )
+        result = solver.operating_point()
+        assert result["b"][0] == pytest.approx(2.5)
+        assert result["c"][0] == pytest.approx(2.5)
+
+    def test_current_source_and_vcvs(self):
+        solver = MNASolver.from_netlist(
+            "I1 0 a 1m\nR1 a 0 1k\nE1 b 0 a 0 10\nR2 b 0 1k\n"
+        )
+        result = solver.operating_point()
+        assert result["a"][0] == pytest.approx(1.0)
+        assert result["b"][0] == pytest.approx(10.0)
+
+    def test_floating_node_does_not_crash(self):
+        solver = MNASolver.from_netlist("V1 a 0 1\nR1 a 0 1k\nC1 x y 1n\n")
+        assert solver.operating_point()["a"][0] == pytest.approx(1.0)
+
+
+class TestACAnalysis:
+    """Test vectorized AC sweeps."""
+
+    def test_rc_lowpass_corner(self):
+        solver = MNASolver.from_netlist(RC_LOWPASS)
+        freqs = np.array([10.0, 1000.0, 100000.0])
+        result = solver.ac(freqs)
+
+        gain = np.abs(result["out"])
+        assert gain[0] == pytest.approx(1.0, abs=1e-3)
+        assert gain[1] == pytest.approx(1 / np.sqrt(2), rel=1e-3)
+        assert gain[2] == pytest.approx(0.01, rel=1e-2)
+        assert np.angle(result["out"][1], deg=True) == pytest.approx(-45, abs=0.1)
+
+    def test_explicit_ac_source_overrides_netlist(self):
+        solver = MNASolver.from_netlist("V1 in 0 5\nR1 in out 1k\nC1 out 0 159.155n\n")
+        assert not np.any(solver.ac([1000.0])["out"])
+        result = solver.ac([1000.0], ac_source="V1")
+        assert abs(result["out"][0]) == pytest.approx(1 / np.sqrt(2), rel=1e-3)
+
+    def test_sparse_path_matches_dense(self, monkeypatch):
+        freqs = frequency_points(10, 1e6, 5)
+        dense = MNASolver.from_netlist(RC_LOWPASS).ac(freqs)["out"]
+        monkeypatch.setattr(mna, "DENSE_LIMIT", 0)
+        sparse = MNASolver.from_netlist(RC_LOWPASS).ac(freqs)["out"]
+        np.testing.assert_allclose(sparse, dense, rtol=1e-9)
+
+    def test_rlc_ladder_sweep_shape(self):
+        lines = ["V1 n0 0 AC 1"]
+        for i in range(100):
+            lines.append(f"L{i} n{i} m{i} 1u")
+            lines.append(f"R{i} m{i} n{i + 1} 1")
+            lines.append(f"C{i} n{i + 1} 0 1n")
+        lines.append("RL n100 0 50")
+        freqs = frequency_points(1e3, 1e8, 20)
+
+        result = MNASolver.from_netlist("\n".join(lines)).ac(freqs)
+
+        assert result["n100"].shape == freqs.shape
+        assert abs(result["n100"][0]) > 0.1
+
+
+class TestIntegration:
+    """Test use as a batch runner."""
+
+    def test_run_mna_as_batch_runner(self):
+        batch = BatchSimulator(
+            "V1 in 0 10\nR1 in out 1000.0\nR2 out 0 1000.0\n",
+            max_workers=1,
+            backend="mna",
+        )
+        result = batch.parameter_sweep({"R2": [1000.0, 3000.0]})
+        np.testing.assert_allclose(result.get_voltage("out", index=0), [5.0, 7.5])
+
+    def test_run_mna_rejects_transient(self):
+        with pytest.raises(MNAUnsupportedError):
+            run_mna("V1 a 0 1\nR1 a 0 1\n", "transient", {})
+
+    def test_circuit_simulator_mna_backend(self):
+        from circuit_synth.core import Circuit, Component, Net
+        from circuit_synth.core.decorators import set_current_circuit
+        from circuit_synth.simulation import CircuitSimulator
+
+        circuit = Circuit("rc_filter")
+        set_current_circuit(circuit)
+        try:
+            vin, out, gnd = Net("VIN"), Net("OUT"), Net("GND")
+            r1 = Component("Device:R", ref="R1", value="1k")
+            c1 = Component("Device:C", ref="C1", value="159.155nF")
+            r1[1] += vin
+            r1[2] += out
+            c1[1] += out
+            c1[2] += gnd
+        finally:
+            set_current_circuit(None)
+
+        sim = CircuitSimulator(circuit, backend="mna")
+        op = sim.operating_point()
+        assert op.get_voltage("OUT") == pytest.approx(5.0)
+
+        ac = sim.ac_analysis(10, 1e5, points=10, ac_source="V_supply_1")
+        gain = np.abs(ac.analysis["OUT"])
+        corner = np.argmin(np.abs(ac.analysis.frequency - 1000.0))
+        assert gain[corner] == pytest.approx(1 / np.sqrt(2), rel=1e-3)
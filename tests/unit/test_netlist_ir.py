@@ -0,0 +1,243 @@
+"""
+Unit tests for the columnar netlist IR shared by the exporters.
+"""
+
+import json
+
+import pytest
+
+from circuit_synth.core import Circuit, Component, Net
+from circuit_synth.core.decorators import set_current_circuit
+from circuit_synth.core.exception import CircuitSynthError
+from circuit_synth.core.json_encoder import CircuitSynthJSONEncoder
+from circuit_synth.core.netlist_exporter import NetlistExporter
+from circuit_synth.core.netlist_ir import MISSING, NetlistIR
+from circuit_synth.kicad.netlist_service import CircuitDataLoader
+from circuit_synth.simulation.converter import SpiceConverter
+
+
+def _json(data):
+    return json.loads(json.dumps(data, cls=CircuitSynthJSONEncoder))
+
+
+@pytest.fixture
+def design():
+    """Root with R1 and a "filter" subcircuit holding R2 and C1."""
+    root = Circuit("top")
+    set_current_circuit(root)
+    vin, gnd = Net("VIN"), Net("GND")
+    r1 = Component("Device:R", ref="R1", value="10k")
+    # Connect in reverse pin order; the IR keeps symbol order
+    r1[2] += gnd
+    r1[1] += vin
+
+    sub = Circuit("filter")
+    set_current_circuit(sub)
+    out = Net("OUT")
+    r2 = Component("Device:R", ref="R2", value="10k")
+    c1 = Component("Device:C", ref="C1", value="100n")
+    r2[1] += vin
+    r2[2] += out
+    c1[1] += out
+    c1[2] += gnd
+    root.add_subcircuit(sub)
+
+    set_current_circuit(root)
+    yield root
+    set_current_circuit(None)
+
+
+class TestFromCircuit:
+    """Test building the IR from live circuits."""
+
+    def test_columns_are_interned(self, design):
+        ir = NetlistIR.from_circuit(design)
+        symbols = ir.component_columns["symbol"]
+        values = ir.component_columns["value"]
+
+        assert ir.sheet_count == 2
+        assert [ir.strings[p] for p in ir.sheet_path] == ["/", "/filter/"]
+        assert [ir.component_ref(row) for row in range(3)] == ["R1", "R2", "C1"]
+        assert symbols[0] == symbols[1] != symbols[2]
+        assert values[0] == values[1]
+        # Every pin is passive, so all pin type entries share one id
+        assert len(set(ir.pin_columns["func"])) == 1
+        assert len(set(ir.node_columns["type"])) == 1
+
+    def test_to_dict_lists_local_nodes_per_sheet(self, design):
+        data = NetlistIR.from_circuit(design).to_dict()
+
+        assert list(data["components"]) == ["R1"]
+        # Nets in first-use order over the sheet's pins
+        assert list(data["nets"]) == ["VIN", "GND"]
+        (node,) = data["nets"]["VIN"]["nodes"]
+        assert node["component"] == "R1"
+        assert (node["pin"]["number"], node["pin"]["name"]) == ("1", "~")
+        sub = data["subcircuits"][0]
+        assert sub["name"] == "filter"
+        assert list(sub["components"]) == ["R2", "C1"]
+        # VIN and GND belong to the parent, so the sheet lists bare nodes
+        assert isinstance(sub["nets"]["VIN"], list)
+        assert sub["nets"]["OUT"]["is_power"] is False
+        assert [p["pin_id"] for p in data["components"]["R1"]["pins"]] == ["1", "2"]
+        assert data["components"]["R1"] == design._components["R1"].to_dict()
+
+    def test_dict_round_trip(self, design):
+        plain = _json(NetlistIR.from_circuit(design).to_dict())
+        assert NetlistIR.from_circuit(design).to_dict(plain=True) == plain
+        assert NetlistIR.from_dict(plain).to_dict() == plain
+
+    def test_to_dict_before_columns_is_a_copy(self, design):
+        ir = NetlistIR.from_circuit(design)
+        data = ir.to_dict()
+        data["components"]["R1"]["pins"][0]["pin_id"] = "9"
+        data["nets"]["VIN"]["nodes"].clear()
+
+        # The columns are built from the walk, not from the returned copy
+        assert ir.component_count == 3
+        assert ir.to_dict() == NetlistIR.from_circuit(design).to_dict()
+
+    def test_flatten_with_sheet_prefixes(self, design):
+        flat = NetlistIR.from_circuit(design).flatten(prefix_refs=True)
+
+        assert list(flat["components"]) == ["R1", "filter_R2", "filter_C1"]
+        assert flat["components"]["filter_R2"]["ref"] == "R2"
+        assert [n["component"] for n in flat["nets"]["VIN"]] == ["R1", "filter_R2"]
+        assert flat["subcircuits"] == []
+
+    def test_flattened_list_keeps_component_attributes(self, design):
+        design._components["R1"].footprint = None
+        c1 = design._subcircuits[0]._components["C1"]
+        c1.footprint = "Capacitor_SMD:C_0603_1608Metric"
+        top, sub = NetlistIR.from_circuit(design).to_flattened_list()
+
+        assert top["components"]["R1"] == {
+            "symbol": "Device:R",
+            "value": "10k",
+            "footprint": None,
+        }
+        assert sub["parent"] == "top"
+        assert sub["components"]["C1"]["footprint"] == c1.footprint
+
+    def test_pin_nets_follow_symbol_order(self, design):
+        ir = NetlistIR.from_circuit(design)
+        assert ir.pin_nets()["R1"] == [("1", "~", "VIN"), ("2", "~", "GND")]
+
+        walked = SpiceConverter(design)
+        walked._build_pin_index()
+        indexed = SpiceConverter(design, netlist_ir=ir)
+        indexed._build_pin_index()
+        assert indexed.pin_index["R1"] == walked.pin_index["R1"]
+
+    def test_bom_rows(self, design):
+        rows = NetlistIR.from_circuit(design).bom_rows(group_by=("value",))
+        assert rows == [
+            {"value": "10k", "refs": ["R1", "R2"], "quantity": 2},
+            {"value": "100n", "refs": ["C1"], "quantity": 1},
+        ]
+        with pytest.raises(ValueError):
+            NetlistIR().bom_rows(group_by=("mpn",))
+
+
+class TestExporterSharing:
+    """Test that one exporter renders every format from one IR."""
+
+    def test_single_traversal_for_several_formats(self, design, tmp_path, monkeypatch):
+        builds = []
+        from_circuit = NetlistIR.from_circuit.__func__
+
+        def counting(cls, circuit):
+            builds.append(circuit.name)
+            return from_circuit(cls, circuit)
+
+        monkeypatch.setattr(NetlistIR, "from_circuit", classmethod(counting))
+        exporter = NetlistExporter(design)
+        exporter.to_flattened_list()
+        exporter.generate_json_netlist(str(tmp_path / "top.json"))
+        exporter.generate_kicad_netlist(str(tmp_path / "top.net"))
+
+        assert builds == ["top"]
+        netlist = (tmp_path / "top.net").read_text()
+        assert netlist.startswith("(export")
+        assert '(ref "C1")' in netlist
+
+    def test_failed_kicad_export_keeps_previous_netlist(self, design, tmp_path):
+        output = tmp_path / "top.net"
+        output.write_text("(export previous)")
+        design._components["R1"].symbol = "R"
+
+        with pytest.raises(CircuitSynthError):
+            NetlistExporter(design).generate_kicad_netlist(str(output))
+        assert output.read_text() == "(export previous)"
+
+
+class TestFromDict:
+    """Test building the IR from circuit JSON, including legacy layouts."""
+
+    DATA = {
+        "name": "root",
+        "source_file": "root.kicad_sch",
+        "components": {"R1": {"symbol": "Device:R", "value": "1k"}},
+        "nets": {
+            "A": [{"component": "R1", "pin": {"number": "1"}}],
+            "B": {"connections": [{"component": "R1", "pin": {"number": "2"}}]},
+        },
+        "subcircuits": [
+            {
+                "name": "child",
+                "components": {"U1": {"symbol": "X:Y", "ref": "U1"}},
+                "nets": {
+                    "A": {
+                        "nodes": [
+                            {"component": "U1", "pin": {"number": "3"}, "extra": 1},
+                            "not-a-node",
+                        ],
+                        "is_power": False,
+                    }
+                },
+            }
+        ],
+    }
+
+    def test_flatten_matches_netlist_service(self):
+        flat = CircuitDataLoader()._flatten_hierarchical_data(self.DATA)
+
+        assert flat["source_file"] == "root.kicad_sch"
+        assert flat["components"]["R1"] == {
+            "symbol": "Device:R",
+            "value": "1k",
+            "ref": "R1",
+        }
+        assert flat["nets"] == {
+            "A": [
+                {"component": "R1", "pin": {"number": "1"}},
+                {"component": "U1", "pin": {"number": "3"}, "extra": 1},
+                "not-a-node",
+            ],
+            "B": [{"component": "R1", "pin": {"number": "2"}}],
+        }
+        assert flat["subcircuits"] == []
+
+    def test_components_pass_through_unchanged(self):
+        data = {
+            "name": "root",
+            "components": {
+                "U1": {"symbol": "X:Y", "pins": {"1": "VCC", "2": "GND"}},
+                "U2": {"symbol": "X:Y", "pins": [{"pin_id": "2"}, {"pin_id": "1"}]},
+                "U3": {"symbol": "X:Y", "pins": None},
+            },
+            "nets": {},
+        }
+        flat = CircuitDataLoader()._flatten_hierarchical_data(data)
+
+        for ref, comp in data["components"].items():
+            assert flat["components"][ref] == {**comp, "ref": ref}
+
+    def test_missing_fields_stay_missing(self):
+        ir = NetlistIR.from_dict(self.DATA)
+        assert ir.component_columns["footprint"][0] == MISSING
+        assert ir.to_dict()["components"] == self.DATA["components"]
+        assert (
+            ir.to_dict()["subcircuits"][0]["nets"]
+            == self.DATA["subcircuits"][0]["nets"]
+        )
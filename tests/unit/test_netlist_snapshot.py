@@ -0,0 +1,130 @@
+"""
+Unit tests for the binary netlist snapshot sibling of circuit JSON files.
+"""
+
+import json
+
+import pytest
+
+from circuit_synth.core import Circuit, Component, Net
+from circuit_synth.core.decorators import set_current_circuit
+from circuit_synth.core.exception import ParseError
+from circuit_synth.core.netlist_snapshot import (
+    NetlistSnapshot,
+    load_circuit_json,
+    open_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+
+DESIGN = {
+    "name": "top",
+    "components": {"R1": {"symbol": "Device:R", "ref": "R1", "value": "1k"}},
+    "nets": {"VIN": [{"component": "R1", "pin": {"number": "1"}}]},
+    "subcircuits": [
+        {
+            "name": "power",
+            "components": {"U1": {"symbol": "Reg:LDO", "ref": "U1"}},
+            "nets": {},
+            "subcircuits": [
+                {
+                    "name": "filter",
+                    "components": {"C1": {"symbol": "Device:C", "ref": "C1"}},
+                    "nets": {},
+                    "subcircuits": [],
+                }
+            ],
+        },
+        {"name": "mcu", "components": {}, "nets": {}, "subcircuits": []},
+    ],
+}
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    path = tmp_path / "top.json"
+    path.write_text(json.dumps(DESIGN, indent=2))
+    write_snapshot(path)
+    return path
+
+
+class TestSnapshot:
+    """Test writing and lazily reading snapshots."""
+
+    def test_full_load_matches_json(self, json_file):
+        snapshot = open_snapshot(json_file)
+
+        assert snapshot.sheet_names == ["top", "power", "filter", "mcu"]
+        assert snapshot.children(0) == [1, 3]
+        assert snapshot.load() == DESIGN
+
+    def test_load_single_sheet(self, json_file, monkeypatch):
+        snapshot = open_snapshot(json_file)
+        parsed = []
+        loads = json.loads
+        monkeypatch.setattr(
+            "circuit_synth.core.netlist_snapshot.json.loads",
+            lambda raw: parsed.append(raw) or loads(raw),
+        )
+
+        power = snapshot.load_sheet("power")
+        assert power == DESIGN["subcircuits"][0]
+        assert len(parsed) == 2
+
+        top = snapshot.load_sheet(include_children=False)
+        assert "subcircuits" not in top
+        assert top["components"] == DESIGN["components"]
+        # Only the root blob is parsed, none of the subcircuits
+        assert b"U1" not in parsed[-1]
+
+    def test_stale_snapshot_is_ignored(self, json_file):
+        changed = dict(DESIGN, name="renamed")
+        json_file.write_text(json.dumps(changed))
+
+        assert open_snapshot(json_file) is None
+        assert load_circuit_json(json_file)["name"] == "renamed"
+
+    def test_corrupt_snapshot(self, json_file):
+        snapshot_path(json_file).write_bytes(b"not a snapshot")
+
+        with pytest.raises(ParseError):
+            NetlistSnapshot.open(snapshot_path(json_file))
+        assert open_snapshot(json_file) is None
+
+
+class TestLoadCircuitJson:
+    """Test that snapshot and JSON fallback load the same data."""
+
+    @pytest.mark.parametrize("with_snapshot", [True, False])
+    def test_same_result_with_and_without_snapshot(self, json_file, with_snapshot):
+        if not with_snapshot:
+            snapshot_path(json_file).unlink()
+
+        assert load_circuit_json(json_file) == DESIGN
+        assert load_circuit_json(json_file, "mcu") == DESIGN["subcircuits"][1]
+        filter_sheet = load_circuit_json(json_file, "filter", include_children=False)
+        assert filter_sheet["components"] == {"C1": {"symbol": "Device:C", "ref": "C1"}}
+        assert "subcircuits" not in filter_sheet
+        with pytest.raises(KeyError):
+            load_circuit_json(json_file, "missing")
+
+    def test_generate_json_netlist_writes_snapshot(self, tmp_path):
+        root = Circuit("board")
+        set_current_circuit(root)
+        try:
+            r1 = Component("Device:R", ref="R1", value="10k")
+            r1[1] += Net("VIN")
+            sub = Circuit("child")
+            set_current_circuit(sub)
+            Component("Device:C", ref="C1", value="100n")[1] += Net("OUT")
+            root.add_subcircuit(sub)
+        finally:
+            set_current_circuit(None)
+
+        json_file = tmp_path / "board.json"
+        root.generate_json_netlist(str(json_file), snapshot=True)
+
+        snapshot = open_snapshot(json_file)
+        assert snapshot is not None
+        assert snapshot.load() == json.loads(json_file.read_text())
+        assert list(snapshot.load_sheet("child")["components"]) == ["C1"]
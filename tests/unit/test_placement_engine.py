@@ -0,0 +1,151 @@
+"""
+Unit tests for PlacementEngine's occupancy map and next-fit placement.
+"""
+
+import random
+
+from kicad_sch_api.core.types import Point, Schematic, SchematicSymbol, Sheet
+
+from circuit_synth.kicad.schematic.placement import (
+    ElementBounds,
+    OccupancyMap,
+    PlacementEngine,
+)
+
+
+def _symbol(ref, x=0.0, y=0.0, lib_id="Device:R"):
+    return SchematicSymbol(
+        uuid=ref, lib_id=lib_id, position=Point(x, y), reference=ref, value="10k"
+    )
+
+
+def _reference_next_fit(engine, occupied, size):
+    """Straightforward scan over a list of bounds, as the engine did before."""
+    width, height = size
+    x = y = engine.margin
+    for _ in range(1000):
+        test = ElementBounds(x - width / 2, y - height / 2, width, height)
+        hit = next((b for b in occupied if test.overlaps(b)), None)
+        if hit is not None:
+            x = max(x, hit.right + 5.08 + width / 2)
+        elif engine._check_within_bounds(x, y, width, height):
+            return engine._snap_to_grid((x, y))
+        x += width + 5.08
+        if x + width / 2 > engine.sheet_size[0] - engine.margin:
+            row_start = engine.margin
+            for b in occupied:
+                if b.y <= y + height + 5.08 and b.bottom > y:
+                    row_start = max(row_start, b.right + 5.08 + width / 2)
+            x = row_start
+            y += height + 5.08
+        if y + height / 2 > engine.sheet_size[1] - engine.margin:
+            break
+    return (engine.margin, engine.margin)
+
+
+class TestOccupancyMap:
+    """Test the grid-bucketed rectangle index."""
+
+    def test_first_overlap_follows_order(self):
+        occupancy = OccupancyMap(cell_size=10)
+        occupancy.add("late", ElementBounds(0, 0, 50, 50), order=5)
+        occupancy.add("early", ElementBounds(20, 20, 5, 5), order=1)
+
+        hit = occupancy.first_overlap(ElementBounds(18, 18, 4, 4))
+        assert (hit.x, hit.y) == (20, 20)
+        assert occupancy.first_overlap(ElementBounds(60, 60, 1, 1)) is None
+
+    def test_touching_edges_overlap(self):
+        occupancy = OccupancyMap(cell_size=10)
+        occupancy.add("a", ElementBounds(0, 0, 10, 10))
+        assert occupancy.first_overlap(ElementBounds(10, 0, 5, 5)) is not None
+
+    def test_remove_and_band(self):
+        occupancy = OccupancyMap(cell_size=10)
+        occupancy.add("a", ElementBounds(0, 0, 10, 10))
+        occupancy.add("b", ElementBounds(0, 40, 10, 10))
+        occupancy.add("huge", ElementBounds(500, 0, 1e6, 1e6))
+
+        band = {(b.x, b.y) for b in occupancy.in_band(5, 30)}
+        assert band == {(0, 0), (500, 0)}
+
+        occupancy.remove("a")
+        occupancy.remove("huge")
+        assert len(occupancy) == 1
+        assert list(occupancy.in_band(5, 30)) == []
+
+
+class TestPlacementEngine:
+    """Test incremental next-fit placement."""
+
+    def test_matches_list_scan(self):
+        rng = random.Random(7)
+        schematic = Schematic()
+        for i in range(8):
+            schematic.components.append(
+                _symbol(f"E{i}", rng.uniform(30, 180), rng.uniform(30, 260))
+            )
+        schematic.sheets.append(
+            Sheet(
+                uuid="s",
+                position=Point(60, 60),
+                size=(30.48, 25.4),
+                name="sub",
+                filename="sub.kicad_sch",
+            )
+        )
+        engine = PlacementEngine(schematic)
+
+        for i in range(40):
+            comp = _symbol(f"R{i}", lib_id=rng.choice(["Device:R", "MCU:X"]))
+            expected = _reference_next_fit(
+                engine,
+                engine._get_occupied_bounds(),
+                engine._estimate_component_size(comp),
+            )
+            position = engine.find_position(component=comp)
+            assert position == expected
+            comp.position = Point(*position)
+            schematic.components.append(comp)
+
+    def test_tracks_moves_and_removals(self):
+        schematic = Schematic()
+        engine = PlacementEngine(schematic)
+        free = engine.find_position(component=_symbol("R2"))
+
+        blocker = _symbol("R1", *free)
+        schematic.components.append(blocker)
+        assert engine.find_position(component=_symbol("R2")) != free
+
+        blocker.position = Point(150, 250)
+        assert engine.find_position(component=_symbol("R2")) == free
+
+        schematic.components.clear()
+        assert len(engine._get_occupied_bounds()) == 0
+
+    def test_sizes_estimated_once(self, monkeypatch):
+        schematic = Schematic()
+        engine = PlacementEngine(schematic)
+        calls = []
+        estimate = engine._estimate_component_size
+        monkeypatch.setattr(
+            engine,
+            "_estimate_component_size",
+            lambda comp: calls.append(comp.reference) or estimate(comp),
+        )
+
+        for i in range(20):
+            comp = _symbol(f"R{i}")
+            comp.position = Point(*engine.find_position(component=comp))
+            schematic.components.append(comp)
+
+        assert len(calls) == 20
+
+    def test_no_console_output(self, capsys):
+        schematic = Schematic()
+        engine = PlacementEngine(schematic)
+        for i in range(5):
+            comp = _symbol(f"R{i}")
+            comp.position = Point(*engine.find_position(component=comp))
+            schematic.components.append(comp)
+        assert capsys.readouterr().out == ""
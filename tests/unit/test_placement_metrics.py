@@ -0,0 +1,169 @@
+"""
+Unit tests for PCB placement metrics and best-of placement selection.
+"""
+
+import itertools
+import math
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from circuit_synth.kicad.pcb_gen.pcb_generator import PCBGenerator
+from circuit_synth.pcb.placement_metrics import (
+    PlacementMetrics,
+    count_crossings,
+    mst_edges,
+)
+
+
+def _random_metrics(seed=5, footprints=30, nets=25):
+    rng = random.Random(seed)
+    positions = {
+        f"U{i}": (rng.uniform(0, 80), rng.uniform(0, 60)) for i in range(footprints)
+    }
+    pins = []
+    for n in range(nets):
+        for ref in rng.sample(sorted(positions), rng.randint(1, 6)):
+            pins.append((ref, f"N{n}", rng.uniform(-2, 2), rng.uniform(-2, 2)))
+    return PlacementMetrics(positions, pins), positions, pins
+
+
+def _brute_hpwl(positions, pins):
+    by_net = {}
+    for ref, net, dx, dy in pins:
+        x, y = positions[ref]
+        by_net.setdefault(net, []).append((x + dx, y + dy))
+    total = 0.0
+    for points in by_net.values():
+        if len(points) > 1:
+            xs, ys = zip(*points)
+            total += max(xs) - min(xs) + max(ys) - min(ys)
+    return total
+
+
+def _kruskal_length(points):
+    edges = sorted(
+        (math.dist(points[a], points[b]), a, b)
+        for a, b in itertools.combinations(range(len(points)), 2)
+    )
+    parent = list(range(len(points)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    total = 0.0
+    for length, a, b in edges:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[ra] = rb
+            total += length
+    return total
+
+
+class TestPlacementMetrics:
+    """Test full and incremental metric computation."""
+
+    def test_hpwl_matches_brute_force(self):
+        metrics, positions, pins = _random_metrics()
+        assert metrics.total_hpwl == pytest.approx(_brute_hpwl(positions, pins))
+
+    def test_incremental_moves_match_recompute(self):
+        metrics, positions, pins = _random_metrics()
+        rng = random.Random(9)
+        for _ in range(200):
+            ref = rng.choice(sorted(positions))
+            x, y = rng.uniform(0, 80), rng.uniform(0, 60)
+
+            before = metrics.total_hpwl
+            predicted = metrics.move_delta(ref, x, y)
+            assert metrics.total_hpwl == before
+            assert metrics.move(ref, x, y) == pytest.approx(predicted)
+
+            positions[ref] = (x, y)
+            assert metrics.position(ref) == pytest.approx((x, y))
+        assert metrics.total_hpwl == pytest.approx(_brute_hpwl(positions, pins))
+
+    def test_ratsnest_is_minimum_spanning_tree(self):
+        metrics, positions, pins = _random_metrics()
+        metrics.move("U3", 10.0, 10.0)
+        positions["U3"] = (10.0, 10.0)
+
+        expected = 0.0
+        for net in metrics.nets:
+            points = [
+                (positions[ref][0] + dx, positions[ref][1] + dy)
+                for ref, name, dx, dy in pins
+                if name == net
+            ]
+            expected += _kruskal_length(points)
+        assert metrics.ratsnest_length() == pytest.approx(expected)
+
+    def test_mst_edges_span_all_points(self):
+        points = np.random.default_rng(1).uniform(0, 10, size=(12, 2))
+        edges = mst_edges(points)
+        assert len(edges) == 11
+        assert {i for edge in edges for i in edge} == set(range(12))
+
+    def test_crossings(self):
+        segments = np.array(
+            [
+                [0, 0, 10, 10],  # net 0
+                [0, 10, 10, 0],  # net 1, crosses net 0
+                [10, 10, 20, 0],  # net 1, shares an end point with net 0
+                [0, 1, 10, 11],  # net 0, crosses net 1 but not itself
+            ],
+            dtype=float,
+        )
+        assert count_crossings(segments, np.array([0, 1, 1, 0])) == 2
+
+    def test_from_board(self, make_footprint):
+        pcb = SimpleNamespace(
+            footprints=[
+                make_footprint("R1", 0, 0, [("A", -1.0), ("B", 1.0)]),
+                make_footprint("R2", 10, 0, [("A", -1.0), ("C", 1.0)]),
+            ]
+        )
+        metrics = PlacementMetrics.from_board(pcb)
+        assert metrics.nets == ["A"]
+        assert metrics.summary() == {
+            "nets": 1,
+            "hpwl": 10.0,
+            "ratsnest": 10.0,
+            "crossings": 0,
+        }
+
+
+class TestBestPlacement:
+    """Test PCBGenerator picking the best of several placements."""
+
+    def test_keeps_shortest_ratsnest(self, make_footprint):
+        layouts = {
+            "hierarchical": {"R1": (0, 0), "R2": (30, 0)},
+            "spiral": {"R1": (0, 0), "R2": (5, 0)},
+            "external": {"R1": (0, 0), "R2": (12, 0)},
+        }
+        pcb = SimpleNamespace(
+            footprints=[
+                make_footprint("R1", 0, 0, [("A", 1.0)]),
+                make_footprint("R2", 30, 0, [("A", -1.0)]),
+            ]
+        )
+
+        def auto_place_components(algorithm, **kwargs):
+            for fp in pcb.footprints:
+                x, y = layouts[algorithm][fp.reference]
+                fp.position = SimpleNamespace(x=x, y=y)
+
+        pcb.auto_place_components = auto_place_components
+        generator = PCBGenerator.__new__(PCBGenerator)
+
+        kept = generator._select_best_placement(
+            pcb, "hierarchical", ["external", "spiral"]
+        )
+
+        assert kept == "spiral"
+        assert [fp.position.x for fp in pcb.footprints] == [0, 5]
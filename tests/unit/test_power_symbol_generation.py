@@ -459,5 +459,61 @@ class TestProjectFolderNaming:
             )
 
 
+class TestPowerValuePositionPatch:
+    """Test the single-pass Value position patcher."""
+
+    @staticmethod
+    def _symbol(uuid, value, x=10, y=20):
+        return (
+            f'\t(symbol\n\t\t(lib_id "power:{value}")\n\t\t(at {x} {y} 0)\n'
+            f'\t\t(uuid "{uuid}")\n'
+            f'\t\t(property "Reference" "#PWR01"\n\t\t\t(at {x} {y} 0)\n\t\t)\n'
+            f'\t\t(property "Value" "{value}"\n\t\t\t(at {x} {y} 0)\n\t\t)\n'
+            f'\t\t(pin "1"\n\t\t\t(uuid "{uuid}-pin")\n\t\t)\n\t)\n'
+        )
+
+    def test_value_position_by_rotation(self):
+        from circuit_synth.kicad.sch_gen.schematic_writer import power_value_position
+
+        assert power_value_position((10, 20), 0, "power:VCC") == (10, 20 - 5.08)
+        assert power_value_position((10, 20), 0, "power:GND") == (10, 20 + 5.08)
+        assert power_value_position((10, 20), 90, "power:GND") == (10 + 5.08, 20)
+        assert power_value_position((10, 20), 270, "power:+3V3") == (10 + 5.08, 20)
+        assert power_value_position((10, 20), 45, "power:GND") is None
+
+    def test_patches_only_targeted_symbols(self):
+        from circuit_synth.kicad.sch_gen.schematic_writer import (
+            patch_power_value_positions,
+        )
+
+        content = (
+            self._symbol("a", "GND")
+            + self._symbol("b", "VCC")
+            + self._symbol("c", "+3V3")
+        )
+        patched, count = patch_power_value_positions(
+            content, {"a": ("GND", (10, 25.08)), "c": ("+3V3", (10, 14.92))}
+        )
+
+        assert count == 2
+        values = re.findall(
+            r'property "Value" "([^"]+)"\s*\(at ([\d.]+ [\d.]+)', patched
+        )
+        assert values == [("GND", "10 25.08"), ("VCC", "10 20"), ("+3V3", "10 14.92")]
+        # Reference positions are untouched
+        assert patched.count('"#PWR01"\n\t\t\t(at 10 20 0)') == 3
+
+    def test_value_mismatch_is_skipped(self):
+        from circuit_synth.kicad.sch_gen.schematic_writer import (
+            patch_power_value_positions,
+        )
+
+        content = self._symbol("a", "GND")
+        patched, count = patch_power_value_positions(content, {"a": ("VCC", (1, 2))})
+
+        assert count == 0
+        assert patched == content
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,276 @@
+"""
+Unit tests for the indexed schematic search engine.
+"""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+from kicad_sch_api.core.types import Point, Schematic, SchematicSymbol, Wire
+
+from circuit_synth.kicad.core import BoundingBox
+from circuit_synth.kicad.schematic.bucket_grid import BucketGrid
+from circuit_synth.kicad.schematic.search_engine import (
+    MatchType,
+    SearchEngine,
+    SearchQuery,
+    SearchQueryBuilder,
+    literal_prefix,
+)
+from circuit_synth.kicad.schematic.synchronizer import APISynchronizer, SyncReport
+
+
+def _symbol(ref, value, lib_id="Device:R", footprint=None, x=0.0, y=0.0, **props):
+    return SchematicSymbol(
+        uuid="",
+        lib_id=lib_id,
+        position=Point(x, y),
+        reference=ref,
+        value=value,
+        footprint=footprint,
+        properties=props,
+    )
+
+
+def _scan(engine, query):
+    """Reference implementation: check every component."""
+    return [c for c in engine.schematic.components if engine._matches_query(c, query)]
+
+
+@pytest.fixture
+def schematic():
+    components = [
+        _symbol("R1", "10k", footprint="Resistor_SMD:R_0603", x=10, y=10, MPN="RC0603"),
+        _symbol("R2", "4.7k", footprint="Resistor_SMD:R_0805", x=60, y=10),
+        _symbol("C1", "100nF", "Device:C", "Capacitor_SMD:C_0603", x=10, y=60),
+        _symbol("C2", "10uF", "Device:C", "Capacitor_SMD:C_0805", x=200, y=200),
+        _symbol("U1", "STM32F4", "MCU_ST:STM32F4", x=100, y=100, MPN="STM32F405"),
+        _symbol("R1", "1k", footprint="Resistor_SMD:R_0603", x=12, y=12),
+    ]
+    return Schematic(components=components)
+
+
+class TestLiteralPrefix:
+    """Test prefix extraction used by the query planner."""
+
+    @pytest.mark.parametrize(
+        "pattern,match_type,expected",
+        [
+            ("R1", MatchType.EXACT, "R1"),
+            ("R*", MatchType.WILDCARD, "R"),
+            ("STM32?4", MatchType.WILDCARD, "STM32"),
+            ("^Device:", MatchType.REGEX, "Device:"),
+            ("^ab+c", MatchType.REGEX, "a"),
+            ("^R|C", MatchType.REGEX, ""),
+            ("R1", MatchType.REGEX, ""),
+            ("R1", MatchType.CONTAINS, ""),
+        ],
+    )
+    def test_prefixes(self, pattern, match_type, expected):
+        assert literal_prefix(pattern, match_type) == expected
+
+
+class TestIndexedSearch:
+    """Test that indexed queries return what a full scan would."""
+
+    def test_exact_and_prefix_lookups(self, schematic):
+        engine = SearchEngine(schematic)
+        query = SearchQueryBuilder().with_reference("r1", MatchType.EXACT).build()
+        assert [c.value for c in engine.search_components(query)] == ["10k", "1k"]
+
+        query = SearchQueryBuilder().with_reference("C*", MatchType.WILDCARD).build()
+        assert [c.reference for c in engine.search_components(query)] == ["C1", "C2"]
+
+    def test_case_sensitive_exact(self, schematic):
+        engine = SearchEngine(schematic)
+        query = SearchQuery()
+        query.add_criterion("reference", "r1", MatchType.EXACT, case_sensitive=True)
+        assert engine.search_components(query) == []
+
+    def test_property_index(self, schematic):
+        engine = SearchEngine(schematic)
+        query = (
+            SearchQueryBuilder()
+            .with_property("MPN", "STM32", MatchType.WILDCARD)
+            .with_property("MPN", "RC0603", MatchType.EXACT)
+            .combine_with_or()
+            .build()
+        )
+        assert [c.reference for c in engine.search_components(query)] == ["R1"]
+
+        query.criteria[0].pattern = "STM32*"
+        assert [c.reference for c in engine.search_components(query)] == ["R1", "U1"]
+
+    def test_random_queries_match_scan(self, schematic):
+        rng = random.Random(7)
+        for i in range(200):
+            schematic.components.append(
+                _symbol(
+                    f"{rng.choice('RCLU')}{rng.randrange(60)}",
+                    rng.choice(["10k", "1k", "100nF", "4.7uF", "TPS7A", ""]),
+                    rng.choice(["Device:R", "Device:C", "Regulator:TPS7A"]),
+                    rng.choice([None, "Resistor_SMD:R_0603", "Capacitor_SMD:C_0402"]),
+                    x=rng.uniform(0, 300),
+                    y=rng.uniform(0, 300),
+                    Tolerance=rng.choice(["1%", "5%"]),
+                )
+            )
+        engine = SearchEngine(schematic)
+
+        fields = ["reference", "value", "footprint", "lib_id", "Tolerance", "MPN"]
+        patterns = ["R1", "r*", "C?", "^Device", "10", "k$", "5%", "*0603", "U"]
+        for _ in range(300):
+            query = SearchQuery(combine_with=rng.choice(["AND", "OR"]))
+            for _ in range(rng.randrange(1, 4)):
+                query.add_criterion(
+                    rng.choice(fields),
+                    rng.choice(patterns),
+                    rng.choice(list(MatchType)),
+                    rng.random() < 0.3,
+                )
+            assert engine.search_components(query) == _scan(engine, query)
+
+    def test_simple_search_helpers(self, schematic):
+        engine = SearchEngine(schematic)
+        assert [c.reference for c in engine.search_components("c")] == ["C1", "C2"]
+        assert [c.reference for c in engine.search_components(value="k")] == [
+            "R1",
+            "R2",
+            "R1",
+        ]
+        assert [c.reference for c in engine.search_by_value("10k", 0.5)] == ["R1"]
+        assert [c.reference for c in engine.search_by_footprint("0603")] == [
+            "R1",
+            "C1",
+            "R1",
+        ]
+        duplicates = engine.find_duplicate_references()
+        assert [(ref, len(comps)) for ref, comps in duplicates] == [("R1", 2)]
+
+
+class TestIndexMaintenance:
+    """Test keeping the indices in step with the schematic."""
+
+    def test_add_and_remove(self, schematic):
+        engine = SearchEngine(schematic)
+        new = _symbol("R9", "22k", x=11, y=11)
+        schematic.components.append(new)
+        engine.index_component(new)
+        assert engine.search_components(reference="R9") == [new]
+
+        schematic.components.remove(new)
+        assert engine.unindex_component(new)
+        assert engine.search_components(reference="R9") == []
+        assert not engine.unindex_component(new)
+
+    def test_unnotified_changes_trigger_rebuild(self, schematic):
+        engine = SearchEngine(schematic)
+        schematic.components.pop(0)
+        assert [c.value for c in engine.search_components(reference="R1")] == ["1k"]
+
+    def test_remove_and_add_at_equal_count(self, schematic):
+        engine = SearchEngine(schematic)
+        r2 = schematic.components[1]
+        assert engine.search_components(reference="R2") == [r2]
+        r3 = _symbol("R3", "4.7k", x=60, y=10)
+        schematic.components[1] = r3
+        engine.unindex_component(r2)
+        engine.index_component(r3)
+
+        assert engine.search_components(reference="R3") == [r3]
+        assert engine.search_components(reference="R2") == []
+        assert engine.search_by_value("4.7k") == [r3]
+
+    def test_synchronizer_update_reindexes(self, schematic):
+        r1 = schematic.components[0]
+        synchronizer = APISynchronizer.__new__(APISynchronizer)
+        synchronizer.schematic = schematic
+        synchronizer.search_engine = SearchEngine(schematic)
+        synchronizer.component_manager = Mock()
+
+        def update_component(reference, value=None, **kwargs):
+            r1.value = value
+            return True
+
+        synchronizer.component_manager.update_component.side_effect = update_component
+        assert synchronizer.search_engine.search_by_value("10k") == [r1]
+
+        synchronizer._process_matches(
+            {"R1_id": {"reference": "R1", "value": "22k"}},
+            {"R1": r1},
+            {"R1_id": "R1"},
+            SyncReport(),
+        )
+
+        assert synchronizer.search_engine.search_by_value("22k") == [r1]
+        assert synchronizer.search_engine.search_by_value("10k") == []
+
+    def test_synchronizer_remove_unindexes(self, schematic):
+        r2 = schematic.components[1]
+        synchronizer = APISynchronizer.__new__(APISynchronizer)
+        synchronizer.schematic = schematic
+        synchronizer.search_engine = SearchEngine(schematic)
+        synchronizer.preserve_user_components = False
+        synchronizer.component_manager = Mock()
+        synchronizer.component_manager.remove_component.side_effect = (
+            lambda ref: schematic.components.remove(r2) or True
+        )
+
+        synchronizer._process_unmatched({}, {"R2": r2}, {}, SyncReport())
+
+        # Unindexed right away, without waiting for a query to notice
+        assert id(r2) not in synchronizer.search_engine._ordinals
+        assert synchronizer.search_engine.search_components(reference="R2") == []
+
+    def test_reindex_after_edit_keeps_order(self, schematic):
+        engine = SearchEngine(schematic)
+        r1 = schematic.components[0]
+        r1.value = "22k"
+        r1.position = Point(150, 150)
+        engine.reindex_component(r1)
+
+        assert engine.search_by_value("22k") == [r1]
+        assert engine.search_by_value("10k") == []
+        area = BoundingBox(140, 140, 160, 160)
+        assert engine.find_components_in_area(area) == [r1]
+
+
+class TestSpatialQueries:
+    """Test grid-backed area and proximity queries."""
+
+    def test_components_in_area(self, schematic):
+        engine = SearchEngine(schematic)
+        area = BoundingBox(0, 0, 60, 60)
+        assert [c.reference for c in engine.find_components_in_area(area)] == [
+            "R1",
+            "R2",
+            "C1",
+            "R1",
+        ]
+        everything = BoundingBox(-1e9, -1e9, float("inf"), float("inf"))
+        assert len(engine.find_components_in_area(everything)) == 6
+
+    def test_grid_readd_does_not_overcount(self):
+        grid = BucketGrid(cell_size=10)
+        grid.add("R1", (1.0, 1.0, 1.0, 1.0))
+        grid.add("R1", (1.0, 1.0, 1.0, 1.0))
+        assert len(grid) == 1
+        assert list(grid.query((0, 0, 5, 5))) == ["R1"]
+        grid.remove("R1")
+        assert len(grid) == 0
+        assert list(grid.query((0, 0, 5, 5))) == []
+
+    def test_unconnected_pins(self):
+        def component(ref, x):
+            comp = Mock(reference=ref, value="", lib_id="Device:R", footprint=None)
+            comp.position = Point(x, 0)
+            comp.properties = {}
+            comp.get_bounding_box.return_value = BoundingBox(x - 2, -2, x + 2, 2)
+            return comp
+
+        schematic = Mock()
+        schematic.components = [component("R1", 0), component("R2", 100)]
+        schematic.labels = []
+        schematic.wires = [Wire(uuid="", points=[Point(1, 0), Point(50, 0)])]
+
+        assert SearchEngine(schematic).find_unconnected_pins() == {"R2": ["all"]}
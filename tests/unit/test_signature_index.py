@@ -0,0 +1,173 @@
+"""
+Unit tests for connectivity candidate generation and the matchers using it.
+"""
+
+import random
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from circuit_synth.kicad.canonical import (
+    CanonicalCircuit,
+    CanonicalConnection,
+    CircuitMatcher,
+)
+from circuit_synth.kicad.schematic.net_matcher import NetMatcher
+from circuit_synth.kicad.signature_index import MinHasher, SignatureIndex, jaccard
+
+
+def _canonical(spec):
+    """Build a CanonicalCircuit from [(type, {pin: net})]."""
+    connections = [
+        CanonicalConnection(idx, pin, net, comp_type)
+        for idx, (comp_type, pins) in enumerate(spec)
+        for pin, net in pins.items()
+    ]
+    return CanonicalCircuit(connections)
+
+
+def _brute_force_match(old_spec, new_spec):
+    """Reference all-pairs greedy matching for a single component type."""
+    scores = []
+    for old_idx, (_, old_pins) in enumerate(old_spec):
+        for new_idx, (_, new_pins) in enumerate(new_spec):
+            score = CircuitMatcher._score_pin_nets(old_pins, new_pins)
+            scores.append((old_idx, new_idx, score))
+    scores.sort(key=lambda x: x[2], reverse=True)
+
+    matches = {idx: -1 for idx in range(len(old_spec))}
+    used = set()
+    for old_idx, new_idx, score in scores:
+        if matches[old_idx] == -1 and new_idx not in used and score > 0:
+            matches[old_idx] = new_idx
+            used.add(new_idx)
+    return matches
+
+
+class TestSignatureIndex:
+    """Test MinHash signatures and candidate lookup."""
+
+    def test_minhash_estimates_jaccard(self):
+        hasher = MinHasher(num_perm=256)
+        a = {f"N{i}" for i in range(100)}
+        b = {f"N{i}" for i in range(50, 150)}
+        estimate = np.mean(hasher.signature(a) == hasher.signature(b))
+        assert estimate == pytest.approx(jaccard(a, b), abs=0.1)
+
+    def test_signatures_are_deterministic(self):
+        tokens = [("1", "VCC"), ("2", "GND")]
+        assert np.array_equal(
+            MinHasher().signature(tokens), MinHasher().signature(reversed(tokens))
+        )
+
+    def test_common_tokens_alone_do_not_make_candidates(self):
+        index = SignatureIndex(max_posting=4)
+        for i in range(100):
+            index.add(f"C{i}", {f"N{i}", f"M{i}", f"K{i}", "GND"})
+
+        candidates = index.candidates({"N7", "M7", "K7", "GND"})
+
+        assert "C7" in candidates
+        assert len(candidates) < 10
+        assert len(index.candidates({"GND"}, exhaustive=True)) == 100
+
+    def test_rare_token_always_found(self):
+        index = SignatureIndex()
+        index.add("U1", {f"BUS{i}" for i in range(40)} | {"SDA"})
+        index.add("U2", {"X", "Y"})
+        assert index.candidates({"SDA", "other"}) == ["U1"]
+
+
+class TestNetMatcher:
+    """Test indexed net matching against KiCad components."""
+
+    @pytest.fixture
+    def matcher(self):
+        nets = {
+            "R1": {"VIN", "OUT"},
+            "R2": {"OUT", "GND"},
+            "C1": {"OUT", "GND"},
+            "U1": {"VIN", "GND", "EN"},
+        }
+        tracer = Mock()
+        tracer.find_all_connections.side_effect = lambda ref: [
+            Mock(net_name=net) for net in sorted(nets[ref])
+        ]
+        return NetMatcher(tracer)
+
+    def test_exhaustive_matches_all_sharing_a_net(self, matcher):
+        kicad_list = [{"reference": r} for r in ["R1", "R2", "C1", "U1"]]
+        result = matcher.match_by_connections(
+            {"pins": {"1": "OUT", "2": "GND"}}, kicad_list
+        )
+        assert result == [
+            ("R2", 1.0),
+            ("C1", 1.0),
+            ("R1", pytest.approx(1 / 3)),
+            ("U1", pytest.approx(1 / 4)),
+        ]
+
+    def test_threshold_filters_and_reuses_index(self, matcher):
+        kicad_list = [{"reference": r} for r in ["R1", "R2", "C1", "U1"]]
+        result = matcher.match_by_connections(
+            {"pins": {"1": "VIN", "2": "OUT"}}, kicad_list, min_similarity=0.7
+        )
+        assert result == [("R1", 1.0)]
+
+        matcher.match_by_connections({"pins": {"1": "GND"}}, kicad_list)
+        assert matcher.tracer.find_all_connections.call_count == 4
+
+
+class TestCircuitMatcher:
+    """Test candidate-based connectivity matching."""
+
+    def test_matches_brute_force_after_refactor(self):
+        rng = random.Random(3)
+        old_spec = [
+            ("Device:R:10k", {"1": f"N{rng.randrange(40)}", "2": "GND"})
+            for _ in range(80)
+        ]
+        new_spec = []
+        for comp_type, pins in old_spec:
+            pins = dict(pins)
+            if rng.random() < 0.3:
+                pins["1"] = f"RENAMED{rng.randrange(1000)}"
+            new_spec.append((comp_type, pins))
+        rng.shuffle(new_spec)
+
+        result = CircuitMatcher().match(_canonical(old_spec), _canonical(new_spec))
+
+        assert result == _brute_force_match(old_spec, new_spec)
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_brute_force_with_high_fanout_nets(self, seed):
+        rng = random.Random(seed)
+
+        def random_pins():
+            count = rng.choice([2, 2, 3, 4])
+            nets = ["GND", "VCC", "VBUS"] + [f"N{rng.randrange(60)}"] * 2
+            return {str(pin): rng.choice(nets) for pin in range(1, count + 1)}
+
+        old_spec = [("Device:C:100n", random_pins()) for _ in range(70)]
+        new_spec = [("Device:C:100n", random_pins()) for _ in range(70)]
+
+        result = CircuitMatcher().match(_canonical(old_spec), _canonical(new_spec))
+
+        assert result == _brute_force_match(old_spec, new_spec)
+
+    def test_pin_name_score_beats_lower_shared_net_score(self):
+        pins = {str(pin): f"N{pin}" for pin in range(1, 11)}
+        old_spec = [("X:U:1", pins), ("X:U:1", {"1": "OTHER"})]
+        new_spec = [("X:U:1", {"1": "N1"})]
+
+        # old[0] shares N1 but scores 0.05; old[1] scores 0.1 on pin names
+        result = CircuitMatcher().match(_canonical(old_spec), _canonical(new_spec))
+
+        assert result == {0: -1, 1: 0}
+        assert result == _brute_force_match(old_spec, new_spec)
+
+    def test_identical_connections_pair_in_order(self):
+        spec = [("Device:C:100n", {"1": "VCC", "2": "GND"})] * 3
+        result = CircuitMatcher().match(_canonical(spec), _canonical(spec))
+        assert result == {0: 0, 1: 1, 2: 2}
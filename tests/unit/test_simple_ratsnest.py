@@ -0,0 +1,150 @@
+"""
+Unit tests for importing netlist nets into a PCB file.
+"""
+
+import re
+import time
+
+from circuit_synth.pcb.simple_ratsnest import add_ratsnest_to_pcb
+
+NETLIST = """(export (version "E")
+  (components
+    (comp (ref "R1") (value "10k"))
+    (comp (ref "R2") (value "10k")))
+  (libparts
+    (libpart (lib "Device") (part "R")
+      (pins (pin (num "1") (name "~") (type "passive")))))
+  (nets
+    (net (code "1") (name "VCC")
+      (node (ref "R1") (pin "1") (pintype "passive")))
+    (net (code "2") (name "/sub/VOUT")
+      (node (ref "/sub/R1") (pin "2") (pintype "passive"))
+      (node (ref "R2") (pin "1") (pintype "passive")))
+    (net (code "3") (name "GND")
+      (node (ref "R2") (pin "2") (pintype "passive")))
+    (net (code "4") (name "")
+      (node (ref "R3") (pin "1") (pintype "passive")))))
+"""
+
+
+def _footprint(ref, pads):
+    return (
+        '  (footprint "Resistor_SMD:R_0603_1608Metric"\n'
+        '    (layer "F.Cu")\n'
+        f'    (property "Reference" "{ref}" (at 0 -1.43 0))\n'
+        + "".join(
+            f'    (pad "{number}" smd roundrect (at {x} 0) (size 0.8 0.95)'
+            + (f"\n      {net}" if net else "")
+            + ")\n"
+            for number, x, net in pads
+        )
+        + "  )\n"
+    )
+
+
+PCB = (
+    '(kicad_pcb (version 20241229) (generator "pcbnew")\n'
+    '  (net 0 "")\n'
+    '  (net 1 "unconnected-(R1-Pad1)")\n'
+    '  (net 2 "GND")\n'
+    + _footprint(
+        "R1", [("1", -0.8, '(net 1 "unconnected-(R1-Pad1)")'), ("2", 0.8, None)]
+    )
+    + _footprint("R2", [("1", -0.8, None), ("2", 0.8, '(net 2 "GND")')])
+    + ")\n"
+)
+
+
+def _pad_nets(text):
+    """(reference, pad) -> net name, parsed independently with regexes."""
+    result = {}
+    for block in text.split("(footprint ")[1:]:
+        ref = re.search(r'"Reference" "([^"]+)"', block).group(1)
+        for number, body in re.findall(
+            r'\(pad "([^"]+)"(.*?)(?=\(pad |\Z)', block, re.S
+        ):
+            net = re.search(r'\(net \d+ "([^"]*)"\)', body)
+            result[(ref, number)] = net.group(1) if net else None
+    return result
+
+
+def _declarations(text):
+    return {
+        name: int(code)
+        for code, name in re.findall(r'^\s*\(net (\d+) "([^"]*)"\)$', text, re.M)
+    }
+
+
+class TestAddRatsnestToPcb:
+    """Test net declaration and pad assignment from a netlist."""
+
+    def test_assigns_pads_and_declares_nets(self, tmp_path):
+        pcb_file, netlist_file = tmp_path / "b.kicad_pcb", tmp_path / "b.net"
+        pcb_file.write_text(PCB)
+        netlist_file.write_text(NETLIST)
+
+        assert add_ratsnest_to_pcb(str(pcb_file), str(netlist_file))
+
+        text = pcb_file.read_text()
+        declared = _declarations(text)
+        # Existing codes are kept; new nets are numbered after them
+        assert declared["GND"] == 2
+        assert declared["VCC"] == 3
+        assert declared["/sub/VOUT"] == 4
+        assert _pad_nets(text) == {
+            ("R1", "1"): "VCC",
+            ("R1", "2"): "/sub/VOUT",
+            ("R2", "1"): "/sub/VOUT",
+            ("R2", "2"): "GND",
+        }
+        assert text.count("(") == text.count(")")
+        assert '  (net 2 "GND")\n  (net 3 "VCC")\n  (net 4 "/sub/VOUT")\n' in text
+
+    def test_second_run_changes_nothing(self, tmp_path):
+        pcb_file, netlist_file = tmp_path / "b.kicad_pcb", tmp_path / "b.net"
+        pcb_file.write_text(PCB)
+        netlist_file.write_text(NETLIST)
+        add_ratsnest_to_pcb(str(pcb_file), str(netlist_file))
+        first = pcb_file.read_text()
+
+        assert add_ratsnest_to_pcb(str(pcb_file), str(netlist_file))
+        assert pcb_file.read_text() == first
+
+    def test_empty_netlist(self, tmp_path):
+        pcb_file, netlist_file = tmp_path / "b.kicad_pcb", tmp_path / "b.net"
+        pcb_file.write_text(PCB)
+        netlist_file.write_text('(export (nets (net (code "1") (name "X"))))')
+
+        assert not add_ratsnest_to_pcb(str(pcb_file), str(netlist_file))
+        assert pcb_file.read_text() == PCB
+
+    def test_large_board_is_linear(self, tmp_path):
+        count = 5000
+        pcb_file, netlist_file = tmp_path / "b.kicad_pcb", tmp_path / "b.net"
+        pcb_file.write_text(
+            '(kicad_pcb (version 20241229)\n  (net 0 "")\n'
+            + "".join(
+                _footprint(f"R{i}", [("1", -0.8, None), ("2", 0.8, None)])
+                for i in range(count)
+            )
+            + ")\n"
+        )
+        netlist_file.write_text(
+            "(export (nets\n"
+            + "".join(
+                f'  (net (code "{i + 1}") (name "N{i}")\n'
+                f'    (node (ref "R{i}") (pin "2"))\n'
+                f'    (node (ref "R{(i + 1) % count}") (pin "1")))\n'
+                for i in range(count)
+            )
+            + "))\n"
+        )
+
+        started = time.perf_counter()
+        assert add_ratsnest_to_pcb(str(pcb_file), str(netlist_file))
+        assert time.perf_counter() - started < 5.0
+
+        pads = _pad_nets(pcb_file.read_text())
+        assert len(pads) == 2 * count
+        assert pads[("R0", "1")] == f"N{count - 1}"
+        assert pads[("R7", "2")] == "N7"
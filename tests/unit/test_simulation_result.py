@@ -0,0 +1,117 @@
+"""
+Unit tests for the columnar SimulationResult container.
+"""
+
+import numpy as np
+import pytest
+
+from circuit_synth.simulation.mna import MNASolver, frequency_points
+from circuit_synth.simulation.simulator import SimulationResult
+
+
+class FakeAnalysis:
+    """Minimal stand-in for a PySpice transient analysis."""
+
+    def __init__(self, points=1000):
+        self.time = np.linspace(0, 1e-3, points)
+        self.nodes = {
+            "vin": np.ones(points) * 5.0,
+            "out": np.sin(self.time * 1e4),
+        }
+        self.branches = {"vv1": np.full(points, -1e-3)}
+
+    def __getitem__(self, name):
+        return {**self.nodes, **self.branches}[name]
+
+
+class TestColumnarStorage:
+    """Test lazy materialization and zero-copy access."""
+
+    def test_materialized_lazily(self):
+        result = SimulationResult(FakeAnalysis(), "transient")
+        assert result._matrix is None
+        assert sorted(result.list_nodes()) == ["out", "vin"]
+        assert result.matrix.shape == (2, 1000)
+        assert result.matrix.flags["C_CONTIGUOUS"]
+
+    def test_waveforms_are_views(self):
+        result = SimulationResult(FakeAnalysis(), "transient")
+        out = result.get_voltage("out")
+        assert isinstance(out, np.ndarray)
+        assert np.shares_memory(out, result.matrix)
+        assert np.shares_memory(result.get_waveform("vin"), result.matrix)
+
+    def test_lookup_is_case_insensitive(self):
+        result = SimulationResult(FakeAnalysis(), "transient")
+        np.testing.assert_array_equal(
+            result.get_voltage("OUT"), result.get_voltage("out")
+        )
+        with pytest.raises(KeyError):
+            result.get_voltage("missing")
+
+    def test_axis_and_current(self):
+        result = SimulationResult(FakeAnalysis(), "transient")
+        assert result.axis[-1] == pytest.approx(1e-3)
+        current = result.get_current("V1")
+        assert current.shape == (1000,)
+        assert current[0] == pytest.approx(-1e-3)
+
+    def test_operating_point_returns_scalars(self):
+        solver = MNASolver.from_netlist("V1 vin 0 10\nR1 vin out 1k\nR2 out 0 1k\n")
+        result = SimulationResult(solver.operating_point(), "dc_op")
+        assert isinstance(result.get_voltage("out"), float)
+        assert result.get_voltage("out") == pytest.approx(5.0)
+        assert result.get_current("V1") == pytest.approx(-5e-3)
+
+
+class TestExport:
+    """Test binary export formats."""
+
+    def test_npz_round_trip(self, tmp_path):
+        result = SimulationResult(FakeAnalysis(), "transient")
+        path = tmp_path / "result.npz"
+        result.to_npz(path)
+
+        loaded = SimulationResult.load_npz(path)
+
+        assert loaded.analysis_type == "transient"
+        assert loaded.list_nodes() == result.list_nodes()
+        np.testing.assert_array_equal(loaded.matrix, result.matrix)
+        np.testing.assert_array_equal(loaded.axis, result.axis)
+
+    def test_npz_round_trip_complex(self, tmp_path):
+        solver = MNASolver.from_netlist("V1 in 0 AC 1\nR1 in out 1k\nC1 out 0 1u\n")
+        freqs = frequency_points(10, 1e4, 5)
+        result = SimulationResult(solver.ac(freqs), "ac")
+        path = tmp_path / "ac.npz"
+        result.to_npz(path, compressed=True)
+
+        loaded = SimulationResult.load_npz(path)
+
+        assert np.iscomplexobj(loaded.matrix)
+        np.testing.assert_allclose(loaded.get_voltage("out"), result.get_voltage("out"))
+        np.testing.assert_allclose(loaded.axis, freqs)
+
+    def test_arrow_export(self, tmp_path):
+        feather = pytest.importorskip("pyarrow.feather")
+        solver = MNASolver.from_netlist("V1 in 0 AC 1\nR1 in out 1k\nC1 out 0 1u\n")
+        result = SimulationResult(solver.ac(frequency_points(10, 1e4, 5)), "ac")
+        path = tmp_path / "ac.arrow"
+        result.to_arrow(path)
+
+        table = feather.read_table(str(path))
+
+        assert table.column_names == [
+            "frequency",
+            "in.real",
+            "in.imag",
+            "out.real",
+            "out.imag",
+        ]
+        out = result.get_voltage("out")
+        np.testing.assert_allclose(table["out.real"].to_numpy(), out.real)
+        assert table.schema.metadata[b"analysis_type"] == b"ac"
+
+    def test_from_arrays_validates_shape(self):
+        with pytest.raises(ValueError):
+            SimulationResult.from_arrays(["a", "b"], np.zeros((3, 4)), "transient")
@@ -0,0 +1,171 @@
+"""
+Unit tests for batch parameter sweeps and Monte Carlo analysis.
+
+ngspice is not required: a small module-level runner evaluates a resistive
+divider analytically so the batch plumbing, process pool and statistics can
+be tested on their own.
+"""
+
+import numpy as np
+import pytest
+
+from circuit_synth.simulation.sweep import (
+    BatchSimulator,
+    NetlistTemplate,
+    Tolerance,
+    analysis_card,
+)
+
+DIVIDER = """.title divider
+VV1 VIN 0 10.0
+RR1 VIN OUT 1000.0
+RR2 OUT 0 1000.0
+"""
+
+
+def divider_runner(netlist, analysis, kwargs):
+    """Evaluate VOUT of DIVIDER from the element values in the netlist."""
+    values = {}
+    for line in netlist.splitlines():
+        tokens = line.split()
+        if tokens and tokens[0][0] in "RV":
+            values[tokens[0]] = float(tokens[3])
+    if values["RR1"] < 0:
+        raise RuntimeError("negative resistance")
+    vout = values["VV1"] * values["RR2"] / (values["RR1"] + values["RR2"])
+    if analysis == "op":
+        return None, {"VOUT": np.array([vout]), "VIN": np.array([values["VV1"]])}
+    axis = np.linspace(0.0, 1.0, 5)
+    return axis, {"VOUT": vout * axis}
+
+
+class TestNetlistTemplate:
+    """Test element lookup and value substitution."""
+
+    def test_nominal_values_and_refs(self):
+        template = NetlistTemplate(DIVIDER)
+        assert template.resolve("R1") == "RR1"
+        assert template.resolve("rr2") == "RR2"
+        assert template.nominal_value("V1") == 10.0
+
+    def test_render_substitutes_only_requested_values(self):
+        template = NetlistTemplate(DIVIDER)
+        text = template.render({"R1": 2200.0})
+        assert "RR1 VIN OUT 2200.0" in text
+        assert "RR2 OUT 0 1000.0" in text
+        # The template itself is unchanged
+        assert template.nominal_value("R1") == 1000.0
+
+    def test_suffixed_values_keep_scale_and_unit(self):
+        template = NetlistTemplate(
+            "R1 in out 1kOhm\nC1 out 0 100nF\nL1 out 0 2.2MEG\nV1 in 0 5V\n"
+        )
+        assert template.nominal_value("R1") == pytest.approx(1e3)
+        assert template.nominal_value("C1") == pytest.approx(100e-9)
+        assert template.nominal_value("L1") == pytest.approx(2.2e6)
+        assert template.nominal_value("V1") == 5.0
+
+        text = template.render({"R1": 2200.0, "C1": 47e-9, "V1": 3.3})
+        assert "R1 in out 2.2kOhm" in text
+        assert "C1 out 0 47nF" in text
+        assert "V1 in 0 3.3V" in text
+        assert "L1 out 0 2.2MEG" in text
+
+    def test_unknown_ref_raises(self):
+        with pytest.raises(KeyError):
+            NetlistTemplate(DIVIDER).resolve("R9")
+
+    def test_analysis_cards(self):
+        assert analysis_card("op", {}) == ".op"
+        assert analysis_card(
+            "ac", {"start_freq": 1, "stop_freq": 1e6, "points": 10}
+        ) == (".ac dec 10 1 1000000.0")
+        assert analysis_card("transient", {"step_time": 1e-6, "end_time": 1e-3}) == (
+            ".tran 1e-06 0.001"
+        )
+        with pytest.raises(ValueError):
+            analysis_card("noise", {})
+
+
+class TestBatchSimulator:
+    """Test sweeps, Monte Carlo sampling and summary statistics."""
+
+    def test_parameter_grid_is_cartesian(self):
+        batch = BatchSimulator(DIVIDER, max_workers=1, runner=divider_runner)
+        result = batch.parameter_sweep({"R1": [1000, 3000], "R2": [1000, 2000, 3000]})
+
+        assert result.runs == 6
+        vout = result.get_voltage("VOUT", index=0)
+        expected = (
+            10.0
+            * result.parameters["R2"]
+            / (result.parameters["R1"] + result.parameters["R2"])
+        )
+        np.testing.assert_allclose(vout, expected)
+
+    def test_monte_carlo_is_reproducible_and_bounded(self):
+        batch = BatchSimulator(DIVIDER, max_workers=1, runner=divider_runner)
+        first = batch.monte_carlo({"R1": 0.05, "R2": 0.05}, runs=200, seed=7)
+        second = batch.monte_carlo({"R1": 0.05, "R2": 0.05}, runs=200, seed=7)
+
+        np.testing.assert_array_equal(first.parameters["R1"], second.parameters["R1"])
+        assert first.parameters["R1"].min() >= 950.0
+        assert first.parameters["R1"].max() <= 1050.0
+
+        stats = first.statistics("VOUT", index=0)
+        assert 4.9 < stats["mean"] < 5.1
+        assert 4.75 <= stats["min"] <= stats["max"] <= 5.25
+
+    def test_gaussian_tolerance_clipped_to_limit(self):
+        rng = np.random.default_rng(0)
+        samples = Tolerance(0.1, "gaussian").sample(100.0, 10000, rng)
+        assert samples.min() >= 90.0 - 1e-9 and samples.max() <= 110.0 + 1e-9
+        assert abs(samples.std() - 100.0 * 0.1 / 3) < 0.5
+
+    def test_yield_worst_case_and_histogram(self):
+        batch = BatchSimulator(DIVIDER, max_workers=1, runner=divider_runner)
+        result = batch.parameter_sweep({"R2": [900.0, 1000.0, 1100.0, 2000.0]})
+
+        assert result.yield_fraction("VOUT", low=4.5, high=5.5, index=0) == 0.75
+        worst = result.worst_case("VOUT", index=0, mode="max")
+        assert worst["run"] == 3
+        assert worst["parameters"]["R2"] == 2000.0
+        counts, edges = result.histogram("VOUT", index=0, bins=4)
+        assert counts.sum() == 4 and len(edges) == 5
+
+    def test_sweep_axis_results_are_stacked(self):
+        batch = BatchSimulator(DIVIDER, max_workers=1, runner=divider_runner)
+        result = batch.parameter_sweep(
+            {"R1": [1000.0, 3000.0]},
+            analysis="transient",
+            step_time=1e-3,
+            end_time=1.0,
+        )
+
+        assert result.axis.shape == (5,)
+        assert result.get_voltage("VOUT").shape == (2, 5)
+        assert result.yield_fraction("VOUT", high=5.0) == 1.0
+
+    def test_failed_runs_are_masked(self):
+        batch = BatchSimulator(DIVIDER, max_workers=1, runner=divider_runner)
+        result = batch.parameter_sweep({"R1": [1000.0, -1.0]})
+
+        assert result.failed.tolist() == [False, True]
+        assert "negative resistance" in result.errors[1]
+        assert result.get_voltage("VOUT", index=0).shape == (1,)
+        assert result.yield_fraction("VOUT", low=0.0) == 0.5
+
+    def test_process_pool_matches_inline(self):
+        inline = BatchSimulator(DIVIDER, max_workers=1, runner=divider_runner)
+        pooled = BatchSimulator(DIVIDER, max_workers=2, runner=divider_runner)
+        grid = {"R1": [500.0, 1000.0, 2000.0, 4000.0]}
+
+        np.testing.assert_allclose(
+            pooled.parameter_sweep(grid).get_voltage("VOUT"),
+            inline.parameter_sweep(grid).get_voltage("VOUT"),
+        )
+
+    def test_mismatched_parameter_lengths_rejected(self):
+        batch = BatchSimulator(DIVIDER, max_workers=1, runner=divider_runner)
+        with pytest.raises(ValueError):
+            batch.run({"R1": np.ones(3), "R2": np.ones(2)})
@@ -0,0 +1,137 @@
+"""
+Unit tests for SpiceConverter pin-to-net indexing and terminal ordering.
+"""
+
+import pytest
+
+from circuit_synth.core import Circuit, Component, Net
+from circuit_synth.core.decorators import set_current_circuit
+from circuit_synth.simulation.converter import PYSPICE_AVAILABLE, SpiceConverter
+
+
+@pytest.fixture
+def circuit():
+    """Create an active circuit for components to register with."""
+    c = Circuit("spice_test")
+    set_current_circuit(c)
+    yield c
+    set_current_circuit(None)
+
+
+class TestPinIndex:
+    """Test the component -> pin -> node table."""
+
+    def test_pins_follow_symbol_order(self, circuit):
+        vin, out = Net("VIN"), Net("OUT")
+        r1 = Component("Device:R", ref="R1", value="10k")
+        # Connect in reverse order; index must follow the symbol, not nets
+        r1[2] += out
+        r1[1] += vin
+
+        converter = SpiceConverter(circuit)
+        converter._build_pin_index()
+
+        assert converter.pin_index["R1"] == [("1", "~", "VIN"), ("2", "~", "OUT")]
+        assert converter._get_component_nodes(r1) == ["VIN", "OUT"]
+
+    def test_nodes_not_sorted_alphabetically(self, circuit):
+        a, z = Net("A_NODE"), Net("Z_NODE")
+        r1 = Component("Device:R", ref="R1", value="1k")
+        r1[1] += z
+        r1[2] += a
+
+        converter = SpiceConverter(circuit)
+
+        assert converter._get_component_nodes(r1) == ["Z_NODE", "A_NODE"]
+
+    def test_bjt_terminals_ordered_cbe(self, circuit):
+        c, b, e = Net("COLL"), Net("BASE"), Net("EMIT")
+        q1 = Component("Device:Q_NPN", ref="Q1")
+        q1["E"] += e
+        q1["B"] += b
+        q1["C"] += c
+
+        converter = SpiceConverter(circuit)
+        nodes = converter._get_component_nodes(
+            q1, terminals=(("C",), ("B",), ("E",)), required=3
+        )
+
+        assert nodes == ["COLL", "BASE", "EMIT"]
+
+    def test_opamp_terminals_use_first_connected_unit(self, circuit):
+        out, inp, inn = Net("OUT"), Net("INP"), Net("INN")
+        u1 = Component("Device:Opamp_Dual", ref="U1")
+        u1[1] += out
+        u1[2] += inn
+        u1[3] += inp
+
+        from circuit_synth.simulation.converter import OPAMP_TERMINALS
+
+        converter = SpiceConverter(circuit)
+        nodes = converter._get_component_nodes(u1, OPAMP_TERMINALS, required=3)
+
+        assert nodes == ["OUT", "INP", "INN"]
+
+    def test_unmatched_terminals_fall_back_to_pin_order(self, circuit):
+        n1, n2 = Net("N1"), Net("N2")
+        r1 = Component("Device:R", ref="R1")
+        r1[1] += n1
+        r1[2] += n2
+
+        converter = SpiceConverter(circuit)
+        nodes = converter._get_component_nodes(r1, (("X",), ("Y",)), required=2)
+
+        assert nodes == ["N1", "N2"]
+
+    def test_similar_refs_do_not_collide(self, circuit):
+        n1, n2, n3 = Net("N1"), Net("N2"), Net("N3")
+        r1 = Component("Device:R", ref="R1")
+        r10 = Component("Device:R", ref="R10")
+        r1[1] += n1
+        r1[2] += n2
+        r10[1] += n2
+        r10[2] += n3
+
+        converter = SpiceConverter(circuit)
+
+        assert converter._get_component_nodes(r1) == ["N1", "N2"]
+        assert converter._get_component_nodes(r10) == ["N2", "N3"]
+
+    def test_unconnected_component_has_no_nodes(self, circuit):
+        r1 = Component("Device:R", ref="R1")
+
+        converter = SpiceConverter(circuit)
+
+        assert converter._get_component_nodes(r1) == []
+
+
+@pytest.mark.skipif(not PYSPICE_AVAILABLE, reason="PySpice not installed")
+class TestConvert:
+    """Test full conversion to a PySpice netlist."""
+
+    def test_voltage_divider_netlist(self, circuit):
+        vin, out, gnd = Net("VIN"), Net("OUT"), Net("GND")
+        r1 = Component("Device:R", ref="R1", value="10k")
+        r2 = Component("Device:R", ref="R2", value="1k")
+        r1[1] += vin
+        r1[2] += out
+        r2[1] += out
+        r2[2] += gnd
+
+        netlist = str(SpiceConverter(circuit).convert())
+
+        assert "RR1 VIN OUT 10000.0" in netlist
+        assert "RR2 OUT 0 1000.0" in netlist
+
+    def test_large_ladder_converts_every_component(self, circuit):
+        nets = [Net(f"N{i}") for i in range(501)]
+        for i in range(500):
+            r = Component("Device:R", ref=f"R{i + 1}", value="1k")
+            r[1] += nets[i]
+            r[2] += nets[i + 1]
+
+        converter = SpiceConverter(circuit)
+        netlist = str(converter.convert())
+
+        assert len(converter.pin_index) == 500
+        assert "RR500 N499 N500 1000.0" in netlist
@@ -0,0 +1,89 @@
+"""
+Unit tests for memoized symbol bounding boxes.
+"""
+
+import pytest
+
+from circuit_synth.kicad.sch_gen.symbol_geometry import SymbolBoundingBoxCalculator
+
+RESISTOR = {
+    "shapes": [
+        {"shape_type": "rectangle", "start": [-1.016, -2.54], "end": [1.016, 2.54]}
+    ],
+    "pins": [
+        {"number": "1", "name": "~", "at": [0, 3.81, 270], "length": 1.27},
+        {"number": "2", "name": "~", "at": [0, -3.81, 90], "length": 1.27},
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    SymbolBoundingBoxCalculator.clear_cache()
+    yield
+    SymbolBoundingBoxCalculator.clear_cache()
+
+
+@pytest.fixture
+def computations(monkeypatch):
+    """Count uncached bounding box computations."""
+    calls = []
+    compute = SymbolBoundingBoxCalculator._compute_bounding_box.__func__
+
+    def counting(cls, *args):
+        calls.append(args)
+        return compute(cls, *args)
+
+    monkeypatch.setattr(
+        SymbolBoundingBoxCalculator, "_compute_bounding_box", classmethod(counting)
+    )
+    return calls
+
+
+class TestBoundingBoxCache:
+    """Test the per-symbol bounding box cache."""
+
+    def test_identical_instances_computed_once(self, computations):
+        boxes = {
+            SymbolBoundingBoxCalculator.calculate_bounding_box(
+                RESISTOR, lib_id="Device:R"
+            )
+            for _ in range(500)
+        }
+        assert len(boxes) == 1
+        assert len(computations) == 1
+        assert boxes == {SymbolBoundingBoxCalculator.calculate_bounding_box(RESISTOR)}
+
+    def test_labels_of_equal_length_share_entry(self, computations):
+        calc = SymbolBoundingBoxCalculator
+        first = calc.calculate_bounding_box(
+            RESISTOR, pin_net_map={"1": "VCC", "2": "GND"}, lib_id="Device:R"
+        )
+        second = calc.calculate_bounding_box(
+            RESISTOR, pin_net_map={"1": "SDA", "2": "SCL"}, lib_id="Device:R"
+        )
+        longer = calc.calculate_bounding_box(
+            RESISTOR, pin_net_map={"1": "VBUS_5V", "2": "GND"}, lib_id="Device:R"
+        )
+
+        assert first == second
+        assert longer != first
+        assert longer == calc.calculate_bounding_box(
+            RESISTOR, pin_net_map={"1": "VBUS_5V", "2": "GND"}
+        )
+        assert len(computations) == 3
+
+    def test_properties_flag_is_part_of_key(self):
+        calc = SymbolBoundingBoxCalculator
+        with_props = calc.calculate_bounding_box(RESISTOR, True, lib_id="Device:R")
+        without = calc.calculate_bounding_box(RESISTOR, False, lib_id="Device:R")
+        assert with_props != without
+        assert calc.get_symbol_dimensions(
+            RESISTOR, False, lib_id="Device:R"
+        ) == pytest.approx((without[2] - without[0], without[3] - without[1]))
+
+    def test_no_stderr_output(self, capsys):
+        SymbolBoundingBoxCalculator.calculate_bounding_box(
+            RESISTOR, pin_net_map={"1": "VCC"}
+        )
+        assert capsys.readouterr().err == ""
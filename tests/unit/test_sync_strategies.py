@@ -15,6 +15,8 @@ from circuit_synth.kicad.schematic.sync_strategies import (
     PositionRenameStrategy,
     ValueFootprintStrategy,
     ConnectionMatchStrategy,
+    MatchMap,
+    solve_assignment,
 )
 
 
@@ -420,5 +422,94 @@ class TestReferenceMatchStrategy:
         assert matches == {}
 
 
+def _kicad(ref, x, y, value="10k", lib_id="Device:R", footprint="R_0603"):
+    comp = Mock()
+    comp.reference = ref
+    comp.position = Point(x, y)
+    comp.value = value
+    comp.lib_id = lib_id
+    comp.footprint = footprint
+    comp.uuid = f"uuid-{ref}"
+    return comp
+
+
+class TestGlobalAssignment:
+    """Test conflict-aware assignment of strategy candidates."""
+
+    def test_match_map_rejects_conflicts(self):
+        match_map = MatchMap()
+        assert match_map.add("R1", "R1")
+        assert not match_map.add("R2", "R1")
+        assert not match_map.add("R1", "R3")
+        assert match_map.circuit_for("R1") == "R1"
+        assert match_map.to_dict() == {"R1": "R1"}
+
+    def test_assignment_beats_greedy_choice(self):
+        # Greedy would give A -> X and leave B unmatched
+        scores = {"A": {"X": 0.9, "Y": 0.8}, "B": {"X": 0.85}}
+        assert solve_assignment(scores) == {"A": "Y", "B": "X"}
+
+    def test_independent_pairs_are_taken_directly(self):
+        scores = {f"C{i}": {f"K{i}": 1.0} for i in range(2000)}
+        result = solve_assignment(scores)
+        assert len(result) == 2000
+        assert result["C1999"] == "K1999"
+
+    def test_position_scores_prefer_closest(self):
+        strategy = PositionRenameStrategy(Mock())
+        kicad_components = {
+            "R10": _kicad("R10", 100.0, 100.0),
+            "R11": _kicad("R11", 101.5, 100.0),
+            "R12": _kicad("R12", 500.0, 500.0),
+        }
+        circuit_components = {
+            "R1": {
+                "reference": "R1",
+                "position": Point(101.4, 100.0),
+                "symbol": "Device:R",
+                "value": "10k",
+                "footprint": "R_0603",
+            },
+            "R2": {
+                "reference": "R2",
+                "position": Point(100.1, 100.0),
+                "symbol": "Device:R",
+                "value": "10k",
+                "footprint": "R_0603",
+            },
+        }
+
+        scores = strategy.score_components(circuit_components, kicad_components)
+
+        assert set(scores["R1"]) == {"R10", "R11"}
+        assert solve_assignment(scores) == {"R1": "R11", "R2": "R10"}
+
+    def test_synchronizer_runs_strategies_in_priority_order(self):
+        from circuit_synth.kicad.schematic.synchronizer import APISynchronizer
+
+        kicad_components = {
+            "R1": _kicad("R1", 0, 0),
+            "R2": _kicad("R2", 10, 0),
+        }
+        circuit_components = {
+            # UUID says this is the KiCad R2, even though a R1 exists
+            "R1": {"reference": "R1", "uuid": "uuid-R2", "value": "10k"},
+            "R5": {"reference": "R5", "value": "10k"},
+        }
+        search_engine = Mock()
+        search_engine.search_by_value.return_value = list(kicad_components.values())
+
+        sync = APISynchronizer.__new__(APISynchronizer)
+        sync.strategies = [
+            UUIDMatchStrategy(search_engine),
+            ReferenceMatchStrategy(search_engine),
+            ValueFootprintStrategy(search_engine),
+        ]
+
+        matches = sync._match_components(circuit_components, kicad_components)
+
+        assert matches == {"R1": "R2", "R5": "R1"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
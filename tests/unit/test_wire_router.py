@@ -0,0 +1,179 @@
+"""
+Unit tests for grid-based obstacle-aware wire routing.
+"""
+
+import random
+from collections import deque
+
+from circuit_synth.kicad.schematic.wire_router import (
+    ObstacleGrid,
+    RoutingConstraints,
+    WireRouter,
+)
+
+G = 2.54
+
+
+def _grid_points(points):
+    """Every grid point covered by an axis-aligned polyline."""
+    covered = []
+    for a, b in zip(points, points[1:]):
+        assert abs(a.x - b.x) < 1e-6 or abs(a.y - b.y) < 1e-6
+        steps = round(max(abs(b.x - a.x), abs(b.y - a.y)) / G)
+        for i in range(steps + 1):
+            t = i / steps if steps else 0
+            covered.append(
+                (round((a.x + (b.x - a.x) * t) / G), round((a.y + (b.y - a.y) * t) / G))
+            )
+    return covered
+
+
+def _inside(point, rect):
+    x, y = point[0] * G, point[1] * G
+    return rect[0] < x < rect[2] and rect[1] < y < rect[3]
+
+
+def _bfs_steps(grid, source, target):
+    """Reference shortest path length in steps around obstacles."""
+    seen = {source: 0}
+    queue = deque([source])
+    while queue:
+        index = queue.popleft()
+        if index == target:
+            return seen[index]
+        row, col = divmod(index, grid.cols)
+        for dc, dr in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            c, r = col + dc, row + dr
+            nxt = r * grid.cols + c
+            if 0 <= c < grid.cols and 0 <= r < grid.rows and nxt not in seen:
+                if not grid._blocked[nxt] or nxt == target:
+                    seen[nxt] = seen[index] + 1
+                    queue.append(nxt)
+    return None
+
+
+class TestObstacleGrid:
+    """Test obstacle rasterization and wire occupancy."""
+
+    def test_interior_blocked_outline_free(self):
+        grid = ObstacleGrid([(10 * G, 10 * G, 14 * G, 12 * G)])
+        assert grid.is_blocked((12 * G, 11 * G))
+        assert not grid.is_blocked((10 * G, 11 * G))
+        assert not grid.is_blocked((12 * G, 12 * G))
+        assert grid.blocked.sum() == 3
+
+    def test_thin_obstacle_blocks_nearest_line(self):
+        grid = ObstacleGrid([(5.0, 0.0, 5.2, 20.0)])
+        assert grid.is_blocked((5.08, 10.16))
+
+    def test_wire_blocks_other_nets_only(self):
+        grid = ObstacleGrid(points=[(0, 0), (20 * G, 20 * G)])
+        grid.add_wire([(0, 5 * G), (10 * G, 5 * G)], "A")
+        middle = grid.index((5 * G, 5 * G))
+        assert not grid.is_free(middle)
+        assert grid.can_join(middle, grid.net_id("A"))
+        assert not grid.can_join(middle, grid.net_id("B"))
+
+
+class TestRouteSmart:
+    """Test single-connection routing around obstacles."""
+
+    def test_clear_straight_path_is_direct(self):
+        router = WireRouter()
+        path = router.route_smart((0, 0), (10 * G, 0), [(0, 5 * G, G, 6 * G)])
+        assert [(p.x, p.y) for p in path] == [(0, 0), (10 * G, 0)]
+
+    def test_detours_around_obstacle(self):
+        rect = (4 * G, -5 * G, 6 * G, 5 * G)
+        router = WireRouter()
+        path = router.route_smart((0, 0), (10 * G, 0), [rect])
+
+        assert (path[0].x, path[0].y) == (0, 0)
+        assert (path[-1].x, path[-1].y) == (10 * G, 0)
+        assert not any(_inside(p, rect) for p in _grid_points(path))
+        assert len(path) == 4
+
+    def test_shortest_without_bend_penalty(self):
+        rng = random.Random(11)
+        rects = []
+        for _ in range(25):
+            x, y = rng.randrange(0, 40) * G, rng.randrange(0, 40) * G
+            rects.append(
+                (x, y, x + rng.randrange(2, 6) * G, y + rng.randrange(2, 6) * G)
+            )
+        router = WireRouter(RoutingConstraints(bend_penalty=0))
+        grid = ObstacleGrid(rects, points=[(0, 0), (45 * G, 45 * G)])
+        cols = grid.cols
+
+        for _ in range(20):
+            source = target = None
+            while source is None or grid._blocked[source] or grid._blocked[target]:
+                source = rng.randrange(len(grid._blocked))
+                target = rng.randrange(len(grid._blocked))
+            path = router._find_path(grid, source, {target}, -2)
+            expected = _bfs_steps(grid, source, target)
+            if expected is None:
+                assert path is None
+                continue
+            assert len(path) - 1 == expected
+            for a, b in zip(path, path[1:]):
+                assert abs(a % cols - b % cols) + abs(a // cols - b // cols) == 1
+
+    def test_enclosed_pin_falls_back_to_manhattan(self):
+        walls = [
+            (-3 * G, -3 * G, 3 * G, -1.5 * G),
+            (-3 * G, 1.5 * G, 3 * G, 3 * G),
+            (-3 * G, -3 * G, -1.5 * G, 3 * G),
+            (1.5 * G, -3 * G, 3 * G, 3 * G),
+        ]
+        router = WireRouter()
+        path = router.route_smart((0, 0), (10 * G, 5 * G), walls)
+        assert path == router.route_manhattan((0, 0), (10 * G, 5 * G))
+
+
+class TestRouteNets:
+    """Test batched routing of several nets on a shared grid."""
+
+    def test_nets_never_share_points_except_crossings(self):
+        router = WireRouter()
+        nets = {
+            "A": [(0, 5 * G), (20 * G, 5 * G)],
+            "B": [(10 * G, 0), (10 * G, 10 * G)],
+            "C": [(2 * G, 0), (18 * G, 10 * G)],
+        }
+        result = router.route_nets(nets, [(8 * G, 2 * G, 12 * G, 3 * G)])
+
+        assert all(result[name].complete for name in nets)
+        nodes = {}
+        covered = {}
+        for name, routed in result.items():
+            for wire in routed.wires:
+                for point in (wire[0], *wire[1:-1], wire[-1]):
+                    nodes.setdefault(
+                        (round(point.x / G), round(point.y / G)), set()
+                    ).add(name)
+                for point in _grid_points(wire):
+                    covered.setdefault(point, set()).add(name)
+
+        for point, owners in nodes.items():
+            assert covered[point] == owners
+
+    def test_multi_pin_net_gets_junction(self):
+        router = WireRouter()
+        result = router.route_nets({"VCC": [(0, 0), (10 * G, 0), (5 * G, 6 * G)]}, [])
+        routed = result["VCC"]
+        assert routed.complete
+        assert len(routed.wires) == 2
+        assert len(routed.junctions) == 1
+
+    def test_unreachable_pin_reported(self):
+        walls = [
+            (17 * G, -3 * G, 23 * G, -1.5 * G),
+            (17 * G, 1.5 * G, 23 * G, 3 * G),
+            (17 * G, -3 * G, 18.5 * G, 3 * G),
+            (21.5 * G, -3 * G, 23 * G, 3 * G),
+        ]
+        router = WireRouter()
+        result = router.route_nets({"N": [(0, 0), (20 * G, 0)]}, walls)
+        assert result["N"].unrouted == [(20 * G, 0)]
+        assert result["N"].wires == []